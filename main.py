@@ -4,6 +4,7 @@ from starrealms.game import Game
 from starrealms.ai import PolicyAgent, GoodHeuristicAgent, load_weights, train
 from starrealms.runner.human import human_turn
 from starrealms.runner.ai_runner import ai_turn   # only if you split AI turn
+from starrealms.planning.ponder import Ponderer
 
 def choose_mode():
     print("Select opponent type:")
@@ -42,6 +43,8 @@ def play_mode():
         game = Game(("Player 1", "Player 2"))
         _mark_players(game, p1_human=True, p2_human=True)  # hotseat
 
+    # The AI thinks about its next turn on a worker thread while you play yours.
+    ponderer = Ponderer(agent, seat=1) if agent else None
     last_log_len = 0
     while True:
         winner = game.check_winner()
@@ -50,22 +53,26 @@ def play_mode():
             break
 
         if game.current_player().name == "Player 1":
+            if ponderer:
+                ponderer.start(game)
             last_log_len = human_turn(game, last_log_len)
         else:
-            last_log_len = ai_turn(game, agent, last_log_len) if agent else human_turn(game, last_log_len)
+            last_log_len = ai_turn(game, agent, last_log_len, ponderer) if agent else human_turn(game, last_log_len)
 
         winner = game.check_winner()
         if winner:
             print(f"\n🎉 {winner.name} wins! 🎉")
             break
+    if ponderer:
+        ponderer.close()
 
-def train_mode(iters: int):
+def train_mode(iters: int, db_path=None):
     def make_game():
         g = Game(("A", "B"))
         _mark_players(g, p1_human=False, p2_human=False)
         return g
     print(f"Starting training for {iters} iterations...")
-    best = train(make_game, iterations=iters, matches_per_iter=20, log_fn=print)
+    best = train(make_game, iterations=iters, matches_per_iter=20, log_fn=print, db_path=db_path)
     print("Training complete. Current best weights:")
     for k, v in sorted(best.items()):
         print(f"  {k}: {v}")
@@ -74,6 +81,7 @@ if __name__ == "__main__":
     args = sys.argv[1:]
     if args and args[0] == "--train":
         iters = int(args[1]) if len(args) > 1 and args[1].isdigit() else 100
-        train_mode(iters)
+        db = args[args.index("--db") + 1] if "--db" in args[:-1] else None
+        train_mode(iters, db)
     else:
         play_mode()
\ No newline at end of file
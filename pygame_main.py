@@ -2,15 +2,19 @@
 import sys
 import time
 import builtins
+from collections import OrderedDict, deque
+
 import pygame
 
 import starrealms.view.ui_common as ui_common
+from starrealms.graphics.governor import FrameGovernor
 
 # --------------------- Config ---------------------
 WINDOW_W, WINDOW_H = 1280, 720
 FONT_SIZE = 24
 LINE_SPACING = 4
 MAX_LINES = 8000
+BLINK_MS = 530           # input cursor blink period
 ECHO_TO_CONSOLE = True   # also mirror to Termux console for now
 # --------------------------------------------------
 
@@ -18,6 +22,16 @@ def _now():
     return time.strftime("%H:%M:%S")
 
 class LogPanel:
+    """
+    Scrollback console. Lines live in a ring buffer (deque, MAX_LINES) and
+    are wrapped only when they scroll into view; wrap results and rendered
+    row surfaces are memoized (dropped on font-size change or resize).
+    draw() repaints only after content, scroll, input or size changes, and
+    an input-only change (typing, cursor blink) repaints just the input row.
+    """
+
+    SURFACE_CACHE = 512  # rendered rows kept
+
     def __init__(self, size=(WINDOW_W, WINDOW_H), bg=(12, 12, 14)):
         pygame.init()
         self.screen = pygame.display.set_mode(size, pygame.RESIZABLE)
@@ -29,29 +43,80 @@ class LogPanel:
         self.font = pygame.font.Font(None, self.font_size)
 
         self.margin = 16
-        self.lines: list[tuple[str, pygame.Color]] = []   # (text, color)
-        self.input_text = ""
+        self.lines: deque[tuple[str, pygame.Color]] = deque(maxlen=MAX_LINES)   # (text, color), unwrapped
+        self._input_text = ""
         self.prompt = "> "
         self.entered: str | None = None
         self.history: list[str] = []
         self.history_idx: int | None = None
 
         # scrolling
-        self.scroll_offset = 0     # how many rendered rows from the bottom we’re scrolled up
+        self._scroll_offset = 0     # how many rendered rows from the bottom we’re scrolled up
+
+        # caches (see _clear_caches) and what needs repainting
+        self._wraps: dict[str, tuple[str, ...]] = {}
+        self._row_surfs: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self._dirty_log = True
+        self._dirty_input = True
+        self._cursor_on = True
+        self.next_blink = pygame.time.get_ticks() + BLINK_MS
         self._recompute_metrics()
 
+    # -------- state that triggers repaints ----------
+    @property
+    def scroll_offset(self) -> int:
+        return self._scroll_offset
+
+    @scroll_offset.setter
+    def scroll_offset(self, value: int):
+        if value != self._scroll_offset:
+            self._scroll_offset = value
+            self._dirty_log = True
+
+    @property
+    def input_text(self) -> str:
+        return self._input_text
+
+    @input_text.setter
+    def input_text(self, value: str):
+        if value != self._input_text:
+            self._input_text = value
+            self._dirty_input = True
+            self._cursor_on = True  # typing shows the cursor and restarts the blink
+            self.next_blink = pygame.time.get_ticks() + BLINK_MS
+
+    def blink(self, now: int | None = None):
+        """Toggle the cursor once its blink deadline (next_blink) has passed."""
+        now = pygame.time.get_ticks() if now is None else now
+        if now >= self.next_blink:
+            self._cursor_on = not self._cursor_on
+            self._dirty_input = True
+            self.next_blink = now + BLINK_MS
+
+    def invalidate(self):
+        """Repaint everything on the next draw()."""
+        self._dirty_log = self._dirty_input = True
+
     # -------- metrics & rendering ----------
     def _recompute_metrics(self):
         w, h = self.screen.get_size()
+        if w != getattr(self, "width", None):
+            self._wraps.clear()
         self.width = w
         self.line_height = self.font.get_height() + LINE_SPACING
         self.input_y = h - self.margin - self.font.get_height()
         usable_h = h - (2 * self.margin) - (self.font.get_height() + 10)
         self.max_visible = max(1, usable_h // self.line_height)
+        self.invalidate()
+
+    def _clear_caches(self):
+        self._wraps.clear()
+        self._row_surfs.clear()
 
     def set_font_size(self, size: int):
         self.font_size = max(12, min(48, size))
         self.font = pygame.font.Font(None, self.font_size)
+        self._clear_caches()
         self._recompute_metrics()
 
     def _wrap(self, text: str) -> list[str]:
@@ -70,6 +135,26 @@ class LogPanel:
             out.append(cur)
         return out
 
+    def _wrapped(self, text: str) -> tuple[str, ...]:
+        """_wrap memoized for the current font and width."""
+        rows = self._wraps.get(text)
+        if rows is None:
+            if len(self._wraps) >= 2 * MAX_LINES:
+                self._wraps.clear()
+            rows = self._wraps[text] = tuple(self._wrap(text))
+        return rows
+
+    def _row_surface(self, text: str, color) -> pygame.Surface:
+        key = (text, tuple(color))
+        surf = self._row_surfs.get(key)
+        if surf is None:
+            surf = self._row_surfs[key] = self.font.render(text, True, color)
+            if len(self._row_surfs) > self.SURFACE_CACHE:
+                self._row_surfs.popitem(last=False)
+        else:
+            self._row_surfs.move_to_end(key)
+        return surf
+
     def _color_for(self, line: str) -> pygame.Color:
         s = line.lower()
         if "blob" in s:
@@ -88,37 +173,54 @@ class LogPanel:
         text = str(text).rstrip()
         if not text:
             return
-        color = self._color_for(text)
-        wrapped = self._wrap(text)
-        # if we are at bottom (no scroll), keep following new lines automatically
-        at_bottom = (self.scroll_offset == 0)
-        for w in wrapped:
-            self.lines.append((w, color))
-        if len(self.lines) > MAX_LINES:
-            self.lines = self.lines[-MAX_LINES:]
-        if at_bottom:
-            self.scroll_offset = 0  # new lines -> stay at bottom
+        self.lines.append((text, self._color_for(text)))
+        # at the bottom (no scroll) the view keeps following new lines
+        self._dirty_log = True
+
+    def visible_rows(self) -> list[tuple[str, pygame.Color]]:
+        """
+        The rows on screen: walk back from the newest line, wrapping only
+        what is needed to fill the window at the current scroll offset.
+        Clamps the offset at the top of the scrollback.
+        """
+        need = self.max_visible + self._scroll_offset
+        rows: list[tuple[str, pygame.Color]] = []
+        for text, color in reversed(self.lines):
+            for row in reversed(self._wrapped(text)):
+                rows.append((row, color))
+            if len(rows) >= need:
+                break
+        top = max(0, len(rows) - self.max_visible)
+        if self._scroll_offset > top:
+            self._scroll_offset = top
+        start = self._scroll_offset
+        return rows[start : start + self.max_visible][::-1]
 
     def draw(self):
-        self.screen.fill(self.bg)
-
-        # compute slice with scrollback
-        start = max(0, len(self.lines) - self.max_visible - self.scroll_offset)
-        end = start + self.max_visible
-        view = self.lines[start:end]
-
-        y = self.margin
-        for text, color in view:
-            surf = self.font.render(text, True, color)
-            self.screen.blit(surf, (self.margin, y))
-            y += self.line_height
-
-        # input line
+        """Repaint what changed since the last draw(); no-op when nothing did."""
+        if self._dirty_log:
+            self.screen.fill(self.bg)
+            y = self.margin
+            for text, color in self.visible_rows():
+                self.screen.blit(self._row_surface(text, color), (self.margin, y))
+                y += self.line_height
+            self._draw_input()
+            pygame.display.flip()
+        elif self._dirty_input:
+            pygame.display.update(self._draw_input())
+        self._dirty_log = self._dirty_input = False
+
+    def _draw_input(self) -> pygame.Rect:
+        row = pygame.Rect(0, self.input_y, self.width, self.font.get_height())
+        self.screen.fill(self.bg, row)
         prompt = self.prompt + self.input_text
-        surf = self.font.render(prompt, True, pygame.Color(180, 220, 180))
+        color = pygame.Color(180, 220, 180)
+        surf = self.font.render(prompt, True, color)
         self.screen.blit(surf, (self.margin, self.input_y))
-
-        pygame.display.flip()
+        if self._cursor_on:
+            x = self.margin + surf.get_width() + 1
+            self.screen.fill(color, (x, self.input_y, 2, self.font.get_height()))
+        return row
 
     def tick(self, fps=30):
         self.clock.tick(fps)
@@ -166,7 +268,8 @@ class LogPanel:
                         else:
                             self.input_text = self.history[self.history_idx]
             elif e.key == pygame.K_PAGEUP:
-                self.scroll_offset = min(len(self.lines), self.scroll_offset + self.max_visible // 2)
+                # clamped to the top of the scrollback by the next draw()
+                self.scroll_offset = self.scroll_offset + self.max_visible // 2
             elif e.key == pygame.K_PAGEDOWN:
                 self.scroll_offset = max(0, self.scroll_offset - self.max_visible // 2)
             elif e.key in (pygame.K_ESCAPE, pygame.K_q):
@@ -179,6 +282,8 @@ class LogPanel:
                 self.set_font_size(FONT_SIZE)
             elif ctrl and e.key == pygame.K_l:
                 self.lines.clear()
+                self.scroll_offset = 0
+                self.invalidate()
             elif ctrl and e.key == pygame.K_s:
                 with open("pygame_log.txt", "w", encoding="utf-8") as f:
                     for t, _c in self.lines:
@@ -197,7 +302,8 @@ class LogPanel:
 
 
 # ------------- UI shims -> pygame -------------
-log_panel = LogPanel()
+log_panel: LogPanel | None = None
+governor = FrameGovernor(max_fps=60, idle_fps=2)
 
 def pygame_ui_print(*args, **kwargs):
     log_panel.add_line(" ".join(str(a) for a in args))
@@ -210,8 +316,10 @@ def pygame_ui_log(game, message: str):
 def pygame_ui_input(prompt: str = "") -> str:
     if prompt:
         log_panel.add_line(prompt)
+    log_panel.draw()
     while True:
-        for e in pygame.event.get():
+        # Sleeps until input, the next cursor blink, or the governor's frame time.
+        for e in governor.wait(log_panel.next_blink):
             if e.type == pygame.QUIT:
                 pygame.quit(); sys.exit(0)
             log_panel.handle_event(e)
@@ -220,35 +328,53 @@ def pygame_ui_input(prompt: str = "") -> str:
         if ans is not None:
             return ans
 
+        log_panel.blink()
         log_panel.draw()
-        log_panel.tick(60)
-
-# Patch ui_common
-ui_common.ui_print = pygame_ui_print
-ui_common.ui_log = pygame_ui_log
-ui_common.ui_input = pygame_ui_input
 
-# Mirror stray print() calls into the panel (and console if enabled)
 _old_print = builtins.print
 def _print_to_both(*args, **kwargs):
     pygame_ui_print(" ".join(str(a) for a in args))
     if ECHO_TO_CONSOLE:
         _old_print(*args, **kwargs)
-builtins.print = _print_to_both
+
+def install() -> LogPanel:
+    """Open the panel and route ui_common and stray print() calls into it."""
+    global log_panel
+    if log_panel is None:
+        log_panel = LogPanel()
+        # Patch ui_common
+        ui_common.ui_print = pygame_ui_print
+        ui_common.ui_log = pygame_ui_log
+        ui_common.ui_input = pygame_ui_input
+        # Mirror stray print() calls into the panel (and console if enabled)
+        builtins.print = _print_to_both
+    return log_panel
 # ----------------------------------------------
 
 def main():
+    from starrealms.ai import GoodHeuristicAgent
     from starrealms.game import Game
+    from starrealms.planning.ponder import Ponderer
+    from starrealms.runner.ai_runner import ai_turn
     from starrealms.runner.human import human_turn
 
+    install()
     g = Game(("You", "AI"))
+    g.players[0].human, g.players[1].human = True, False
+    agent = GoodHeuristicAgent()
+    # The AI ponders its next turn on a worker thread while you play yours.
+    ponderer = Ponderer(agent, seat=1)
     log_panel.add_line("Pygame UI ready. Starting a game…")
     last_log = 0
 
     while not g.check_winner():
-        last_log = human_turn(g, last_log)
+        if g.turn % 2 == 0:
+            ponderer.start(g)
+            last_log = human_turn(g, last_log)
+        else:
+            last_log = ai_turn(g, agent, last_log, ponderer)
         log_panel.draw()
-        log_panel.tick(60)
+    ponderer.close()
 
     w = g.check_winner()
     pygame_ui_print(f"Winner: {w.name if w else 'Unknown'}")
@@ -12,11 +12,22 @@ from __future__ import annotations
 import json
 import os
 import random
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from starrealms.planning.buy_cache import BuyDecisionCache, policy_key, shared_buy_cache
+from starrealms.planning.lethal import execute_line, find_lethal
+from starrealms.planning.ponder import LethalBook
+from starrealms.planning.purchase import (
+    DEFAULT_MAX_BUYS,
+    EXPLORER_SLOT,
+    plan_purchases,
+    run_purchases,
+)
 
 # ---------------- Storage ----------------
 AI_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ai_data")
 WEIGHTS_PATH = os.path.join(AI_DATA_DIR, "ai_weights.json")
+BUY_CACHE_PATH = os.path.join(AI_DATA_DIR, "buy_cache.json")
 os.makedirs(AI_DATA_DIR, exist_ok=True)
 
 # ---------------- Default scoring weights ----------------
@@ -125,8 +136,33 @@ def score_card(card: dict, weights: Dict[str, float]) -> float:
 class PolicyAgent:
     """Plans (cmd, arg) steps. Replans buys after 'pa' using a 'replan' marker."""
 
-    def __init__(self, weights: Optional[Dict[str, float]] = None):
+    uses_buy_cache = True  # plan_buys answers from buy_cache, so pondering can warm it
+
+    def __init__(
+        self,
+        weights: Optional[Dict[str, float]] = None,
+        buy_cache: Optional[BuyDecisionCache] = None,
+    ):
         self.weights = weights or load_weights()
+        self.buy_cache = buy_cache if buy_cache is not None else shared_buy_cache()
+        self.lethal_book = LethalBook()  # answers pondered during the opponent's turn
+
+    @property
+    def weights(self) -> Dict[str, float]:
+        """Scoring weights; assign a new dict to change them (the policy key is computed here)."""
+        return self._weights
+
+    @weights.setter
+    def weights(self, weights: Dict[str, float]) -> None:
+        self._weights = weights
+        self._policy_key = policy_key(type(self).__name__, weights)
+
+    def _buy_score(self, game, card) -> float:
+        return score_card(card, self.weights)
+
+    def _turn_bucket(self, game) -> int:
+        """Coarse turn phase that _buy_score depends on (0: turn-independent)."""
+        return 0
 
     def _best_affordable_slot(self, game, player) -> Optional[int]:
         best_slot = None
@@ -135,22 +171,61 @@ class PolicyAgent:
             if not card:
                 continue
             if card["cost"] <= player.trade_pool:
-                sc = score_card(card, self.weights)
+                sc = self._buy_score(game, card)
                 if sc > best_score:
                     best_score = sc
                     best_slot = i
         return best_slot
 
+    def plan_buys(
+        self, game, player, max_buys: int = DEFAULT_MAX_BUYS, bought: Sequence[object] = ()
+    ) -> List[object]:
+        """Slots to buy now (1-based ints, or 'x' for an Explorer), best first; bought: earlier buys this turn."""
+        key = (
+            self._policy_key,
+            self._turn_bucket(game),
+            int(player.trade_pool),
+            max_buys,
+            (len(bought), list(bought).count(EXPLORER_SLOT)),
+            tuple(card["name"] if card else None for card in game.trade_row),
+        )
+        hit = self.buy_cache.get(key)
+        if hit is not None:
+            return list(hit)
+
+        offers = [
+            (card["cost"], self._buy_score(game, card)) if card else None
+            for card in game.trade_row
+        ]
+        explorer = getattr(game, "explorer_card", None)
+        ex = (explorer.get("cost", 2) or 2, self._buy_score(game, explorer)) if explorer else None
+        picks = plan_purchases(offers, player.trade_pool, ex, max_buys, bought).picks
+        self.buy_cache.put(key, picks)
+        return list(picks)
+
+    def _lethal_plan(self, game) -> Optional[List[Tuple[str, object]]]:
+        """If this turn can kill, the plan that does it: ('lethal', LethalLine), attack, end."""
+        p, o = game.current_player(), game.opponent()
+        known, line = self.lethal_book.lookup(p, o, game)
+        if not known:
+            line = find_lethal(p, o, game)
+        if line is None:
+            return None
+        return [("lethal", line), ("a", None), ("e", None)]
+
     def plan_turn(self, game) -> List[Tuple[str, object]]:
+        lethal = self._lethal_plan(game)
+        if lethal:
+            return lethal
         # UI must handle 'replan' by performing buys
         return [("pa", None), ("replan", None), ("a", None), ("e", None)]
 
 
 # ---------------- Stronger hard-coded AI (no 'replan') ----------------
 class GoodHeuristicAgent(PolicyAgent):
-    """Deterministic AI that plays, buys (twice), attacks, ends — no 'replan' step."""
+    """Deterministic AI that plays, buys (up to twice), attacks, ends — no 'replan' step."""
 
-    def __init__(self):
+    def __init__(self, buy_cache: Optional[BuyDecisionCache] = None):
         weights = {
             "trade": 1.2,
             "combat": 1.0,
@@ -169,27 +244,28 @@ class GoodHeuristicAgent(PolicyAgent):
             "outpost_bonus": 0.7,
             "cost_penalty": 0.045,
         }
-        super().__init__(weights=weights)
+        super().__init__(weights=weights, buy_cache=buy_cache)
 
-    def _best_affordable_slot(self, game, player):
-        best_slot = None
-        best_score = -1e9
+    def _turn_bucket(self, game) -> int:
         turn = getattr(game, "turn_number", 1)
-        for i, card in enumerate(game.trade_row, start=1):
-            if not card or card["cost"] > player.trade_pool:
-                continue
-            sc = score_card(card, self.weights)
-            # Early bias: trade/draw; Mid bias: bases
-            if turn <= 6:
-                sc += 0.25 * _sum_effects_for(card, "trade")
-                sc += 0.25 * _sum_effects_for(card, "draw")
-            elif 6 < turn <= 12 and card.get("type") in ("base", "outpost"):
-                sc += 0.6
-            if sc > best_score:
-                best_score, best_slot = sc, i
-        return best_slot
+        return 0 if turn <= 6 else 1 if turn <= 12 else 2
+
+    def _buy_score(self, game, card) -> float:
+        sc = score_card(card, self.weights)
+        bucket = self._turn_bucket(game)
+        # Early bias: trade/draw; Mid bias: bases
+        if bucket == 0:
+            sc += 0.25 * _sum_effects_for(card, "trade")
+            sc += 0.25 * _sum_effects_for(card, "draw")
+        elif bucket == 1 and card.get("type") in ("base", "outpost"):
+            sc += 0.6
+        return sc
 
     def plan_turn(self, game):
+        lethal = self._lethal_plan(game)
+        if lethal:
+            return lethal
+
         p = game.current_player()
         cmds: List[Tuple[str, object]] = []
 
@@ -205,15 +281,9 @@ class GoodHeuristicAgent(PolicyAgent):
         except Exception:
             pass
 
-        # 3) Buy up to two times
-        for _ in range(2):
-            slot = self._best_affordable_slot(game, p)
-            if slot is not None:
-                cmds.append(("b", slot))  # 1-based index
-            elif p.trade_pool >= 2:
-                cmds.append(("b", "x"))  # Explorer
-            else:
-                break
+        # 3) Buy the best affordable set (1-based slots and/or "x" Explorers)
+        for slot in self.plan_buys(game, p):
+            cmds.append(("b", slot))
 
         # 4) Attack
         cmds.append(("a", None))
@@ -232,24 +302,17 @@ def ai_take_turn(game, apply_command) -> None:
         cmd, arg = script[i]
         if cmd == "replan":
             p = game.current_player()
-            buys_done = 0
-            while buys_done < 2:
-                # best slot?
-                slot = agent._best_affordable_slot(game, p)
-                if slot is not None:
-                    apply_command("b", str(slot))
-                    buys_done += 1
-                    continue
-                # else Explorer
-                if p.trade_pool >= 2:
-                    apply_command("b", "x")
-                    buys_done += 1
-                    continue
-                break
+            run_purchases(
+                lambda left, bought: agent.plan_buys(game, p, left, bought),
+                lambda slot: apply_command("b", str(slot)),
+            )
             i += 1
             continue
 
-        apply_command(cmd, None if arg is None else str(arg))
+        if cmd == "lethal":
+            apply_command(cmd, arg)  # LethalLine object, not a string
+        else:
+            apply_command(cmd, None if arg is None else str(arg))
         i += 1
 
 
@@ -278,6 +341,8 @@ def self_play_match(
         if cmd == "pa":
             for card in list(p.hand):
                 p.play_card(card, o, game)
+        elif cmd == "lethal":
+            execute_line(arg, p, o, game)
         elif cmd == "b":
             if arg == "x":
                 if p.trade_pool >= 2:
@@ -303,17 +368,12 @@ def self_play_match(
         # A
         for cmd, arg in agentA.plan_turn(game):
             if cmd == "replan":
-                buys = 0
-                while buys < 2:
-                    slot = agentA._best_affordable_slot(game, game.current_player())
-                    if slot is not None:
-                        _apply("b", str(slot))
-                        buys += 1
-                    elif game.current_player().trade_pool >= 2:
-                        _apply("b", "x")
-                        buys += 1
-                    else:
-                        break
+                run_purchases(
+                    lambda left, bought: agentA.plan_buys(game, game.current_player(), left, bought),
+                    lambda slot: _apply("b", str(slot)),
+                )
+            elif cmd == "lethal":
+                _apply(cmd, arg)
             else:
                 _apply(cmd, None if arg is None else str(arg))
         winner = game.check_winner()
@@ -322,17 +382,12 @@ def self_play_match(
         # B
         for cmd, arg in agentB.plan_turn(game):
             if cmd == "replan":
-                buys = 0
-                while buys < 2:
-                    slot = agentB._best_affordable_slot(game, game.current_player())
-                    if slot is not None:
-                        _apply("b", str(slot))
-                        buys += 1
-                    elif game.current_player().trade_pool >= 2:
-                        _apply("b", "x")
-                        buys += 1
-                    else:
-                        break
+                run_purchases(
+                    lambda left, bought: agentB.plan_buys(game, game.current_player(), left, bought),
+                    lambda slot: _apply("b", str(slot)),
+                )
+            elif cmd == "lethal":
+                _apply(cmd, arg)
             else:
                 _apply(cmd, None if arg is None else str(arg))
         winner = game.check_winner()
@@ -343,20 +398,49 @@ def self_play_match(
     return -1
 
 
+def load_buy_cache(path: str = BUY_CACHE_PATH) -> int:
+    """Warm the shared buy-decision cache from disk; returns entries loaded."""
+    return shared_buy_cache().load(path)
+
+
+def save_buy_cache(path: str = BUY_CACHE_PATH) -> None:
+    shared_buy_cache().save(path)
+
+
 def train(
-    make_game, iterations=20, matches_per_iter=20, log_fn=print
+    make_game, iterations=20, matches_per_iter=20, log_fn=print, buy_cache_path=None, db_path=None
 ) -> Dict[str, float]:
+    """db_path: also store every match in the SQLite results warehouse (starrealms.warehouse)."""
+    if buy_cache_path:
+        load_buy_cache(buy_cache_path)
     best = load_weights()
+    wh = run_id = None
+    if db_path:
+        from starrealms.warehouse import Warehouse
+
+        wh = Warehouse(db_path)
+        run_id = wh.start_run("train", meta={"iterations": iterations, "matches_per_iter": matches_per_iter})
+    games = []
+
+    def _make():
+        games.append(make_game())
+        return games[-1]
+
     for it in range(1, iterations + 1):
         candidate = _mutate(best, scale=0.25)
         wins = 0
-        for _ in range(matches_per_iter):
+        for m in range(matches_per_iter):
+            games.clear()
             if random.random() < 0.5:
-                res = self_play_match(make_game, candidate, best)
+                res = self_play_match(_make, candidate, best)
                 wins += 1 if res == 1 else 0
+                seats = (("candidate", candidate), ("best", best))
             else:
-                res = self_play_match(make_game, best, candidate)
+                res = self_play_match(_make, best, candidate)
                 wins += 1 if res == -1 else 0
+                seats = (("best", best), ("candidate", candidate))
+            if wh is not None:
+                _store_match(wh, run_id, f"{it}:{m}", seats, games[-1])
         score = wins / matches_per_iter
         log_fn(
             f"[iter {it}] candidate vs best: {wins}/{matches_per_iter} = {score:.2f}"
@@ -365,4 +449,25 @@ def train(
             best = candidate
             save_weights(best)
             log_fn(f"  ✅ Updated weights saved to {WEIGHTS_PATH}")
+    if buy_cache_path:
+        save_buy_cache(buy_cache_path)
+    if wh is not None:
+        wh.finish_run(run_id)
+        wh.close()
     return best
+
+
+def _weights_id(weights: Optional[Dict[str, float]]) -> Optional[str]:
+    return None if weights is None else policy_key(PolicyAgent.__name__, weights)
+
+
+def _store_match(wh, run_id, key, seats, game) -> None:
+    from starrealms.warehouse import SeatResult
+
+    w = game.check_winner()
+    winner = None if w is None else game.players.index(w)  # None: turn cap
+    rows = [
+        SeatResult(name, 0.5 if winner is None else float(i == winner), _weights_id(wt), game.players[i].authority)
+        for i, (name, wt) in enumerate(seats)
+    ]
+    wh.add_game(run_id, rows, winner, game.turn, key=key)  # turns ended, both players
@@ -0,0 +1,36 @@
+# starrealms/analytics/__init__.py
+"""
+Streaming card analytics from self-play: which cards get bought, when, and
+how often the player who bought them wins.
+
+    python -m starrealms.analytics --agent good=heuristic --games 100000 \\
+        --save ai_data/cards.jsonl --report ai_data/cards.json
+"""
+
+from .stats import CardLine, CardStats, FactionLine, format_report, write_report
+from .summary import (
+    BOUGHT,
+    SCRAPPED,
+    CardRecorder,
+    GameSummary,
+    play_summary,
+    read_summaries,
+    simulate,
+    tee_summaries,
+)
+
+__all__ = [
+    "CardLine",
+    "CardStats",
+    "FactionLine",
+    "format_report",
+    "write_report",
+    "BOUGHT",
+    "SCRAPPED",
+    "CardRecorder",
+    "GameSummary",
+    "play_summary",
+    "read_summaries",
+    "simulate",
+    "tee_summaries",
+]
@@ -0,0 +1,69 @@
+# starrealms/analytics/__main__.py
+import argparse
+import sys
+import time
+
+from starrealms.tournament.runner import parse_agent
+
+from .stats import CardStats, format_report, write_report
+from .summary import read_summaries, simulate, tee_summaries
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Per-card win-rate analytics from self-play")
+    src = ap.add_mutually_exclusive_group(required=True)
+    src.add_argument(
+        "--agent",
+        action="append",
+        help="NAME=KIND[@WEIGHTS] (once for self-play, twice for a seat-swapped match)",
+    )
+    src.add_argument("--input", help="JSON-lines summaries to aggregate instead of playing ('-' = stdin)")
+    ap.add_argument("--games", type=int, default=1000)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--workers", type=int, default=0, help="processes (default: CPU count)")
+    ap.add_argument("--max-turns", type=int, default=200)
+    ap.add_argument("--save", help="append each game's summary to this JSON-lines file")
+    ap.add_argument("--report", help="write the report here (.json for JSON, else text)")
+    ap.add_argument("--only", metavar="NAME", help="count only the seats played by this agent")
+    ap.add_argument("--min-games", type=int, default=1, help="hide cards bought in fewer player-games")
+    ap.add_argument("--progress", type=int, default=0, help="print a line every N games")
+    args = ap.parse_args(argv)
+
+    infile = None
+    if args.input:
+        infile = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+        stream = read_summaries(infile)
+    else:
+        if len(args.agent) > 2:
+            ap.error("give one or two --agent")
+        stream = simulate(
+            [parse_agent(a) for a in args.agent],
+            args.games,
+            seed=args.seed,
+            max_turns=args.max_turns,
+            workers=args.workers,
+        )
+    out = open(args.save, "a", encoding="utf-8") if args.save else None
+    if out is not None:
+        stream = tee_summaries(stream, out)
+
+    stats = CardStats(args.only)
+    t0 = time.perf_counter()
+    try:
+        for n, s in enumerate(stream, start=1):
+            stats.add(s)
+            if args.progress and n % args.progress == 0:
+                print(f"{n} games, {n / (time.perf_counter() - t0):.1f}/s", file=sys.stderr, flush=True)
+    finally:
+        if out is not None:
+            out.close()
+        if infile not in (None, sys.stdin):
+            infile.close()
+
+    if args.report:
+        write_report(stats, args.report, args.min_games)
+    print(format_report(stats, args.min_games))
+
+
+if __name__ == "__main__":
+    main()
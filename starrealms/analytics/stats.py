@@ -0,0 +1,254 @@
+# starrealms/analytics/stats.py
+"""
+Constant-memory card statistics over a stream of GameSummary records.
+
+Every counter is a running sum keyed by card or faction name, so memory is
+bounded by the card pool, not by the number of games, and two CardStats built
+on separate shards merge exactly (merge()). Per player-game ("seat" of one
+game) a card counts as bought if at least one copy was acquired; scores are
+1 for a win, 0.5 for a draw, 0 for a loss.
+"""
+
+from __future__ import annotations
+import json
+import math
+from dataclasses import asdict, dataclass, fields
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
+
+from .summary import BOUGHT, SCRAPPED, GameSummary
+
+NEUTRAL = frozenset({"Neutral", "Unaligned", "", None})
+
+
+@lru_cache(maxsize=None)
+def faction_of(name: str) -> Optional[str]:
+    from starrealms.cards import find_card
+
+    try:
+        return find_card(name).get("faction")
+    except Exception:
+        return None
+
+
+@dataclass
+class CardLine:
+    bought_games: int = 0  # player-games with >= 1 copy acquired
+    bought_score: float = 0.0  # sum of those player-games' scores
+    copies: int = 0
+    turn_sum: int = 0  # sum of the player turn each copy was acquired on
+    first_turn_sum: int = 0  # ... of the first copy, per bought game
+    plays: int = 0
+    scraps: int = 0
+
+    def merge(self, other: "CardLine") -> None:
+        for f in fields(self):
+            setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+
+
+@dataclass
+class FactionLine:
+    copies: int = 0
+    primary_games: int = 0  # player-games where this faction was acquired most
+    primary_score: float = 0.0
+
+    def merge(self, other: "FactionLine") -> None:
+        for f in fields(self):
+            setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+
+
+def _rate(num: float, den: float) -> Optional[float]:
+    return num / den if den else None
+
+
+def _half_width(p: Optional[float], n: int) -> Optional[float]:
+    """95% normal-approximation half-width of a rate measured over n player-games."""
+    return None if p is None or not n else 1.96 * math.sqrt(max(p * (1.0 - p), 0.0) / n)
+
+
+class CardStats:
+    """
+    stats = CardStats().consume(stream)   # any iterable of GameSummary
+    stats.rows()                          # per-card metrics, best win rate first
+
+    agent: only count the seats played by that agent name (None: both seats).
+    """
+
+    def __init__(self, agent: Optional[str] = None):
+        self.agent = agent
+        self.games = 0
+        self.player_games = 0
+        self.score = 0.0
+        self.draws = 0
+        self.turns = 0
+        self.cards: Dict[str, CardLine] = {}
+        self.factions: Dict[str, FactionLine] = {}
+
+    def _seats(self, s: GameSummary) -> List[int]:
+        return [i for i in (0, 1) if self.agent is None or s.agents[i] == self.agent]
+
+    def add(self, s: GameSummary) -> None:
+        seats = self._seats(s)
+        if not seats:
+            return
+        self.games += 1
+        self.turns += s.turns
+        self.draws += s.winner is None
+        for seat in seats:
+            score = s.score(seat)
+            self.player_games += 1
+            self.score += score
+            first: Dict[str, int] = {}
+            mix: Dict[str, int] = {}
+            for e_seat, kind, name, turn in s.events:
+                if e_seat != seat:
+                    continue
+                line = self.cards.get(name)
+                if line is None:
+                    line = self.cards[name] = CardLine()
+                if kind == BOUGHT:
+                    line.copies += 1
+                    line.turn_sum += turn
+                    first.setdefault(name, turn)
+                    faction = faction_of(name)
+                    if faction not in NEUTRAL:
+                        mix[faction] = mix.get(faction, 0) + 1
+                elif kind == SCRAPPED:
+                    line.scraps += 1
+            for p_seat, name, n in s.plays:
+                if p_seat == seat:
+                    self.cards.setdefault(name, CardLine()).plays += n
+            for name, turn in first.items():
+                line = self.cards[name]
+                line.bought_games += 1
+                line.bought_score += score
+                line.first_turn_sum += turn
+            for faction, n in mix.items():
+                self.factions.setdefault(faction, FactionLine()).copies += n
+            if mix:
+                top = max(mix.values())
+                leaders = [f for f, n in mix.items() if n == top]
+                if len(leaders) == 1:  # a tie has no primary faction
+                    row = self.factions[leaders[0]]
+                    row.primary_games += 1
+                    row.primary_score += score
+
+    def consume(self, stream: Iterable[GameSummary]) -> "CardStats":
+        for s in stream:
+            self.add(s)
+        return self
+
+    def merge(self, other: "CardStats") -> "CardStats":
+        self.games += other.games
+        self.player_games += other.player_games
+        self.score += other.score
+        self.draws += other.draws
+        self.turns += other.turns
+        for table, theirs, make in ((self.cards, other.cards, CardLine), (self.factions, other.factions, FactionLine)):
+            for name, line in theirs.items():
+                table.setdefault(name, make()).merge(line)
+        return self
+
+    # ---------------- report ----------------
+    def rows(self, min_games: int = 1) -> List[Dict[str, Any]]:
+        """Per-card metrics for cards bought in at least `min_games` player-games."""
+        out = []
+        for name, c in self.cards.items():
+            if c.bought_games < min_games:
+                continue
+            win = _rate(c.bought_score, c.bought_games)
+            without = _rate(self.score - c.bought_score, self.player_games - c.bought_games)
+            out.append(
+                {
+                    "card": name,
+                    "faction": faction_of(name),
+                    "bought_rate": _rate(c.bought_games, self.player_games),
+                    "win_when_bought": win,
+                    "win_ci95": _half_width(win, c.bought_games),
+                    "win_without": without,
+                    "lift": None if win is None or without is None else win - without,
+                    "avg_turn_bought": _rate(c.turn_sum, c.copies),
+                    "avg_first_turn": _rate(c.first_turn_sum, c.bought_games),
+                    "copies_per_game": _rate(c.copies, c.bought_games),
+                    "plays_per_game": _rate(c.plays, self.player_games),
+                    "scraps_per_game": _rate(c.scraps, self.player_games),
+                    "bought_games": c.bought_games,
+                }
+            )
+        out.sort(key=lambda r: (-r["win_when_bought"], r["card"]))
+        return out
+
+    def faction_rows(self) -> List[Dict[str, Any]]:
+        copies = sum(f.copies for f in self.factions.values())
+        return sorted(
+            (
+                {
+                    "faction": name,
+                    "share": _rate(f.copies, copies),
+                    "primary_rate": _rate(f.primary_games, self.player_games),
+                    "win_when_primary": _rate(f.primary_score, f.primary_games),
+                    "primary_games": f.primary_games,
+                }
+                for name, f in self.factions.items()
+            ),
+            key=lambda r: (-(r["share"] or 0.0), r["faction"]),
+        )
+
+    def to_dict(self, min_games: int = 1) -> Dict[str, Any]:
+        return {
+            "agent": self.agent,
+            "games": self.games,
+            "player_games": self.player_games,
+            "draws": self.draws,
+            "avg_turns": _rate(self.turns, self.games),
+            "cards": self.rows(min_games),
+            "factions": self.faction_rows(),
+            "totals": {
+                "cards": {n: asdict(c) for n, c in sorted(self.cards.items())},
+                "factions": {n: asdict(f) for n, f in sorted(self.factions.items())},
+            },
+        }
+
+
+def _fmt(x: Optional[float], spec: str) -> str:
+    if x is None:
+        width = spec.lstrip("+").split(".")[0]
+        return "-".rjust(int(width or 0))
+    return format(x, spec)
+
+
+def format_report(stats: CardStats, min_games: int = 1, top: int = 0) -> str:
+    who = f" for {stats.agent}" if stats.agent else ""
+    lines = [
+        f"{stats.games} games{who}, {stats.player_games} player-games,"
+        f" {stats.draws} draws, {_fmt(_rate(stats.turns, stats.games), '.1f')} turns/game",
+        "",
+        f"{'card':<24} {'faction':<16} {'bought':>7} {'win%':>6} {'±95%':>5} {'lift':>6}"
+        f" {'turn':>5} {'1st':>5} {'copies':>6} {'plays':>6} {'scraps':>6}",
+    ]
+    rows = stats.rows(min_games)
+    for r in rows[:top] if top else rows:
+        lines.append(
+            f"{r['card']:<24} {str(r['faction'] or '-'):<16} {_fmt(r['bought_rate'], '7.1%')}"
+            f" {_fmt(r['win_when_bought'], '6.1%')} {_fmt(r['win_ci95'], '5.1%')} {_fmt(r['lift'], '+6.1%')}"
+            f" {_fmt(r['avg_turn_bought'], '5.1f')} {_fmt(r['avg_first_turn'], '5.1f')}"
+            f" {_fmt(r['copies_per_game'], '6.2f')} {_fmt(r['plays_per_game'], '6.2f')}"
+            f" {_fmt(r['scraps_per_game'], '6.2f')}"
+        )
+    lines += ["", f"{'faction':<16} {'share':>6} {'primary':>8} {'win%':>6}"]
+    for f in stats.faction_rows():
+        lines.append(
+            f"{f['faction']:<16} {_fmt(f['share'], '6.1%')} {_fmt(f['primary_rate'], '8.1%')}"
+            f" {_fmt(f['win_when_primary'], '6.1%')}"
+        )
+    return "\n".join(lines)
+
+
+def write_report(stats: CardStats, path: str, min_games: int = 1) -> None:
+    """JSON if `path` ends in .json, else the text table."""
+    with open(path, "w", encoding="utf-8") as f:
+        if path.endswith(".json"):
+            json.dump(stats.to_dict(min_games), f, indent=2)
+            f.write("\n")
+        else:
+            f.write(format_report(stats, min_games) + "\n")
@@ -0,0 +1,181 @@
+# starrealms/analytics/summary.py
+"""
+Compact per-game card summaries and the self-play stream that produces them.
+
+A GameSummary is the seed, the result, one (seat, kind, card, turn) event per
+card bought or scrapped (`turn` is the player's own turn: 1, 2, ...) and
+(seat, card, count) play totals. Summaries are one short JSON line each, so a
+stream of them can be piped, saved or aggregated (stats.CardStats) without
+keeping any game.
+"""
+
+from __future__ import annotations
+import itertools
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from starrealms.tournament.runner import AgentSpec, make_agent, seat_swapped_jobs
+
+BOUGHT = "b"  # acquired: bought, or gained by an effect
+SCRAPPED = "s"  # one of the player's own cards
+
+Event = Tuple[int, str, str, int]  # (seat, kind, card name, player turn)
+Plays = Tuple[int, str, int]  # (seat, card name, times played)
+
+
+@dataclass(frozen=True)
+class GameSummary:
+    """winner: seat index, None for a draw (turn cap). agents: names by seat."""
+
+    seed: Optional[int]
+    winner: Optional[int]
+    turns: int
+    agents: Tuple[str, str] = ("P1", "P2")
+    events: Tuple[Event, ...] = ()
+    plays: Tuple[Plays, ...] = ()
+
+    def score(self, seat: int) -> float:
+        return 0.5 if self.winner is None else float(self.winner == seat)
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "s": self.seed,
+                "w": self.winner,
+                "t": self.turns,
+                "a": list(self.agents),
+                "e": self.events,
+                "p": self.plays,
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, line: str) -> "GameSummary":
+        d = json.loads(line)
+        return cls(
+            d["s"], d["w"], d["t"], tuple(d["a"]), tuple(map(tuple, d["e"])), tuple(map(tuple, d.get("p", ())))
+        )
+
+
+class CardRecorder:
+    """
+    Observer for runner.headless.play_game, as both on_card (each card bought
+    or scrapped, from Game.card_event) and on_turn (turn count, cards played).
+    """
+
+    def __init__(self):
+        self.events: List[Event] = []
+        self.plays: Dict[Tuple[int, str], int] = {}
+        self._turns = [0, 0]
+
+    def on_card(self, game, player, kind: str, card) -> None:
+        seat = game.players.index(player)
+        turn = self._turns[seat] + (1 if seat == game.turn % 2 else 0)  # their turn in progress
+        self.events.append((seat, BOUGHT if kind == "acquire" else SCRAPPED, card.get("name", "?"), turn))
+
+    def __call__(self, game, seat: int) -> None:
+        self._turns[seat] += 1
+        played = getattr(game, "_played_this_turn", {}).get(game.players[seat].name, ())
+        for c in played:
+            key = (seat, c.get("name", "?"))
+            self.plays[key] = self.plays.get(key, 0) + 1
+
+    def summary(self, seed, winner, turns, agents=("P1", "P2")) -> GameSummary:
+        plays = tuple((seat, name, n) for (seat, name), n in sorted(self.plays.items()))
+        return GameSummary(seed, winner, turns, tuple(agents), tuple(self.events), plays)
+
+
+def play_summary(
+    agents: Sequence[Any],
+    seed: Optional[int] = None,
+    max_turns: int = 200,
+    agent_names: Tuple[str, str] = ("P1", "P2"),
+) -> GameSummary:
+    """Play one headless game and summarize it."""
+    from starrealms.runner.headless import play_game
+
+    rec = CardRecorder()
+    res = play_game(agents, seed=seed, max_turns=max_turns, on_turn=rec, on_card=rec.on_card)
+    return rec.summary(seed, res.winner, res.turns, agent_names)
+
+
+# ---------------- self-play stream ----------------
+_worker_agents: Dict[AgentSpec, Any] = {}
+
+
+def _play_chunk(jobs: List[Tuple[int, AgentSpec, AgentSpec]], max_turns: int) -> List[GameSummary]:
+    out = []
+    for seed, first, second in jobs:
+        agents = []
+        for spec in (first, second):
+            if spec not in _worker_agents:  # agents are stateless between games
+                _worker_agents[spec] = make_agent(spec)
+            agents.append(_worker_agents[spec])
+        out.append(play_summary(agents, seed, max_turns, (first.name, second.name)))
+    return out
+
+
+def _chunks(it: Iterator, n: int) -> Iterator[List]:
+    while True:
+        part = list(itertools.islice(it, n))
+        if not part:
+            return
+        yield part
+
+
+def simulate(
+    agents: Sequence[AgentSpec],
+    games: int,
+    seed: int = 0,
+    max_turns: int = 200,
+    workers: int = 0,
+    chunk: int = 32,
+) -> Iterator[GameSummary]:
+    """
+    Yield one GameSummary per game as games finish. Work goes out in chunks of
+    `chunk` games with at most 2 chunks per worker in flight, so memory stays
+    flat however many games are asked for. workers: 0 = CPU count, 1 = in-process.
+    """
+    if not 1 <= len(agents) <= 2:
+        raise ValueError("simulate takes one (self-play) or two agents")
+    chunks = _chunks(seat_swapped_jobs(agents, games, seed, "cards"), chunk)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for jobs in chunks:
+            yield from _play_chunk(jobs, max_turns)
+        return
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending = {pool.submit(_play_chunk, jobs, max_turns) for jobs in itertools.islice(chunks, 2 * workers)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for f in done:
+                yield from f.result()
+                jobs = next(chunks, None)
+                if jobs is not None:
+                    pending.add(pool.submit(_play_chunk, jobs, max_turns))
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+# ---------------- files ----------------
+def read_summaries(f: TextIO) -> Iterator[GameSummary]:
+    """Summaries from a JSON-lines stream; blank and torn lines are skipped."""
+    for line in f:
+        if not line.strip():
+            continue
+        try:
+            yield GameSummary.from_json(line)
+        except (ValueError, KeyError, TypeError):
+            continue
+
+
+def tee_summaries(stream: Iterable[GameSummary], f: TextIO) -> Iterator[GameSummary]:
+    """Pass `stream` through, appending each summary to `f` as a JSON line."""
+    for s in stream:
+        f.write(s.to_json() + "\n")
+        yield s
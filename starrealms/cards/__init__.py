@@ -1,7 +1,15 @@
 # starrealms/cards/__init__.py
 from importlib import import_module
+import hashlib
 import logging
-from typing import List, Dict, Any, Tuple
+import os
+import pickle
+import random
+import sys
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from starrealms.engine.unified_dispatcher import compile_abilities
 
 # Enable whatever sets you want here. Later, you can make this configurable.
 ENABLED_SETS = [
@@ -11,8 +19,30 @@ ENABLED_SETS = [
 CARDS: List[Dict[str, Any]] = []
 EXPLORER_NAME = "Explorer"
 _modules = []  # keep the loaded set modules for deck building
+_bundles: Dict[str, Dict[str, Any]] = {}  # set module name -> compiled bundle
+_deck_protos: Optional[Tuple[Dict[str, Any], ...]] = None  # see _trade_deck_prototypes()
+
+# Name indexes over CARDS, rebuilt by _load(). CARD_INDEX keeps its identity across reloads.
+CARD_INDEX: Dict[str, Dict[str, Any]] = {}
+_CARD_INDEX_LOWER: Dict[str, Dict[str, Any]] = {}
+_adapted_views: Dict[str, Dict[str, Any]] = {}  # name -> memoized _adapt_to_new_schema(template)
+EXPLORER: Optional[Dict[str, Any]] = None
 _logger = logging.getLogger("starrealms.cards")
 
+# Compiled bundles live beside each set and are keyed on the bytes of the set's
+# files (its loader and the data files beside it, _SET_FILE_SUFFIXES) and the
+# source of every module that builds the bundle (see _builder_digest), so
+# editing the data or the normalizer invalidates them. The key never loads or
+# serializes the cards themselves: a hit costs a few small reads. Edits made to
+# a set's CARDS in memory are not seen; code that makes them should turn
+# bundles off (STARREALMS_CARD_BUNDLE=0). _BUNDLE_VERSION only guards the
+# pickle layout.
+_BUNDLE_VERSION = 2
+_BUNDLE_FILENAME = "cards.bundle.pickle"
+_SET_FILE_SUFFIXES = (".py", ".json")
+# Set STARREALMS_CARD_BUNDLE=0 to always recompile (and never write) bundles.
+_BUNDLE_ENV = "STARREALMS_CARD_BUNDLE"
+
 
 # --- Minimal normalization & validation (no external deps) --------------------
 
@@ -141,17 +171,11 @@ def _import_enabled_modules():
 
 def _merge_cards_from_modules(mods) -> List[Dict[str, Any]]:
     merged: List[Dict[str, Any]] = []
+    _bundles.clear()
     for m in mods:
-        if not hasattr(m, "CARDS"):
-            raise RuntimeError(f"Set module '{m.__name__}' is missing CARDS list")
-        lst = getattr(m, "CARDS")
-        for i, rc in enumerate(lst):
-            try:
-                c = _normalize_card(rc)
-                _validate_card(c)
-                merged.append(c)
-            except Exception as e:
-                raise RuntimeError(f"[{m.__name__}] CARDS[{i}] invalid: {e}") from e
+        bundle = _set_bundle(m)
+        _bundles[m.__name__] = bundle
+        merged.extend(bundle["cards"])
     _assert_no_duplicate_names(merged)
     return merged
 
@@ -169,13 +193,27 @@ def _assert_no_duplicate_names(cards: List[Dict[str, Any]]):
 
 
 def _load():
-    global CARDS, _modules
+    global CARDS, _modules, _deck_protos
+    _deck_protos = None
     _modules = _import_enabled_modules()
     all_cards = _merge_cards_from_modules(_modules)
     CARDS[:] = all_cards
+    _rebuild_indexes()
     _logger.debug("Loaded %d cards from %d sets", len(CARDS), len(_modules))
 
 
+def _rebuild_indexes():
+    global EXPLORER
+    CARD_INDEX.clear()
+    CARD_INDEX.update((c["name"], c) for c in CARDS)
+    _CARD_INDEX_LOWER.clear()
+    _CARD_INDEX_LOWER.update((n.lower(), c) for n, c in CARD_INDEX.items())
+    _adapted_views.clear()
+    # template (don’t mutate; copy before use). None if a set omits Explorer,
+    # so tests can assert on it.
+    EXPLORER = CARD_INDEX.get(EXPLORER_NAME)
+
+
 # --- Trade deck building (duplicates allowed, must be consistent) ------------
 
 
@@ -214,64 +252,261 @@ def _fingerprint(c: Dict[str, Any]) -> Tuple:
     )
 
 
-def build_trade_deck() -> List[Dict[str, Any]]:
-    """
-    Combined trade deck from all enabled sets.
-    Each set module must define build_trade_deck() returning a list of card dict copies.
-    All cards returned are normalized + validated here (so callers don’t have to).
+# --- Compiled bundles (normalized cards + trade deck, cached on disk) ---------
 
-    NOTE: Duplicate names are EXPECTED in the trade deck (multiple copies).
-          We only ensure that copies with the same name are internally consistent.
+
+def _bundle_enabled() -> bool:
+    return os.environ.get(_BUNDLE_ENV, "1") != "0"
+
+
+def _set_dir(m) -> Optional[Path]:
+    f = getattr(m, "__file__", None)
+    return Path(f).parent if f else None
+
+
+_builder_hash: Optional[str] = None
+
+
+def _builder_digest() -> str:
+    """Hash of the source files of the modules that normalize/validate/compile bundles."""
+    global _builder_hash
+    if _builder_hash is None:
+        h = hashlib.sha256()
+        for name in _bundle_builders():
+            f = getattr(sys.modules.get(name), "__file__", None)
+            h.update(b"\0" + name.encode("utf-8") + b"\0")
+            if f:
+                h.update(Path(f).read_bytes())
+        _builder_hash = h.hexdigest()
+    return _builder_hash
+
+
+def _bundle_builders() -> Tuple[str, ...]:
+    """Modules whose code shapes a bundle: wherever the normalizer, validator and compilers live."""
+    fns = (_normalize_card, _copy_effect_fields, _validate_card, _fingerprint, _compile_set, _compile_trade_deck)
+    return tuple(sorted({f.__module__ for f in fns}))
+
+
+def _source_hash(m) -> Optional[str]:
     """
-    if not _modules:
-        _load()
+    Cache key of a set's bundle: the bytes of the set's files and the bundle
+    builders' source. None if the set has no directory to keep a bundle in
+    (e.g. a module built in memory by a test).
+    """
+    d = _set_dir(m)
+    if d is None:
+        return None
+    h = hashlib.sha256(f"v{_BUNDLE_VERSION}:{m.__name__}:{_builder_digest()}".encode("utf-8"))
+    try:
+        files = sorted(f for f in d.iterdir() if f.suffix in _SET_FILE_SUFFIXES and f.is_file())
+        for f in files:
+            h.update(b"\0" + f.name.encode("utf-8") + b"\0")
+            h.update(f.read_bytes())
+    except OSError:
+        return None
+    return h.hexdigest()
+
 
-    deck: List[Dict[str, Any]] = []
+def _compile_trade_deck(m, cards: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Normalize + validate the set's trade deck once and reduce it to its composition:
+    an ordered list of card names plus one prototype per name.
+    Returns the deck_* entries of a bundle.
+    """
+    names: List[str] = []
+    protos: Dict[str, Dict[str, Any]] = {}
     errors: List[str] = []
 
-    for m in _modules:
-        fn = getattr(m, "build_trade_deck", None)
-        if not callable(fn):
-            errors.append(f"Set module '{m.__name__}' missing build_trade_deck()")
-            continue
-        try:
-            raw_list = fn()
-            for i, rc in enumerate(raw_list):
-                try:
-                    c = _normalize_card(rc)
-                    _validate_card(c)
-                    deck.append(c)
-                except Exception as e:
-                    errors.append(
-                        f"[{m.__name__}] build_trade_deck()[{i}] invalid: {e}"
-                    )
-        except Exception as e:
-            errors.append(f"[{m.__name__}] build_trade_deck() error: {e!r}")
+    fn = getattr(m, "build_trade_deck", None)
+    if not callable(fn):
+        errors.append(f"Set module '{m.__name__}' missing build_trade_deck()")
+        return _deck_entries(names, protos, errors)
 
-    if errors:
-        raise RuntimeError("Trade deck build errors:\n- " + "\n- ".join(errors))
+    try:
+        raw_list = fn()
+    except Exception as e:
+        errors.append(f"[{m.__name__}] build_trade_deck() error: {e!r}")
+        return _deck_entries(names, protos, errors)
 
     # Consistency guard: same-name copies should match on core fields/effects
     by_name: Dict[str, Tuple] = {}
     mismatches = []
-    for c in deck:
+    for i, rc in enumerate(raw_list):
+        try:
+            c = _normalize_card(rc)
+            _validate_card(c)
+        except Exception as e:
+            errors.append(f"[{m.__name__}] build_trade_deck()[{i}] invalid: {e}")
+            continue
         fp = _fingerprint(c)
         n = c["name"]
         if n not in by_name:
             by_name[n] = fp
+            protos[n] = c
         elif by_name[n] != fp:
             mismatches.append(n)
+        names.append(n)
 
+    conflict = None
     if mismatches:
         uniq = ", ".join(sorted(set(mismatches)))
-        raise RuntimeError(
+        conflict = (
             "Inconsistent duplicate card definitions for: "
             + uniq
             + " (cards with the same name have different fields/effects)"
         )
 
+    # Share the card-list template when a deck copy matches it exactly, so the
+    # bundle stores each definition once.
+    templates = {c["name"]: c for c in cards}
+    for n, c in protos.items():
+        t = templates.get(n)
+        if t is not None and t == c:
+            protos[n] = t
+
+    return _deck_entries(names, protos, errors, conflict)
+
+
+def _deck_entries(names, protos, errors, conflict=None) -> Dict[str, Any]:
+    return {
+        "deck_names": names,
+        "deck_protos": protos,
+        "deck_errors": errors,
+        "deck_conflict": conflict,
+    }
+
+
+def _compile_set(m, source_hash: Optional[str]) -> Dict[str, Any]:
+    """Run the full normalize/validate pass for one set module."""
+    if not hasattr(m, "CARDS"):
+        raise RuntimeError(f"Set module '{m.__name__}' is missing CARDS list")
+    cards: List[Dict[str, Any]] = []
+    for i, rc in enumerate(getattr(m, "CARDS")):
+        try:
+            c = _normalize_card(rc)
+            _validate_card(c)
+            cards.append(c)
+        except Exception as e:
+            raise RuntimeError(f"[{m.__name__}] CARDS[{i}] invalid: {e}") from e
+
+    bundle = {"version": _BUNDLE_VERSION, "hash": source_hash, "cards": cards}
+    bundle.update(_compile_trade_deck(m, cards))
+    return bundle
+
+
+def _read_bundle(path: Path, source_hash: str) -> Optional[Dict[str, Any]]:
+    try:
+        with path.open("rb") as f:
+            bundle = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        _logger.debug("Ignoring unreadable card bundle %s: %r", path, e)
+        return None
+    if (
+        not isinstance(bundle, dict)
+        or bundle.get("version") != _BUNDLE_VERSION
+        or bundle.get("hash") != source_hash
+    ):
+        return None
+    return bundle
+
+
+def _write_bundle(path: Path, bundle: Dict[str, Any]) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("wb") as f:
+            pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)  # atomic: concurrent workers never see half a file
+    except OSError as e:
+        # Read-only installs simply recompile each run.
+        _logger.debug("Could not write card bundle %s: %r", path, e)
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def _set_bundle(m) -> Dict[str, Any]:
+    """
+    Return the compiled bundle for a set module, reusing the on-disk copy when
+    its hash matches the set's current data and the builders' source.
+    """
+    source_hash = _source_hash(m) if _bundle_enabled() else None
+    if source_hash is None:
+        return _compile_set(m, None)
+
+    path = _set_dir(m) / _BUNDLE_FILENAME
+    bundle = _read_bundle(path, source_hash)
+    if bundle is not None:
+        _logger.debug("Loaded compiled card bundle %s", path)
+        return bundle
+
+    bundle = _compile_set(m, source_hash)
+    # Never persist a broken deck: errors must surface on every build_trade_deck().
+    if not bundle["deck_errors"] and not bundle["deck_conflict"]:
+        _write_bundle(path, bundle)
+    return bundle
+
+
+def _trade_deck_prototypes() -> Tuple[Dict[str, Any], ...]:
+    """
+    Validated trade-deck composition for this process: one shared prototype per
+    physical copy, in set order. Built once and reset by _load()/reload.
+    Prototypes are templates — copy before handing them to a game.
+    """
+    global _deck_protos
+    if _deck_protos is not None:
+        return _deck_protos
+    if not _modules:
+        _load()
+
+    protos: List[Dict[str, Any]] = []
+    errors: List[str] = []
+    conflicts: List[str] = []
+
+    for m in _modules:
+        bundle = _bundles.get(m.__name__) or _set_bundle(m)
+        errors.extend(bundle["deck_errors"])
+        if bundle["deck_conflict"]:
+            conflicts.append(bundle["deck_conflict"])
+        by_name = bundle["deck_protos"]
+        protos.extend(by_name[n] for n in bundle["deck_names"])
+
+    if errors:
+        raise RuntimeError("Trade deck build errors:\n- " + "\n- ".join(errors))
+    if conflicts:
+        raise RuntimeError("; ".join(conflicts))
+
+    _deck_protos = tuple(protos)
+    return _deck_protos
+
+
+def build_trade_deck() -> List[Dict[str, Any]]:
+    """
+    Combined trade deck from all enabled sets.
+    Each set module must define build_trade_deck() returning a list of card dict copies.
+    All cards returned are normalized + validated (once per data change, via the
+    compiled set bundles) so callers don’t have to.
+
+    NOTE: Duplicate names are EXPECTED in the trade deck (multiple copies).
+          We only ensure that copies with the same name are internally consistent.
+    """
+    # Shallow copies: per-instance runtime flags stay per copy.
     # DO NOT call _assert_no_duplicate_names(deck) here — duplicates are valid in the trade deck
-    return deck
+    return [dict(c) for c in _trade_deck_prototypes()]
+
+
+def new_trade_deck(rng=None) -> List[Dict[str, Any]]:
+    """
+    Shuffled trade deck for a new game: a permutation of the cached prototypes,
+    shallow-copied so each game owns its card instances.
+    Consumes `rng` (default: the `random` module) exactly like shuffling
+    build_trade_deck() would, so seeded games deal the same rows as before.
+    """
+    deck = list(_trade_deck_prototypes())
+    (rng or random).shuffle(deck)
+    return [dict(c) for c in deck]
 
 
 def reload_enabled_sets(new_enabled: List[str] | None = None) -> int:
@@ -286,16 +521,9 @@ def reload_enabled_sets(new_enabled: List[str] | None = None) -> int:
     return len(CARDS)
 
 
-# Load at import time
+# Load at import time (also builds CARD_INDEX and exposes EXPLORER)
 _load()
 
-# Build quick indexes and expose EXPLORER for tests/engine convenience
-CARD_INDEX: Dict[str, Dict[str, Any]] = {c["name"]: c for c in CARDS}
-try:
-    EXPLORER = CARD_INDEX[EXPLORER_NAME]  # template (don’t mutate; copy before use)
-except KeyError:
-    EXPLORER = None  # if a set omits Explorer, tests can assert on this
-
 # Lightweight lookup used by tests
 
 
@@ -402,20 +630,64 @@ def _adapt_to_new_schema(card: dict) -> dict:
         })
 
     if abilities:
-        c["abilities"] = abilities
+        c["abilities"] = compile_abilities(abilities)
 
     return c
+
+
+def card_template(name: str, *, case_sensitive: bool = True) -> Optional[Dict[str, Any]]:
+    """O(1) lookup of the loaded template for `name` (don’t mutate; copy before use)."""
+    if case_sensitive:
+        return CARD_INDEX.get(name)
+    return _CARD_INDEX_LOWER.get((name or "").lower())
+
+
+def card_view(name: str, *, case_sensitive: bool = True) -> Optional[Dict[str, Any]]:
+    """
+    Memoized schema-adapted view of a template (see _adapt_to_new_schema).
+    Shared and read-only: use it for display/scoring, copy it before playing it.
+    Cleared on reload_enabled_sets().
+    """
+    tmpl = card_template(name, case_sensitive=case_sensitive)
+    if tmpl is None:
+        return None
+    view = _adapted_views.get(tmpl["name"])
+    if view is None:
+        view = _adapted_views[tmpl["name"]] = _adapt_to_new_schema(tmpl)
+    return view
+
+
+def _copy_view(view: Dict[str, Any]) -> Dict[str, Any]:
+    """A caller's own copy of a shared view: a new dict with new top-level lists (on_play, ally, scrap, ...)."""
+    return {k: list(v) if type(v) is list else v for k, v in view.items()}
+
+
+def find_card(name, *, case_sensitive=True):
+    """
+    get_card_by_name() over the loaded cards, but O(1): a fresh copy of the
+    memoized adapted view (see _copy_view), or None if not found.
+    """
+    view = card_view(name, case_sensitive=case_sensitive)
+    return _copy_view(view) if view is not None else None
+
+
 def get_card_by_name(cards, name, *, case_sensitive=True):
     """
-    Find the first card dict in `cards` whose "name" matches `name`.
-    Returns the card dict, or None if not found.
+    Find the first card dict in `cards` whose "name" matches `name` and return
+    it adapted to the new schema, or None if not found. A match that is a
+    loaded template itself reuses the template's memoized view; cards=None
+    looks the name up among the loaded cards (see find_card).
     Tests typically pass (g.trade_deck + g.card_db) as `cards`.
     """
+    if cards is None:
+        return find_card(name, case_sensitive=case_sensitive)
     key = name if case_sensitive else name.lower()
-    for c in cards or []:
+    for c in cards:
         nm = c.get("name")
         if not case_sensitive:
             nm = (nm or "").lower()
         if nm == key:
+            if CARD_INDEX.get(c.get("name")) is c:
+                return _copy_view(card_view(c["name"]))
             return _adapt_to_new_schema(c)
-    return None
\ No newline at end of file
+    return None
@@ -0,0 +1,154 @@
+# starrealms/cards/lazy_deck.py
+"""
+LazyTradeDeck: the trade deck as remaining counts per card, not a shuffled list.
+
+A list deck is one fixed permutation of 80 card dicts, so copying a game
+copies them all and re-determinizing the hidden order reshuffles them. The
+lazy deck keeps only which cards remain (a small array of prototype indices)
+and draws uniformly without replacement on demand, from the game's RNG
+(Game.rng; the `random` module if none is given). A draw is O(1): pick a
+random position in the live part of the array and swap it to the end.
+Copies are a few short arrays, and since no order exists until a card is
+drawn, resampling the hidden deck costs nothing.
+
+Replay: fix_order(names) makes the next draws come out in exactly that
+order (random again afterwards). `history` records every draw, so
+LazyTradeDeck(order=deck.history) deals a game's rows again, and
+from_cards() turns a list deck into a lazy one with the same future draws.
+
+It supports what the engine does with Game.trade_deck (pop, len, truth,
+iteration, + list) and is opt-in: Game(lazy_trade_deck=True).
+"""
+
+from __future__ import annotations
+import copy
+import random
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from . import CARD_INDEX, _trade_deck_prototypes
+
+
+class LazyTradeDeck:
+    __slots__ = ("_protos", "_ids", "_pool", "_size", "_counts", "_order", "rng", "history")
+
+    def __init__(self, cards: Optional[Iterable[Any]] = None, rng=None, order: Sequence[str] = ()):
+        """cards: card dicts or names (default: the full trade deck of the enabled sets)."""
+        protos: List[Dict[str, Any]] = []
+        ids: Dict[str, int] = {}
+        pool = array("H")
+        for c in _trade_deck_prototypes() if cards is None else cards:
+            name = c["name"] if isinstance(c, dict) else c
+            if name not in ids:
+                proto = c if isinstance(c, dict) else _prototype(name)
+                ids[name] = len(protos)
+                protos.append(proto)
+            pool.append(ids[name])
+        self._protos: Tuple[Dict[str, Any], ...] = tuple(protos)
+        self._ids = ids
+        self._pool = pool
+        self._size = len(pool)
+        self._counts = [0] * len(protos)
+        for k in pool:
+            self._counts[k] += 1
+        self._order: List[int] = []
+        self.rng = rng or random
+        self.history: List[str] = []
+        self.fix_order(order)
+
+    @classmethod
+    def from_cards(cls, deck: Sequence[Dict[str, Any]], rng=None) -> "LazyTradeDeck":
+        """A lazy deck drawing exactly what the list deck `deck` would (it pops from the end)."""
+        return cls(deck, rng, order=[c["name"] for c in reversed(deck)])
+
+    # ---------------- drawing ----------------
+    def fix_order(self, names: Sequence[str]) -> None:
+        """The next draws are `names`, in order (replaces any order already fixed)."""
+        need: Dict[int, int] = {}
+        order = []
+        for n in names:
+            k = self._ids.get(n)
+            need[k] = need.get(k, 0) + 1
+            if k is None or need[k] > self._counts[k]:
+                raise ValueError(f"{n!r} is not left in the trade deck {need[k]} time(s)")
+            order.append(k)
+        self._order = order[::-1]
+
+    @property
+    def fixed(self) -> List[str]:
+        """Names still due to be drawn in a fixed order, next first."""
+        return [self._protos[k]["name"] for k in reversed(self._order)]
+
+    def _take(self, i: int) -> int:
+        pool, last = self._pool, self._size - 1
+        k = pool[i]
+        pool[i], pool[last] = pool[last], k
+        self._size = last
+        self._counts[k] -= 1
+        return k
+
+    def pop(self, index: int = -1) -> Dict[str, Any]:
+        """Draw the next card (a fresh copy). The deck has no order, so `index` is ignored."""
+        if not self._size:
+            raise IndexError("pop from empty trade deck")
+        if self._order:
+            k = self._take(self._pool.index(self._order.pop(), 0, self._size))
+        else:
+            k = self._take(self.rng.randrange(self._size))
+        proto = self._protos[k]
+        self.history.append(proto["name"])
+        return dict(proto)
+
+    # ---------------- composition ----------------
+    def counts(self) -> Dict[str, int]:
+        return {p["name"]: n for p, n in zip(self._protos, self._counts) if n}
+
+    def count(self, name: str) -> int:
+        k = self._ids.get(name)
+        return self._counts[k] if k is not None else 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Fresh copies of the remaining cards, in no particular order."""
+        protos = self._protos
+        return (dict(protos[k]) for k in self._pool[: self._size])
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __repr__(self) -> str:
+        return f"LazyTradeDeck({self._size} cards, {len(self._order)} fixed)"
+
+    # ---------------- copies ----------------
+    def copy(self) -> "LazyTradeDeck":
+        new = object.__new__(LazyTradeDeck)
+        new._protos, new._ids = self._protos, self._ids  # shared, never mutated
+        new._pool = array("H", self._pool[: self._size])
+        new._size = self._size
+        new._counts = list(self._counts)
+        new._order = list(self._order)
+        new.rng = self.rng
+        new.history = list(self.history)
+        return new
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo) -> "LazyTradeDeck":
+        new = self.copy()
+        if isinstance(self.rng, random.Random):
+            new.rng = copy.deepcopy(self.rng, memo)  # via memo: stays the copied game's RNG
+        return new
+
+
+def _prototype(name: str) -> Dict[str, Any]:
+    for c in _trade_deck_prototypes():
+        if c["name"] == name:
+            return c
+    if name in CARD_INDEX:
+        return CARD_INDEX[name]
+    raise KeyError(f"unknown card {name!r}")
@@ -0,0 +1,31 @@
+# starrealms/dataset/__init__.py
+"""
+Offline training data: buy decisions from headless games, exported to
+memory-mapped NumPy shards (needs numpy).
+
+    python -m starrealms.dataset export --agent good=heuristic --games 5000 --out ai_data/traj
+    ds = ShardDataset("ai_data/traj")
+    for batch in ds.batches(1024, seed=0):
+        batch["obs"], batch["action"], batch["mask"], batch["outcome"]
+"""
+
+from .encoding import PASS, action_names, encode_observation, feature_names, legal_mask, n_actions, obs_dim, vocab
+from .export import TrajectoryRecorder, export_trajectories, replay_jobs, self_play_jobs
+from .shards import ShardDataset, ShardWriter
+
+__all__ = [
+    "PASS",
+    "action_names",
+    "encode_observation",
+    "feature_names",
+    "legal_mask",
+    "n_actions",
+    "obs_dim",
+    "vocab",
+    "TrajectoryRecorder",
+    "export_trajectories",
+    "replay_jobs",
+    "self_play_jobs",
+    "ShardDataset",
+    "ShardWriter",
+]
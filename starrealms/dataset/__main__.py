@@ -0,0 +1,71 @@
+# starrealms/dataset/__main__.py
+import argparse
+import sys
+
+import numpy as np
+
+from starrealms.tournament.runner import parse_agent
+
+from .export import export_trajectories, replay_jobs, self_play_jobs
+from .shards import ShardDataset
+
+
+def _export(args) -> None:
+    agents = [parse_agent(a) for a in args.agent]
+    if args.replay:
+        jobs = replay_jobs(args.replay, agents)
+    elif len(agents) > 2:
+        sys.exit("give one or two --agent (or --replay a results file)")
+    else:
+        jobs = self_play_jobs(agents, args.games, args.seed)
+
+    def progress(n, res, rows):
+        if args.progress and n % args.progress == 0:
+            print(f"{n} games", file=sys.stderr, flush=True)
+
+    w = export_trajectories(
+        args.out,
+        jobs,
+        max_turns=args.max_turns,
+        shard_size=args.shard_size,
+        buffer_rows=args.buffer_rows,
+        seed=args.seed,
+        append=args.append,
+        on_game=progress,
+    )
+    print(f"{w.rows} rows in {len(w.shards)} shards -> {args.out}")
+
+
+def _info(args) -> None:
+    ds = ShardDataset(args.out)
+    print(f"{len(ds)} rows, {ds.num_shards} shards, {ds.meta.get('games', '?')} games")
+    for name, (dtype, shape) in ds.index["columns"].items():
+        print(f"  {name:<8} {dtype:<6} {tuple(shape)}")
+    if len(ds):
+        outcome = np.concatenate([ds.column(i, "outcome") for i in range(ds.num_shards)])
+        action = np.concatenate([ds.column(i, "action") for i in range(ds.num_shards)])
+        print(f"  outcome mean {outcome.mean():+.3f}, PASS share {(action == 0).mean():.1%}")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Export game trajectories to NumPy shards")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    ex = sub.add_parser("export", help="play or replay games and write shards")
+    ex.add_argument("--agent", action="append", required=True, help="NAME=KIND[@WEIGHTS] (repeat)")
+    ex.add_argument("--games", type=int, default=100)
+    ex.add_argument("--replay", help="tournament results file: re-run its games (agents matched by name)")
+    ex.add_argument("--out", required=True, help="export directory")
+    ex.add_argument("--append", action="store_true", help="add shards to an existing export")
+    ex.add_argument("--seed", type=int, default=0)
+    ex.add_argument("--max-turns", type=int, default=200)
+    ex.add_argument("--shard-size", type=int, default=65536, help="rows per shard")
+    ex.add_argument("--buffer-rows", type=int, default=8192, help="shuffle buffer (bounds memory)")
+    ex.add_argument("--progress", type=int, default=0, help="print a line every N games")
+    info = sub.add_parser("info", help="summarize an export")
+    info.add_argument("out")
+    args = ap.parse_args(argv)
+    (_export if args.cmd == "export" else _info)(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# starrealms/dataset/encoding.py
+"""
+Fixed-size encodings of a decision point, from the acting player's view.
+
+Observation (float32, raw counts and amounts, not normalized):
+  per card name, in VOCAB order: own hand, own in play, own bases, own deck
+  + discard, opponent bases, opponent owned cards (all zones: the opponent's
+  purchases are public, the order of its deck and its hand are not), trade
+  row; then the scalars in SCALARS.
+
+Actions are buy decisions: 0 = stop buying (PASS), 1 + i = acquire VOCAB[i]
+(the trade-row card of that name, or an Explorer). The legal mask allows
+PASS and every card the current trade pool can pay for.
+"""
+
+from __future__ import annotations
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+PASS = 0
+ZONES = ("hand", "in_play", "bases", "owned_rest", "opp_bases", "opp_owned", "trade_row")
+SCALARS = (
+    "authority",
+    "opp_authority",
+    "trade",
+    "combat",
+    "turn",
+    "deck_size",
+    "discard_size",
+    "opp_hand_size",
+    "opp_deck_size",
+    "opp_discard_size",
+    "trade_deck_size",
+)
+
+
+@lru_cache(maxsize=1)
+def vocab() -> Tuple[str, ...]:
+    """Card names of the enabled sets, sorted (the order of every per-card block)."""
+    from starrealms.cards import CARDS
+
+    return tuple(sorted({c["name"] for c in CARDS}))
+
+
+@lru_cache(maxsize=1)
+def _ids() -> Dict[str, int]:
+    return {name: i for i, name in enumerate(vocab())}
+
+
+def obs_dim() -> int:
+    return len(ZONES) * len(vocab()) + len(SCALARS)
+
+
+def n_actions() -> int:
+    return 1 + len(vocab())
+
+
+def feature_names() -> List[str]:
+    return [f"{z}:{n}" for z in ZONES for n in vocab()] + list(SCALARS)
+
+
+def action_names() -> List[str]:
+    return ["PASS"] + [f"buy:{n}" for n in vocab()]
+
+
+def _count(out: np.ndarray, block: int, cards) -> None:
+    ids, base = _ids(), block * len(vocab())
+    for c in cards:
+        i = ids.get(c.get("name")) if c else None
+        if i is not None:
+            out[base + i] += 1.0
+
+
+def encode_observation(game, player, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Observation vector for `player` (the acting player) in `game`."""
+    opp = game.players[1] if player is game.players[0] else game.players[0]
+    if out is None:
+        out = np.zeros(obs_dim(), dtype=np.float32)
+    else:
+        out[:] = 0.0
+    _count(out, 0, player.hand)
+    _count(out, 1, player.in_play)
+    _count(out, 2, player.bases)
+    _count(out, 3, player.deck)
+    _count(out, 3, player.discard_pile)
+    _count(out, 4, opp.bases)
+    for zone in (opp.hand, opp.deck, opp.discard_pile, opp.in_play, opp.bases):
+        _count(out, 5, zone)
+    _count(out, 6, game.trade_row)
+    out[len(ZONES) * len(vocab()) :] = (
+        player.authority,
+        opp.authority,
+        player.trade_pool,
+        player.combat_pool,
+        game.turn_number,
+        len(player.deck),
+        len(player.discard_pile),
+        len(opp.hand),
+        len(opp.deck),
+        len(opp.discard_pile),
+        len(game.trade_deck),
+    )
+    return out
+
+
+def legal_mask(game, player, out: Optional[np.ndarray] = None) -> np.ndarray:
+    if out is None:
+        out = np.zeros(n_actions(), dtype=np.bool_)
+    else:
+        out[:] = False
+    out[PASS] = True
+    ids = _ids()
+    trade = player.trade_pool
+    explorer = getattr(game, "explorer_card", None)
+    for c in list(game.trade_row) + [explorer]:
+        if c and int(c.get("cost", 0) or 0) <= trade and c.get("name") in ids:
+            out[1 + ids[c["name"]]] = True
+    return out
+
+
+def buy_action(game, slot: Any) -> Optional[int]:
+    """Action id of a planner buy (1-based trade-row slot or "x"); None if no card is there."""
+    if slot == "x":
+        card = getattr(game, "explorer_card", None)
+    else:
+        try:
+            idx = int(slot) - 1
+        except (ValueError, TypeError):
+            return None
+        card = game.trade_row[idx] if 0 <= idx < len(game.trade_row) else None
+    i = _ids().get(card.get("name")) if card else None
+    return None if i is None else 1 + i
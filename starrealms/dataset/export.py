@@ -0,0 +1,143 @@
+# starrealms/dataset/export.py
+"""
+Run (or replay) headless games and export every buy decision as a row:
+observation, action, legal mask, final outcome for the acting player
+(+1 win, -1 loss, 0 turn-cap draw), plus seat, turn and game number.
+
+Rows of a game are held until it ends (its outcome is needed), then passed to
+a ShardWriter; memory is one game plus the writer's shuffle buffer.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from starrealms.tournament.runner import AgentSpec, load_results, make_agent, seat_swapped_jobs
+
+from . import encoding
+from .shards import ShardWriter
+
+Job = Tuple[int, AgentSpec, AgentSpec]  # (seed, first, second)
+
+
+def columns() -> Dict[str, Tuple[str, Tuple[int, ...]]]:
+    return {
+        "obs": ("float32", (encoding.obs_dim(),)),
+        "action": ("int16", ()),
+        "mask": ("bool", (encoding.n_actions(),)),
+        "outcome": ("int8", ()),
+        "seat": ("int8", ()),
+        "turn": ("int16", ()),
+        "game": ("int32", ()),
+    }
+
+
+class TrajectoryRecorder:
+    """
+    on_step observer for runner.headless.play_game. Records each buy and,
+    once per turn, the decision to stop buying (the first attack/end after
+    the turn's buys; turns won by a lethal line make no buy decision).
+    """
+
+    def __init__(self):
+        self.obs: List[np.ndarray] = []
+        self.action: List[int] = []
+        self.mask: List[np.ndarray] = []
+        self.seat: List[int] = []
+        self.turn: List[int] = []
+        self._turn = None
+        self._buying = False
+
+    def __len__(self) -> int:
+        return len(self.action)
+
+    def _record(self, game, action: int) -> None:
+        p = game.current_player()
+        mask = encoding.legal_mask(game, p)
+        if not mask[action]:
+            return  # the planner asked for something it cannot pay for: not a decision
+        self.obs.append(encoding.encode_observation(game, p))
+        self.mask.append(mask)
+        self.action.append(action)
+        self.seat.append(game.turn % 2)
+        self.turn.append(game.turn_number)
+
+    def __call__(self, game, cmd: str, arg: Any) -> None:
+        if self._turn != game.turn_number:
+            self._turn, self._buying = game.turn_number, False
+        if cmd == "pa":
+            self._buying = True
+        elif cmd == "lethal":
+            self._buying = False
+        elif cmd == "b":
+            self._buying = True
+            action = encoding.buy_action(game, arg)
+            if action is not None:
+                self._record(game, action)
+        elif cmd in ("a", "e") and self._buying:
+            self._buying = False
+            self._record(game, encoding.PASS)
+
+    def rows(self, winner: Optional[int], game_no: int) -> Dict[str, np.ndarray]:
+        n = len(self.action)
+        seat = np.asarray(self.seat, dtype=np.int8)
+        outcome = np.zeros(n, dtype=np.int8) if winner is None else np.where(seat == winner, 1, -1).astype(np.int8)
+        return {
+            "obs": np.stack(self.obs) if n else np.zeros((0, encoding.obs_dim()), np.float32),
+            "action": np.asarray(self.action, dtype=np.int16),
+            "mask": np.stack(self.mask) if n else np.zeros((0, encoding.n_actions()), np.bool_),
+            "outcome": outcome,
+            "seat": seat,
+            "turn": np.asarray(self.turn, dtype=np.int16),
+            "game": np.full(n, game_no, dtype=np.int32),
+        }
+
+
+def self_play_jobs(agents: Sequence[AgentSpec], games: int, seed: int = 0) -> Iterator[Job]:
+    """Seat-swapped pairs sharing a seed; one agent means self-play."""
+    return seat_swapped_jobs(agents, games, seed, "traj")
+
+
+def replay_jobs(results_path: str, agents: Sequence[AgentSpec]) -> Iterator[Job]:
+    """Re-run the games of a tournament results file (same seeds, same seats)."""
+    specs = {a.name: a for a in agents}
+    for rec in sorted(load_results(results_path).values(), key=lambda r: r.id):
+        if rec.first in specs and rec.second in specs:
+            yield rec.seed, specs[rec.first], specs[rec.second]
+
+
+def export_trajectories(
+    out_dir: str,
+    jobs: Iterable[Job],
+    max_turns: int = 200,
+    shard_size: int = 65536,
+    buffer_rows: int = 8192,
+    seed: Optional[int] = None,
+    append: bool = False,
+    on_game=None,
+) -> ShardWriter:
+    """Play `jobs` one by one and write their decision rows; returns the closed writer."""
+    from starrealms.runner.headless import play_game
+
+    meta = {
+        "features": encoding.feature_names(),
+        "actions": encoding.action_names(),
+        "outcome": "acting player's final result: 1 win, -1 loss, 0 draw",
+    }
+    agents: Dict[AgentSpec, Any] = {}
+    with ShardWriter(out_dir, columns(), shard_size, buffer_rows, meta, seed, append) as w:
+        game_no = int(w.meta.get("games", 0))
+        for seed_k, first, second in jobs:
+            for spec in (first, second):
+                if spec not in agents:
+                    agents[spec] = make_agent(spec)
+            rec = TrajectoryRecorder()
+            res = play_game([agents[first], agents[second]], seed=seed_k, max_turns=max_turns, on_step=rec)
+            if len(rec):
+                w.write(rec.rows(res.winner, game_no))
+            game_no += 1
+            w.meta["games"] = game_no
+            if on_game is not None:
+                on_game(game_no, res, len(rec))
+    return w
@@ -0,0 +1,215 @@
+# starrealms/dataset/shards.py
+"""
+Fixed-size .npy shards of decision rows, written incrementally and read back
+through np.memmap.
+
+Layout of an export directory:
+
+  index.json                    columns, shapes, feature/action names, shards
+  shard-00000.<column>.npy      one array per column, `shard_size` rows each
+
+A shard's files are preallocated with np.lib.format.open_memmap and filled in
+place, so the writer holds at most one shuffle buffer of rows in memory. Rows
+are shuffled within that buffer before they are written, so contiguous slices
+of a shard already mix many games; the reader therefore hands out contiguous
+slices (views of the memmap, no copy) in shuffled block order. index.json is
+rewritten (atomically) after each completed shard and on close, and lists
+only the rows actually written (the last shard may be partly filled).
+"""
+
+from __future__ import annotations
+import json
+import os
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+INDEX = "index.json"
+VERSION = 1
+
+Spec = Tuple[str, Tuple[int, ...]]  # (dtype, per-row shape)
+
+
+def _shard_file(root: str, shard: str, column: str) -> str:
+    return os.path.join(root, f"{shard}.{column}.npy")
+
+
+class ShardWriter:
+    """
+    w = ShardWriter(out_dir, {"obs": ("float32", (D,)), "action": ("int16", ())})
+    w.write({"obs": obs_rows, "action": action_rows})   # any number of rows
+    w.close()
+
+    append=True continues an existing export (same columns) with new shards.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        columns: Dict[str, Spec],
+        shard_size: int = 65536,
+        buffer_rows: int = 8192,
+        meta: Optional[Dict[str, Any]] = None,
+        seed: Optional[int] = None,
+        append: bool = False,
+    ):
+        self.root = root
+        self.columns = {k: (np.dtype(d).str, tuple(shape)) for k, (d, shape) in columns.items()}
+        self.shard_size = shard_size
+        self.buffer_rows = max(1, min(buffer_rows, shard_size))
+        self.meta = dict(meta or {})
+        self._rng = np.random.default_rng(seed)
+        self.shards: List[Dict[str, Any]] = []
+        os.makedirs(root, exist_ok=True)
+        index_path = os.path.join(root, INDEX)
+        if os.path.exists(index_path):
+            if not append:
+                raise FileExistsError(f"{index_path} exists (use append=True to add shards)")
+            with open(index_path, "r", encoding="utf-8") as f:
+                old = json.load(f)
+            if {k: (d, tuple(s)) for k, (d, s) in old["columns"].items()} != self.columns:
+                raise ValueError("appending with different columns")
+            self.shards = old["shards"]
+            self.meta = {**old.get("meta", {}), **self.meta}
+        self._buf: Dict[str, List[np.ndarray]] = {k: [] for k in self.columns}
+        self._buffered = 0
+        self._open: Optional[Dict[str, np.memmap]] = None
+        self._name = ""
+        self._fill = 0
+
+    @property
+    def rows(self) -> int:
+        return sum(s["rows"] for s in self.shards) + self._fill + self._buffered
+
+    def write(self, rows: Dict[str, np.ndarray]) -> None:
+        n = len(next(iter(rows.values())))
+        for k in self.columns:
+            a = np.asarray(rows[k], dtype=self.columns[k][0])
+            if len(a) != n:
+                raise ValueError(f"column {k!r} has {len(a)} rows, expected {n}")
+            self._buf[k].append(a)
+        self._buffered += n
+        if self._buffered >= self.buffer_rows:
+            self._drain()
+
+    def _drain(self) -> None:
+        if not self._buffered:
+            return
+        cols = {k: np.concatenate(v) for k, v in self._buf.items()}
+        order = self._rng.permutation(self._buffered)
+        self._buf = {k: [] for k in self.columns}
+        self._buffered = 0
+        start = 0
+        while start < len(order):
+            if self._open is None:
+                self._new_shard()
+            take = order[start : start + self.shard_size - self._fill]
+            for k, mm in self._open.items():
+                mm[self._fill : self._fill + len(take)] = cols[k][take]
+            self._fill += len(take)
+            start += len(take)
+            if self._fill == self.shard_size:
+                self._close_shard()
+
+    def _new_shard(self) -> None:
+        name = f"shard-{len(self.shards):05d}"
+        self._name = name
+        self._open = {
+            k: np.lib.format.open_memmap(
+                _shard_file(self.root, name, k), mode="w+", dtype=d, shape=(self.shard_size,) + shape
+            )
+            for k, (d, shape) in self.columns.items()
+        }
+        self._fill = 0
+
+    def _close_shard(self) -> None:
+        for mm in self._open.values():
+            mm.flush()
+        self._open = None
+        self.shards.append({"name": self._name, "rows": self._fill})
+        self._fill = 0
+        self._write_index()
+
+    def _write_index(self) -> None:
+        index = {
+            "version": VERSION,
+            "shard_size": self.shard_size,
+            "columns": {k: [d, list(s)] for k, (d, s) in self.columns.items()},
+            "rows": sum(s["rows"] for s in self.shards),
+            "shards": self.shards,
+            "meta": self.meta,
+        }
+        tmp = os.path.join(self.root, INDEX + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=1)
+        os.replace(tmp, os.path.join(self.root, INDEX))
+
+    def close(self) -> None:
+        self._drain()
+        if self._open is not None and self._fill:
+            self._close_shard()
+        self._open = None
+        self._write_index()
+
+    def __enter__(self) -> "ShardWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ShardDataset:
+    """Read side: every column of every shard as a read-only memmap view."""
+
+    def __init__(self, root: str):
+        self.root = root
+        with open(os.path.join(root, INDEX), "r", encoding="utf-8") as f:
+            self.index = json.load(f)
+        self.columns = list(self.index["columns"])
+        self.meta = self.index.get("meta", {})
+        self._maps: Dict[Tuple[int, str], np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return int(self.index["rows"])
+
+    @property
+    def num_shards(self) -> int:
+        return len(self.index["shards"])
+
+    def column(self, shard: int, name: str) -> np.ndarray:
+        """Rows actually written of one column of one shard (a memmap view)."""
+        key = (shard, name)
+        if key not in self._maps:
+            info = self.index["shards"][shard]
+            mm = np.load(_shard_file(self.root, info["name"], name), mmap_mode="r")
+            self._maps[key] = mm[: info["rows"]]
+        return self._maps[key]
+
+    def shard(self, i: int, columns: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        return {k: self.column(i, k) for k in columns or self.columns}
+
+    def batches(
+        self,
+        batch_size: int,
+        shuffle: bool = True,
+        seed: Optional[int] = None,
+        drop_last: bool = False,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Mini-batches as dicts of memmap slices (zero-copy). With shuffle the
+        block order is random each call; rows within a block were already
+        shuffled by the writer. A shard's last block may be short unless
+        drop_last.
+        """
+        cols = list(columns or self.columns)
+        blocks = []
+        for i, info in enumerate(self.index["shards"]):
+            for start in range(0, info["rows"], batch_size):
+                if drop_last and start + batch_size > info["rows"]:
+                    continue
+                blocks.append((i, start))
+        if shuffle:
+            np.random.default_rng(seed).shuffle(blocks)
+        for i, start in blocks:
+            yield {k: self.column(i, k)[start : start + batch_size] for k in cols}
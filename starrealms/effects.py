@@ -7,6 +7,7 @@ Effect engine for Star Realms.
 
 from starrealms.view import ui_common
 import random
+from .engine import decisions as _decisions
 from .engine.resolver import can_handle as _resolver_can, apply_effect as _resolver_apply
 
 
@@ -20,6 +21,10 @@ def ui_input(prompt: str = ""):
 def ui_print(*args, **kwargs):
     return ui_common.ui_print(*args, **kwargs)
 
+def _ask(game, player, prompt: str, kind: str = "text") -> str:
+    """A decision for `player`: resumable under engine.decisions, else blocking ui_input."""
+    return _decisions.ask(prompt, game, player, kind, fallback=ui_input)
+
 _INTERACTIVE_EFFECTS = {
     # existing
     "scrap_hand_or_discard",
@@ -60,6 +65,12 @@ def _log(game, msg: str) -> None:
     except Exception:
         pass
 
+def _card_event(game, player, kind: str, card) -> None:
+    """Game.card_event, for games that have it (test doubles may not)."""
+    hook = getattr(game, "card_event", None)
+    if hook is not None:
+        hook(player, kind, card)
+
 def _fmt_eff(e):
     """Short, single-effect formatter for logs."""
     if not isinstance(e, dict):
@@ -166,6 +177,7 @@ def _acquire_from_trade_row(player, game, idx: int, destination: str = "discard"
         player.deck.insert(0, card)
     else:
         player.discard_pile.append(card)
+    _card_event(game, player, "acquire", card)
     # refill slot if deck exists
     if hasattr(game, "trade_deck") and game.trade_deck:
         row.insert(idx, game.trade_deck.pop())
@@ -469,7 +481,7 @@ def apply_effect(effect, player, opponent, game, **kwargs):
                     ui_print(f"{opponent.name}, choose a card to discard:")
                     for i, c in enumerate(opponent.hand, start=1):
                         ui_print(f"  {i}: {c.get('name','?')}")
-                    ans = ui_input("Index (1-based): ").strip()
+                    ans = _ask(game, opponent, "Index (1-based): ", kind="index").strip()
                     if ans.isdigit():
                         idx = int(ans) - 1
                         if 0 <= idx < len(opponent.hand):
@@ -528,6 +540,7 @@ def apply_effect(effect, player, opponent, game, **kwargs):
             # Agent path → game.scrap_heap per tests that read from game.scrap_heap
             game.scrap_heap.append(card)
             _log(game, f"{player.name} scraps {card.get('name','?')} from {from_label}")
+            _card_event(game, player, "scrap", card)
             return
 
         # --- Legacy agent path (1-based index) ---
@@ -554,6 +567,7 @@ def apply_effect(effect, player, opponent, game, **kwargs):
                 card = pile.pop(idx - 1)
                 game.scrap_heap.append(card)
                 _log(game, f"{player.name} scraps {card.get('name','?')} from {'hand' if src=='h' else 'discard'}")
+                _card_event(game, player, "scrap", card)
             return
 
         # --- Human path (UI) ---
@@ -562,7 +576,7 @@ def apply_effect(effect, player, opponent, game, **kwargs):
                 h_ct, d_ct = len(player.hand), len(player.discard_pile)
                 ui_print(f"Hand   : [{_list_with_idx(player.hand)}]")
                 ui_print(f"Discard: [{_list_with_idx(player.discard_pile)}]")
-                ans = ui_input("Scrap from [h]and or [d]iscard? (x=skip) ").strip().lower()
+                ans = _ask(game, player, "Scrap from [h]and or [d]iscard? (x=skip) ", kind="pile").strip().lower()
 
                 if ans in ("x", "skip", ""):
                     ui_print("↩️  Skipped scrapping.")
@@ -575,7 +589,7 @@ def apply_effect(effect, player, opponent, game, **kwargs):
                     # Human → game.scrap_heap (UI prompt handles heap)
                     while True:
                         ui_print(f"Hand: [{_list_with_idx(player.hand)}]")
-                        a2 = ui_input("Pick a hand card to scrap (1-based), or x: ").strip().lower()
+                        a2 = _ask(game, player, "Pick a hand card to scrap (1-based), or x: ", kind="index").strip().lower()
                         if a2 in ("x", ""):
                             break
                         if a2.isdigit():
@@ -584,6 +598,7 @@ def apply_effect(effect, player, opponent, game, **kwargs):
                                 card = player.hand.pop(i2)
                                 game.scrap_heap.append(card)
                                 _log(game, f"{player.name} scraps {card.get('name','?')} from hand")
+                                _card_event(game, player, "scrap", card)
                                 return
                         ui_print("❗ Invalid index.")
                 elif ans.startswith("d"):
@@ -592,7 +607,7 @@ def apply_effect(effect, player, opponent, game, **kwargs):
                         continue
                     while True:
                         ui_print(f"Discard: [{_list_with_idx(player.discard_pile)}]")
-                        a2 = ui_input("Pick a discard card to scrap (1-based), or x: ").strip().lower()
+                        a2 = _ask(game, player, "Pick a discard card to scrap (1-based), or x: ", kind="index").strip().lower()
                         if a2 in ("x", ""):
                             break
                         if a2.isdigit():
@@ -601,6 +616,7 @@ def apply_effect(effect, player, opponent, game, **kwargs):
                                 card = player.discard_pile.pop(i2)
                                 game.scrap_heap.append(card)
                                 _log(game, f"{player.name} scraps {card.get('name','?')} from discard")
+                                _card_event(game, player, "scrap", card)
                                 return
                         ui_print("❗ Invalid index.")
                 else:
@@ -612,10 +628,12 @@ def apply_effect(effect, player, opponent, game, **kwargs):
             card = player.discard_pile.pop(0)
             player.scrap_heap.append(card)  # AI (no agent) → player heap (some tests inspect this)
             _log(game, f"{player.name} scraps {card.get('name','?')} from discard")
+            _card_event(game, player, "scrap", card)
         elif player.hand:
             card = player.hand.pop(0)
             player.scrap_heap.append(card)
             _log(game, f"{player.name} scraps {card.get('name','?')} from hand")
+            _card_event(game, player, "scrap", card)
         return
 
     # -------------- scrap multiple --------------
@@ -633,7 +651,7 @@ def apply_effect(effect, player, opponent, game, **kwargs):
             while scrapped < n and (player.hand or player.discard_pile):
                 ui_print(f"Hand   : [{_list_with_idx(player.hand)}]")
                 ui_print(f"Discard: [{_list_with_idx(player.discard_pile)}]")
-                ans = ui_input("Choose pile [h/d] (or 'x' to stop scrapping): ").strip().lower()
+                ans = _ask(game, player, "Choose pile [h/d] (or 'x' to stop scrapping): ", kind="pile").strip().lower()
                 if ans in ("x", ""):
                     break
                 if ans not in ("h", "d", "hand", "discard"):
@@ -647,7 +665,7 @@ def apply_effect(effect, player, opponent, game, **kwargs):
                     # 1-based index
                     while True:
                         ui_print(f"Hand: [{_list_with_idx(player.hand)}]")
-                        a2 = ui_input("Pick a hand card to scrap (1-based), or x: ").strip().lower()
+                        a2 = _ask(game, player, "Pick a hand card to scrap (1-based), or x: ", kind="index").strip().lower()
                         if a2 in ("x", ""):
                             break
                         if a2.isdigit():
@@ -656,6 +674,7 @@ def apply_effect(effect, player, opponent, game, **kwargs):
                                 card = player.hand.pop(i2)
                                 game.scrap_heap.append(card)
                                 _log(game, f"{player.name} scraps {card.get('name','?')} from hand")
+                                _card_event(game, player, "scrap", card)
                                 scrapped += 1
                                 break
                         ui_print("❗ Invalid index.")
@@ -665,7 +684,7 @@ def apply_effect(effect, player, opponent, game, **kwargs):
                         continue
                     while True:
                         ui_print(f"Discard: [{_list_with_idx(player.discard_pile)}]")
-                        a2 = ui_input("Pick a discard card to scrap (1-based), or x: ").strip().lower()
+                        a2 = _ask(game, player, "Pick a discard card to scrap (1-based), or x: ", kind="index").strip().lower()
                         if a2 in ("x", ""):
                             break
                         if a2.isdigit():
@@ -674,6 +693,7 @@ def apply_effect(effect, player, opponent, game, **kwargs):
                                 card = player.discard_pile.pop(i2)
                                 game.scrap_heap.append(card)
                                 _log(game, f"{player.name} scraps {card.get('name','?')} from discard")
+                                _card_event(game, player, "scrap", card)
                                 scrapped += 1
                                 break
                         ui_print("❗ Invalid index.")
@@ -688,11 +708,13 @@ def apply_effect(effect, player, opponent, game, **kwargs):
                 card = player.discard_pile.pop(0)
                 player.scrap_heap.append(card)
                 _log(game, f"{player.name} scraps {card.get('name','?')} from discard")
+                _card_event(game, player, "scrap", card)
                 scrapped += 1
             elif player.hand:
                 card = player.hand.pop(0)
                 player.scrap_heap.append(card)
                 _log(game, f"{player.name} scraps {card.get('name','?')} from hand")
+                _card_event(game, player, "scrap", card)
                 scrapped += 1
             else:
                 break
@@ -758,9 +780,12 @@ def apply_effect(effect, player, opponent, game, **kwargs):
         elif getattr(player, "human", False):
             while actual_discards < max_discards and player.hand:
                 ui_print(f"Your hand: [{_list_with_idx(player.hand)}]")
-                ans = ui_input(
+                ans = _ask(
+                    game,
+                    player,
                     f"Discard a card? ({actual_discards}/{max_discards}) "
-                    f"Type 1-based index, or 'x' to stop: "
+                    f"Type 1-based index, or 'x' to stop: ",
+                    kind="index",
                 ).strip().lower()
                 if ans in ("x", "stop", ""):
                     break
@@ -841,7 +866,7 @@ def apply_effect(effect, player, opponent, game, **kwargs):
                 f"{i+1}:{b.get('name','?')}{' [Outpost]' if b.get('outpost') else ''}"
                 for i, b in enumerate(opponent.bases)
             ])
-            ans = ui_input("Choose base to destroy (1-based, x=cancel): ").strip().lower()
+            ans = _ask(game, player, "Choose base to destroy (1-based, x=cancel): ", kind="index").strip().lower()
             if ans in ("x", ""):
                 _log(game, "Cancelled base destruction")
                 return
@@ -885,7 +910,7 @@ def apply_effect(effect, player, opponent, game, **kwargs):
                     ui_print(f"  {i}: {c.get('name','?')} (cost {c.get('cost','?')})")
                 else:
                     ui_print(f"  {i}: [empty]")
-            ans = ui_input("Pick a slot to destroy (1-based), or 'x' to cancel: ").strip().lower()
+            ans = _ask(game, player, "Pick a slot to destroy (1-based), or 'x' to cancel: ", kind="index").strip().lower()
             if ans in ("x", ""):
                 _log(game, f"{player.name} cancels destroying the trade row")
                 return
@@ -901,7 +926,7 @@ def apply_effect(effect, player, opponent, game, **kwargs):
             # Simple AI: choose a random non-empty slot
             non_empty = [i for i, c in enumerate(row) if c]
             if non_empty:
-                idx = random.choice(non_empty)
+                idx = (getattr(game, "rng", None) or random).choice(non_empty)
 
         if idx is None or not row[idx]:
             _log(game, f"{player.name} found no destroyable slot")
@@ -949,7 +974,7 @@ def apply_effect(effect, player, opponent, game, **kwargs):
             ui_print("Choose a ship to copy:")
             for i, c in enumerate(eligible, start=1):
                 ui_print(f"  {i}: {c.get('name','?')}")
-            ans = ui_input("Index (1-based), or 'x' to cancel: ").strip().lower()
+            ans = _ask(game, player, "Index (1-based), or 'x' to cancel: ", kind="index").strip().lower()
             if ans.isdigit():
                 idx = int(ans) - 1
                 if 0 <= idx < len(eligible):
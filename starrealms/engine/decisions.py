@@ -0,0 +1,163 @@
+# starrealms/engine/decisions.py
+"""
+Resumable player decisions.
+
+Interactive effects (opponent discard, scrap choices, destroy-base / trade-row
+targets, copy-ship) ask through `ask()` instead of reading input directly.
+
+- With no decider installed (CLI, tests) `ask()` is a thin adapter over
+  ui_input, so blocking play is unchanged.
+- `Resumable` runs an engine call on a copy of the game with a scripted
+  decider. When the script runs out of answers the call stops with the open
+  `Decision` and the real game is left untouched; `answer()` replays the call
+  on a fresh copy with one more answer, its RNG (Game.rng, one per game)
+  reset to where the step started. Every replay deals the same cards,
+  whatever other games on other threads do meanwhile. Nothing waits
+  on a thread, so a server can park any number of games on pending decisions.
+
+Replaying is not free: each answer deep-copies the starting game and re-runs
+the whole call, so a call that asks k questions costs k copies and O(k^2)
+effect resolutions. For an AI turn (server steps of play_turn) every answer
+re-runs the AI's planning as well. Calls asking one or two questions, the
+common case, pay little; keep long question chains out of a single call.
+
+The copies are not observed (see Game.__getstate__). Card events of a
+replay are held back and delivered to the starting game's card_observers
+only when the call completes, and the completed game keeps those observers.
+"""
+
+from __future__ import annotations
+import copy
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Tuple
+
+from starrealms.view import ui_common
+
+_local = threading.local()
+
+
+@dataclass(frozen=True)
+class Decision:
+    """One question for a player. seat: index in game.players (None if unknown)."""
+
+    prompt: str
+    seat: Optional[int] = None
+    kind: str = "text"  # "index" | "pile" | "text"
+    context: Tuple[str, ...] = ()  # lines shown with the prompt (e.g. numbered options)
+
+
+class DecisionPending(BaseException):
+    """
+    Unwinds an engine call that needs an answer it does not have yet.
+    A BaseException so the engine's `except Exception` guards let it through.
+    """
+
+    def __init__(self, decision: Decision):
+        super().__init__(decision.prompt)
+        self.decision = decision
+
+
+def _seat(game, player) -> Optional[int]:
+    try:
+        return game.players.index(player)
+    except (AttributeError, ValueError):
+        return None
+
+
+def ask(prompt: str, game=None, player=None, kind: str = "text", fallback: Optional[Callable[[str], str]] = None) -> str:
+    """Answer for `player`'s decision: from the active script, else blocking input."""
+    script = getattr(_local, "script", None)
+    if script is None:
+        return (fallback or ui_common.ui_input)(prompt)
+    return script.answer(Decision(prompt, _seat(game, player), kind))
+
+
+class _Script:
+    """Feeds recorded answers in order; raises DecisionPending when they run out."""
+
+    def __init__(self, answers: List[str], expected: List[Decision]):
+        self.answers = answers
+        self.expected = expected
+        self.asked: List[Decision] = []
+        self.lines: List[str] = []
+
+    def answer(self, decision: Decision) -> str:
+        decision = Decision(decision.prompt, decision.seat, decision.kind, tuple(self.lines))
+        self.lines = []
+        k = len(self.asked)
+        if k < len(self.expected) and self.expected[k].prompt != decision.prompt:
+            del self.answers[k:]  # the replay diverged: later answers no longer apply
+        self.asked.append(decision)
+        if k >= len(self.answers):
+            raise DecisionPending(decision)
+        return self.answers[k]
+
+    def print(self, *args, **kwargs) -> None:
+        self.lines.append(" ".join(str(a) for a in args))
+
+
+class Resumable:
+    """
+    fn(game, *args) run so it can stop at a decision and resume later.
+
+        r = Resumable(apply_human, game, seat, "p", 2)
+        d = r.run()                 # None: done, r.game is the new state
+        while d is not None:
+            d = r.answer(get_answer(d))
+    """
+
+    def __init__(self, fn: Callable[..., Any], game, *args):
+        self.fn = fn
+        self.start = game
+        self.args = args
+        self.game = game
+        self.result: Any = None
+        self.answers: List[str] = []
+        self.decisions: List[Decision] = []
+        self.pending: Optional[Decision] = None
+        self.lines: List[str] = []  # ui_print output of the completed call
+        rng = getattr(game, "rng", None)
+        self._rng = rng.getstate() if rng is not None else None
+
+    @property
+    def done(self) -> bool:
+        return self.pending is None and self.game is not self.start
+
+    def run(self) -> Optional[Decision]:
+        trial = copy.deepcopy(self.start)
+        if self._rng is not None:
+            trial.rng.setstate(self._rng)  # the position the step started from
+        events: List[Tuple[Any, str, Any]] = []
+        if hasattr(trial, "card_observers"):
+            trial.card_observers = [lambda g, player, kind, card: events.append((player, kind, card))]
+        script = _Script(self.answers, self.decisions)
+        prev_script = getattr(_local, "script", None)
+        prev_io = ui_common.thread_io()
+        _local.script = script
+        # Prompts that bypass ask() (plain ui_input) are scripted too, seat unknown.
+        ui_common.set_thread_io(lambda prompt="": script.answer(Decision(prompt)), script.print)
+        try:
+            self.result = self.fn(trial, *self.args)
+        except DecisionPending as p:
+            self.decisions = script.asked
+            self.pending = p.decision
+            return self.pending
+        finally:
+            _local.script = prev_script
+            ui_common.set_thread_io(*prev_io)
+        self.decisions = script.asked
+        self.pending = None
+        self.lines = script.lines
+        if hasattr(trial, "card_observers"):
+            trial.card_observers = self.start.card_observers
+            for event in events:  # only the replay that completed is reported
+                trial.card_event(*event)
+        self.game = trial
+        return None
+
+    def answer(self, text: str) -> Optional[Decision]:
+        if self.pending is None:
+            raise RuntimeError("no decision is pending")
+        self.answers.append(str(text))
+        return self.run()
@@ -6,6 +6,8 @@ __all__ = [
 
 from typing import Callable, Dict, Any, List
 
+from .decisions import ask
+
 LegacyGame = Any
 LegacyPlayer = Any
 Effect = Dict[str, Any]
@@ -109,7 +111,7 @@ def _opponent_discards(game, player, opponent, spec):
                 names = [c.get("name","?") for c in opponent.hand]
                 # Show options and read 1-based index
                 ui_common.ui_print("Choose discard:", names)
-                ans = (ui_common.ui_input("Pick hand index (1-based): ") or "").strip()
+                ans = (ask("Pick hand index (1-based): ", game, opponent, kind="index") or "").strip()
                 idx = int(ans) - 1
             except Exception:
                 idx = 0
@@ -144,6 +146,8 @@ def _scrap_one(game, player, opponent, spec):
         player.scrap_heap.append(card)
     if hasattr(game, "log"):
         game.log.append(f"{player.name} scraps {card['name']}")
+    if hasattr(game, "card_event"):
+        game.card_event(player, "scrap", card)
 
 
 @register("destroy_base")
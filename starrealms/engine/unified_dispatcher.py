@@ -2,14 +2,95 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional, Callable, Tuple
 
 
+# ---------- Hook registry (continuous abilities) ----------
+class HookRegistry:
+    """
+    One player's hooks: event -> ordered subscribers, source -> handles.
+    Register/unregister are O(1) per hook (dicts keep insertion order), and
+    firing iterates a cached tuple that is only rebuilt after a change, so
+    hooks may safely (un)register other hooks while an event is firing.
+
+    Read-only mapping access mirrors the old List[(source, fn)] layout:
+        registry.get(event, []) -> ((source, fn), ...)
+    """
+
+    __slots__ = ("_by_event", "_by_source", "_event_of", "_snapshots", "_next")
+
+    def __init__(self):
+        self._by_event: Dict[str, Dict[int, Tuple[str, Callable]]] = {}
+        self._by_source: Dict[str, Dict[int, None]] = {}
+        self._event_of: Dict[int, str] = {}
+        self._snapshots: Dict[str, Tuple[Tuple[str, Callable], ...]] = {}
+        self._next = 0
+
+    def add(self, event: str, fn: Callable, source: str) -> int:
+        handle = self._next
+        self._next += 1
+        self._by_event.setdefault(event, {})[handle] = (source, fn)
+        self._by_source.setdefault(source, {})[handle] = None
+        self._event_of[handle] = event
+        self._snapshots.pop(event, None)
+        return handle
+
+    def remove(self, handle: int) -> bool:
+        event = self._event_of.pop(handle, None)
+        if event is None:
+            return False
+        source, _fn = self._by_event[event].pop(handle)
+        handles = self._by_source.get(source)
+        if handles is not None:
+            handles.pop(handle, None)
+            if not handles:
+                del self._by_source[source]
+        self._snapshots.pop(event, None)
+        return True
+
+    def remove_source(self, source: str) -> int:
+        handles = self._by_source.pop(source, None)
+        if not handles:
+            return 0
+        for handle in handles:
+            event = self._event_of.pop(handle)
+            self._by_event[event].pop(handle, None)
+            self._snapshots.pop(event, None)
+        return len(handles)
+
+    def subscribers(self, event: str) -> Tuple[Tuple[str, Callable], ...]:
+        snap = self._snapshots.get(event)
+        if snap is None:
+            subs = self._by_event.get(event)
+            snap = tuple(subs.values()) if subs else ()
+            self._snapshots[event] = snap
+        return snap
+
+    # Mapping-style read access (event -> subscribers)
+    def get(self, event: str, default=None):
+        if event not in self._by_event:
+            return default
+        return self.subscribers(event)
+
+    def __contains__(self, event: object) -> bool:
+        return event in self._by_event
+
+    def __iter__(self):
+        return iter(self._by_event)
+
+    def items(self):
+        return [(event, self.subscribers(event)) for event in self._by_event]
+
+    def __len__(self) -> int:
+        return len(self._event_of)
+
+
 # ---------- GameAPI (adapter to your Game) ----------
 class GameAPI:
     def __init__(self, game, ui):
         self.game = game
         self.ui = ui
         self.used_abilities: Dict[str, set[str]] = {}
-        # hooks[player][event] -> List[(source_name, fn)]
-        self.hooks: Dict[str, Dict[str, List[Tuple[str, Callable]]]] = {}
+        # hooks[player] -> HookRegistry (event -> ordered (source_name, fn))
+        self.hooks: Dict[str, HookRegistry] = {}
+        self.dispatcher: Optional["AbilityDispatcher"] = None  # set by AbilityDispatcher
 
     # Turn lifecycle
     def start_turn(self, player: str):
@@ -67,16 +148,27 @@ class GameAPI:
         self.game.destroy_enemy_base(owner, base_idx)
 
     # Hooks (continuous)
-    def register_hook(self, player: str, event: str, fn: Callable, source: str):
-        p = self.hooks.setdefault(player, {})
-        p.setdefault(event, []).append((source, fn))
+    def register_hook(self, player: str, event: str, fn: Callable, source: str) -> int:
+        """Subscribe `fn(api, player, **payload)` to `event`; returns a handle."""
+        reg = self.hooks.get(player)
+        if reg is None:
+            reg = self.hooks[player] = HookRegistry()
+        return reg.add(event, fn, source)
+
+    def unregister_hook(self, player: str, handle: int) -> bool:
+        reg = self.hooks.get(player)
+        return reg.remove(handle) if reg is not None else False
 
     def unregister_hooks_from_source(self, player: str, source: str):
-        for event, lst in self.hooks.get(player, {}).items():
-            self.hooks[player][event] = [(s, fn) for (s, fn) in lst if s != source]
+        reg = self.hooks.get(player)
+        if reg is not None:
+            reg.remove_source(source)
 
     def fire(self, player: str, event: str, **payload):
-        for _source, fn in self.hooks.get(player, {}).get(event, []):
+        reg = self.hooks.get(player)
+        if reg is None:
+            return
+        for _source, fn in reg.subscribers(event):
             fn(self, player, **payload)
 
     # Ally checks
@@ -95,10 +187,182 @@ class GameAPI:
         return ability_id not in self.used_abilities.setdefault(player, set())
 
 
+# ---------- Precompiled continuous-ability handlers ----------
+class _ContinuousHook:
+    """
+    Hook handler compiled once per continuous ability definition, as part of
+    the definition's _AbilityIndex, and shared by every copy of the card (and
+    every game); applies the ability's effects through the firing API's
+    dispatcher.
+    """
+
+    __slots__ = ("event", "effects")
+
+    def __init__(self, event: str, effects: List[Dict[str, Any]]):
+        self.event = event
+        self.effects = effects
+
+    @classmethod
+    def of(cls, ab: Dict[str, Any]) -> "_ContinuousHook":
+        _, event = ab.get("trigger").split(":", 1)
+        return cls(event, ab.get("effects", []))
+
+    def __call__(self, api: GameAPI, player: str, **payload):
+        api.dispatcher._apply_effects(player, self.effects)
+
+
+# ---------- Per-trigger ability index ----------
+# Parsed condition: (faction, min_count, scope) or None for "always".
+_Cond = Optional[Tuple[Any, int, str]]
+
+
+def _parse_condition(ab: Dict[str, Any]) -> _Cond:
+    cond = ab.get("condition")
+    if not cond or "faction_in_play" not in cond:
+        return None
+    cfg = cond["faction_in_play"]
+    return (cfg.get("faction"), int(cfg.get("min", 1)), cfg.get("scope", "this_turn"))
+
+
+class _AbilityIndex:
+    """
+    A card definition's abilities grouped by trigger, with conditions parsed and
+    ally thresholds resolved up front, so dispatcher calls only touch abilities
+    that can fire.
+      on_enter : ((hook, ab, cond), ...) in card order; hook is the compiled
+                 _ContinuousHook of a continuous ability, None for on_play
+      by_trigger: trigger -> ((ab, cond), ...) for on_turn_start/activated/scrap_activated
+      allies   : ((ability_index, ab, faction, need), ...)
+    """
+
+    __slots__ = ("on_enter", "by_trigger", "allies")
+
+    _EMPTY: Tuple = ()
+
+    def __init__(self, abilities: List[Any]):
+        on_enter = []
+        by_trigger: Dict[str, List[Tuple[Dict[str, Any], _Cond]]] = {}
+        allies = []
+        for idx, ab in enumerate(abilities):
+            if not isinstance(ab, dict):
+                continue
+            trig = ab.get("trigger", "")
+            if trig.startswith("continuous:"):
+                on_enter.append((_ContinuousHook.of(ab), ab, None))
+            elif trig == "on_play":
+                on_enter.append((None, ab, _parse_condition(ab)))
+            elif trig == "ally":
+                # Ally means "another" card of the faction in play (count >= 2),
+                # even if a bad JSON says min=1.
+                cond = ab.get("condition") or {}
+                if "faction_in_play" in cond:
+                    cfg = cond["faction_in_play"]
+                    faction = cfg.get("faction")
+                    need = max(2, int(cfg.get("min", 1)))
+                else:
+                    faction = ab.get("faction")
+                    need = 2
+                allies.append((idx, ab, faction, need))
+            else:
+                by_trigger.setdefault(trig, []).append((ab, _parse_condition(ab)))
+        self.on_enter = tuple(on_enter)
+        self.by_trigger = {t: tuple(v) for t, v in by_trigger.items()}
+        self.allies = tuple(allies)
+
+    def get(self, trigger: str) -> Tuple[Tuple[Dict[str, Any], _Cond], ...]:
+        return self.by_trigger.get(trigger, self._EMPTY)
+
+
+_EMPTY_INDEX = _AbilityIndex([])
+
+
+# ---------- Compiled ability definitions ----------
+# A loaded card's abilities are an AbilityList of Ability dicts: compiled once,
+# with their _AbilityIndex, and read-only from then on, so the index never
+# goes stale and copies of the card can share it. To change a card's
+# abilities, assign a new list (compile_abilities() to index it up front).
+
+
+def _read_only(cls, names: Tuple[str, ...]):
+    def refuse(self, *args, **kwargs):
+        raise TypeError(
+            f"{type(self).__name__} is part of a compiled card definition; "
+            "copy it (list()/dict()) and assign the copy instead of editing it"
+        )
+
+    for name in names:
+        setattr(cls, name, refuse)
+    return cls
+
+
+class Ability(dict):
+    """One read-only ability definition of an AbilityList."""
+
+    __slots__ = ()
+
+    def __copy__(self) -> "Ability":
+        return self
+
+    def __deepcopy__(self, memo) -> "Ability":
+        return self
+
+    def __reduce__(self):
+        return (Ability, (dict(self),))
+
+
+_read_only(Ability, ("__setitem__", "__delitem__", "__ior__", "clear", "pop", "popitem", "setdefault", "update"))
+
+
+class AbilityList(list):
+    """
+    A card definition's abilities together with their _AbilityIndex, built
+    once when the card is loaded (see compile_abilities). Read-only, so every
+    copy of the card (shallow, deep or pickled) shares or rebuilds the same
+    definition.
+    """
+
+    __slots__ = ("index",)
+
+    def __init__(self, abilities=()):
+        super().__init__(ab if type(ab) is not dict else Ability(ab) for ab in abilities)
+        self.index = _AbilityIndex(self)
+
+    def __copy__(self) -> "AbilityList":
+        return self
+
+    def __deepcopy__(self, memo) -> "AbilityList":
+        return self
+
+    def __reduce__(self):
+        return (AbilityList, (list(self),))
+
+
+_read_only(
+    AbilityList,
+    ("__setitem__", "__delitem__", "__iadd__", "__imul__",
+     "append", "extend", "insert", "pop", "remove", "clear", "sort", "reverse"),
+)
+
+
+def compile_abilities(abilities) -> AbilityList:
+    """A read-only AbilityList of `abilities` with its index built."""
+    return AbilityList(abilities)
+
+
+def _ability_index(card: Dict[str, Any]) -> _AbilityIndex:
+    abilities = card.get("abilities")
+    if not abilities:
+        return _EMPTY_INDEX
+    if type(abilities) is AbilityList:
+        return abilities.index
+    return _AbilityIndex(abilities)  # ad-hoc card: compiled for this call only
+
+
 # ---------- Dispatcher ----------
 class AbilityDispatcher:
     def __init__(self, api: GameAPI):
         self.api = api
+        api.dispatcher = self
         self.vars: Dict[str, Any] = {}  # ephemeral key/value between effects
         # Track which ally abilities have already been applied this turn:
         # player -> {(id(card), ability_index)}
@@ -107,13 +371,11 @@ class AbilityDispatcher:
     # Public hook points
     def on_card_enter_play(self, player: str, card: Dict[str, Any]):
         # Resolve continuous and on_play (including conditional on_play)
-        for ab in card.get("abilities", []):
-            trig: str = ab.get("trigger", "")
-            if trig.startswith("continuous:"):
-                self._register_continuous(player, card, ab)
-            elif trig == "on_play":
-                if self._condition_ok(player, ab):
-                    self._apply_effects(player, ab.get("effects", []))
+        for hook, ab, cond in _ability_index(card).on_enter:
+            if hook is not None:
+                self._register_continuous(player, card, ab, hook)
+            elif self._cond_ok(player, cond):
+                self._apply_effects(player, ab.get("effects", []))
         self._record_played_this_turn(player, card)
 
         # After a card hits play, re-check ally abilities across the board
@@ -130,23 +392,21 @@ class AbilityDispatcher:
         self._applied_allies[player] = set()
         # Apply any on_turn_start abilities
         for card in self.api.list_zone(player, "in_play"):
-            for ab in card.get("abilities", []):
-                if ab.get("trigger") == "on_turn_start" and self._condition_ok(player, ab):
+            for ab, cond in _ability_index(card).get("on_turn_start"):
+                if self._cond_ok(player, cond):
                     self._apply_effects(player, ab.get("effects", []))
 
     def activate_card(
         self, player: str, card: Dict[str, Any], ability_id: Optional[str] = None
     ):
-        for ab in card.get("abilities", []):
-            if ab.get("trigger") != "activated":
-                continue
+        for ab, cond in _ability_index(card).get("activated"):
             if ability_id and ab.get("id") != ability_id:
                 continue
             freq = ab.get("frequency", {})
             if freq.get("once_per_turn", True) and not self.api.can_use(player, ab.get("id")):
                 self._notify("Already used this ability this turn.")
                 return
-            if self._condition_ok(player, ab):
+            if self._cond_ok(player, cond):
                 self._apply_effects(player, ab.get("effects", []))
                 if freq.get("once_per_turn", True):
                     self.api.mark_used(player, ab.get("id"))
@@ -154,8 +414,8 @@ class AbilityDispatcher:
         self._notify("No activatable ability found.")
 
     def scrap_activate(self, player: str, card: Dict[str, Any]):
-        for ab in card.get("abilities", []):
-            if ab.get("trigger") == "scrap_activated" and self._condition_ok(player, ab):
+        for ab, cond in _ability_index(card).get("scrap_activated"):
+            if self._cond_ok(player, cond):
                 self._apply_effects(player, ab.get("effects", []))
                 return
         self._notify("No scrap-activated ability on this card.")
@@ -168,29 +428,21 @@ class AbilityDispatcher:
 
     # Internals
     def _condition_ok(self, player: str, ab: Dict[str, Any]) -> bool:
-        cond = ab.get("condition")
-        if not cond:
+        return self._cond_ok(player, _parse_condition(ab))
+
+    def _cond_ok(self, player: str, cond: _Cond) -> bool:
+        if cond is None:
             return True
-        if "faction_in_play" in cond:
-            cfg = cond["faction_in_play"]
-            return self.api.faction_in_play(
-                player,
-                cfg["faction"],
-                int(cfg.get("min", 1)),
-                cfg.get("scope", "this_turn"),
-            )
-        return True
+        faction, min_count, scope = cond
+        return self.api.faction_in_play(player, faction, min_count, scope)
 
-    def _register_continuous(self, player: str, card: Dict[str, Any], ab: Dict[str, Any]):
-        trigger = ab.get("trigger")
-        _, event = trigger.split(":", 1)
+    def _register_continuous(
+        self, player: str, card: Dict[str, Any], ab: Dict[str, Any],
+        handler: Optional[_ContinuousHook] = None,
+    ):
+        handler = handler or _ContinuousHook.of(ab)
         source = card.get("name", f"id{card.get('id')}")
-        effects = ab.get("effects", [])
-
-        def hook_fn(api: GameAPI, p: str, **payload):
-            self._apply_effects(p, effects)
-
-        self.api.register_hook(player, event, hook_fn, source=source)
+        self.api.register_hook(player, handler.event, handler, source=source)
 
     def _record_played_this_turn(self, player: str, card: Dict[str, Any]):
         g = getattr(self.api, "game", None)
@@ -214,34 +466,13 @@ class AbilityDispatcher:
         in_play = self.api.list_zone(player, "in_play")
 
         for card in in_play:
-            abilities = card.get("abilities", []) or []
-            for idx, ab in enumerate(abilities):
-                if not isinstance(ab, dict):
-                    continue
-                if ab.get("trigger") != "ally":
-                    continue
-                # HARD GUARD: do not re-apply on_play/activated/scrap_activated here
-
+            # HARD GUARD: only 'ally' abilities are indexed here, never
+            # on_play/activated/scrap_activated
+            for idx, ab, faction, need in _ability_index(card).allies:
                 key = (id(card), idx)
                 if key in applied:
                     continue
-
-                # Resolve faction + require "another" card of that faction in play (count >= 2)
-                faction: Optional[str] = None
-                if "condition" in ab and "faction_in_play" in ab["condition"]:
-                    cfg = ab["condition"]["faction_in_play"]
-                    faction = cfg.get("faction")
-                    # Even if a bad JSON says min=1, ally semantics need at least 2 in play.
-                    need = max(2, int(cfg.get("min", 1)))
-                else:
-                    faction = ab.get("faction")
-                    need = 2  # ally means "another" card in play
-
-                ok = False
-                if faction:
-                    ok = self.api.faction_in_play(player, faction, need, "in_play")
-
-                if ok:
+                if faction and self.api.faction_in_play(player, faction, need, "in_play"):
                     self._apply_effects(player, ab.get("effects", []))
                     applied.add(key)
 
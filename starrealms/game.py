@@ -5,16 +5,19 @@ Handles players, trade row, turn order, and win conditions.
 """
 
 import random
-from .cards import CARDS, build_trade_deck, EXPLORER_NAME
+
+from .cards import CARDS, CARD_INDEX, new_trade_deck, EXPLORER_NAME
+from .cards.lazy_deck import LazyTradeDeck
 from .player import Player, trigger_effects, collect_effects
 from .effects import apply_effects
+from .zobrist import ZobristRow, compute_state_hash, debug_enabled, turn_key
 
 # Unified ability runner (data-driven cards)
 from starrealms.engine.unified_dispatcher import GameAPI, AbilityDispatcher
 
 
 def _card_template(name: str):
-    return next(c for c in CARDS if c["name"] == name)
+    return CARD_INDEX[name]
 
 
 def _make_starting_deck():
@@ -24,12 +27,81 @@ def _make_starting_deck():
 
 
 class Game:
-    def __init__(self, player_names=("Player 1", "Player 2")):
+    # Cross-check every state_hash read against a full recomputation.
+    zobrist_debug = debug_enabled()
+
+    def __setattr__(self, name, value):
+        if self.__dict__.get("hashing"):
+            if name == "trade_row":
+                old = self.__dict__.get(name)
+                if not (isinstance(value, ZobristRow) and value._owner is self):
+                    value = ZobristRow(value or [], owner=self)
+                if old is not value:
+                    self._zx((old.zhash() if isinstance(old, ZobristRow) else 0) ^ value.zhash())
+            elif name == "turn":
+                old = self.__dict__.get(name)
+                self._zx((turn_key(old) if old is not None else 0) ^ turn_key(value))
+        super().__setattr__(name, value)
+
+    def _zx(self, delta: int) -> None:
+        self.__dict__["_zhash"] = self.__dict__.get("_zhash", 0) ^ delta
+
+    def enable_hashing(self) -> None:
+        """Switch to incremental Zobrist hashing, as Game(hashing=True) does from the start."""
+        if self.__dict__.get("hashing"):
+            return
+        self.__dict__["hashing"] = True
+        self.__dict__["trade_row"] = ZobristRow(self.trade_row, owner=self)
+        self.__dict__["_zhash"] = self.trade_row.zhash() ^ turn_key(self.turn)
+        for p in self.players:
+            p.enable_hashing()
+
+    @property
+    def state_hash(self) -> int:
+        """
+        64-bit Zobrist hash of the game state (see starrealms.zobrist). Kept up
+        to date incrementally when hashing is on, computed on read otherwise.
+        """
+        if not self.__dict__.get("hashing"):
+            return compute_state_hash(self)
+        h = self.__dict__.get("_zhash", 0)
+        for p in self.players:
+            h ^= p.__dict__.get("_zhash", 0)
+        if self.zobrist_debug:
+            full = compute_state_hash(self)
+            if full != h:
+                raise AssertionError(
+                    f"Zobrist hash drift: incremental {h:#018x} != recomputed {full:#018x}"
+                )
+        return h
+
+    def __getstate__(self):
+        # Copies (search worlds, snapshots) are not observed: observers stay with the original.
+        state = self.__dict__.copy()
+        state["card_observers"] = []
+        return state
+
+    def __init__(
+        self,
+        player_names=("Player 1", "Player 2"),
+        lazy_trade_deck: bool = False,
+        hashing: bool = False,
+        seed=None,
+    ):
+        # Incremental state_hash upkeep (search agents); plain games skip its cost.
+        self.hashing = hashing
         self.log = []
+        # card_observers: callables run by card_event() on each card gained or scrapped.
+        self.card_observers = []
 
-        # Trade deck & row
-        self.trade_deck = build_trade_deck()
-        random.shuffle(self.trade_deck)
+        # The game's own RNG: every shuffle and random draw of this game uses it,
+        # so copies replay identically and concurrent games never share a stream.
+        # Unseeded games take their seed from `random`, so random.seed() still
+        # reproduces them.
+        self.rng = random.Random(random.getrandbits(64) if seed is None else seed)
+
+        # Trade deck & row (lazy: remaining counts, drawn on demand; see cards.lazy_deck)
+        self.trade_deck = LazyTradeDeck(rng=self.rng) if lazy_trade_deck else new_trade_deck(self.rng)
         self.trade_row = [self.trade_deck.pop() for _ in range(5)]  # 5 fixed slots
         self.scrap_heap = []
 
@@ -46,7 +118,7 @@ class Game:
         for name in player_names:
             starting_deck = _make_starting_deck()
             is_human = str(name).lower() in ("you", "player 1")
-            self.players.append(Player(name, starting_deck, is_human=is_human))
+            self.players.append(Player(name, starting_deck, is_human=is_human, hashing=hashing, rng=self.rng))
 
         # Turn pointers
         self.turn = 0  # 0/1 index of current player
@@ -187,6 +259,17 @@ class Game:
         self.turn += 1
         self.refill_trade_row()
 
+    # --- card events ---
+    def card_event(self, player: "Player", kind: str, card: dict):
+        """
+        Tell each of card_observers(game, player, kind, card) that `player`
+        acquired (kind "acquire": bought, or gained by an effect) or scrapped
+        (kind "scrap": from hand, discard or play) `card`. Trade row cards
+        scrapped by an effect belong to no player and are not reported.
+        """
+        for observer in self.card_observers:
+            observer(self, player, kind, card)
+
     # --- purchases ---
     def _acquire(self, player: "Player", card: dict):
         card_copy = card.copy()
@@ -197,6 +280,7 @@ class Game:
         else:
             player.discard_pile.append(card_copy)
             self.log.append(f"{player.name} gains {card_copy['name']} → discard")
+        self.card_event(player, "acquire", card_copy)
 
     def buy_explorer(self, player: "Player"):
         player.trade_pool -= 2
@@ -270,6 +354,7 @@ class Game:
             return
         self.scrap_heap.append(card)
         self.log.append(f"{p.name} scraps {card.get('name','?')}")
+        self.card_event(p, "scrap", card)
 
     # --- Market helpers ---
     def trade_row_filtered(self, filt: dict):
@@ -323,8 +408,10 @@ class Game:
             self.log.append(f"{p.name}'s base {base.get('name','?')} destroyed")
 
     def _acquire_topdeck(self, player: "Player", card: dict):
-        player.deck.insert(0, card.copy())
+        card_copy = card.copy()
+        player.deck.insert(0, card_copy)
         self.log.append(f"{player.name} gains {card['name']} → top-deck")
+        self.card_event(player, "acquire", card_copy)
 
     # --- Tracking for Blob World / ally (used by dispatcher) ---
     def record_played_this_turn(self, player_name: str, card: dict):
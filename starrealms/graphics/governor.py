@@ -0,0 +1,61 @@
+# starrealms/graphics/governor.py
+"""
+Event-driven frame pacing for the pygame front ends.
+
+Instead of polling pygame.event.get() at a fixed 60 FPS, loops block in
+pygame.event.wait() with a timeout chosen by FrameGovernor:
+
+- right after input (or while something animates) frames come at max_fps;
+- once input stops the rate halves every `cooldown_ms` down to idle_fps;
+- a caller deadline (next cursor blink, animation step) shortens the wait.
+
+An idle window therefore wakes a couple of times a second instead of 60.
+"""
+
+from typing import List, Optional
+
+import pygame
+
+
+def _now_ms() -> int:
+    return pygame.time.get_ticks()
+
+
+class FrameGovernor:
+    def __init__(self, max_fps: float = 60.0, idle_fps: float = 2.0, cooldown_ms: int = 500):
+        self.max_fps = max_fps
+        self.idle_fps = idle_fps
+        self.cooldown_ms = cooldown_ms
+        self._last_active = _now_ms()
+        self.frames = 0  # wake-ups, for benchmarks
+
+    def activity(self, now: Optional[int] = None) -> None:
+        """Something happened (input, animation): go back to full rate."""
+        self._last_active = _now_ms() if now is None else now
+
+    def fps(self, now: Optional[int] = None) -> float:
+        idle = (_now_ms() if now is None else now) - self._last_active
+        if idle < self.cooldown_ms:
+            return self.max_fps
+        halvings = (idle - self.cooldown_ms) / self.cooldown_ms + 1.0
+        return max(self.idle_fps, self.max_fps / 2.0**halvings)
+
+    def timeout_ms(self, deadline: Optional[int] = None, now: Optional[int] = None) -> int:
+        """How long the next wait may block; `deadline` is an absolute get_ticks() time."""
+        now = _now_ms() if now is None else now
+        t = 1000.0 / self.fps(now)
+        if deadline is not None:
+            t = min(t, deadline - now)
+        return max(0, int(t))
+
+    def wait(self, deadline: Optional[int] = None) -> List[pygame.event.Event]:
+        """Block until an event or the governed timeout; returns every pending event."""
+        timeout = self.timeout_ms(deadline)
+        # wait(0) would block forever: a due deadline only polls.
+        first = pygame.event.wait(timeout) if timeout > 0 else pygame.event.poll()
+        events = [] if first.type == pygame.NOEVENT else [first]
+        events.extend(pygame.event.get())
+        self.frames += 1
+        if events:
+            self.activity()
+        return events
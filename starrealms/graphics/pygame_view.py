@@ -9,6 +9,8 @@
 import pygame
 from typing import List, Tuple, Dict, Optional
 
+from starrealms.graphics.governor import FrameGovernor
+
 CARD_W, CARD_H = 120, 170
 PADDING = 10
 FONT_SIZE = 18
@@ -44,7 +46,26 @@ class CardView:
         self.index = index
         self.card = card
 
+class _Region:
+    """One screen area: repainted only when its key changes (or a dirty rect crosses it)."""
+
+    __slots__ = ("name", "key", "rect", "paint")
+
+    def __init__(self, name: str, key, rect: pygame.Rect, paint):
+        self.name = name
+        self.key = key
+        self.rect = rect
+        self.paint = paint
+
+
+def card_key(c: Dict) -> Tuple:
+    """Everything a card face shows; equal keys render identical surfaces."""
+    return (safe_name(c), safe_faction(c), safe_cost(c), is_outpost(c))
+
+
 class StarRealmsPygameView:
+    CACHE_LIMIT = 512  # cached text / card surfaces before the caches are dropped
+
     def __init__(self, game, w=1280, h=800, fps=60):
         pygame.init()
         pygame.display.set_caption("Star Realms (Pygame)")
@@ -57,6 +78,59 @@ class StarRealmsPygameView:
         self.hover: Optional[CardView] = None
         self.message: str = ""
         self.views: List[CardView] = []
+        self.btn_end = pygame.Rect(838, 594, 150, 40)
+        self.btn_play_all = pygame.Rect(1010, 594, 150, 40)
+        # Render caches: card faces by (card_key, highlight), text by (font, text, color).
+        self._card_surfs: Dict[Tuple, pygame.Surface] = {}
+        self._text_surfs: Dict[Tuple, pygame.Surface] = {}
+        # Last painted frame: region name -> (key, rect), and the hovered card.
+        self._painted: Dict[str, Tuple] = {}
+        self._painted_hover: Optional[Tuple[str, int]] = None
+        self._full_repaint = True
+
+    def invalidate(self) -> None:
+        """Repaint everything on the next render (window exposed, resized, ...)."""
+        self._full_repaint = True
+
+    # ---------- Cached surfaces ----------
+    def _text(self, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        key = (id(font), text, color)
+        surf = self._text_surfs.get(key)
+        if surf is None:
+            if len(self._text_surfs) >= self.CACHE_LIMIT:
+                self._text_surfs.clear()
+            surf = self._text_surfs[key] = font.render(text, True, color)
+        return surf
+
+    def _card_surface(self, c: Dict, highlight: bool) -> pygame.Surface:
+        key = (card_key(c), highlight)
+        surf = self._card_surfs.get(key)
+        if surf is None:
+            if len(self._card_surfs) >= self.CACHE_LIMIT:
+                self._card_surfs.clear()
+            surf = self._card_surfs[key] = self._render_card(c, highlight)
+        return surf
+
+    def _render_card(self, c: Dict, highlight: bool) -> pygame.Surface:
+        surf = pygame.Surface((CARD_W, CARD_H), pygame.SRCALPHA)
+        rect = surf.get_rect()
+        fac_color = FACTION_COLORS.get(safe_faction(c), GRAY)
+        # panel
+        pygame.draw.rect(surf, PANEL_HL if highlight else PANEL, rect, border_radius=12)
+        # faction stripe
+        stripe = rect.copy()
+        stripe.height = 22
+        pygame.draw.rect(surf, fac_color, stripe, border_radius=12)
+        # name
+        surf.blit(self._text(self.font, safe_name(c), TEXT), (8, 26))
+        # cost badge
+        badge = pygame.Rect(rect.right - 32, 6, 26, 26)
+        pygame.draw.ellipse(surf, YELLOW, badge)
+        surf.blit(self._text(self.font, str(safe_cost(c)), (20, 20, 20)), (badge.x + 8, badge.y + 4))
+        # outpost banner
+        if is_outpost(c):
+            surf.blit(self._text(self.font, "OUTPOST", TEXT), (8, rect.bottom - 24))
+        return surf
 
     # ---------- Layout helpers ----------
     def _layout_row(self, cards: List[Dict], start_y: int, zone: str, left_margin=10) -> List[CardView]:
@@ -69,115 +143,138 @@ class StarRealmsPygameView:
         return rendered
 
     def _draw_card(self, cv: CardView, highlight=False):
-        c = cv.card
-        name = safe_name(c)
-        faction = safe_faction(c)
-        cost = safe_cost(c)
-        fac_color = FACTION_COLORS.get(faction, GRAY)
-        # panel
-        color = PANEL_HL if highlight else PANEL
-        pygame.draw.rect(self.screen, color, cv.rect, border_radius=12)
-        # faction stripe
-        stripe = cv.rect.copy()
-        stripe.height = 22
-        pygame.draw.rect(self.screen, fac_color, stripe, border_radius=12)
-        # name
-        txt = self.font.render(name, True, TEXT)
-        self.screen.blit(txt, (cv.rect.x + 8, cv.rect.y + 26))
-        # cost badge
-        badge = pygame.Rect(cv.rect.right - 32, cv.rect.y + 6, 26, 26)
-        pygame.draw.ellipse(self.screen, YELLOW, badge)
-        cost_surf = self.font.render(str(cost), True, (20, 20, 20))
-        self.screen.blit(cost_surf, (badge.x + 8, badge.y + 4))
-        # outpost banner
-        if is_outpost(c):
-            tag = self.font.render("OUTPOST", True, TEXT)
-            self.screen.blit(tag, (cv.rect.x + 8, cv.rect.bottom - 24))
+        self.screen.blit(self._card_surface(cv.card, highlight), cv.rect.topleft)
 
     def _draw_panel(self, rect: pygame.Rect, label: str, value_surf: Optional[pygame.Surface] = None, color=PANEL):
         pygame.draw.rect(self.screen, color, rect, border_radius=12)
-        lab = self.big.render(label, True, TEXT)
+        lab = self._text(self.big, label, TEXT)
         self.screen.blit(lab, (rect.x + 12, rect.y + 10))
         if value_surf:
             self.screen.blit(value_surf, (rect.right - value_surf.get_width() - 12, rect.y + 12))
 
-    # ---------- Render ----------
-    def render(self):
-        self.screen.fill(BG)
-        self.views = []
+    def _is_hover(self, cv: CardView) -> bool:
+        return self.hover is not None and (self.hover.zone, self.hover.index) == (cv.zone, cv.index)
+
+    def _card_row(self, name: str, label_rect: Optional[pygame.Rect], label: str, cards, y: int, left=10) -> _Region:
+        views = self._layout_row(cards, y, name, left_margin=left)
+        self.views.extend(views)
+        rect = label_rect.copy() if label_rect is not None else pygame.Rect(left, y, 0, 0)
+        for cv in views:
+            rect.union_ip(cv.rect)
 
+        def paint():
+            if label_rect is not None:
+                self._draw_panel(label_rect, label)
+            for cv in views:
+                self._draw_card(cv, highlight=self._is_hover(cv))
+
+        return _Region(name, tuple(card_key(c) for c in cards), rect, paint)
+
+    def _regions(self) -> List[_Region]:
+        """Lay out the frame (cheap: no drawing) as regions in paint order."""
+        self.views = []
         p = self.game.current_player()
         o = self.game.opponent()
+        regions = []
 
-        # Top: opponent panels
+        # Top: opponent panel
         opp_panel = pygame.Rect(10, 10, 380, 80)
-        opp_stats = self.font.render(
-            f"Authority {o.authority}  |  Bases {len(getattr(o, 'bases', []))}", True, TEXT)
-        self._draw_panel(opp_panel, "Opponent", opp_stats)
+        opp_text = f"Authority {o.authority}  |  Bases {len(getattr(o, 'bases', []))}"
 
-        # Opponent bases
-        ob_start = opp_panel.bottom + 10
-        ob_views = self._layout_row(getattr(o, "bases", []), ob_start, "op_bases")
-        self.views.extend(ob_views)
-        for cv in ob_views:
-            self._draw_card(cv, highlight=(self.hover is cv))
+        def paint_opponent():
+            self._draw_panel(opp_panel, "Opponent", self._text(self.font, opp_text, TEXT))
 
+        regions.append(_Region("opponent", opp_text, opp_panel, paint_opponent))
+        # Opponent bases
+        regions.append(self._card_row("op_bases", None, "", getattr(o, "bases", []), opp_panel.bottom + 10))
         # Trade row
         tr_label = pygame.Rect(10, 200, 780, 40)
-        self._draw_panel(tr_label, "Trade Row")
-        tr_views = self._layout_row(getattr(self.game, "trade_row", []), tr_label.bottom + 10, "trade")
-        self.views.extend(tr_views)
-        for cv in tr_views:
-            self._draw_card(cv, highlight=(self.hover is cv))
-
+        regions.append(self._card_row("trade", tr_label, "Trade Row", getattr(self.game, "trade_row", []), tr_label.bottom + 10))
         # In Play
         ip_label = pygame.Rect(10, 430, 780, 40)
-        self._draw_panel(ip_label, "In Play")
-        ip_views = self._layout_row(getattr(p, "in_play", []), ip_label.bottom + 10, "in_play")
-        self.views.extend(ip_views)
-        for cv in ip_views:
-            self._draw_card(cv, highlight=(self.hover is cv))
-
+        regions.append(self._card_row("in_play", ip_label, "In Play", getattr(p, "in_play", []), ip_label.bottom + 10))
         # Player bases
         pb_label = pygame.Rect(10, 610, 780, 40)
-        self._draw_panel(pb_label, "Your Bases")
-        pb_views = self._layout_row(getattr(p, "bases", []), pb_label.bottom + 10, "bases")
-        self.views.extend(pb_views)
-        for cv in pb_views:
-            self._draw_card(cv, highlight=(self.hover is cv))
-
+        regions.append(self._card_row("bases", pb_label, "Your Bases", getattr(p, "bases", []), pb_label.bottom + 10))
         # Hand (right side)
         hand_panel = pygame.Rect(820, 10, 450, 40)
-        self._draw_panel(hand_panel, "Your Hand")
-        h_views = self._layout_row(getattr(p, "hand", []), hand_panel.bottom + 10, "hand", left_margin=820)
-        self.views.extend(h_views)
-        for cv in h_views:
-            self._draw_card(cv, highlight=(self.hover is cv))
+        regions.append(self._card_row("hand", hand_panel, "Your Hand", getattr(p, "hand", []), hand_panel.bottom + 10, left=820))
 
         # Stats & controls
         stats_panel = pygame.Rect(820, 430, 450, 220)
-        pv = self.font.render(
-            f"Authority: {p.authority}   Trade: {getattr(p, 'trade_pool', 0)}   Combat: {getattr(p, 'combat_pool', 0)}",
-            True, TEXT
+        stats_text = (
+            f"Authority: {p.authority}   Trade: {getattr(p, 'trade_pool', 0)}   Combat: {getattr(p, 'combat_pool', 0)}"
         )
-        self._draw_panel(stats_panel, "Status", pv)
-
-        # Buttons
         self.btn_end = pygame.Rect(stats_panel.x + 18, stats_panel.bottom - 56, 150, 40)
         self.btn_play_all = pygame.Rect(stats_panel.x + 190, stats_panel.bottom - 56, 150, 40)
-        self._button(self.btn_end, "End Turn")
-        self._button(self.btn_play_all, "Play All")
+
+        def paint_stats():
+            self._draw_panel(stats_panel, "Status", self._text(self.font, stats_text, TEXT))
+            self._button(self.btn_end, "End Turn")
+            self._button(self.btn_play_all, "Play All")
+
+        regions.append(_Region("status", stats_text, stats_panel, paint_stats))
 
         # Message line
-        if self.message:
-            msg = self.font.render(self.message, True, ACCENT)
-            self.screen.blit(msg, (820, 670))
+        msg_rect = pygame.Rect(820, 670, self.screen.get_width() - 820, FONT_SIZE + 4)
+        message = self.message
+
+        def paint_message():
+            if message:
+                self.screen.blit(self._text(self.font, message, ACCENT), msg_rect.topleft)
+
+        regions.append(_Region("message", message, msg_rect, paint_message))
+        return regions
 
-        pygame.display.flip()
+    # ---------- Render ----------
+    def render(self) -> List[pygame.Rect]:
+        """
+        Repaint only what changed since the last call (zone contents, stats,
+        message, hover) and push just those rects to the display. Returns the
+        updated rects; [] when the frame is unchanged.
+        """
+        regions = self._regions()
+        hover = None if self.hover is None else (self.hover.zone, self.hover.index)
+        screen_rect = self.screen.get_rect()
+
+        if self._full_repaint:
+            dirty = [screen_rect]
+        else:
+            dirty = []
+            for r in regions:
+                before = self._painted.get(r.name)
+                if before is None:
+                    dirty.append(r.rect)
+                elif before[0] != r.key:
+                    dirty.append(r.rect.union(before[1]))
+            if hover != self._painted_hover:
+                for key in (hover, self._painted_hover):
+                    cv = next((v for v in self.views if (v.zone, v.index) == key), None)
+                    if cv is not None:
+                        dirty.append(cv.rect)
+            dirty = [d.clip(screen_rect) for d in dirty]
+            dirty = [d for d in dirty if d.width and d.height]
+
+        for area in dirty:
+            self.screen.set_clip(area)
+            self.screen.fill(BG)
+            for r in regions:
+                if r.rect.colliderect(area):
+                    r.paint()
+        self.screen.set_clip(None)
+
+        if self._full_repaint:
+            pygame.display.flip()
+        elif dirty:
+            pygame.display.update(dirty)
+        self._full_repaint = False
+        self._painted = {r.name: (r.key, r.rect) for r in regions}
+        self._painted_hover = hover
+        return dirty
 
     def _button(self, rect: pygame.Rect, label: str):
         pygame.draw.rect(self.screen, (52, 64, 78), rect, border_radius=10)
-        txt = self.font.render(label, True, TEXT)
+        txt = self._text(self.font, label, TEXT)
         self.screen.blit(txt, (rect.centerx - txt.get_width()//2, rect.centery - txt.get_height()//2))
 
     # ---------- Interaction ----------
@@ -188,12 +285,17 @@ class StarRealmsPygameView:
         return None
 
     def loop(self):
+        # Event-driven: sleeps in pygame.event.wait between frames; render() only
+        # repaints what changed, so idle frames cost almost nothing.
+        governor = FrameGovernor(max_fps=self.fps)
+        self.render()
         running = True
         while running:
-            dt = self.clock.tick(self.fps)
-            for e in pygame.event.get():
+            for e in governor.wait():
                 if e.type == pygame.QUIT:
                     running = False
+                elif e.type in (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE):
+                    self.invalidate()
                 elif e.type == pygame.MOUSEMOTION:
                     self.hover = self._card_under_mouse(e.pos)
                 elif e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
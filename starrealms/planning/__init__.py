@@ -0,0 +1,27 @@
+# starrealms/planning/__init__.py
+"""
+Exact, memoized solvers the AI agents use for turn decisions.
+"""
+
+from .attack import AttackPlan, plan_attack
+from .determinize import Determinizer, KnowledgeTracker, clone_game
+from .draws import HandOutlook, hand_distribution, next_hand
+from .lethal import LethalLine, execute_line, find_lethal, has_lethal
+from .transposition import TTEntry, TranspositionTable
+
+__all__ = [
+    "AttackPlan",
+    "plan_attack",
+    "Determinizer",
+    "KnowledgeTracker",
+    "clone_game",
+    "HandOutlook",
+    "hand_distribution",
+    "next_hand",
+    "LethalLine",
+    "execute_line",
+    "find_lethal",
+    "has_lethal",
+    "TTEntry",
+    "TranspositionTable",
+]
@@ -0,0 +1,115 @@
+# starrealms/planning/attack.py
+"""
+Optimal combat allocation for an attack step.
+
+Given a combat pool, the opponent's bases and authority, choose which bases to
+destroy and how much to send to the face, honoring the outpost rule (every
+outpost must fall before normal bases or authority can be targeted).
+
+- Lethal always wins: if clearing the outposts leaves >= authority, go face.
+- Otherwise maximize value = sum(base removal values) + face damage * face weight,
+  where the face weight grows as the opponent's authority gets low.
+- Solved as two 0/1 knapsacks (outposts only / normals after all outposts) and
+  memoized on (combat, sorted (defense, outpost) pairs, clamped authority), so it
+  is cheap enough to call inside rollouts.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
+
+# ---------------- Value model ----------------
+BASE_REMOVAL_BONUS = 2.5  # destroying a base denies its effect on every future turn
+OUTPOST_REMOVAL_BONUS = 0.5  # ...and an outpost also stops shielding
+FACE_URGENCY = 0.05  # extra value per face point for each authority below the threshold
+URGENCY_THRESHOLD = 20
+
+LETHAL_VALUE = 1e9
+
+
+@dataclass(frozen=True)
+class AttackPlan:
+    """destroy: indexes into the bases passed to plan_attack, in execution order."""
+
+    destroy: Tuple[int, ...]
+    face: int
+    lethal: bool
+    value: float
+
+
+def _defense(b: Dict[str, Any]) -> int:
+    return int(b.get("defense", 0) or 0)
+
+
+def base_value(defense: int, outpost: bool) -> float:
+    return defense + BASE_REMOVAL_BONUS + (OUTPOST_REMOVAL_BONUS if outpost else 0.0)
+
+
+def face_weight(authority: int) -> float:
+    return 1.0 + FACE_URGENCY * max(0, URGENCY_THRESHOLD - authority)
+
+
+def _knapsack(
+    items: Sequence[Tuple[int, float]], capacity: int
+) -> Tuple[float, int, Tuple[int, ...]]:
+    """
+    0/1 knapsack over (weight, value) items with integer capacity.
+    Returns (best value, weight used, chosen item positions); ties prefer less weight.
+    """
+    # best[c] = (value, -weight, chosen) using capacity c
+    best: List[Tuple[float, int, Tuple[int, ...]]] = [(0.0, 0, ())] * (capacity + 1)
+    for pos, (w, v) in enumerate(items):
+        if w > capacity:
+            continue
+        for c in range(capacity, w - 1, -1):
+            pv, pnw, pch = best[c - w]
+            cand = (pv + v, pnw - w, pch + (pos,))
+            if cand[:2] > best[c][:2]:
+                best[c] = cand
+    v, nw, chosen = max(best, key=lambda t: t[:2])
+    return v, -nw, chosen
+
+
+@lru_cache(maxsize=65536)
+def _solve(
+    combat: int, bases: Tuple[Tuple[int, bool], ...], authority: int
+) -> Tuple[Tuple[int, ...], int, bool, float]:
+    """Canonical solver; `bases` is sorted, returned positions index into it."""
+    outposts = [i for i, (_d, o) in enumerate(bases) if o]
+    normals = [i for i, (_d, o) in enumerate(bases) if not o]
+    fw = face_weight(authority)
+
+    # A) Some outpost survives: only outposts can be hit, the rest is wasted.
+    items = [(bases[i][0], base_value(*bases[i])) for i in outposts]
+    va, _w, chosen = _knapsack(items, combat)
+    plan = (tuple(outposts[k] for k in chosen), 0, False, va)
+
+    # B) Clear every outpost, then split the rest between normals and face.
+    shield = sum(bases[i][0] for i in outposts)
+    if shield <= combat:
+        rest = combat - shield
+        cleared = sum(base_value(*bases[i]) for i in outposts)
+        if rest >= authority:
+            return (tuple(outposts), rest, True, LETHAL_VALUE)
+        # Each normal base trades its defense in face damage for its removal value.
+        items = [(bases[i][0], base_value(*bases[i]) - bases[i][0] * fw) for i in normals]
+        gain, used, chosen = _knapsack(items, rest)
+        vb = cleared + rest * fw + gain
+        if vb > plan[3]:
+            plan = (tuple(outposts) + tuple(normals[k] for k in chosen), rest - used, False, vb)
+    return plan
+
+
+def plan_attack(combat: int, bases: Sequence[Dict[str, Any]], authority: int) -> AttackPlan:
+    """
+    Best use of `combat` against `bases` (opponent's base dicts) and `authority`.
+    Outposts come first in AttackPlan.destroy, so executing it in order is legal.
+    """
+    combat = max(0, int(combat or 0))
+    order = sorted(range(len(bases)), key=lambda i: (_defense(bases[i]), bool(bases[i].get("outpost"))))
+    canon = tuple((_defense(bases[i]), bool(bases[i].get("outpost"))) for i in order)
+    # Authority above both the pool and the urgency threshold behaves identically.
+    auth_key = min(int(authority), max(URGENCY_THRESHOLD, combat + 1))
+    destroy, face, lethal, value = _solve(combat, canon, auth_key)
+    return AttackPlan(tuple(order[k] for k in destroy), face, lethal, value)
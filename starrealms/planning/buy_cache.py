@@ -0,0 +1,143 @@
+# starrealms/planning/buy_cache.py
+"""
+LRU-bounded cache of buy decisions.
+
+A purchase plan depends only on tiny inputs: the scoring policy (agent class +
+weights), a turn bucket, the trade pool, the buys left and the five trade-row
+card names. Self-play batches hit the same situations over and over, so plans
+are cached on a canonical key built from those inputs and shared by every agent
+in the process (one cache per worker). Access is locked, so server and ponder
+threads can share one cache.
+
+The cache can be saved to / loaded from a JSON file; the file records a
+fingerprint of the card data so stale decisions are dropped when cards change.
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Sequence, Tuple
+
+DEFAULT_MAXSIZE = 50_000
+_FILE_VERSION = 1
+
+Key = Tuple[Hashable, ...]
+
+
+def policy_key(kind: str, weights: Dict[str, float]) -> str:
+    """Canonical short hash of a scoring policy (agent kind + weight vector)."""
+    blob = json.dumps([kind, sorted((k, float(v)) for k, v in weights.items())])
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16]
+
+
+def cards_fingerprint() -> str:
+    from starrealms.cards import CARDS
+
+    blob = json.dumps(CARDS, sort_keys=True, default=str)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16]
+
+
+class BuyDecisionCache:
+    """Least-recently-used map from decision keys to planned picks (thread-safe)."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Key, Tuple[Any, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Key) -> Optional[Tuple[Any, ...]]:
+        with self._lock:
+            val = self._data.get(key)
+            if val is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return val
+
+    def put(self, key: Key, picks: Sequence[Any]) -> None:
+        with self._lock:
+            self._put(key, tuple(picks))
+
+    def _put(self, key: Key, picks: Tuple[Any, ...]) -> None:
+        self._data[key] = picks
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def _items(self):
+        with self._lock:
+            return list(self._data.items())
+
+    def merge(self, other: "BuyDecisionCache") -> int:
+        """Copy every entry of `other` in (as most recent); returns how many."""
+        items = other._items()
+        with self._lock:
+            for key, picks in items:
+                self._put(key, picks)
+        return len(items)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            size, hits, misses = len(self._data), self.hits, self.misses
+        total = hits + misses
+        return {
+            "size": size,
+            "maxsize": self.maxsize,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": (hits / total) if total else 0.0,
+        }
+
+    # ---------------- persistence ----------------
+    def save(self, path: str) -> None:
+        """Write entries (oldest first) atomically as JSON."""
+        d = os.path.dirname(path)
+        if d:
+            os.makedirs(d, exist_ok=True)
+        payload = {
+            "version": _FILE_VERSION,
+            "cards": cards_fingerprint(),
+            "entries": [[list(k), list(v)] for k, v in self._items()],
+        }
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(payload, f)
+        os.replace(tmp, path)
+
+    def load(self, path: str) -> int:
+        """Merge entries from `path`; returns how many were loaded (0 if missing/stale)."""
+        try:
+            with open(path, "r") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return 0
+        if payload.get("version") != _FILE_VERSION or payload.get("cards") != cards_fingerprint():
+            return 0
+        n = 0
+        for key, picks in payload.get("entries", []):
+            # JSON turns tuples into lists; the row names are the trailing tuple.
+            self.put(tuple(tuple(k) if isinstance(k, list) else k for k in key), picks)
+            n += 1
+        return n
+
+
+_shared = BuyDecisionCache()
+
+
+def shared_buy_cache() -> BuyDecisionCache:
+    """The process-wide cache used by the AI agents."""
+    return _shared
@@ -0,0 +1,197 @@
+# starrealms/planning/determinize.py
+"""
+Determinization: sample a full game state that agrees with everything one
+player (the observer) can know, for information-set search.
+
+Hidden from the observer are the order of every player's deck, the contents
+of the other players' hands and the order of the trade deck. Their
+compositions are public: a player's hand + deck is what they own minus their
+public zones, and the trade deck is whatever has not been dealt to the row.
+
+Some hidden cards do have a known place. A card gained to the top of a deck
+is announced, so the observer knows where it sits until it is played or
+shuffled away, including in the opponent's hand once drawn. KnowledgeTracker
+follows this by card identity: a card seen for the first time in a deck or
+hand was gained there (every other card reaches a hidden zone from a public
+one, or was dealt at the start), and it stays known until it shows up in a
+public zone. Call observe() at least once per turn.
+
+Determinizer fixes the free slots of the real game once; each world is then
+an in-place shuffle of those slots in a clone, through buffers allocated up
+front, so a search can draw thousands of worlds per decision:
+
+    det = Determinizer(game, me, tracker, seed=1)
+    for world in det.worlds(1000):
+        ...  # play a rollout in `world`
+
+clone_game() copies a Game several times faster than copy.deepcopy by
+sharing the read-only card data (printed abilities, the card database)
+between copies.
+"""
+
+from __future__ import annotations
+import copy
+import random
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from starrealms.cards import CARDS
+
+HIDDEN_ZONES = ("hand", "deck")
+PUBLIC_ZONES = ("discard_pile", "in_play", "bases", "scrap_heap")
+
+# (zone, index) of a hidden card in one player's zones
+_Slot = Tuple[str, int]
+
+
+def _cards(game) -> Iterator[Dict[str, Any]]:
+    if isinstance(game.trade_deck, list):  # a LazyTradeDeck holds no card instances
+        yield from game.trade_deck
+    yield from (c for c in game.trade_row if c)
+    yield from game.scrap_heap
+    for p in game.players:
+        for zone in HIDDEN_ZONES + PUBLIC_ZONES:
+            yield from getattr(p, zone, None) or ()
+
+
+def _shared(game) -> Dict[int, Any]:
+    """deepcopy memo entries for objects every copy can share: prototypes and their nested data."""
+    memo: Dict[int, Any] = {id(game.card_db): game.card_db}
+    for proto in list(CARDS) + list(game.card_db) + [game.explorer_card]:
+        memo[id(proto)] = proto
+        for v in proto.values():
+            if isinstance(v, (list, dict)):
+                memo[id(v)] = v
+    return memo
+
+
+def _copy_card(card: Dict[str, Any], shared: Dict[int, Any]) -> Dict[str, Any]:
+    # Instances are shallow copies of prototypes: nested values still shared
+    # with the prototype are never mutated; anything else (_rt, ...) is private.
+    out = card.copy()
+    for k, v in card.items():
+        if type(v) in (list, dict) and id(v) not in shared:
+            out[k] = copy.deepcopy(v)
+    return out
+
+
+def clone_game(game, shared: Optional[Dict[int, Any]] = None):
+    """An independent copy of `game` (same state_hash); card data is shared, not copied."""
+    shared = shared if shared is not None else _shared(game)
+    memo = dict(shared)
+    for c in _cards(game):
+        if id(c) not in memo:
+            memo[id(c)] = _copy_card(c, shared)
+    memo[id(game.log)] = list(game.log)
+    return copy.deepcopy(game, memo)
+
+
+class KnowledgeTracker:
+    """Which cards in hidden zones have a location known to every player."""
+
+    def __init__(self, game=None):
+        self._seen: Dict[int, Dict[str, Any]] = {}  # id -> card (kept alive so ids stay unique)
+        self._known: Dict[int, Dict[str, Any]] = {}
+        if game is not None:
+            self.observe(game, initial=True)
+
+    def observe(self, game, initial: bool = False) -> None:
+        """Catch up with `game`. initial: the cards dealt so far are not known (opening decks)."""
+        for p in game.players:
+            for zone in PUBLIC_ZONES:
+                for c in getattr(p, zone, None) or ():
+                    self._known.pop(id(c), None)
+                    self._seen[id(c)] = c
+            for zone in HIDDEN_ZONES:
+                for c in getattr(p, zone):
+                    if id(c) not in self._seen:
+                        self._seen[id(c)] = c
+                        if not initial:
+                            self._known[id(c)] = c
+
+    def is_known(self, card) -> bool:
+        return id(card) in self._known
+
+    def known(self, player) -> List[Tuple[str, int, str]]:
+        """(zone, index, name) of each of `player`'s hidden cards with a known place."""
+        return [
+            (zone, i, c.get("name"))
+            for zone in HIDDEN_ZONES
+            for i, c in enumerate(getattr(player, zone))
+            if id(c) in self._known
+        ]
+
+
+class Determinizer:
+    """
+    Worlds consistent with what `observer` knows about `game`.
+
+    The observer's own hand stays put; the rest of each hidden group (the
+    observer's deck; each opponent's hand + deck; the trade deck) is shuffled
+    among its free slots (a LazyTradeDeck needs no shuffle). Hand sizes, deck sizes, compositions and known
+    cards never change, so every world hashes like the real game except for
+    the opponents' hand/deck split. Each world's RNG (its lazy trade deck,
+    reshuffles, rollouts) is reseeded from `seed`, so one seed gives the same
+    worlds whatever the global `random` state.
+    """
+
+    def __init__(self, game, observer, tracker: Optional[KnowledgeTracker] = None, seed=None):
+        self.game = game
+        self.seat = next(i for i, p in enumerate(game.players) if p is observer)
+        if tracker is not None:
+            tracker.observe(game)
+        self.rng = seed if isinstance(seed, random.Random) else random.Random(seed)
+        self._shared = _shared(game)
+        self._groups: List[Tuple[int, List[_Slot], List[Any]]] = []
+        for seat, p in enumerate(game.players):
+            zones = ("deck",) if seat == self.seat else HIDDEN_ZONES
+            slots = [
+                (zone, i)
+                for zone in zones
+                for i, c in enumerate(getattr(p, zone))
+                if tracker is None or not tracker.is_known(c)
+            ]
+            if len(slots) > 1:
+                self._groups.append((seat, slots, [None] * len(slots)))
+
+    @property
+    def free_slots(self) -> int:
+        return sum(len(s) for _, s, _ in self._groups) + len(self.game.trade_deck)
+
+    def determinize(self, world):
+        """Reshuffle the hidden cards of `world` (a clone of the game, or a world from here) in place."""
+        shuffle = self.rng.shuffle
+        for seat, slots, buf in self._groups:
+            p = world.players[seat]
+            zones = {zone: getattr(p, zone) for zone in HIDDEN_ZONES}
+            for k, (zone, i) in enumerate(slots):
+                buf[k] = zones[zone][i]
+            shuffle(buf)
+            for k, (zone, i) in enumerate(slots):
+                zones[zone][i] = buf[k]
+        # The world's future (lazy trade draws, reshuffles, rollouts) comes from
+        # its own RNG, seeded from self.rng: not the real game's stream or `random`.
+        rng = getattr(world, "rng", None)
+        if not isinstance(rng, random.Random):
+            rng = world.rng = random.Random()
+        rng.seed(self.rng.getrandbits(64))
+        for p in world.players:
+            p.rng = rng
+        deck = world.trade_deck
+        if isinstance(deck, list):
+            shuffle(deck)
+        else:
+            deck.fix_order(())  # a lazy deck has no order to hide, unless one was fixed
+            deck.rng = rng
+        return world
+
+    def clone(self):
+        """A copy of the real game to determinize."""
+        return clone_game(self.game, self._shared)
+
+    def sample(self):
+        """A fresh determinized world."""
+        return self.determinize(self.clone())
+
+    def worlds(self, n: int) -> Iterator[Any]:
+        for _ in range(n):
+            yield self.sample()
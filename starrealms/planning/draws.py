@@ -0,0 +1,243 @@
+# starrealms/planning/draws.py
+"""
+Exact distribution of the trade and combat in a player's next hand.
+
+The next hand is drawn at the end of this turn: any known cards on top of the
+deck first, then uniformly from the rest of the deck. If the deck runs out
+mid-draw, the discard pile is reshuffled (after cleanup, so it holds this
+turn's hand, ships and purchases too) and the draw continues from it, the
+same way Player.draw_card does via reshuffle_discard_into_deck(). Each part
+is a hypergeometric draw, so the distribution is a sum over the multisets
+that can be drawn, each weighted by a product of binomials.
+
+Cards are reduced to what they add when played: primary trade/combat, plus
+ally trade/combat when another card of their faction is in the hand or among
+the player's bases (and bases in play fire their own allies when the hand
+holds their faction). A 'choose' counts its option with the most trade +
+combat. Draws, scraps and the rest are blanks. Cards with the same reduction
+are one kind, so a starting deck has two kinds (Scout, Viper). Results are
+memoized on the kind multisets, so buy evaluation can ask about every
+candidate purchase without sampling.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import lru_cache
+from math import comb
+from typing import Any, Dict, FrozenSet, Iterable, List, Sequence, Tuple
+
+from starrealms.cards import card_template
+from starrealms.player import collect_effects
+
+HAND_SIZE = 5
+
+# (trade, combat, faction, ally trade, ally combat)
+_Kind = Tuple[int, int, Any, int, int]
+_Pool = Tuple[Tuple[_Kind, int], ...]  # sorted multiset of kinds
+
+
+@dataclass(frozen=True)
+class HandOutlook:
+    """outcomes: (trade, combat, probability), most likely first."""
+
+    outcomes: Tuple[Tuple[int, int, float], ...]
+
+    def trade_pmf(self) -> Dict[int, float]:
+        return self._marginal(0)
+
+    def combat_pmf(self) -> Dict[int, float]:
+        return self._marginal(1)
+
+    def _marginal(self, i: int) -> Dict[int, float]:
+        out: Dict[int, float] = {}
+        for o in self.outcomes:
+            out[o[i]] = out.get(o[i], 0.0) + o[2]
+        return dict(sorted(out.items()))
+
+    @property
+    def expected_trade(self) -> float:
+        return sum(t * p for t, _, p in self.outcomes)
+
+    @property
+    def expected_combat(self) -> float:
+        return sum(c * p for _, c, p in self.outcomes)
+
+    def p_trade_at_least(self, trade: int) -> float:
+        return sum(p for t, _, p in self.outcomes if t >= trade)
+
+    def p_combat_at_least(self, combat: int) -> float:
+        return sum(p for _, c, p in self.outcomes if c >= combat)
+
+
+# ---------------- Card reduction ----------------
+def _gain(effects: Sequence[Any]) -> Tuple[int, int]:
+    trade = combat = 0
+    for e in effects:
+        if not isinstance(e, dict):
+            continue
+        t = e.get("type")
+        if t == "trade":
+            trade += int(e.get("amount", 0) or 0)
+        elif t == "combat":
+            combat += int(e.get("amount", 0) or 0)
+        elif t in ("choose", "choose_one"):
+            best = (0, 0)
+            for opt in e.get("options") or []:
+                if isinstance(opt, dict) and isinstance(opt.get("effects"), list):
+                    opt = opt["effects"]
+                g = _gain(opt if isinstance(opt, list) else [opt])
+                if sum(g) > sum(best):
+                    best = g
+            trade, combat = trade + best[0], combat + best[1]
+    return trade, combat
+
+
+def _reduce(card: Dict[str, Any]) -> _Kind:
+    trade, combat = _gain(collect_effects(card, "play"))
+    ally_trade, ally_combat = _gain(collect_effects(card, "ally"))
+    return (trade, combat, card.get("faction"), ally_trade, ally_combat)
+
+
+@lru_cache(maxsize=None)
+def _kind_of(name: str) -> _Kind:
+    tmpl = card_template(name)
+    return _reduce(tmpl) if tmpl is not None else (0, 0, None, 0, 0)
+
+
+def kind(card: Any) -> _Kind:
+    """The economy of a card (dict or name): (trade, combat, faction, ally trade, ally combat)."""
+    if isinstance(card, str):
+        return _kind_of(card)
+    name = card.get("name")
+    return _kind_of(name) if card_template(name) is not None else _reduce(card)
+
+
+def _pool(cards: Iterable[Any]) -> _Pool:
+    counts: Dict[_Kind, int] = {}
+    for c in cards:
+        k = kind(c)
+        counts[k] = counts.get(k, 0) + 1
+    return tuple(sorted(counts.items(), key=repr))
+
+
+# ---------------- Exact enumeration ----------------
+@lru_cache(maxsize=1 << 14)
+def _draws(counts: Tuple[int, ...], k: int) -> Tuple[Tuple[Tuple[int, ...], int], ...]:
+    """Every way to draw k cards from kinds with `counts`: (picks per kind, number of card subsets)."""
+    if k == 0:
+        return (((0,) * len(counts), 1),)
+    if not counts:
+        return ()
+    head, rest = counts[0], counts[1:]
+    out = []
+    for x in range(min(head, k), -1, -1):
+        if sum(rest) < k - x:
+            break
+        w = comb(head, x)
+        for picks, ways in _draws(rest, k - x):
+            out.append(((x,) + picks, w * ways))
+    return tuple(out)
+
+
+def _totals(
+    hand: Dict[_Kind, int], bases: Tuple[Tuple[Any, int, int], ...], base_factions: FrozenSet
+) -> Tuple[int, int]:
+    factions: Dict[Any, int] = {}
+    for (_, _, f, _, _), n in hand.items():
+        if f is not None:
+            factions[f] = factions.get(f, 0) + n
+    trade = combat = 0
+    for (t, c, f, at, ac), n in hand.items():
+        trade += t * n
+        combat += c * n
+        if (at or ac) and f is not None and (factions[f] > 1 or f in base_factions):
+            trade += at * n
+            combat += ac * n
+    for f, at, ac in bases:
+        if factions.get(f):
+            trade += at
+            combat += ac
+    return trade, combat
+
+
+@lru_cache(maxsize=1 << 12)
+def _outlook(pool: _Pool, k: int, fixed: _Pool, bases: Tuple[Tuple[Any, int, int], ...]) -> HandOutlook:
+    kinds = [kd for kd, _ in pool]
+    base_factions = frozenset(f for f, _, _ in bases)
+    total = comb(sum(n for _, n in pool), k)
+    acc: Dict[Tuple[int, int], int] = {}
+    for picks, ways in _draws(tuple(n for _, n in pool), k):
+        hand = dict(fixed)
+        for kd, x in zip(kinds, picks):
+            if x:
+                hand[kd] = hand.get(kd, 0) + x
+        key = _totals(hand, bases, base_factions)
+        acc[key] = acc.get(key, 0) + ways
+    outcomes = sorted(
+        ((t, c, ways / total) for (t, c), ways in acc.items()), key=lambda o: (-o[2], o[0], o[1])
+    )
+    return HandOutlook(tuple(outcomes))
+
+
+def hand_distribution(
+    deck: Iterable[Any],
+    discard: Iterable[Any] = (),
+    top: Sequence[Any] = (),
+    bases: Iterable[Any] = (),
+    hand_size: int = HAND_SIZE,
+) -> HandOutlook:
+    """
+    Next-hand outlook. deck: cards in the deck in unknown order (dicts or names);
+    top: known cards on top of it, next first; discard: what a mid-draw
+    reshuffle would shuffle in; bases: the player's bases in play.
+    """
+    fixed = list(top)[:hand_size]
+    deck = list(deck)
+    need = hand_size - len(fixed)
+    if need > len(deck):  # the deck runs out: all of it, then the reshuffled discard
+        fixed += deck
+        need -= len(deck)
+        deck = list(discard)
+        need = min(need, len(deck))
+    base_keys = []
+    for b in bases:
+        _, _, f, at, ac = kind(b)
+        if f is not None:
+            base_keys.append((f, at, ac))
+    return _outlook(_pool(deck), max(need, 0), _pool(fixed), tuple(sorted(base_keys, key=repr)))
+
+
+def next_hand(
+    player,
+    bought: Sequence[Any] = (),
+    tracker=None,
+    hand_size: int = HAND_SIZE,
+) -> HandOutlook:
+    """
+    What `player` draws at the end of this turn if they also buy `bought` now.
+    Cleanup sends the hand and ships in play to the discard pile first; a
+    pending top-deck purchase puts the first bought card on top. tracker (a
+    KnowledgeTracker, observed up to now) supplies cards known to be on top of
+    the deck already.
+    """
+    deck = list(player.deck)
+    top: List[Any] = []
+    if tracker is not None:
+        while len(top) < len(deck) and tracker.is_known(deck[len(top)]):
+            top.append(deck[len(top)])
+    rest = deck[len(top):]
+    bought = list(bought)
+    if bought and getattr(player, "topdeck_next_purchase", False):
+        top.insert(0, bought.pop(0))
+    discard = list(player.discard_pile) + list(player.hand) + list(player.in_play) + bought
+    return hand_distribution(rest, discard, top, player.bases, hand_size)
+
+
+def cache_info() -> Dict[str, Any]:
+    return {"outlooks": _outlook.cache_info(), "draws": _draws.cache_info()}
+
+
+def clear_cache() -> None:
+    _outlook.cache_clear()
+    _draws.cache_clear()
+    _kind_of.cache_clear()
@@ -0,0 +1,497 @@
+# starrealms/planning/lethal.py
+"""
+Exact "can I kill the opponent this turn?" solver.
+
+Every card the active player can still use this turn (hand + ships/bases in
+play) is reduced to the combat-relevant part of its play / ally / activated /
+scrap effects, mirroring how the engine resolves them for a non-human player:
+  - ally effects fire once, as soon as another card of the faction is in play
+    (or an ally wildcard is active),
+  - 'choose' options are picked explicitly by the line (see execute_line),
+  - destroy_base hits the first outpost, else the first base,
+  - per_ship_combat adds to every ship played afterwards.
+Draws are treated as blanks, so a line found here wins whatever is drawn.
+
+A depth-first search over play/activate/scrap orderings, memoized on the
+multiset state and pruned by an optimistic bound, returns the winning line.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from itertools import product
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from starrealms.cards import card_template
+from starrealms.player import collect_effects
+from .attack import plan_attack
+
+# (combat, destroys, per_ship, wildcard) gained by one resolution of an effect list
+_Gain = Tuple[int, int, int, bool]
+_NO_GAIN: _Gain = (0, 0, 0, False)
+
+
+# ---------------- Card abstraction ----------------
+def _effect_gain(e: Dict[str, Any]) -> _Gain:
+    t = e.get("type")
+    if t == "combat":
+        return (int(e.get("amount", 0) or 0), 0, 0, False)
+    if t == "destroy_base":
+        return (0, 1, 0, False)
+    if t in ("per_ship_combat", "per_ship_combat_bonus"):
+        return (0, 0, int(e.get("amount", 0) or 0), False)
+    if t == "ally_any_faction":
+        return (0, 0, 0, True)
+    return _NO_GAIN
+
+
+def _add(a: _Gain, b: _Gain) -> _Gain:
+    return (a[0] + b[0], a[1] + b[1], a[2] + b[2], a[3] or b[3])
+
+
+def _options(effects: Sequence[Any]) -> Tuple[Tuple[_Gain, Tuple[int, ...]], ...]:
+    """
+    All outcomes of resolving `effects`: (gain, choice indexes for each 'choose'
+    in order). A list without 'choose' has exactly one outcome.
+    """
+    fixed = _NO_GAIN
+    branches: List[List[_Gain]] = []
+    for e in effects:
+        if not isinstance(e, dict):
+            continue
+        if e.get("type") in ("choose", "choose_one"):
+            opts = []
+            for opt in e.get("options") or []:
+                if isinstance(opt, dict) and isinstance(opt.get("effects"), list):
+                    opt = opt["effects"]
+                g = _NO_GAIN
+                for sub in opt if isinstance(opt, list) else [opt]:
+                    if isinstance(sub, dict):
+                        g = _add(g, _effect_gain(sub))
+                opts.append(g)
+            if opts:
+                branches.append(opts)
+        else:
+            fixed = _add(fixed, _effect_gain(e))
+    if not branches:
+        return ((fixed, ()),)
+    out = []
+    for picks in product(*(range(len(b)) for b in branches)):
+        g = fixed
+        for b, k in zip(branches, picks):
+            g = _add(g, b[k])
+        out.append((g, picks))
+    return tuple(out)
+
+
+@dataclass(frozen=True)
+class _Spec:
+    """Combat-relevant view of one card definition (hashable, shared by copies)."""
+
+    name: str
+    faction: Any
+    is_ship: bool
+    wildcard_aura: bool  # legacy continuous ally_any_faction on the card
+    play: Tuple[Tuple[_Gain, Tuple[int, ...]], ...]
+    ally: Tuple[Tuple[_Gain, Tuple[int, ...]], ...]
+    activated: Tuple[Tuple[_Gain, Tuple[int, ...]], ...]
+    scrap: Tuple[Tuple[_Gain, Tuple[int, ...]], ...]
+
+    def __post_init__(self):
+        bests = {}
+        for which in ("play", "ally", "activated", "scrap"):
+            opts = getattr(self, which)
+            bests[which] = (
+                (
+                    max(g[0] for g, _ in opts),
+                    max(g[1] for g, _ in opts),
+                    max(g[2] for g, _ in opts),
+                    any(g[3] for g, _ in opts),
+                )
+                if opts
+                else _NO_GAIN
+            )
+        object.__setattr__(self, "_bests", bests)
+
+    def best(self, which: str) -> _Gain:
+        """Component-wise best outcome of one ability (for the search bound)."""
+        return self._bests[which]
+
+
+def _useful_options(card: Dict[str, Any], phase: str):
+    """Outcomes of an optional ability; () if none of them can matter for lethal."""
+    opts = _options(collect_effects(card, phase))
+    return opts if any(g != _NO_GAIN for g, _ in opts) else ()
+
+
+def _play_effects(card: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """On-play effects as trigger_effects() applies them (repeated combat specs count once)."""
+    seen = set()
+    out = []
+    for e in collect_effects(card, "play"):
+        if isinstance(e, dict) and e.get("type") == "combat":
+            key = int(e.get("amount", 0) or 0)
+            if key in seen:
+                continue
+            seen.add(key)
+        out.append(e)
+    return out
+
+
+def _spec(card: Dict[str, Any]) -> _Spec:
+    aura = any(
+        isinstance(e, dict)
+        and e.get("type") == "ally_any_faction"
+        and e.get("trigger") in (None, "continuous")
+        for e in card.get("effects") or []
+    )
+    return _Spec(
+        name=card.get("name", "?"),
+        faction=card.get("faction"),
+        is_ship=card.get("type") not in ("base", "outpost"),
+        wildcard_aura=aura,
+        play=_options(_play_effects(card)),
+        ally=_useful_options(card, "ally"),
+        activated=_useful_options(card, "activated"),
+        scrap=_useful_options(card, "scrap"),
+    )
+
+
+# Specs of the loaded card definitions, by name. A card uses its definition's
+# spec when it carries the definition's effects (trade-deck copies share the
+# list, deep copies of a game hold an equal one); any other card, such as a
+# custom test card, is abstracted on each call. At most one entry per loaded
+# card, replaced if a reload brings a new definition.
+_SPECS: Dict[str, Tuple[List[Any], _Spec]] = {}
+
+
+def _cached_spec(card: Dict[str, Any]) -> _Spec:
+    effects = card.get("effects")
+    tmpl = card_template(card.get("name")) if effects else None
+    defined = tmpl.get("effects") if tmpl is not None else None
+    if defined is None or (effects is not defined and effects != defined):
+        return _spec(card)
+    hit = _SPECS.get(tmpl["name"])
+    if hit is not None and hit[0] is defined:
+        return hit[1]
+    sp = _spec(card)
+    _SPECS[tmpl["name"]] = (defined, sp)
+    return sp
+
+
+# ---------------- Search ----------------
+# Field entry: (spec id, ally_pending, can_activate, can_scrap)
+_Field = Tuple[int, bool, bool, bool]
+# Line step: (kind, spec id or field entry, choice indexes)
+_Step = Tuple[str, Any, Tuple[int, ...]]
+
+
+@dataclass(frozen=True)
+class LethalLine:
+    """
+    A winning sequence for the active player. `steps` are
+    ("play" | "activate" | "scrap", card, choice_indexes) in execution order;
+    after them, attacking with the whole pool (outposts first) is lethal.
+    """
+
+    steps: Tuple[Tuple[str, Dict[str, Any], Tuple[int, ...]], ...]
+    combat: int
+    destroys: int
+
+
+class _Solver:
+    def __init__(self, specs, bases, authority):
+        self.specs: List[_Spec] = specs
+        self.bases: Tuple[Tuple[int, bool], ...] = bases
+        self.authority = authority
+        self.memo: Dict[Any, Optional[Tuple[_Step, ...]]] = {}
+        self.kill_memo: Dict[Tuple[int, int], bool] = {}
+
+    # --- terminal test ---
+    def kills(self, combat: int, destroys: int) -> bool:
+        destroys = min(destroys, len(self.bases))
+        key = (combat, destroys)
+        hit = self.kill_memo.get(key)
+        if hit is not None:
+            return hit
+        left = list(self.bases)
+        for _ in range(destroys):
+            j = next((i for i, (_d, o) in enumerate(left) if o), 0)
+            left.pop(j)
+        bases = [{"defense": d, "outpost": o} for d, o in left]
+        ok = plan_attack(combat, bases, self.authority).lethal
+        self.kill_memo[key] = ok
+        return ok
+
+    # --- helpers ---
+    def _fire_allies(self, field: List[_Field], wildcard: bool) -> _Gain:
+        """Fire every pending ally whose condition now holds (engine order)."""
+        gain = _NO_GAIN
+        factions: Dict[Any, int] = {}
+        for sid, *_ in field:
+            f = self.specs[sid].faction
+            factions[f] = factions.get(f, 0) + 1
+        for i, (sid, pending, act, scr) in enumerate(field):
+            if not pending:
+                continue
+            sp = self.specs[sid]
+            if wildcard or (sp.faction and factions.get(sp.faction, 0) >= 2):
+                # Engine applies ally effects without a choice prompt: first option.
+                gain = _add(gain, sp.ally[0][0])
+                field[i] = (sid, False, act, scr)
+        return gain
+
+    def _bound(self, hand, field, combat, destroys, per_ship) -> Tuple[int, int]:
+        """Optimistic (combat, destroys) still reachable from this state."""
+        c, d = combat, destroys
+        ships = 0
+        ps = per_ship
+        for sid in hand:
+            sp = self.specs[sid]
+            for which in ("play", "ally", "activated", "scrap"):
+                g = sp.best(which)
+                c += g[0]
+                d += g[1]
+                ps += g[2]
+            ships += sp.is_ship
+        for sid, pending, act, scr in field:
+            sp = self.specs[sid]
+            for which, flag in (("ally", pending), ("activated", act), ("scrap", scr)):
+                if flag:
+                    g = sp.best(which)
+                    c += g[0]
+                    d += g[1]
+        return c + ps * ships, d
+
+    # --- DFS ---
+    def search(self, hand, field, combat, destroys, per_ship, wildcard):
+        if self.kills(combat, destroys):
+            return ()
+        key = (hand, field, combat, min(destroys, len(self.bases)), per_ship, wildcard)
+        if key in self.memo:
+            return self.memo[key]
+        self.memo[key] = None  # cycle guard (every step consumes something anyway)
+
+        bc, bd = self._bound(hand, field, combat, destroys, per_ship)
+        if not self.kills(bc, bd):
+            return None
+
+        result = None
+        # 1) play a card from hand (one representative per distinct spec)
+        for sid in sorted(set(hand)):
+            sp = self.specs[sid]
+            rest = list(hand)
+            rest.remove(sid)
+            for gain, picks in sp.play:
+                c = combat + gain[0] + (per_ship if sp.is_ship else 0)
+                d = destroys + gain[1]
+                ps = per_ship + gain[2]
+                wc = wildcard or gain[3] or sp.wildcard_aura
+                nf = list(field) + [(sid, bool(sp.ally), bool(sp.activated), bool(sp.scrap))]
+                ag = self._fire_allies(nf, wc)
+                sub = self.search(
+                    tuple(rest), tuple(sorted(nf)), c + ag[0], d + ag[1], ps + ag[2], wc or ag[3]
+                )
+                if sub is not None:
+                    result = (("play", sid, picks),) + sub
+                    break
+            if result is not None:
+                break
+
+        # 2) activate / scrap a card already in play
+        if result is None:
+            for entry in sorted(set(field)):
+                sid, pending, act, scr = entry
+                sp = self.specs[sid]
+                for kind, flag, opts in (("activate", act, sp.activated), ("scrap", scr, sp.scrap)):
+                    if not flag:
+                        continue
+                    nf = list(field)
+                    nf.remove(entry)
+                    if kind == "activate":
+                        nf.append((sid, pending, False, scr))
+                    for gain, picks in opts:
+                        wc = wildcard or gain[3]
+                        ag = self._fire_allies(nf, wc) if gain[3] and not wildcard else _NO_GAIN
+                        sub = self.search(
+                            hand,
+                            tuple(sorted(nf)),
+                            combat + gain[0] + ag[0],
+                            destroys + gain[1] + ag[1],
+                            per_ship + gain[2] + ag[2],
+                            wc,
+                        )
+                        if sub is not None:
+                            result = ((kind, entry, picks),) + sub
+                            break
+                    if result is not None:
+                        break
+                if result is not None:
+                    break
+
+        self.memo[key] = result
+        return result
+
+
+def _wildcard_now(player, game) -> bool:
+    if getattr(player, "ally_wildcard_active", False):
+        return True
+    api = getattr(getattr(game, "dispatcher", None), "api", None)
+    if api is not None and hasattr(api, "ally_wildcard_active"):
+        try:
+            return bool(api.ally_wildcard_active(player.name))
+        except Exception:
+            return False
+    return False
+
+
+def find_lethal(player, opponent, game=None) -> Optional[LethalLine]:
+    """
+    Return a LethalLine if `player` can reduce `opponent` to 0 authority this
+    turn with the cards in hand and in play, else None.
+    """
+    specs: List[_Spec] = []
+    spec_ids: Dict[Tuple[str, int], int] = {}
+    cards_by_sid: Dict[int, List[Dict[str, Any]]] = {}
+
+    def sid_of(card) -> int:
+        k = (card.get("name", "?"), id(card.get("effects")) if card.get("effects") else id(card))
+        sid = spec_ids.get(k)
+        if sid is None:
+            sid = spec_ids[k] = len(specs)
+            specs.append(_cached_spec(card))
+        return sid
+
+    hand = []
+    for c in getattr(player, "hand", []):
+        sid = sid_of(c)
+        hand.append(sid)
+        cards_by_sid.setdefault(sid, []).append(c)
+
+    field = []
+    field_cards: Dict[_Field, List[Dict[str, Any]]] = {}
+    wildcard = _wildcard_now(player, game)
+    for c in list(getattr(player, "in_play", [])) + list(getattr(player, "bases", [])):
+        sid = sid_of(c)
+        sp = specs[sid]
+        wildcard = wildcard or sp.wildcard_aura
+        rt = c.get("_rt") or {}
+        entry = (sid, bool(sp.ally) and not rt.get("ally_triggered"), bool(sp.activated), bool(sp.scrap))
+        field.append(entry)
+        field_cards.setdefault(entry, []).append(c)
+
+    bases = tuple(
+        (int(b.get("defense", 0) or 0), bool(b.get("outpost"))) for b in getattr(opponent, "bases", [])
+    )
+    solver = _Solver(specs, bases, int(opponent.authority))
+    per_ship = int(getattr(player, "per_ship_combat_bonus", 0) or 0)
+    steps = solver.search(
+        tuple(sorted(hand)),
+        tuple(sorted(field)),
+        int(player.combat_pool),
+        0,
+        per_ship,
+        wildcard,
+    )
+    if steps is None:
+        return None
+
+    # Map abstract steps back onto concrete card dicts.
+    concrete = []
+    live: Dict[_Field, List[Dict[str, Any]]] = {k: list(v) for k, v in field_cards.items()}
+    for kind, ref, picks in steps:
+        if kind == "play":
+            card = cards_by_sid[ref].pop(0)
+            sp = specs[ref]
+            entry = (ref, bool(sp.ally), bool(sp.activated), bool(sp.scrap))
+            live.setdefault(entry, []).append(card)
+        else:
+            card = live[ref].pop(0)
+            if kind == "activate":
+                sid, pending, _act, scr = ref
+                live.setdefault((sid, pending, False, scr), []).append(card)
+        concrete.append((kind, card, picks))
+
+    # Re-run the cheap forward pass to report the final pools.
+    return LethalLine(tuple(concrete), *_final_pools(solver, steps, hand, field, player, wildcard))
+
+
+def _final_pools(solver, steps, hand, field, player, wildcard) -> Tuple[int, int]:
+    combat = int(player.combat_pool)
+    destroys = 0
+    per_ship = int(getattr(player, "per_ship_combat_bonus", 0) or 0)
+    field = list(field)
+    for kind, ref, picks in steps:
+        if kind == "play":
+            sp = solver.specs[ref]
+            gain = next(g for g, p in sp.play if p == picks)
+            combat += gain[0] + (per_ship if sp.is_ship else 0)
+            destroys += gain[1]
+            per_ship += gain[2]
+            wildcard = wildcard or gain[3] or sp.wildcard_aura
+            field.append((ref, bool(sp.ally), bool(sp.activated), bool(sp.scrap)))
+        else:
+            sid, pending, act, scr = ref
+            sp = solver.specs[sid]
+            opts = sp.activated if kind == "activate" else sp.scrap
+            gain = next(g for g, p in opts if p == picks)
+            field.remove(ref)
+            if kind == "activate":
+                field.append((sid, pending, False, scr))
+            combat += gain[0]
+            destroys += gain[1]
+            per_ship += gain[2]
+            wildcard = wildcard or gain[3]
+            if not gain[3]:
+                continue
+        ag = solver._fire_allies(field, wildcard)
+        combat += ag[0]
+        destroys += ag[1]
+        per_ship += ag[2]
+        wildcard = wildcard or ag[3]
+    return combat, destroys
+
+
+def has_lethal(player, opponent, game=None) -> bool:
+    """Cheap yes/no form of find_lethal (e.g. to end rollouts early)."""
+    return find_lethal(player, opponent, game) is not None
+
+
+# ---------------- Execution ----------------
+class _ScriptedChoices:
+    """Temporary player.agent answering 'choose' prompts from a line step."""
+
+    def __init__(self, picks: Sequence[int], inner=None):
+        self._picks = list(picks)
+        self._inner = inner
+
+    def choose_index(self, options, prompt=None):
+        if self._picks:
+            return self._picks.pop(0)
+        if self._inner is not None and hasattr(self._inner, "choose_index"):
+            return self._inner.choose_index(options, prompt=prompt)
+        return 0
+
+    def __getattr__(self, name):
+        if self._inner is None:
+            raise AttributeError(name)
+        return getattr(self._inner, name)
+
+
+def execute_line(line: LethalLine, player, opponent, game) -> None:
+    """Perform a LethalLine's plays/activations/scraps (the attack is left to the caller)."""
+    had_agent = "agent" in vars(player)
+    inner = getattr(player, "agent", None)
+    try:
+        for kind, card, picks in line.steps:
+            player.agent = _ScriptedChoices(picks, inner)
+            if kind == "play":
+                player.play_card(card, opponent, game)
+            elif kind == "activate":
+                player.activate_ship(card, opponent, game, scrap=False)
+            else:
+                player.activate_ship(card, opponent, game, scrap=True)
+    finally:
+        if had_agent:
+            player.agent = inner
+        elif "agent" in vars(player):
+            del player.agent
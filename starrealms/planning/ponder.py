@@ -0,0 +1,268 @@
+# starrealms/planning/ponder.py
+"""
+Background "pondering": an AI seat thinks about its next turn while the
+opponent is still playing, so its own turn starts from warm results.
+
+The AI's next hand is already drawn when the opponent's turn begins, so on a
+private clone of the game (the opponent's turn skipped, the AI's turn started)
+a worker thread:
+
+1. finds the largest opponent authority the AI can kill next turn (exact
+   lethal search, binary-searched over authority). A line that kills
+   authority M kills anything lower, and nothing above M dies, so the answer
+   stays exact whatever the opponent gains or loses this turn, as long as
+   the AI's cards and the opponent's bases are unchanged (LethalBook);
+2. plans buys for the likely trade rows (the current one, then the opponent
+   buying one slot and it refilling with each card still in the trade deck,
+   most likely first) over a range of trade pools, with a deep copy of the
+   agent, into a private BuyDecisionCache. Agents whose buys are not cached
+   (uses_buy_cache false, e.g. a ValueAgent with a net) skip this step.
+
+Nothing shared is touched off the caller's thread: Ponderer.finish() stops
+the worker and merges the results into the agent on the calling thread.
+Hidden information stays hidden: only the AI's own hand, public zones and
+the trade deck's composition (not its order) are used.
+"""
+
+from __future__ import annotations
+import copy
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .buy_cache import BuyDecisionCache
+from .lethal import LethalLine, _wildcard_now, find_lethal
+from .purchase import DEFAULT_MAX_BUYS
+
+MAX_AUTHORITY = 256  # lethal search ceiling
+BUY_BUDGET = 4000  # buy plans per ponder
+MAX_TRADE = 12  # trade pools 0..MAX_TRADE are warmed
+_ZONES = ("hand", "in_play", "bases")
+
+# (kind, zone, index, picks) of each line step, relative to the player's zones when solved
+_Ref = Tuple[str, str, int, Tuple[int, ...]]
+
+
+def lethal_key(player, opponent, game=None) -> Tuple:
+    """Everything find_lethal's answer depends on, except the opponent's authority."""
+
+    def zone(cards):
+        return tuple((c.get("name"), bool((c.get("_rt") or {}).get("ally_triggered"))) for c in cards)
+
+    return (
+        tuple(c.get("name") for c in player.hand),
+        zone(player.in_play),
+        zone(player.bases),
+        int(player.combat_pool),
+        int(getattr(player, "per_ship_combat_bonus", 0) or 0),
+        _wildcard_now(player, game),
+        tuple((b.get("name"), int(b.get("defense", 0) or 0), bool(b.get("outpost"))) for b in opponent.bases),
+    )
+
+
+class LethalBook:
+    """Pondered lethal answers: key -> (max killable authority, line as zone refs)."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._data: Dict[Tuple, Tuple[int, Optional[Tuple[_Ref, ...]], int, int]] = {}
+        self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def record(self, key: Tuple, max_authority: int, line: Optional[LethalLine], player) -> None:
+        if len(self._data) >= self.maxsize:
+            self._data.clear()
+        if line is None:
+            self._data[key] = (max_authority, None, 0, 0)
+            return
+        where = {id(c): (z, i) for z in _ZONES for i, c in enumerate(getattr(player, z))}
+        refs = tuple((kind, *where[id(card)], picks) for kind, card, picks in line.steps)
+        self._data[key] = (max_authority, refs, line.combat, line.destroys)
+
+    def lookup(self, player, opponent, game=None) -> Tuple[bool, Optional[LethalLine]]:
+        """(known, line): known=False means "not pondered, search now"."""
+        entry = self._data.get(lethal_key(player, opponent, game))
+        if entry is None:
+            return False, None
+        self.hits += 1
+        max_auth, refs, combat, destroys = entry
+        if refs is None or int(opponent.authority) > max_auth:
+            return True, None
+        steps = tuple((kind, getattr(player, zone)[i], picks) for kind, zone, i, picks in refs)
+        return True, LethalLine(steps, combat, destroys)
+
+
+def max_lethal(player, opponent, game, stop: Optional[threading.Event] = None) -> Tuple[int, Optional[LethalLine]]:
+    """Largest opponent authority `player` can kill this turn (0 if none) and a line for it."""
+    saved = opponent.authority
+    try:
+
+        def kills(a: int) -> Optional[LethalLine]:
+            opponent.authority = a
+            return find_lethal(player, opponent, game)
+
+        best = kills(1)
+        if best is None:
+            return 0, None
+        lo, hi = 1, 2
+        while hi <= MAX_AUTHORITY and not (stop and stop.is_set()):
+            line = kills(hi)
+            if line is None:
+                break
+            lo, best, hi = hi, line, hi * 2
+        hi = min(hi, MAX_AUTHORITY + 1)
+        while hi - lo > 1 and not (stop and stop.is_set()):  # lo kills, hi does not
+            mid = (lo + hi) // 2
+            line = kills(mid)
+            if line is None:
+                hi = mid
+            else:
+                lo, best = mid, line
+        return lo, best
+    finally:
+        opponent.authority = saved
+
+
+def likely_rows(agent, game) -> List[List[Any]]:
+    """Trade rows the AI may face: as now, then one slot bought and refilled."""
+    row = list(game.trade_row)
+    rows = [row]
+    names: Dict[str, Any] = {}
+    counts: Dict[str, int] = {}
+    for c in getattr(game, "trade_deck", []):
+        counts[c["name"]] = counts.get(c["name"], 0) + 1
+        names.setdefault(c["name"], c)
+    refills = sorted(names.values(), key=lambda c: (-counts[c["name"]], c["name"]))
+    # The opponent most likely buys what the AI itself rates highest.
+    slots = sorted(
+        (i for i, c in enumerate(row) if c), key=lambda i: -agent._buy_score(game, row[i])
+    )
+    for i in slots:
+        for card in refills:
+            r = list(row)
+            r[i] = card
+            rows.append(r)
+    return rows
+
+
+def warm_buys(agent, game, player, stop=None, budget: int = BUY_BUDGET) -> BuyDecisionCache:
+    """plan_buys for likely rows and pools, into a private cache (agent is not modified).
+
+    The worker plans with a deep copy of the agent (scratch buffers included),
+    sharing only the lethal book, which plan_buys does not touch. Agents whose
+    plan_buys does not use the cache (uses_buy_cache false) are not warmed.
+    """
+    if not getattr(agent, "uses_buy_cache", False):
+        return BuyDecisionCache(maxsize=budget)
+    memo: Dict[int, Any] = {id(agent.buy_cache): BuyDecisionCache(maxsize=budget)}
+    book = getattr(agent, "lethal_book", None)
+    if book is not None:
+        memo[id(book)] = book
+    worker = copy.deepcopy(agent, memo)
+    saved_row, saved_pool = game.trade_row, player.trade_pool
+    try:
+        for row in likely_rows(worker, game):
+            game.trade_row = row
+            for pool in range(MAX_TRADE + 1):
+                if (stop and stop.is_set()) or len(worker.buy_cache) >= budget:
+                    return worker.buy_cache
+                player.trade_pool = pool
+                worker.plan_buys(game, player, DEFAULT_MAX_BUYS)
+    finally:
+        game.trade_row, player.trade_pool = saved_row, saved_pool
+    return worker.buy_cache
+
+
+@dataclass
+class PonderResult:
+    seat: int
+    lethal_key: Optional[Tuple] = None
+    max_authority: int = 0
+    line: Optional[LethalLine] = None
+    player: Any = None  # the clone's player the line refers to
+    buys: Optional[BuyDecisionCache] = None
+    stopped: bool = False
+
+
+def ponder(agent, game, seat: int, stop: Optional[threading.Event] = None, budget: int = BUY_BUDGET) -> PonderResult:
+    """Think about `seat`'s next turn. `game` must be a private clone: it is advanced and mutated."""
+    res = PonderResult(seat)
+    if game.turn % 2 != seat:
+        game.turn += 1  # skip the opponent's turn: its hidden cards are not ours to see
+    game.start_turn()
+    p, o = game.current_player(), game.opponent()
+    res.lethal_key = lethal_key(p, o, game)
+    res.max_authority, res.line = max_lethal(p, o, game, stop)
+    res.player = p
+    if stop is not None and stop.is_set():
+        res.stopped = True
+        res.lethal_key = None  # an interrupted search is not exact
+        return res
+    res.buys = warm_buys(agent, game, p, stop, budget)
+    res.stopped = bool(stop and stop.is_set())
+    return res
+
+
+class Ponderer:
+    """
+    Runs `ponder` for `agent` (seat `seat`) on a worker thread.
+
+        ponderer.start(game)     # the opponent's turn begins
+        ...                      # opponent plays; the UI thread stays free
+        ponderer.finish()        # our turn begins: stop, merge, reuse
+    """
+
+    def __init__(self, agent, seat: int, budget: int = BUY_BUDGET):
+        self.agent = agent
+        self.seat = seat
+        self.budget = budget
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ponder")
+        self._future: Optional[Future] = None
+        self._stop = threading.Event()
+        self.last: Optional[PonderResult] = None
+
+    def start(self, game) -> None:
+        self.cancel()
+        clone = copy.deepcopy(game)  # taken on the caller's thread, before the opponent moves
+        self._stop = threading.Event()
+        self._future = self._pool.submit(ponder, self.agent, clone, self.seat, self._stop, self.budget)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the worker finishes on its own; False on timeout."""
+        if self._future is None:
+            return True
+        try:
+            self._future.exception(timeout)
+        except FutureTimeout:
+            return False
+        return True
+
+    def cancel(self) -> None:
+        if self._future is not None:
+            self._stop.set()
+            self._future.result()
+            self._future = None
+
+    def finish(self, timeout: Optional[float] = None) -> Optional[PonderResult]:
+        """Stop thinking and hand the results to the agent. Call on the agent's thread."""
+        if self._future is None:
+            return None
+        self._stop.set()
+        res = self._future.result(timeout)
+        self._future = None
+        self.last = res
+        book = getattr(self.agent, "lethal_book", None)
+        if book is not None and res.lethal_key is not None:
+            book.record(res.lethal_key, res.max_authority, res.line, res.player)
+        cache = getattr(self.agent, "buy_cache", None)
+        if cache is not None and res.buys is not None:
+            cache.merge(res.buys)
+        return res
+
+    def close(self) -> None:
+        self.cancel()
+        self._pool.shutdown(wait=True)
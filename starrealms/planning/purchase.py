@@ -0,0 +1,127 @@
+# starrealms/planning/purchase.py
+"""
+Buy-phase planning: the best multiset of purchases for a trade pool.
+
+Candidates are the visible trade-row cards (each at most once). Every
+candidate carries (cost, score); the planner picks the set with the highest
+total score whose cost fits the trade pool and whose size fits max_buys, so
+two 3-cost cards can beat one 5-cost card. Only cards with a positive score
+are bought: a pool can go unspent.
+
+Scores are per card, but every card bought also dilutes the deck: the j-th
+card bought in a turn (from 0) costs j * dilution, so a second buy has to be
+worth its hand slot. Explorers are a fallback, at most MAX_EXPLORERS a turn,
+offered only when no trade-row card worth buying fits the pool: a linear score
+counts both the Explorer's trade and its scrap combat, and rates it above row
+cards that win more games (see tests/test_purchase_planner.py).
+
+max_buys is an AI heuristic, not a game rule; Star Realms lets a player buy as
+much as their trade pays for. DEFAULT_MAX_BUYS keeps the two-buy habit of the
+original AI, which keeps plans (and ponder/candidate enumeration) small.
+
+What a bought slot refills with is unknown, so plans only count visible cards;
+run_purchases() replans after buying, letting leftover trade reach a refill.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+EXPLORER_SLOT = "x"
+DEFAULT_MAX_BUYS = 2  # heuristic buy budget per turn (see above); the rules set no limit
+MAX_EXPLORERS = 1  # Explorers per turn (see above)
+DEFAULT_DILUTION = 4.0  # score cost of each further card bought in a turn (see above)
+
+Slot = Union[int, str]  # 1-based trade-row slot, or EXPLORER_SLOT
+
+
+@dataclass(frozen=True)
+class PurchasePlan:
+    """picks: slots to buy, best score first; Explorers appear once per copy."""
+
+    picks: Tuple[Slot, ...]
+    spent: int
+    value: float
+
+
+def _dilution(dilution: float, bought: int, n: int) -> float:
+    """Dilution cost of n more buys after `bought`: the j-th card bought this turn (from 0) costs j * dilution."""
+    return dilution * (n * bought + n * (n - 1) / 2)
+
+
+def plan_purchases(
+    offers: Sequence[Optional[Tuple[int, float]]],
+    trade: int,
+    explorer: Optional[Tuple[int, float]] = None,
+    max_buys: int = DEFAULT_MAX_BUYS,
+    bought: Sequence[Slot] = (),
+    dilution: float = DEFAULT_DILUTION,
+) -> PurchasePlan:
+    """
+    offers[i] is (cost, score) for trade-row slot i+1, or None for an empty slot.
+    explorer is (cost, score) for an Explorer, or None if Explorers are not for sale;
+    it is only a candidate when no trade-row card with a positive score fits.
+    bought: slots already bought this turn (they count towards dilution and
+    the Explorer cap). Only candidates with a positive score are bought, and
+    only while the plan's total, net of dilution, keeps rising; ties prefer
+    spending less.
+    """
+    trade = max(0, int(trade or 0))
+    items: List[Tuple[Slot, int, float]] = []
+    for i, offer in enumerate(offers, start=1):
+        if offer is None:
+            continue
+        cost, score = int(offer[0] or 0), float(offer[1])
+        if score > 0 and cost <= trade:
+            items.append((i, cost, score))
+    if explorer is not None and not items:
+        cost, score = int(explorer[0] or 0), float(explorer[1])
+        copies = min(MAX_EXPLORERS - list(bought).count(EXPLORER_SLOT), max_buys, trade // cost if cost else 0)
+        if score > 0 and copies > 0:
+            items.extend([(EXPLORER_SLOT, cost, score)] * copies)
+
+    # best[c][k] = (value, -spent, picks) with at most c trade and exactly k buys
+    empty = (0.0, 0, ())
+    best = [[empty] + [None] * max_buys for _ in range(trade + 1)]
+    for slot, cost, score in items:
+        for c in range(trade, cost - 1, -1):
+            for k in range(max_buys, 0, -1):
+                prev = best[c - cost][k - 1]
+                if prev is None:
+                    continue
+                pv, pns, picks = prev
+                cand = (pv + score, pns - cost, picks + ((slot, score),))
+                if best[c][k] is None or cand[:2] > best[c][k][:2]:
+                    best[c][k] = cand
+    value, neg_spent, picks = max(
+        (
+            (b[0] - _dilution(dilution, len(bought), k), b[1], b[2])
+            for k, b in enumerate(best[trade])
+            if b is not None
+        ),
+        key=lambda b: b[:2],
+    )
+    ordered = sorted(picks, key=lambda p: -p[1])  # stable: row order on ties
+    return PurchasePlan(tuple(s for s, _ in ordered), -neg_spent, value)
+
+
+def run_purchases(
+    plan_fn: Callable[[int, Tuple[Slot, ...]], Sequence[Slot]],
+    buy: Callable[[Slot], None],
+    max_buys: int = DEFAULT_MAX_BUYS,
+) -> int:
+    """
+    Execute purchases: plan_fn(buys_left, bought) returns the slots to buy now
+    (planned against the current row; bought: the slots bought so far), buy(slot)
+    performs one. Replans after each batch so refilled slots are considered
+    while buys remain. Returns the number of buys.
+    """
+    bought: List[Slot] = []
+    while len(bought) < max_buys:
+        picks = list(plan_fn(max_buys - len(bought), tuple(bought)))[: max_buys - len(bought)]
+        if not picks:
+            break
+        for slot in picks:
+            buy(slot)
+        bought.extend(picks)
+    return len(bought)
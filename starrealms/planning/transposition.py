@@ -0,0 +1,175 @@
+# starrealms/planning/transposition.py
+"""
+Bounded transposition table for search over Game states.
+
+Different play orders reach the same position (Scout then Viper vs Viper then
+Scout); keyed by game.state_hash, a search can reuse the value it already
+computed for that position, within one decision and across later decisions.
+
+- Fixed capacity (rounded up to a power of two), stored in flat parallel lists.
+- Two-way buckets: a key may live in slot i or i ^ 1. Replacement prefers an
+  empty slot, then an entry from an older search generation, then the shallower
+  entry; a new entry shallower than both current-generation residents is dropped.
+- Entries keep the full 64-bit key, so index collisions (a different key with
+  the same index) are detected and counted instead of returning another
+  position's value.
+- Values can be stored exactly (store) or averaged over samples (accumulate),
+  which suits rollout-based agents.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+EXACT, LOWER, UPPER = 0, 1, 2  # bound kind of a stored value (alpha-beta style)
+
+DEFAULT_CAPACITY = 1 << 16
+
+
+@dataclass(frozen=True)
+class TTEntry:
+    key: int
+    value: float
+    depth: int
+    flag: int
+    move: Any
+    visits: int
+
+
+class TranspositionTable:
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        size = 2
+        while size < capacity:
+            size <<= 1
+        self.size = size
+        self._mask = size - 1
+        self._keys: List[Optional[int]] = [None] * size
+        self._values: List[float] = [0.0] * size
+        self._depths: List[int] = [0] * size
+        self._flags: List[int] = [EXACT] * size
+        self._moves: List[Any] = [None] * size
+        self._visits: List[int] = [0] * size
+        self._gens: List[int] = [0] * size
+        self.generation = 0
+        self.used = 0
+        self.probes = self.hits = self.collisions = 0
+        self.stores = self.replacements = self.rejected = 0
+
+    # ---------------- lookup ----------------
+    def _find(self, key: int) -> int:
+        i = key & self._mask
+        if self._keys[i] == key:
+            return i
+        j = i ^ 1
+        if self._keys[j] == key:
+            return j
+        return -1
+
+    def probe(self, key: int) -> Optional[TTEntry]:
+        self.probes += 1
+        i = self._find(key)
+        if i < 0:
+            # A collision: another position with the same index holds the bucket.
+            # Residents that merely share the bucket from their own home slot don't count.
+            home = key & self._mask
+            for other in (self._keys[home], self._keys[home ^ 1]):
+                if other is not None and other & self._mask == home:
+                    self.collisions += 1
+                    break
+            return None
+        self.hits += 1
+        self._gens[i] = self.generation  # touched this search: keep it around
+        return TTEntry(key, self._values[i], self._depths[i], self._flags[i], self._moves[i], self._visits[i])
+
+    def __contains__(self, key: int) -> bool:
+        return self._find(key) >= 0
+
+    def __len__(self) -> int:
+        return self.used
+
+    # ---------------- store ----------------
+    def _victim(self, key: int, depth: int) -> int:
+        i = key & self._mask
+        j = i ^ 1
+        keys, gens, depths = self._keys, self._gens, self._depths
+        for s in (i, j):
+            if keys[s] is None:
+                return s
+        old = [s for s in (i, j) if gens[s] != self.generation]
+        if old:
+            return min(old, key=lambda s: depths[s])
+        s = i if depths[i] <= depths[j] else j
+        return s if depth >= depths[s] else -1
+
+    def _slot_for(self, key: int, depth: int) -> int:
+        i = self._find(key)
+        if i >= 0:
+            return i
+        i = self._victim(key, depth)
+        if i < 0:
+            self.rejected += 1
+            return -1
+        if self._keys[i] is None:
+            self.used += 1
+        else:
+            self.replacements += 1
+        self._keys[i] = key
+        self._visits[i] = 0
+        self._values[i] = 0.0
+        self._depths[i] = depth
+        self._flags[i] = EXACT
+        self._moves[i] = None
+        return i
+
+    def store(self, key: int, value: float, depth: int = 0, flag: int = EXACT, move: Any = None) -> bool:
+        """Record a searched value; a deeper existing result for the same key wins."""
+        self.stores += 1
+        i = self._slot_for(key, depth)
+        if i < 0:
+            return False
+        if self._visits[i] and self._depths[i] > depth:
+            self._gens[i] = self.generation
+            return True
+        self._values[i] = float(value)
+        self._depths[i] = depth
+        self._flags[i] = flag
+        self._moves[i] = move
+        self._visits[i] = max(1, self._visits[i])
+        self._gens[i] = self.generation
+        return True
+
+    def accumulate(self, key: int, value: float, depth: int = 0) -> float:
+        """Fold one sample into the position's running mean; returns the new mean."""
+        self.stores += 1
+        i = self._slot_for(key, depth)
+        if i < 0:
+            return float(value)
+        n = self._visits[i] + 1
+        self._values[i] += (float(value) - self._values[i]) / n
+        self._visits[i] = n
+        self._depths[i] = max(self._depths[i], depth)
+        self._gens[i] = self.generation
+        return self._values[i]
+
+    # ---------------- lifecycle ----------------
+    def new_search(self) -> None:
+        """Start a new decision: older entries become preferred replacement victims."""
+        self.generation += 1
+
+    def clear(self) -> None:
+        self.__init__(self.size)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "used": self.used,
+            "fill": self.used / self.size,
+            "generation": self.generation,
+            "probes": self.probes,
+            "hits": self.hits,
+            "hit_rate": (self.hits / self.probes) if self.probes else 0.0,
+            "collisions": self.collisions,
+            "stores": self.stores,
+            "replacements": self.replacements,
+            "rejected": self.rejected,
+        }
@@ -7,6 +7,7 @@ Handles deck, hand, discard, bases, authority, trade, combat, and card play.
 import random
 from typing import Any, Dict, List
 from .effects import apply_effects
+from .zobrist import PLAYER_POOLS, PLAYER_ZONES, ZobristZone, player_hash, pool_key
 
 
 
@@ -255,9 +256,31 @@ def _apply_ally_if_active(card: Dict[str, Any], player, opponent, game) -> None:
         apply_effects(ally_effs, player, opponent, game)
 
 
+_MISSING = object()
+
+
 class Player:
     def __setattr__(self, name, value):
         super_setattr = super().__setattr__
+        # Zobrist bookkeeping (hashing games only): zones become hashed lists,
+        # pools XOR their keys.
+        if self.__dict__.get("_hashing"):
+            if name in PLAYER_ZONES:
+                old = self.__dict__.get(name)
+                if not (isinstance(value, ZobristZone) and value._owner is self and value._zone == name):
+                    value = ZobristZone(value or [], owner=self, zone=name)
+                if old is not value:
+                    self._zx((old.zhash() if isinstance(old, ZobristZone) else 0) ^ value.zhash())
+            elif name in PLAYER_POOLS:
+                old = self.__dict__.get(name, _MISSING)
+                if old is not _MISSING:
+                    self._zx(pool_key(self.name, name, old))
+                self._zx(pool_key(self.name, name, value))
+            elif name == "name" and "_zhash" in self.__dict__:
+                super_setattr(name, value)
+                self.__dict__["_zhash"] = player_hash(self)
+                return
+
         if name != "authority":
             return super_setattr(name, value)
         super_setattr(name, value)
@@ -269,12 +292,16 @@ class Player:
         except Exception:
             pass
 
-    def __init__(self, name, starting_deck, is_human: bool = False):
+    def __init__(
+        self, name, starting_deck, is_human: bool = False, hashing: bool = False, rng=None
+    ):
+        self._hashing = hashing  # see Game(hashing=...)
         self.name = name
         self.human = bool(is_human)
+        self.rng = rng  # the game's random.Random; None: the random module
 
         self.deck = starting_deck[:]
-        random.shuffle(self.deck)
+        (rng or random).shuffle(self.deck)
 
         self.hand: List[Dict[str, Any]] = []
         self.discard_pile: List[Dict[str, Any]] = []
@@ -291,6 +318,19 @@ class Player:
         # Per-turn modifiers
         self.per_ship_combat_bonus = 0
 
+    def _zx(self, delta: int) -> None:
+        """XOR a Zobrist delta into this player's share of game.state_hash."""
+        self.__dict__["_zhash"] = self.__dict__.get("_zhash", 0) ^ delta
+
+    def enable_hashing(self) -> None:
+        """Turn the zones into hashed lists and start tracking this player's hash share."""
+        if self.__dict__.get("_hashing"):
+            return
+        self.__dict__["_hashing"] = True
+        for zone in PLAYER_ZONES:
+            self.__dict__[zone] = ZobristZone(getattr(self, zone, None) or [], owner=self, zone=zone)
+        self.__dict__["_zhash"] = player_hash(self)
+
     # --------------------
     # Core Card Handling
     # --------------------
@@ -313,7 +353,7 @@ class Player:
 
     def reshuffle_discard_into_deck(self):
         if self.discard_pile:
-            random.shuffle(self.discard_pile)
+            (getattr(self, "rng", None) or random).shuffle(self.discard_pile)
             self.deck = self.discard_pile[:]
             self.discard_pile.clear()
 
@@ -417,6 +457,8 @@ class Player:
             self.scrap_heap.append(card) if hasattr(self, 'scrap_heap') else (setattr(self, 'scrap_heap', [card]))
             if hasattr(game, "log"):
                 game.log.append(f"{self.name} scraps {card['name']} for effect")
+            if hasattr(game, "card_event"):
+                game.card_event(self, "scrap", card)
             return True
 
         effs = collect_effects(card, "activated")
@@ -448,6 +490,11 @@ class Player:
             self.discard_pile.extend(self.hand)
             self.hand.clear()
         if self.in_play:
+            # Ships leaving play drop their runtime flags (play_resolved,
+            # ally_triggered) so they resolve again the next time they are played.
+            for c in self.in_play:
+                if isinstance(c, dict):
+                    c.pop("_rt", None)
             self.discard_pile.extend(self.in_play)
             self.in_play.clear()
 
@@ -1,10 +1,13 @@
 from starrealms.ui import print_state, print_new_log
 from starrealms.runner.controller import apply_command
 from starrealms.ai import PolicyAgent
+from starrealms.planning.purchase import run_purchases
 
 
-def ai_turn(game, agent: PolicyAgent, last_log_len: int) -> int:
+def ai_turn(game, agent: PolicyAgent, last_log_len: int, ponderer=None) -> int:
     game.start_turn()
+    if ponderer is not None:
+        ponderer.finish()  # reuse what was pondered during the opponent's turn
     print_state(game)
     last_log_len = print_new_log(game, last_log_len)
 
@@ -25,26 +28,12 @@ def ai_turn(game, agent: PolicyAgent, last_log_len: int) -> int:
 
         if cmd == "replan":
             p = game.current_player()
-            buys = 0
-            while buys < 2:
-                slot = (
-                    agent._best_affordable_slot(game, p)
-                    if hasattr(agent, "_best_affordable_slot")
-                    else None
-                )
-                if slot is not None:
-                    last_log_len = apply_command(
-                        game, "b", int(slot), last_log_len, echo=True
-                    )
-                    buys += 1
-                    continue
-                if p.trade_pool >= 2:
-                    last_log_len = apply_command(
-                        game, "b", "x", last_log_len, echo=True
-                    )
-                    buys += 1
-                    continue
-                break
+
+            def _buy(slot):
+                nonlocal last_log_len
+                last_log_len = apply_command(game, "b", slot, last_log_len, echo=True)
+
+            run_purchases(lambda left, bought: agent.plan_buys(game, p, left, bought), _buy)
             i += 1
             continue
 
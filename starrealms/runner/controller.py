@@ -19,6 +19,8 @@ except Exception:
 
 
 from starrealms.effects import apply_effects
+from starrealms.planning.attack import plan_attack
+from starrealms.planning.lethal import execute_line
 
 
 def _list_bases_for_choice(bases):
@@ -50,41 +52,18 @@ def _spend_to_destroy_base(attacker, defender, base, game) -> bool:
 
 def _ai_resolve_attack(p, o, game) -> None:
     """
-    Non-interactive attack resolution for AI:
-      1) While outposts exist and affordable, destroy the cheapest outpost.
-      2) Otherwise, dump remaining combat into authority.
-    Optional: you can expand to destroy cheap normal bases before face damage.
+    Non-interactive attack resolution for AI, using the exact planner
+    (starrealms.planning.attack):
+      1) Destroy the planned bases (all outposts first, as the rules require).
+      2) Send the planned remainder to authority (all of it when lethal).
     """
-    # Step 1: clear outposts as long as we can afford one
-    while True:
-        outposts = [b for b in o.bases if b.get("outpost")]
-        if not outposts:
-            break
-        outposts.sort(key=lambda b: int(b.get("defense", 0) or 0))
-        destroyed = False
-        for b in outposts:
-            if p.combat_pool >= int(b.get("defense", 0) or 0):
-                _spend_to_destroy_base(p, o, b, game)
-                destroyed = True
-                break
-        if not destroyed:
-            # can't afford any outpost; stop the attack step here
-            return
-
-    # Step 2: (optional) destroy a cheap normal base if it's very cheap; else face
-    normals = [b for b in o.bases if not b.get("outpost")]
-    if normals:
-        normals.sort(key=lambda b: int(b.get("defense", 0) or 0))
-        # very simple heuristic: only destroy if its defense <= half our pool
-        if (
-            p.combat_pool > 0
-            and p.combat_pool >= int(normals[0].get("defense", 0) or 0)
-            and int(normals[0].get("defense", 0) or 0) <= max(1, p.combat_pool // 2)
-        ):
-            _spend_to_destroy_base(p, o, normals[0], game)
-
-    # Step 3: send remaining combat to authority
-    if p.combat_pool > 0:
+    plan = plan_attack(p.combat_pool, o.bases, o.authority)
+    targets = [o.bases[i] for i in plan.destroy]
+    for b in targets:
+        _spend_to_destroy_base(p, o, b, game)
+
+    # Send remaining combat to authority (only possible once outposts are gone)
+    if plan.face > 0 and not any(b.get("outpost") for b in o.bases):
         o.authority -= p.combat_pool
         game.log.append(f"{p.name} deals {p.combat_pool} damage to {o.name}")
         if hasattr(game, 'check_lethal'):
@@ -118,6 +97,15 @@ def apply_command(
         print_state(game)
         return last_log_len
 
+    # -------- lethal line (AI: plays/activations/scraps from the lethal solver) --------
+    if cmd == "lethal":
+        if echo:
+            print("🎯 Going for the kill.")
+        execute_line(arg, p, o, game)
+        last_log_len = print_new_log(game, last_log_len)
+        print_state(game)
+        return last_log_len
+
     # -------- play single (1-based index) --------
     if cmd == "p":
         if isinstance(arg, int):
@@ -0,0 +1,136 @@
+# starrealms/runner/headless.py
+"""
+Silent game driver for AI-vs-AI play (tournaments, servers, data generation).
+
+Same command vocabulary as runner/controller.apply_command, but nothing is
+printed and every turn goes through Game.start_turn(), so seeded games are
+reproducible and per-turn card guards behave as in interactive play.
+"""
+
+from __future__ import annotations
+import random
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+from starrealms.planning.lethal import execute_line
+from starrealms.planning.purchase import run_purchases
+from starrealms.runner.controller import _ai_resolve_attack
+
+
+@dataclass(frozen=True)
+class GameResult:
+    """winner: seat index (0 first player, 1 second) or None if the turn cap was hit."""
+
+    winner: Optional[int]
+    turns: int
+    authority: Tuple[int, int]
+
+
+def apply_silent(game, cmd: str, arg: Any) -> None:
+    """Execute one planned (cmd, arg) step for the current player without output."""
+    p = game.current_player()
+    o = game.opponent()
+    if cmd == "pa":
+        for card in list(p.hand):
+            p.play_card(card, o, game)
+    elif cmd == "lethal":
+        execute_line(arg, p, o, game)
+    elif cmd == "p":
+        idx = int(arg) - 1
+        if 0 <= idx < len(p.hand):
+            p.play_card(p.hand[idx], o, game)
+    elif cmd == "b":
+        if arg == "x":
+            if p.trade_pool >= 2:
+                game.buy_explorer(p)
+            return
+        idx = int(arg) - 1
+        card = game.trade_row[idx] if 0 <= idx < len(game.trade_row) else None
+        if card is not None and p.buy_card(card, game):
+            game.log.append(f"{p.name} buys {card['name']}")
+            game.refill_trade_row()
+    elif cmd == "a":
+        if p.combat_pool > 0:
+            _ai_resolve_attack(p, o, game)
+    elif cmd == "e":
+        game.end_turn()
+    # "u", "i", "d" and unknown commands are UI-only: ignored
+
+
+def play_turn(game, agent, on_step: Optional[Callable[[Any, str, Any], None]] = None) -> None:
+    """
+    Start the current player's turn and run `agent`'s plan (replanning after
+    play-all). on_step(game, cmd, arg) runs before each command is applied.
+    """
+    game.start_turn()
+    p = game.current_player()
+
+    def step(cmd: str, arg: Any) -> None:
+        if on_step is not None:
+            on_step(game, cmd, arg)
+        apply_silent(game, cmd, arg)
+
+    plan = list(agent.plan_turn(game))
+    i = 0
+    while i < len(plan):
+        cmd, arg = plan[i]
+        if cmd == "pa":
+            step(cmd, arg)
+            # Buys are planned with the real trade pool once everything is played.
+            plan = [step for step in agent.plan_turn(game) if step[0] != "pa"]
+            i = 0
+            continue
+        if cmd == "replan":
+            run_purchases(
+                lambda left, bought: agent.plan_buys(game, p, left, bought),
+                lambda slot: step("b", slot),
+            )
+        else:
+            step(cmd, arg)
+            if cmd == "e":
+                return
+        if game.check_winner():
+            return
+        i += 1
+    step("e", None)  # plans without an explicit end
+
+
+def play_game(
+    agents: Sequence[Any],
+    seed: Optional[int] = None,
+    max_turns: int = 200,
+    names: Tuple[str, str] = ("P1", "P2"),
+    on_turn: Optional[Callable[[Any, int], None]] = None,
+    on_step: Optional[Callable[[Any, str, Any], None]] = None,
+    lazy_trade_deck: bool = False,
+    on_card: Optional[Callable[[Any, Any, str, Any], None]] = None,
+) -> GameResult:
+    """
+    Play one game, agents[0] moving first. `seed` seeds the game's RNG (see
+    Game), so the same seed deals the same cards, and the global RNG for agents
+    that use it. max_turns counts the
+    turns of both players. on_turn(game, seat) runs after each turn; on_step is
+    passed to play_turn; on_card(game, player, kind, card) is added to the
+    game's card_observers (see Game.card_event). lazy_trade_deck: see Game.
+    """
+    from starrealms.game import Game
+
+    if seed is not None:
+        random.seed(seed)
+    game = Game(names, lazy_trade_deck=lazy_trade_deck, seed=seed)
+    if on_card is not None:
+        game.card_observers.append(on_card)
+    turns = 0
+    winner = None
+    while turns < max_turns:
+        seat = game.turn % 2
+        play_turn(game, agents[seat], on_step)
+        turns += 1
+        if on_turn is not None:
+            on_turn(game, seat)
+        w = game.check_winner()
+        if w is not None:
+            winner = game.players.index(w)
+            break
+    a, b = game.players
+    return GameResult(winner, turns, (a.authority, b.authority))
@@ -0,0 +1,12 @@
+# starrealms/server/__init__.py
+"""
+asyncio multi-game server speaking JSON lines over TCP or Unix sockets.
+
+    python -m starrealms.server --port 7777
+    python -m starrealms.server --unix /tmp/starrealms.sock
+"""
+
+from .server import Connection, GameServer
+from .session import ActionError, GameSession, public_state
+
+__all__ = ["Connection", "GameServer", "ActionError", "GameSession", "public_state"]
@@ -0,0 +1,35 @@
+# starrealms/server/__main__.py
+import argparse
+import asyncio
+
+from .server import GameServer
+
+
+async def _serve(args) -> None:
+    server = GameServer(max_games=args.max_games)
+    if args.unix:
+        where = await server.start_unix(args.unix)
+    else:
+        where = "%s:%d" % tuple(await server.start_tcp(args.host, args.port))
+    print(f"Star Realms server listening on {where}", flush=True)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Star Realms multi-game server (JSON lines)")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=7777)
+    ap.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    ap.add_argument("--max-games", type=int, default=256)
+    args = ap.parse_args(argv)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+# starrealms/server/server.py
+"""
+asyncio game server: many concurrent games on one event loop.
+
+Transport: local TCP (host/port) or a Unix socket; one JSON object per line in
+both directions. Client requests carry an "op"; an optional "id" is echoed in
+the direct reply so clients can match responses.
+
+  {"op": "new", "seats": ["human", "heuristic"], "seat": 0, "seed": 7}
+                                   -> {"type": "created", "game": ..., "seat": 0}
+  {"op": "join", "game": G, "seat": 1}        take a free human seat
+  {"op": "watch", "game": G}                  spectate (hands hidden)
+  {"op": "list"}                              -> {"type": "games", "games": [...]}
+  {"op": "state", "game": G}                  -> {"type": "state", ...}
+  {"op": "action", "game": G, "cmd": "p", "arg": 1}
+        cmd: pa | p <hand#> | b <slot#|"x"> | a [{"bases": [#...], "face": true}]
+             | use {"zone": "in_play"|"bases", "index": #, "scrap": bool} | e
+  {"op": "answer", "game": G, "text": "2"}    reply to a prompt
+
+Pushed events: state, log, prompt, your_turn, message, game_over, error.
+Seat kinds: "human", "policy", "heuristic" or "package.module:Class"
+(see starrealms.tournament.runner.make_agent). Engine work runs on a shared
+thread pool; a game waiting on a prompt holds no thread (see session.py).
+"""
+
+from __future__ import annotations
+import asyncio
+import itertools
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from .session import HUMAN, ActionError, GameSession, public_state
+
+MAX_LINE = 1 << 16
+
+
+class Connection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.seats: Dict[str, int] = {}  # game id -> seat held
+        self.closed = False
+        self._wlock = asyncio.Lock()
+
+    async def send(self, msg: Dict[str, Any]) -> None:
+        if self.closed:
+            return
+        data = (json.dumps(msg, separators=(",", ":")) + "\n").encode("utf-8")
+        async with self._wlock:
+            try:
+                self.writer.write(data)
+                await self.writer.drain()
+            except (ConnectionError, RuntimeError):
+                self.closed = True
+
+
+class GameServer:
+    def __init__(self, max_games: int = 256, workers: Optional[int] = None):
+        self.games: Dict[str, GameSession] = {}
+        self.max_games = max_games
+        # Engine steps of all games share one pool; a game waiting on a player holds no thread.
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="engine")
+        self._ids = itertools.count(1)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._tasks: set = set()
+
+    # ---------------- lifecycle ----------------
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> Tuple[str, int]:
+        self._server = await asyncio.start_server(self._handle, host, port, limit=MAX_LINE)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def start_unix(self, path: str) -> str:
+        self._server = await asyncio.start_unix_server(self._handle, path, limit=MAX_LINE)
+        return path
+
+    async def serve_forever(self) -> None:
+        assert self._server is not None, "call start_tcp()/start_unix() first"
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for t in list(self._tasks):
+            t.cancel()
+        for g in self.games.values():
+            g.close()
+        self.games.clear()
+        self.executor.shutdown(wait=False)
+
+    # ---------------- connections ----------------
+    async def _handle(self, reader, writer) -> None:
+        conn = Connection(reader, writer)
+        await conn.send({"type": "hello", "protocol": 1})
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    await conn.send({"type": "error", "message": "line too long"})
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    msg = json.loads(line)
+                    if not isinstance(msg, dict):
+                        raise ValueError("expected a JSON object")
+                except ValueError as e:
+                    await conn.send({"type": "error", "message": f"bad JSON: {e}"})
+                    continue
+                # Each request runs as its own task, so a slow engine step in one
+                # game does not hold up this client's requests for another.
+                self._spawn(self._dispatch(conn, msg))
+        finally:
+            conn.closed = True
+            for gid, seat in conn.seats.items():
+                g = self.games.get(gid)
+                if g is not None:
+                    self._spawn(g.seat_left(seat))
+            for g in self.games.values():
+                if conn in g.watchers:
+                    g.watchers.remove(conn)
+            writer.close()
+
+    async def _dispatch(self, conn: Connection, msg: Dict[str, Any]) -> None:
+        op = msg.get("op")
+        reply_id = msg.get("id")
+        try:
+            handler = getattr(self, f"_op_{op}", None) if isinstance(op, str) else None
+            if handler is None:
+                raise ActionError(f"unknown op {op!r}")
+            reply = await handler(conn, msg)
+        except ActionError as e:
+            reply = {"type": "error", "message": str(e)}
+        except Exception as e:  # engine bug: report it, keep serving other games
+            reply = {"type": "error", "message": f"internal error: {e!r}"}
+        if reply is not None:
+            if reply_id is not None:
+                reply["id"] = reply_id
+            await conn.send(reply)
+
+    def _game(self, msg) -> GameSession:
+        g = self.games.get(str(msg.get("game")))
+        if g is None:
+            raise ActionError(f"no such game {msg.get('game')!r}")
+        return g
+
+    # ---------------- ops ----------------
+    async def _op_new(self, conn, msg):
+        if len(self.games) >= self.max_games:
+            self._reap()
+            if len(self.games) >= self.max_games:
+                raise ActionError("server is full")
+        seats = msg.get("seats") or [HUMAN, "heuristic"]
+        gid = f"g{next(self._ids)}"
+        try:
+            g = GameSession(gid, seats, asyncio.get_running_loop(), seed=msg.get("seed"), executor=self.executor)
+        except (ValueError, ImportError, AttributeError) as e:
+            raise ActionError(str(e)) from None
+        self.games[gid] = g
+        seat = msg.get("seat")
+        if seat is None:
+            seat = next((i for i, k in enumerate(seats) if k == HUMAN), None)
+        if seat is not None:
+            self._take_seat(conn, g, int(seat))
+        else:
+            g.watchers.append(conn)
+        await conn.send({"type": "created", "game": gid, "seat": seat, "id": msg.get("id")})
+        self._spawn(self._start(g))
+        return None
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _start(self, g: GameSession) -> None:
+        async with g.lock:
+            await g.flush()
+            await g.advance()
+
+    def _take_seat(self, conn, g: GameSession, seat: int) -> None:
+        if not 0 <= seat < len(g.seats) or g.seats[seat] != HUMAN:
+            raise ActionError("that seat is not a human seat")
+        if seat in g.clients:
+            raise ActionError("that seat is taken")
+        g.clients[seat] = conn
+        g.game.players[seat].human = True
+        conn.seats[g.id] = seat
+
+    async def _op_join(self, conn, msg):
+        g = self._game(msg)
+        self._take_seat(conn, g, int(msg.get("seat", 0)))
+        await g.flush()
+        return {"type": "joined", "game": g.id, "seat": conn.seats[g.id]}
+
+    async def _op_watch(self, conn, msg):
+        g = self._game(msg)
+        if conn not in g.watchers:
+            g.watchers.append(conn)
+        return {"type": "state", "game": g.id, "state": public_state(g.game, None)}
+
+    async def _op_list(self, conn, msg):
+        return {"type": "games", "games": [g.describe() for g in self.games.values()]}
+
+    async def _op_state(self, conn, msg):
+        g = self._game(msg)
+        return {"type": "state", "game": g.id, "state": public_state(g.game, conn.seats.get(g.id))}
+
+    async def _op_action(self, conn, msg):
+        g = self._game(msg)
+        cmd = msg.get("cmd")
+        if not isinstance(cmd, str):
+            raise ActionError("action needs a 'cmd'")
+        await g.act(conn.seats.get(g.id), cmd, msg.get("arg"))
+        return {"type": "ok", "game": g.id}
+
+    async def _op_answer(self, conn, msg):
+        g = self._game(msg)
+        await g.answer(conn.seats.get(g.id), msg.get("text", ""))
+        return None
+
+    def _reap(self) -> None:
+        """Drop finished games nobody is attached to."""
+        for gid, g in list(self.games.items()):
+            if g.over and not g.clients and not g.watchers:
+                g.close()
+                del self.games[gid]
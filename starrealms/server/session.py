@@ -0,0 +1,337 @@
+# starrealms/server/session.py
+"""
+One hosted game: engine state, seats, and the bridge between the engine's
+player decisions and the asyncio clients.
+
+Every engine step (a human action, the start of a human turn, a whole AI turn)
+runs as an engine.decisions.Resumable on a worker thread, so slow AI turns
+never block the event loop. A step that needs a player's decision parks: the
+game keeps its pre-step state, the seat gets a {"type": "prompt"} message, and
+no thread waits. Each {"op": "answer"} replays the step with one more answer
+until it completes; only then is the new state adopted. Steps of one game are
+serialized by the session lock; games are independent.
+"""
+
+from __future__ import annotations
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from starrealms.engine.decisions import Decision, Resumable
+
+from starrealms.runner.controller import _ai_resolve_attack, _spend_to_destroy_base
+from starrealms.runner.headless import play_turn
+from starrealms.tournament.runner import AgentSpec, make_agent
+
+HUMAN = "human"
+MAX_TURNS = 400
+
+
+class ActionError(Exception):
+    """A client action that is not legal right now (reported back, game unchanged)."""
+
+
+def public_state(game, seat: Optional[int]) -> Dict[str, Any]:
+    """Snapshot as seen from `seat` (None = spectator): other hands are counts only."""
+    players = []
+    for i, p in enumerate(game.players):
+        players.append(
+            {
+                "name": p.name,
+                "authority": p.authority,
+                "trade": p.trade_pool,
+                "combat": p.combat_pool,
+                "hand": [c["name"] for c in p.hand] if i == seat else len(p.hand),
+                "deck": len(p.deck),
+                "discard": len(p.discard_pile),
+                "in_play": [c["name"] for c in p.in_play],
+                "bases": [
+                    {"name": b["name"], "defense": b.get("defense", 0), "outpost": bool(b.get("outpost"))}
+                    for b in p.bases
+                ],
+            }
+        )
+    row = [None if c is None else {"name": c["name"], "cost": c.get("cost", 0)} for c in game.trade_row]
+    return {
+        "turn": game.turn_number,
+        "active": game.turn % 2,
+        "you": seat,
+        "players": players,
+        "trade_row": row,
+    }
+
+
+def apply_human(game, seat: int, cmd: str, arg: Any) -> None:
+    """Run one human command on the engine thread; raises ActionError if illegal."""
+    p = game.current_player()
+    o = game.opponent()
+    if cmd == "pa":
+        for card in list(p.hand):
+            p.play_card(card, o, game)
+    elif cmd == "p":
+        idx = _index(arg, len(p.hand), "hand")
+        p.play_card(p.hand[idx], o, game)
+    elif cmd == "b":
+        if arg == "x":
+            if p.trade_pool < 2:
+                raise ActionError("not enough trade for an Explorer")
+            game.buy_explorer(p)
+            return
+        idx = _index(arg, len(game.trade_row), "trade row")
+        card = game.trade_row[idx]
+        if card is None:
+            raise ActionError("that trade-row slot is empty")
+        if not p.buy_card(card, game):
+            raise ActionError("not enough trade")
+        game.log.append(f"{p.name} buys {card['name']}")
+        game.refill_trade_row()
+    elif cmd == "use":
+        arg = arg or {}
+        zone = arg.get("zone", "in_play")
+        if zone not in ("in_play", "bases"):
+            raise ActionError("zone must be 'in_play' or 'bases'")
+        cards = getattr(p, zone)
+        card = cards[_index(arg.get("index"), len(cards), zone)]
+        scrap = bool(arg.get("scrap"))
+        fn = p.activate_base if zone == "bases" else p.activate_ship
+        if not fn(card, o, game, scrap=scrap):
+            raise ActionError(f"{card['name']} has no {'scrap' if scrap else 'activated'} ability")
+    elif cmd == "a":
+        _human_attack(game, p, o, arg)
+    elif cmd == "e":
+        game.end_turn()
+    else:
+        raise ActionError(f"unknown command {cmd!r}")
+
+
+def _index(arg: Any, n: int, what: str) -> int:
+    try:
+        k = int(arg)
+    except (TypeError, ValueError):
+        raise ActionError(f"expected a 1-based {what} index") from None
+    if not 1 <= k <= n:
+        raise ActionError(f"{what} index out of range (1-{n})")
+    return k - 1
+
+
+def _human_attack(game, p, o, arg) -> None:
+    """arg None: planner picks targets. Else {"bases": [1-based...], "face": bool}."""
+    if p.combat_pool <= 0:
+        raise ActionError("no combat available")
+    if not arg:
+        _ai_resolve_attack(p, o, game)
+        return
+    targets = [o.bases[_index(i, len(o.bases), "base")] for i in arg.get("bases", [])]
+    for b in targets:
+        outposts = [x for x in o.bases if x.get("outpost")]
+        if outposts and b not in outposts:
+            raise ActionError(f"{outposts[0]['name']} (outpost) must be destroyed first")
+        if not _spend_to_destroy_base(p, o, b, game):
+            raise ActionError(f"not enough combat to destroy {b['name']}")
+    if arg.get("face", True) and p.combat_pool > 0:
+        if any(x.get("outpost") for x in o.bases):
+            raise ActionError("an outpost protects the opponent's authority")
+        o.authority -= p.combat_pool
+        game.log.append(f"{p.name} deals {p.combat_pool} damage to {o.name}")
+        p.combat_pool = 0
+
+
+class GameSession:
+    def __init__(
+        self,
+        game_id: str,
+        seats: Sequence[str],
+        loop: asyncio.AbstractEventLoop,
+        seed: Optional[int] = None,
+        max_turns: int = MAX_TURNS,
+        executor=None,
+    ):
+        if len(seats) != 2:
+            raise ValueError("a game needs exactly two seats")
+        self.id = game_id
+        self.loop = loop
+        self.seats = list(seats)
+        self.agents = [None if k == HUMAN else make_agent(AgentSpec(f"seat{i}", k)) for i, k in enumerate(seats)]
+        self.max_turns = max_turns
+        self.clients: Dict[int, Any] = {}  # seat -> connection
+        self.watchers: List[Any] = []
+        self.lock = asyncio.Lock()
+        self.turns = 0
+        self.winner: Optional[int] = None
+        self.over = False
+        self.executor = executor  # None: the loop's default executor
+        # A step waiting on a decision, and what to do once it completes.
+        self._parked: Optional[Resumable] = None
+        self._then: Optional[Callable[[], Awaitable[None]]] = None
+        self._log_sent = 0
+        names = [f"P{i + 1}" for i in range(2)]
+        from starrealms.game import Game
+
+        self.game = Game(names, seed=seed)  # its own RNG: sessions never share a stream
+        for p, kind in zip(self.game.players, seats):
+            p.human = kind == HUMAN
+
+    async def run_engine(self, fn, *args):
+        return await self.loop.run_in_executor(self.executor, fn, *args)
+
+    # ---------------- resumable steps ----------------
+    async def _step(self, fn, *args, then: Callable[[], Awaitable[None]]) -> bool:
+        """
+        Run fn(game, *args). True if it completed (state adopted; the caller
+        continues). False if it parked on a decision; `then` runs after the
+        answer that completes it.
+        """
+        r = Resumable(fn, self.game, *args)
+        return await self._settle(r, await self.run_engine(r.run), then)
+
+    async def _settle(self, r: Resumable, pending: Optional[Decision], then) -> bool:
+        if pending is None:
+            self._parked = self._then = None
+            self.game = r.game
+            for line in r.lines:
+                await self.broadcast({"type": "message", "text": line})
+            await self.flush()
+            return True
+        self._parked, self._then = r, then
+        seat = self._decision_seat(pending)
+        conn = self.clients.get(seat)
+        if conn is None:
+            # Nobody to ask: the engine's AI path decides for this seat.
+            self.game.players[seat].human = False
+            return await self._settle(r, await self.run_engine(self._restart, r), then)
+        await self.flush()
+        await conn.send(
+            {
+                "type": "prompt",
+                "game": self.id,
+                "seat": seat,
+                "prompt": pending.prompt,
+                "kind": pending.kind,
+                "context": list(pending.context),
+            }
+        )
+        return False
+
+    @staticmethod
+    def _restart(r: Resumable) -> Optional[Decision]:
+        r.answers.clear()
+        return r.run()
+
+    def _decision_seat(self, d: Decision) -> int:
+        if d.seat is not None:
+            return d.seat
+        seat = self.game.turn % 2
+        if self.seats[seat] == HUMAN:
+            return seat
+        return next((i for i, k in enumerate(self.seats) if k == HUMAN), seat)
+
+    @property
+    def pending(self) -> Optional[Decision]:
+        return None if self._parked is None else self._parked.pending
+
+    async def answer(self, seat: Optional[int], text: str) -> None:
+        async with self.lock:
+            r, then = self._parked, self._then
+            if r is None:
+                raise ActionError("no prompt is waiting")
+            if seat != self._decision_seat(r.pending):
+                raise ActionError("the prompt is for the other seat")
+            if await self._settle(r, await self.run_engine(r.answer, str(text)), then):
+                await then()
+
+    async def seat_left(self, seat: int) -> None:
+        """Detach `seat`; a decision parked on it is made by the engine's AI path."""
+        async with self.lock:
+            self.clients.pop(seat, None)
+            r, then = self._parked, self._then
+            if r is not None and self._decision_seat(r.pending) == seat:
+                self.game.players[seat].human = False
+                if await self._settle(r, await self.run_engine(self._restart, r), then):
+                    await then()
+
+    # ---------------- flow ----------------
+    async def broadcast(self, msg: Dict[str, Any]) -> None:
+        msg = dict(msg, game=self.id)
+        for conn in list(self.clients.values()) + list(self.watchers):
+            await conn.send(msg)
+
+    async def flush(self) -> None:
+        """Send new log lines and a fresh per-seat state to everyone attached."""
+        lines = self.game.log[self._log_sent :]
+        self._log_sent = len(self.game.log)
+        if lines:
+            await self.broadcast({"type": "log", "lines": lines})
+        for seat, conn in list(self.clients.items()):
+            await conn.send({"type": "state", "game": self.id, "state": public_state(self.game, seat)})
+        for conn in list(self.watchers):
+            await conn.send({"type": "state", "game": self.id, "state": public_state(self.game, None)})
+
+    def _check_over(self) -> bool:
+        w = self.game.check_winner()
+        if w is not None:
+            self.winner = self.game.players.index(w)
+            self.over = True
+        elif self.turns >= self.max_turns:
+            self.over = True
+        return self.over
+
+    async def advance(self) -> None:
+        """Play AI turns until a human seat is to move (its turn is started) or the game ends."""
+        while not self._check_over():
+            seat = self.game.turn % 2
+            agent = self.agents[seat]
+            if agent is None:
+                if await self._step(_start_turn, then=self._your_turn):
+                    await self._your_turn()
+                return
+            if not await self._step(play_turn, agent, then=self._ai_turn_done):
+                return
+            self.turns += 1
+        await self.flush()
+        await self.broadcast({"type": "game_over", "winner": self.winner, "turns": self.turns})
+
+    async def _your_turn(self) -> None:
+        await self.broadcast({"type": "your_turn", "seat": self.game.turn % 2})
+
+    async def _ai_turn_done(self) -> None:
+        self.turns += 1
+        await self.advance()
+
+    async def act(self, seat: Optional[int], cmd: str, arg: Any) -> None:
+        async with self.lock:
+            if self.over:
+                raise ActionError("the game is over")
+            if seat is None or self.seats[seat] != HUMAN:
+                raise ActionError("you do not hold a human seat in this game")
+            if self.game.turn % 2 != seat:
+                raise ActionError("it is not your turn")
+            if self._parked is not None:
+                raise ActionError("answer the pending prompt first")
+
+            async def then() -> None:
+                if cmd == "e":
+                    self.turns += 1
+                    await self.advance()
+                elif self._check_over():
+                    await self.broadcast({"type": "game_over", "winner": self.winner, "turns": self.turns})
+
+            if await self._step(apply_human, seat, cmd, arg, then=then):
+                await then()
+
+    def close(self) -> None:
+        self._parked = self._then = None
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "game": self.id,
+            "seats": [
+                {"kind": k, "taken": (k != HUMAN) or (i in self.clients)} for i, k in enumerate(self.seats)
+            ],
+            "turn": self.game.turn_number,
+            "over": self.over,
+            "winner": self.winner,
+            "waiting": self.pending is not None,
+        }
+
+
+def _start_turn(game) -> None:
+    game.start_turn()
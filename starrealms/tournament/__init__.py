@@ -0,0 +1,41 @@
+# starrealms/tournament/__init__.py
+"""
+Parallel AI tournaments (round-robin or Swiss) with Elo and TrueSkill ratings.
+
+    python -m starrealms.tournament --agent base=policy --agent good=heuristic \\
+        --games 20 --results ai_data/tournament.jsonl
+"""
+
+from .ratings import EloRating, TrueSkill, TrueSkillEnv, bradley_terry_elo, trueskill_ratings
+from .runner import (
+    ROUND_ROBIN,
+    SWISS,
+    AgentSpec,
+    GameRecord,
+    Standing,
+    Tournament,
+    format_standings,
+    load_results,
+    make_agent,
+    parse_agent,
+    standings,
+)
+
+__all__ = [
+    "EloRating",
+    "TrueSkill",
+    "TrueSkillEnv",
+    "bradley_terry_elo",
+    "trueskill_ratings",
+    "ROUND_ROBIN",
+    "SWISS",
+    "AgentSpec",
+    "GameRecord",
+    "Standing",
+    "Tournament",
+    "format_standings",
+    "load_results",
+    "make_agent",
+    "parse_agent",
+    "standings",
+]
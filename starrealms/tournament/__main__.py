@@ -0,0 +1,46 @@
+# starrealms/tournament/__main__.py
+import argparse
+
+from .runner import ROUND_ROBIN, SWISS, Tournament, format_standings, parse_agent
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Star Realms AI tournament")
+    ap.add_argument(
+        "--agent",
+        action="append",
+        required=True,
+        help="NAME=KIND[@WEIGHTS]; KIND is policy, heuristic, value or package.module:Class (repeat)",
+    )
+    ap.add_argument("--format", choices=(ROUND_ROBIN, SWISS), default=ROUND_ROBIN)
+    ap.add_argument("--games", type=int, default=2, help="games per pairing (seat-swapped pairs)")
+    ap.add_argument("--rounds", type=int, default=0, help="Swiss rounds (default: log2(n) + 1)")
+    ap.add_argument("--workers", type=int, default=0, help="processes (default: CPU count)")
+    ap.add_argument("--results", help="JSON-lines results file; existing games are skipped (resume)")
+    ap.add_argument("--db", help="also store every game in this SQLite results warehouse")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--max-turns", type=int, default=200)
+    ap.add_argument("--quiet", action="store_true", help="don't print each game as it finishes")
+    args = ap.parse_args(argv)
+
+    def progress(rec):
+        who = rec.winner or "draw"
+        print(f"{rec.id}: {rec.first} vs {rec.second} -> {who} ({rec.turns} turns)", flush=True)
+
+    t = Tournament(
+        [parse_agent(a) for a in args.agent],
+        format=args.format,
+        games_per_pair=args.games,
+        rounds=args.rounds,
+        workers=args.workers,
+        results_path=args.results,
+        db_path=args.db,
+        seed=args.seed,
+        max_turns=args.max_turns,
+        on_result=None if args.quiet else progress,
+    )
+    print(format_standings(t.run()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# starrealms/tournament/ratings.py
+"""
+Rating models for tournament results.
+
+- Elo: Bradley-Terry maximum likelihood over all games (order independent, so
+  results can arrive from workers in any order), with a normal-approximation
+  confidence interval from the Fisher information. Draws count half a win.
+- TrueSkill: the two-player Gaussian update with a draw margin, applied in a
+  caller-given canonical order; mu +/- z * sigma is its interval.
+"""
+
+from __future__ import annotations
+import math
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Dict, Iterable, List, Optional, Tuple
+
+ELO_BASE = 1500.0
+ELO_SCALE = 400.0 / math.log(10.0)  # Elo points per natural-log unit of strength
+PRIOR_GAMES = 1.0  # virtual draw against an average opponent (keeps 100% scores finite)
+
+_N = NormalDist()
+
+# (player_a, player_b, score_a) with score_a in {1, 0.5, 0}
+Outcome = Tuple[str, str, float]
+
+
+@dataclass(frozen=True)
+class EloRating:
+    elo: float
+    low: float
+    high: float
+
+
+def bradley_terry_elo(
+    outcomes: Iterable[Outcome],
+    players: Optional[Iterable[str]] = None,
+    z: float = 1.96,
+    iterations: int = 500,
+    tol: float = 1e-10,
+) -> Dict[str, EloRating]:
+    """Elo ratings (mean 1500) and z-sigma intervals from pairwise outcomes."""
+    wins: Dict[str, float] = {}
+    pair_games: Dict[Tuple[str, str], float] = {}
+    for a, b, s in outcomes:
+        wins[a] = wins.get(a, 0.0) + s
+        wins[b] = wins.get(b, 0.0) + (1.0 - s)
+        key = (a, b) if a <= b else (b, a)
+        pair_games[key] = pair_games.get(key, 0.0) + 1.0
+    names = sorted(set(players or ()) | set(wins))
+    if not names:
+        return {}
+
+    opponents: Dict[str, List[Tuple[str, float]]] = {n: [] for n in names}
+    for (a, b), n in pair_games.items():
+        opponents[a].append((b, n))
+        opponents[b].append((a, n))
+
+    # Minorization-maximization (Hunter 2004); the prior is a draw vs gamma = 1.
+    gamma = {n: 1.0 for n in names}
+    for _ in range(iterations):
+        new = {}
+        for i in names:
+            denom = PRIOR_GAMES / (gamma[i] + 1.0)
+            for j, n in opponents[i]:
+                denom += n / (gamma[i] + gamma[j])
+            new[i] = (wins.get(i, 0.0) + 0.5 * PRIOR_GAMES) / denom
+        g = math.exp(sum(math.log(v) for v in new.values()) / len(new))
+        new = {k: v / g for k, v in new.items()}
+        delta = max(abs(math.log(new[k] / gamma[k])) for k in names)
+        gamma = new
+        if delta < tol:
+            break
+
+    out = {}
+    for i in names:
+        info = PRIOR_GAMES * _p(gamma[i], 1.0) * _p(1.0, gamma[i])
+        for j, n in opponents[i]:
+            p = _p(gamma[i], gamma[j])
+            info += n * p * (1.0 - p)
+        elo = ELO_BASE + ELO_SCALE * math.log(gamma[i])
+        half = z * ELO_SCALE / math.sqrt(info)
+        out[i] = EloRating(elo, elo - half, elo + half)
+    return out
+
+
+def _p(gi: float, gj: float) -> float:
+    return gi / (gi + gj)
+
+
+# ---------------- TrueSkill (two players) ----------------
+@dataclass(frozen=True)
+class TrueSkill:
+    mu: float = 25.0
+    sigma: float = 25.0 / 3.0
+
+    def interval(self, z: float = 1.96) -> Tuple[float, float]:
+        return self.mu - z * self.sigma, self.mu + z * self.sigma
+
+    @property
+    def conservative(self) -> float:
+        return self.mu - 3.0 * self.sigma
+
+
+@dataclass(frozen=True)
+class TrueSkillEnv:
+    mu: float = 25.0
+    sigma: float = 25.0 / 3.0
+    beta: float = 25.0 / 6.0
+    tau: float = 25.0 / 300.0
+    draw_probability: float = 0.05
+
+    def create(self) -> TrueSkill:
+        return TrueSkill(self.mu, self.sigma)
+
+    @property
+    def draw_margin(self) -> float:
+        return _N.inv_cdf((self.draw_probability + 1.0) / 2.0) * math.sqrt(2.0) * self.beta
+
+    def rate_1vs1(self, a: TrueSkill, b: TrueSkill, score_a: float) -> Tuple[TrueSkill, TrueSkill]:
+        """Update after one game; score_a is 1 (a won), 0 (b won) or 0.5 (draw)."""
+        if score_a < 0.5:
+            b2, a2 = self.rate_1vs1(b, a, 1.0)
+            return a2, b2
+        var_a = a.sigma**2 + self.tau**2
+        var_b = b.sigma**2 + self.tau**2
+        c2 = 2.0 * self.beta**2 + var_a + var_b
+        c = math.sqrt(c2)
+        t = (a.mu - b.mu) / c
+        eps = self.draw_margin / c
+        if score_a > 0.5:
+            v, w = _v_win(t, eps), _w_win(t, eps)
+        else:
+            v, w = _v_draw(t, eps), _w_draw(t, eps)
+        a2 = TrueSkill(a.mu + var_a / c * v, math.sqrt(var_a * max(1e-9, 1.0 - var_a / c2 * w)))
+        b2 = TrueSkill(b.mu - var_b / c * v, math.sqrt(var_b * max(1e-9, 1.0 - var_b / c2 * w)))
+        return a2, b2
+
+
+def _v_win(t: float, eps: float) -> float:
+    x = t - eps
+    denom = _N.cdf(x)
+    return -x if denom < 1e-300 else _N.pdf(x) / denom
+
+
+def _w_win(t: float, eps: float) -> float:
+    x = t - eps
+    v = _v_win(t, eps)
+    return min(1.0, max(0.0, v * (v + x)))
+
+
+def _v_draw(t: float, eps: float) -> float:
+    a, b = -eps - t, eps - t
+    denom = _N.cdf(b) - _N.cdf(a)
+    if denom < 1e-300:
+        return -t
+    return (_N.pdf(a) - _N.pdf(b)) / denom
+
+
+def _w_draw(t: float, eps: float) -> float:
+    a, b = -eps - t, eps - t
+    denom = _N.cdf(b) - _N.cdf(a)
+    if denom < 1e-300:
+        return 1.0
+    v = _v_draw(t, eps)
+    return min(1.0, max(0.0, v * v + (b * _N.pdf(b) - a * _N.pdf(a)) / denom))
+
+
+def trueskill_ratings(
+    outcomes: Iterable[Outcome], players: Optional[Iterable[str]] = None, env: Optional[TrueSkillEnv] = None
+) -> Dict[str, TrueSkill]:
+    """Sequential TrueSkill over outcomes in the order given."""
+    env = env or TrueSkillEnv()
+    ratings: Dict[str, TrueSkill] = {n: env.create() for n in (players or ())}
+    for a, b, s in outcomes:
+        ra = ratings.get(a) or env.create()
+        rb = ratings.get(b) or env.create()
+        ratings[a], ratings[b] = env.rate_1vs1(ra, rb, s)
+    return ratings
@@ -0,0 +1,392 @@
+# starrealms/tournament/runner.py
+"""
+Round-robin / Swiss tournaments between AI agents.
+
+- Agents are described by picklable AgentSpecs (built inside each worker).
+- Every pairing is played in seat-swapped pairs: both games use the same seed,
+  so each agent gets the same deals from both seats.
+- Games run on a process pool; each result is appended to a JSON-lines file as
+  soon as it arrives. Re-running with the same file skips finished games, so an
+  interrupted tournament resumes where it stopped (Swiss pairings are rebuilt
+  from the recorded results, so they come out the same).
+- Standings carry win/draw/loss counts, Bradley-Terry Elo and TrueSkill, each
+  with a confidence interval.
+- With `db_path` every game is also stored in the SQLite results warehouse
+  (starrealms.warehouse), tagged with the agents' weights hashes.
+"""
+
+from __future__ import annotations
+import hashlib
+import importlib
+import json
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .ratings import TrueSkillEnv, bradley_terry_elo, trueskill_ratings
+
+ROUND_ROBIN = "round-robin"
+SWISS = "swiss"
+
+
+# ---------------- Agents ----------------
+@dataclass(frozen=True)
+class AgentSpec:
+    """
+    kind: "policy" (PolicyAgent; weights = JSON weights file or None for the
+    default), "heuristic" (GoodHeuristicAgent), "value" (value.ValueAgent;
+    weights = .npz model file or None for the default), or
+    "package.module:Class" for any agent class with plan_turn/plan_buys
+    (constructed with `options` as kwargs).
+    """
+
+    name: str
+    kind: str = "policy"
+    weights: Optional[str] = None
+    options: Tuple[Tuple[str, Any], ...] = ()
+
+
+def parse_agent(text: str) -> AgentSpec:
+    """'NAME=KIND[@WEIGHTS]', e.g. 'base=policy@ai_data/ai_weights.json', 'good=heuristic'."""
+    name, sep, rest = text.partition("=")
+    if not sep or not name:
+        raise ValueError(f"agent spec must look like NAME=KIND[@WEIGHTS]: {text!r}")
+    kind, _, weights = rest.partition("@")
+    return AgentSpec(name.strip(), kind.strip() or "policy", weights.strip() or None)
+
+
+def make_agent(spec: AgentSpec):
+    from starrealms.ai import GoodHeuristicAgent, PolicyAgent, load_weights
+
+    if spec.kind == "policy":
+        return PolicyAgent(load_weights(spec.weights) if spec.weights else None)
+    if spec.kind == "heuristic":
+        return GoodHeuristicAgent()
+    if spec.kind == "value":
+        from starrealms.value import ValueAgent
+
+        return ValueAgent(spec.weights)
+    module, sep, cls = spec.kind.partition(":")
+    if not sep:
+        raise ValueError(f"unknown agent kind {spec.kind!r}")
+    return getattr(importlib.import_module(module), cls)(**dict(spec.options))
+
+
+def weights_id(spec: AgentSpec) -> Optional[str]:
+    """
+    Id of the weights a policy or value agent plays with (None for other kinds):
+    the policy's buy-cache key, or a hash of the value model file.
+    """
+    if spec.kind == "value":
+        from starrealms.value import MODEL_PATH
+
+        path = spec.weights or MODEL_PATH
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()[:12]
+    if spec.kind != "policy":
+        return None
+    from starrealms.ai import PolicyAgent, load_weights
+    from starrealms.planning.buy_cache import policy_key
+
+    return policy_key(PolicyAgent.__name__, load_weights(spec.weights) if spec.weights else load_weights())
+
+
+# ---------------- Games ----------------
+@dataclass(frozen=True)
+class GameJob:
+    id: str
+    first: str
+    second: str
+    seed: int
+
+
+@dataclass(frozen=True)
+class GameRecord:
+    id: str
+    first: str
+    second: str
+    seed: int
+    winner: Optional[str]  # agent name, None for a draw (turn cap)
+    turns: int
+
+    def score_first(self) -> float:
+        return 0.5 if self.winner is None else float(self.winner == self.first)
+
+
+def _seed(base: int, *parts: Any) -> int:
+    return zlib.crc32(":".join(map(str, (base,) + parts)).encode("utf-8"))
+
+
+def _pair_jobs(prefix: str, a: str, b: str, games: int, base_seed: int) -> List[GameJob]:
+    """`games` games between a and b, seat-swapped in pairs sharing a seed."""
+    jobs = []
+    for k in range(games):
+        seed = _seed(base_seed, prefix, a, b, k // 2)
+        first, second = (a, b) if k % 2 == 0 else (b, a)
+        jobs.append(GameJob(f"{prefix}:{a}:{b}:{k}", first, second, seed))
+    return jobs
+
+
+def seat_swapped_jobs(
+    agents: Sequence[AgentSpec], games: int, seed: int, prefix: str
+) -> Iterator[Tuple[int, AgentSpec, AgentSpec]]:
+    """(seed, first, second) for `games` games in seat-swapped pairs sharing a seed; one agent means self-play."""
+    a, b = agents[0], agents[-1]
+    for k in range(games):
+        first, second = (a, b) if k % 2 == 0 else (b, a)
+        yield _seed(seed, prefix, k // 2), first, second
+
+
+def round_robin_jobs(names: Sequence[str], games_per_pair: int, base_seed: int = 0) -> List[GameJob]:
+    names = sorted(names)
+    jobs = []
+    for i, a in enumerate(names):
+        for b in names[i + 1 :]:
+            jobs.extend(_pair_jobs("rr", a, b, games_per_pair, base_seed))
+    return jobs
+
+
+def swiss_pairings(
+    names: Sequence[str], ratings: Dict[str, float], played: Dict[str, set]
+) -> List[Tuple[str, str]]:
+    """Pair neighbours in the standings, avoiding rematches when possible; odd one out sits."""
+    order = sorted(names, key=lambda n: (-ratings.get(n, 0.0), n))
+    pairs = []
+    free = list(order)
+    while len(free) >= 2:
+        a = free.pop(0)
+        j = next((k for k, b in enumerate(free) if b not in played.get(a, set())), 0)
+        b = free.pop(j)
+        pairs.append((a, b) if a <= b else (b, a))
+    return pairs
+
+
+_worker_agents: Dict[AgentSpec, Any] = {}
+
+
+def _run_job(job: GameJob, specs: Dict[str, AgentSpec], max_turns: int) -> GameRecord:
+    from starrealms.runner.headless import play_game
+
+    agents = []
+    for name in (job.first, job.second):
+        spec = specs[name]
+        if spec not in _worker_agents:  # agents are stateless between games
+            _worker_agents[spec] = make_agent(spec)
+        agents.append(_worker_agents[spec])
+    res = play_game(agents, seed=job.seed, max_turns=max_turns)
+    winner = None if res.winner is None else (job.first, job.second)[res.winner]
+    return GameRecord(job.id, job.first, job.second, job.seed, winner, res.turns)
+
+
+# ---------------- Results file ----------------
+def load_results(path: Optional[str]) -> Dict[str, GameRecord]:
+    """Records from a JSON-lines results file; a torn last line (crash) is ignored."""
+    out: Dict[str, GameRecord] = {}
+    if not path or not os.path.exists(path):
+        return out
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                rec = GameRecord(**json.loads(line))
+            except (ValueError, TypeError):
+                continue
+            out[rec.id] = rec
+    return out
+
+
+def _drop_torn_tail(path: str) -> None:
+    """Cut a partial last line (crash mid-write) so appended records start cleanly."""
+    try:
+        with open(path, "rb+") as f:
+            data = f.read()
+            if data and not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+    except FileNotFoundError:
+        pass
+
+
+# ---------------- Standings ----------------
+@dataclass
+class Standing:
+    name: str
+    games: int = 0
+    wins: int = 0
+    draws: int = 0
+    losses: int = 0
+    elo: float = 1500.0
+    elo_low: float = 1500.0
+    elo_high: float = 1500.0
+    ts_mu: float = 25.0
+    ts_sigma: float = 25.0 / 3.0
+
+    @property
+    def score(self) -> float:
+        return (self.wins + 0.5 * self.draws) / self.games if self.games else 0.0
+
+
+def standings(
+    records: Iterable[GameRecord], names: Sequence[str], env: Optional[TrueSkillEnv] = None
+) -> List[Standing]:
+    """Table sorted by Elo. TrueSkill replays games in id order so it is reproducible."""
+    recs = sorted(records, key=lambda r: r.id)
+    table = {n: Standing(n) for n in names}
+    outcomes = []
+    for r in recs:
+        s = r.score_first()
+        outcomes.append((r.first, r.second, s))
+        for name, score in ((r.first, s), (r.second, 1.0 - s)):
+            row = table.setdefault(name, Standing(name))
+            row.games += 1
+            if score == 1.0:
+                row.wins += 1
+            elif score == 0.0:
+                row.losses += 1
+            else:
+                row.draws += 1
+    for n, e in bradley_terry_elo(outcomes, table).items():
+        table[n].elo, table[n].elo_low, table[n].elo_high = e.elo, e.low, e.high
+    for n, t in trueskill_ratings(outcomes, table, env).items():
+        table[n].ts_mu, table[n].ts_sigma = t.mu, t.sigma
+    return sorted(table.values(), key=lambda s: (-s.elo, s.name))
+
+
+def format_standings(rows: Sequence[Standing]) -> str:
+    lines = [
+        f"{'#':>2} {'agent':<20} {'G':>4} {'W':>4} {'D':>4} {'L':>4} {'score':>6}"
+        f" {'Elo':>6} {'95% CI':>13} {'TS mu':>6} {'±2σ':>5}"
+    ]
+    for i, s in enumerate(rows, start=1):
+        lines.append(
+            f"{i:>2} {s.name:<20} {s.games:>4} {s.wins:>4} {s.draws:>4} {s.losses:>4} {s.score:>6.3f}"
+            f" {s.elo:>6.0f} {f'[{s.elo_low:.0f}, {s.elo_high:.0f}]':>13} {s.ts_mu:>6.2f} {2 * s.ts_sigma:>5.2f}"
+        )
+    return "\n".join(lines)
+
+
+# ---------------- Runner ----------------
+@dataclass
+class Tournament:
+    agents: Sequence[AgentSpec]
+    format: str = ROUND_ROBIN
+    games_per_pair: int = 2
+    rounds: int = 0  # Swiss only; 0 = ceil(log2(n)) + 1
+    workers: int = 0  # 0 = os.cpu_count(); 1 = run in-process
+    results_path: Optional[str] = None
+    seed: int = 0
+    max_turns: int = 200
+    on_result: Optional[Callable[[GameRecord], None]] = None
+    db_path: Optional[str] = None  # SQLite results warehouse
+    records: Dict[str, GameRecord] = field(default_factory=dict)
+
+    def __post_init__(self):
+        names = [a.name for a in self.agents]
+        if len(set(names)) != len(names):
+            raise ValueError("agent names must be unique")
+        if self.format not in (ROUND_ROBIN, SWISS):
+            raise ValueError(f"unknown tournament format {self.format!r}")
+        self._specs = {a.name: a for a in self.agents}
+        self._wh = None
+        self.records.update(load_results(self.results_path))
+
+    @property
+    def names(self) -> List[str]:
+        return [a.name for a in self.agents]
+
+    def run(self) -> List[Standing]:
+        workers = self.workers or os.cpu_count() or 1
+        pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        self._open_warehouse()
+        try:
+            if self.format == ROUND_ROBIN:
+                self._play(round_robin_jobs(self.names, self.games_per_pair, self.seed), pool)
+            else:
+                n_rounds = self.rounds or (max(1, (len(self.agents) - 1).bit_length()) + 1)
+                for rnd in range(1, n_rounds + 1):
+                    self._play(self._swiss_round(rnd), pool)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+            if self._wh is not None:
+                self._wh.finish_run(self._run_id)
+                self._wh.close()
+                self._wh = None
+        return self.standings()
+
+    def _open_warehouse(self) -> None:
+        if not self.db_path:
+            return
+        from starrealms.warehouse import Warehouse
+
+        self._weights = {a.name: weights_id(a) for a in self.agents}
+        self._wh = Warehouse(self.db_path)
+        meta = {
+            "format": self.format,
+            "games_per_pair": self.games_per_pair,
+            "max_turns": self.max_turns,
+            "results": self.results_path,
+            "agents": [dict(asdict(a), weights_id=self._weights[a.name]) for a in self.agents],
+        }
+        self._run_id = self._wh.start_run("tournament", seed=self.seed, meta=meta)
+
+    def _store(self, rec: GameRecord) -> None:
+        from starrealms.warehouse import SeatResult
+
+        s = rec.score_first()
+        seats = [
+            SeatResult(rec.first, s, self._weights.get(rec.first)),
+            SeatResult(rec.second, 1.0 - s, self._weights.get(rec.second)),
+        ]
+        winner = None if rec.winner is None else (0 if rec.winner == rec.first else 1)
+        self._wh.add_game(self._run_id, seats, winner, rec.turns, seed=rec.seed, key=rec.id)
+
+    def standings(self) -> List[Standing]:
+        return standings(self.records.values(), self.names)
+
+    def _swiss_round(self, rnd: int) -> List[GameJob]:
+        before = [r for r in self.records.values() if _round_of(r.id) < rnd]
+        ratings = {s.name: s.elo for s in standings(before, self.names)}
+        played: Dict[str, set] = {}
+        for r in before:
+            played.setdefault(r.first, set()).add(r.second)
+            played.setdefault(r.second, set()).add(r.first)
+        jobs = []
+        for a, b in swiss_pairings(self.names, ratings, played):
+            jobs.extend(_pair_jobs(f"sw{rnd}", a, b, self.games_per_pair, self.seed))
+        return jobs
+
+    def _play(self, jobs: List[GameJob], pool) -> None:
+        todo = [j for j in jobs if j.id not in self.records]
+        if not todo:
+            return
+        out = None
+        if self.results_path:
+            _drop_torn_tail(self.results_path)
+            out = open(self.results_path, "a", encoding="utf-8")
+        try:
+            if pool is None:
+                done = (_run_job(j, self._specs, self.max_turns) for j in todo)
+            else:
+                futures = [pool.submit(_run_job, j, self._specs, self.max_turns) for j in todo]
+                done = (f.result() for f in as_completed(futures))
+            for rec in done:
+                self.records[rec.id] = rec
+                if self._wh is not None:
+                    self._store(rec)
+                if out is not None:
+                    out.write(json.dumps(asdict(rec)) + "\n")
+                    out.flush()
+                if self.on_result is not None:
+                    self.on_result(rec)
+        finally:
+            if out is not None:
+                out.close()
+
+
+def _round_of(game_id: str) -> int:
+    """Swiss round of a game id ('sw3:...' -> 3); 0 for anything else."""
+    head = game_id.split(":", 1)[0]
+    return int(head[2:]) if head.startswith("sw") and head[2:].isdigit() else 0
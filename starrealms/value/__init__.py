@@ -0,0 +1,24 @@
+# starrealms/value/__init__.py
+"""
+CPU-only value network (NumPy MLP) over dataset.encoding observations, the
+ValueAgent that buys with it, and its trainer (needs numpy).
+
+    python -m starrealms.value --data ai_data/traj --agent good=heuristic --games 2000 --rounds 3
+    python -m starrealms.tournament --agent v=value@ai_data/value_mlp.npz --agent good=heuristic
+"""
+
+from .agent import MODEL_PATH, ValueAgent, candidate_sets
+from .features import afterstates, buy_sets
+from .mlp import MLP
+from .train import FitResult, fit
+
+__all__ = [
+    "MODEL_PATH",
+    "ValueAgent",
+    "candidate_sets",
+    "afterstates",
+    "buy_sets",
+    "MLP",
+    "FitResult",
+    "fit",
+]
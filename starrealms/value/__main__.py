@@ -0,0 +1,63 @@
+# starrealms/value/__main__.py
+import argparse
+import os
+
+from starrealms.dataset import ShardDataset, export_trajectories, self_play_jobs
+from starrealms.tournament.runner import AgentSpec, parse_agent
+
+from .agent import MODEL_PATH
+from .mlp import MLP
+from .train import fit
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Train the NumPy value net from self-play")
+    ap.add_argument("--data", required=True, help="trajectory export directory (created or appended to)")
+    ap.add_argument("--out", default=MODEL_PATH, help="model file (.npz)")
+    ap.add_argument("--agent", action="append", default=[], help="NAME=KIND[@WEIGHTS] for the first round's games")
+    ap.add_argument("--games", type=int, default=0, help="self-play games to export per round (0: train only)")
+    ap.add_argument("--rounds", type=int, default=1, help="export/fit rounds; later rounds play the latest net")
+    ap.add_argument("--hidden", default="64,64", help="hidden layer sizes")
+    ap.add_argument("--epochs", type=int, default=5)
+    ap.add_argument("--lr", type=float, default=1e-3)
+    ap.add_argument("--batch-size", type=int, default=512)
+    ap.add_argument("--val-fraction", type=float, default=0.1)
+    ap.add_argument("--max-turns", type=int, default=200)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--resume", action="store_true", help="start from the weights in --out")
+    args = ap.parse_args(argv)
+
+    hidden = tuple(int(h) for h in args.hidden.split(",") if h)
+    agents = [parse_agent(a) for a in args.agent] or [AgentSpec("good", "heuristic")]
+    net = MLP.load(args.out) if args.resume and os.path.exists(args.out) else None
+    for rnd in range(1, args.rounds + 1):
+        if args.games:
+            if rnd > 1 or net is not None:
+                agents = [AgentSpec("value", "value", args.out)]
+            w = export_trajectories(
+                args.data,
+                self_play_jobs(agents, args.games, args.seed + rnd),
+                max_turns=args.max_turns,
+                seed=args.seed + rnd,
+                append=os.path.exists(os.path.join(args.data, "index.json")),
+            )
+            print(f"[round {rnd}] {w.rows} rows from {w.meta.get('games')} games ({', '.join(a.name for a in agents)})")
+        res = fit(
+            ShardDataset(args.data),
+            hidden=hidden,
+            epochs=args.epochs,
+            lr=args.lr,
+            batch_size=args.batch_size,
+            val_fraction=args.val_fraction,
+            seed=args.seed + rnd,
+            init=net,
+            log_fn=print,
+        )
+        net = res.net
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        net.save(args.out)
+        print(f"[round {rnd}] saved {args.out} ({res.train_rows} train / {res.val_rows} val rows)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# starrealms/value/agent.py
+"""
+ValueAgent: PolicyAgent whose buys come from the value net.
+
+Every affordable purchase set (up to the heuristic buy budget, the empty
+set included) is turned into an afterstate and the whole candidate matrix is
+scored in one forward pass; the highest value wins. Lethal search, play-all
+and attacks are PolicyAgent's.
+"""
+
+from __future__ import annotations
+import itertools
+import os
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from starrealms.ai import AI_DATA_DIR, PolicyAgent
+from starrealms.dataset import encoding
+from starrealms.planning.purchase import DEFAULT_MAX_BUYS, EXPLORER_SLOT, Slot
+
+from .features import buy_sets
+from .mlp import MLP
+
+MODEL_PATH = os.path.join(AI_DATA_DIR, "value_mlp.npz")
+
+Candidate = Tuple[Tuple[Slot, ...], Tuple[int, ...]]  # (slots to buy, their card ids)
+
+
+def candidate_sets(game, player, max_buys: int = DEFAULT_MAX_BUYS) -> List[Candidate]:
+    """Every affordable set of at most max_buys purchases; the empty set first."""
+    ids = {n: i for i, n in enumerate(encoding.vocab())}
+    trade = int(player.trade_pool or 0)
+    items = []
+    for slot, card in enumerate(game.trade_row, start=1):
+        if card and card.get("name") in ids and int(card.get("cost", 0) or 0) <= trade:
+            items.append((slot, ids[card["name"]], int(card.get("cost", 0) or 0)))
+    explorer = getattr(game, "explorer_card", None)
+    ex = None
+    if explorer and explorer.get("name") in ids:
+        ex = (EXPLORER_SLOT, ids[explorer["name"]], int(explorer.get("cost", 2) or 2))
+    out: List[Candidate] = [((), ())]
+    for n in range(1, max_buys + 1):
+        for k in range(0, n + 1):  # k row cards + (n - k) Explorers
+            if n - k and ex is None:
+                continue
+            for row in itertools.combinations(items, k):
+                picks = list(row) + [ex] * (n - k)
+                if sum(c for _, _, c in picks) > trade:
+                    continue
+                picks.sort(key=lambda p: -p[2])
+                out.append((tuple(s for s, _, _ in picks), tuple(i for _, i, _ in picks)))
+    return out
+
+
+class ValueAgent(PolicyAgent):
+    """model: an MLP, a .npz path, or None for MODEL_PATH (PolicyAgent buys if it is missing)."""
+
+    def __init__(self, model: Union[MLP, str, None] = None, weights=None, buy_cache=None):
+        super().__init__(weights, buy_cache)
+        if model is None or isinstance(model, str):
+            path = model or MODEL_PATH
+            model = MLP.load(path) if os.path.exists(path) else None
+        if model is not None and model.inputs != encoding.obs_dim():
+            raise ValueError(
+                f"value net expects {model.inputs} inputs, the enabled card sets encode {encoding.obs_dim()}"
+            )
+        self.net: Optional[MLP] = model
+        self._obs = np.zeros(encoding.obs_dim(), np.float32)
+
+    @property
+    def uses_buy_cache(self) -> bool:
+        """The net's buys are not cached; only the PolicyAgent fallback is."""
+        return self.net is None
+
+    def evaluate(self, game, player, max_buys: int = DEFAULT_MAX_BUYS) -> Tuple[List[Candidate], np.ndarray]:
+        """Candidate purchase sets and their values, from one batched forward pass."""
+        cands = candidate_sets(game, player, max_buys)
+        obs = encoding.encode_observation(game, player, self._obs)
+        return cands, self.net.forward(buy_sets(obs, [ids for _, ids in cands]))
+
+    def plan_buys(self, game, player, max_buys: int = DEFAULT_MAX_BUYS, bought: Sequence[Slot] = ()) -> List[object]:
+        if self.net is None:
+            return super().plan_buys(game, player, max_buys, bought)
+        cands, values = self.evaluate(game, player, max_buys)
+        return list(cands[int(np.argmax(values))][0])  # ties: the earlier (smaller) set
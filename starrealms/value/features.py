@@ -0,0 +1,58 @@
+# starrealms/value/features.py
+"""
+Afterstates: a dataset.encoding observation with buys applied.
+
+Buying card i adds one to the player's owned cards (deck + discard block),
+takes it off the trade row (Explorers are not on it) and spends its cost from
+the trade scalar. What the slot refills with is unknown and left out, the same
+way the purchase planner only counts visible cards. The trainer and the
+agent both score afterstates, so the value net is judged on the same inputs it
+was fitted on.
+"""
+
+from __future__ import annotations
+from functools import lru_cache
+from typing import Sequence
+
+import numpy as np
+
+from starrealms.dataset import encoding
+
+
+@lru_cache(maxsize=1)
+def _layout():
+    from starrealms.cards import EXPLORER_NAME, find_card
+
+    names = encoding.vocab()
+    v = len(names)
+    owned = encoding.ZONES.index("owned_rest") * v
+    row = encoding.ZONES.index("trade_row") * v
+    trade = len(encoding.ZONES) * v + encoding.SCALARS.index("trade")
+    costs = np.array([float((find_card(n) or {}).get("cost", 0) or 0) for n in names], np.float32)
+    on_row = np.array([n != EXPLORER_NAME for n in names], np.float32)
+    return owned, row, trade, costs, on_row
+
+
+def afterstates(obs: np.ndarray, actions: np.ndarray) -> np.ndarray:
+    """obs (B, D) with action[b] applied (0 = PASS: unchanged). Returns a new array."""
+    owned, row, trade, costs, on_row = _layout()
+    out = np.array(obs, dtype=np.float32, copy=True)
+    actions = np.asarray(actions)
+    b = np.nonzero(actions > 0)[0]
+    card = actions[b].astype(np.int64) - 1
+    out[b, owned + card] += 1.0
+    out[b, row + card] = np.maximum(out[b, row + card] - on_row[card], 0.0)
+    out[b, trade] -= costs[card]
+    return out
+
+
+def buy_sets(obs: np.ndarray, sets: Sequence[Sequence[int]]) -> np.ndarray:
+    """One afterstate row per candidate set of card ids (vocab order) bought from `obs` (D,)."""
+    owned, row, trade, costs, on_row = _layout()
+    out = np.repeat(np.asarray(obs, np.float32)[None, :], len(sets), axis=0)
+    for k, cards in enumerate(sets):
+        for i in cards:
+            out[k, owned + i] += 1.0
+            out[k, row + i] = max(out[k, row + i] - on_row[i], 0.0)
+            out[k, trade] -= costs[i]
+    return out
@@ -0,0 +1,92 @@
+# starrealms/value/mlp.py
+"""
+A small multilayer perceptron in plain NumPy (float32, CPU).
+
+    x -> standardize -> [Linear -> ReLU] * hidden -> Linear -> tanh  = value in [-1, 1]
+
+forward() takes a whole batch (B, D) and is a handful of matrix products, so
+scoring every candidate of a decision costs one call. backward() returns the
+gradients of the mean squared error for the trainer's Adam step.
+"""
+
+from __future__ import annotations
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+FORMAT = 1
+
+
+class MLP:
+    def __init__(self, sizes: Sequence[int], seed: Optional[int] = 0):
+        if len(sizes) < 2 or sizes[-1] != 1:
+            raise ValueError("sizes are (inputs, hidden..., 1)")
+        rng = np.random.default_rng(seed)
+        self.sizes = tuple(int(s) for s in sizes)
+        self.params: List[np.ndarray] = []
+        for fan_in, fan_out in zip(self.sizes[:-1], self.sizes[1:]):
+            w = rng.normal(0.0, np.sqrt(2.0 / fan_in), (fan_in, fan_out)).astype(np.float32)  # He init
+            self.params += [w, np.zeros(fan_out, np.float32)]
+        self.mean = np.zeros(self.sizes[0], np.float32)
+        self.scale = np.ones(self.sizes[0], np.float32)  # 1 / std
+        self.meta: Dict[str, Any] = {}
+
+    @property
+    def inputs(self) -> int:
+        return self.sizes[0]
+
+    def set_normalization(self, mean: np.ndarray, std: np.ndarray) -> None:
+        self.mean = np.asarray(mean, np.float32)
+        self.scale = (1.0 / np.maximum(np.asarray(std, np.float32), 1e-3)).astype(np.float32)
+
+    def forward(self, x: np.ndarray) -> np.ndarray:
+        """Values (B,) for a batch of inputs (B, D)."""
+        h = (np.asarray(x, np.float32) - self.mean) * self.scale
+        last = len(self.params) // 2 - 1
+        for k in range(0, len(self.params), 2):
+            h = h @ self.params[k] + self.params[k + 1]
+            if k // 2 < last:
+                np.maximum(h, 0.0, out=h)
+        return np.tanh(h[:, 0])
+
+    __call__ = forward
+
+    def loss_and_grads(self, x: np.ndarray, y: np.ndarray) -> Tuple[float, List[np.ndarray]]:
+        """Mean squared error of forward(x) against y, and d loss / d params."""
+        acts = [(np.asarray(x, np.float32) - self.mean) * self.scale]
+        last = len(self.params) // 2 - 1
+        for k in range(0, len(self.params), 2):
+            h = acts[-1] @ self.params[k] + self.params[k + 1]
+            acts.append(np.maximum(h, 0.0) if k // 2 < last else h)
+        out = np.tanh(acts[-1][:, 0])
+        err = out - np.asarray(y, np.float32)
+        loss = float(np.mean(err * err))
+        delta = ((2.0 / len(err)) * err * (1.0 - out * out))[:, None].astype(np.float32)
+        grads: List[np.ndarray] = [None] * len(self.params)  # type: ignore[list-item]
+        for k in range(len(self.params) - 2, -1, -2):
+            a = acts[k // 2]
+            grads[k] = a.T @ delta
+            grads[k + 1] = delta.sum(axis=0)
+            if k:
+                delta = (delta @ self.params[k].T) * (a > 0.0)
+        return loss, grads
+
+    # ---------------- persistence ----------------
+    def save(self, path: str) -> None:
+        arrays = {f"p{i}": p for i, p in enumerate(self.params)}
+        meta = dict(self.meta, format=FORMAT, sizes=list(self.sizes))
+        with open(path, "wb") as f:
+            np.savez(f, mean=self.mean, scale=self.scale, meta=np.array(json.dumps(meta)), **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> "MLP":
+        with np.load(path, allow_pickle=False) as z:
+            meta = json.loads(str(z["meta"]))
+            if meta.get("format") != FORMAT:
+                raise ValueError(f"{path}: unsupported model format {meta.get('format')!r}")
+            net = cls(meta["sizes"], seed=None)
+            net.params = [z[f"p{i}"].astype(np.float32) for i in range(len(net.params))]
+            net.mean, net.scale = z["mean"], z["scale"]
+        net.meta = {k: v for k, v in meta.items() if k not in ("format", "sizes")}
+        return net
@@ -0,0 +1,128 @@
+# starrealms/value/train.py
+"""
+Fit the value net on exported trajectories (starrealms.dataset shards).
+
+Each row becomes (afterstate of the chosen action, acting player's final
+outcome); the net regresses the outcome with mean squared error and Adam.
+Whole games are held out for validation (game id % k == 0, k = 1/val_fraction)
+so positions of one game never sit on both sides. Inputs are standardized
+with mean/std from one streaming pass over the shards; the parameters with the
+best validation loss are kept.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from starrealms.dataset import ShardDataset, encoding
+
+from .features import afterstates
+from .mlp import MLP
+
+
+@dataclass
+class FitResult:
+    net: MLP
+    history: List[Dict[str, float]] = field(default_factory=list)
+    train_rows: int = 0
+    val_rows: int = 0
+
+
+def _holdout(games: np.ndarray, val_fraction: float) -> np.ndarray:
+    if val_fraction <= 0:
+        return np.zeros(len(games), np.bool_)
+    k = max(2, int(round(1.0 / val_fraction)))
+    return (games % k) == 0
+
+
+def input_stats(ds: ShardDataset, batch_size: int = 8192):
+    """Mean and std of the afterstate inputs, accumulated block by block."""
+    n, total, sq = 0, None, None
+    for b in ds.batches(batch_size, shuffle=False, columns=("obs", "action")):
+        x = afterstates(b["obs"], b["action"]).astype(np.float64)
+        total = x.sum(axis=0) if total is None else total + x.sum(axis=0)
+        sq = (x * x).sum(axis=0) if sq is None else sq + (x * x).sum(axis=0)
+        n += len(x)
+    if not n:
+        raise ValueError("the dataset is empty")
+    mean = total / n
+    return mean, np.sqrt(np.maximum(sq / n - mean * mean, 0.0))
+
+
+def evaluate(net: MLP, ds: ShardDataset, val_fraction: float, held_out: bool, batch_size: int = 8192):
+    """(mean squared error, sign accuracy on decided games, rows) on one side of the split."""
+    se = hits = decided = n = 0.0
+    for b in ds.batches(batch_size, shuffle=False, columns=("obs", "action", "outcome", "game")):
+        keep = _holdout(b["game"], val_fraction) == held_out
+        if not keep.any():
+            continue
+        y = b["outcome"][keep].astype(np.float32)
+        v = net.forward(afterstates(b["obs"][keep], b["action"][keep]))
+        se += float(((v - y) ** 2).sum())
+        won = y != 0
+        hits += float((np.sign(v[won]) == y[won]).sum())
+        decided += float(won.sum())
+        n += len(y)
+    return (se / n if n else float("nan")), (hits / decided if decided else float("nan")), int(n)
+
+
+def fit(
+    ds: ShardDataset,
+    hidden: Sequence[int] = (64, 64),
+    epochs: int = 5,
+    lr: float = 1e-3,
+    batch_size: int = 512,
+    val_fraction: float = 0.1,
+    seed: int = 0,
+    init: Optional[MLP] = None,
+    log_fn: Optional[Callable[[str], None]] = None,
+) -> FitResult:
+    if ds.index["columns"]["obs"][1] != [encoding.obs_dim()]:
+        raise ValueError("dataset was exported with a different card vocabulary")
+    net = init or MLP((encoding.obs_dim(), *hidden, 1), seed=seed)
+    if init is None:
+        net.set_normalization(*input_stats(ds))
+    m = [np.zeros_like(p) for p in net.params]
+    v = [np.zeros_like(p) for p in net.params]
+    beta1, beta2, eps, t = 0.9, 0.999, 1e-8, 0
+    best = (float("inf"), [p.copy() for p in net.params])
+    res = FitResult(net)
+    for epoch in range(1, epochs + 1):
+        total = rows = 0.0
+        for b in ds.batches(batch_size, seed=seed + epoch, columns=("obs", "action", "outcome", "game")):
+            keep = ~_holdout(b["game"], val_fraction)
+            if not keep.any():
+                continue
+            x = afterstates(b["obs"][keep], b["action"][keep])
+            loss, grads = net.loss_and_grads(x, b["outcome"][keep])
+            t += 1
+            for p, g, mi, vi in zip(net.params, grads, m, v):  # Adam
+                mi *= beta1
+                mi += (1 - beta1) * g
+                vi *= beta2
+                vi += (1 - beta2) * g * g
+                p -= (lr * np.sqrt(1 - beta2**t) / (1 - beta1**t)) * mi / (np.sqrt(vi) + eps)
+            total += loss * len(x)
+            rows += len(x)
+        val_loss, val_acc, val_rows = evaluate(net, ds, val_fraction, True)
+        entry = {
+            "epoch": epoch,
+            "train_loss": total / rows if rows else float("nan"),
+            "val_loss": val_loss,
+            "val_sign_acc": val_acc,
+        }
+        res.history.append(entry)
+        res.train_rows, res.val_rows = int(rows), val_rows
+        if log_fn is not None:
+            log_fn(
+                f"[epoch {epoch}] train {entry['train_loss']:.4f}  val {val_loss:.4f}"
+                f"  val sign acc {val_acc:.3f}"
+            )
+        score = val_loss if val_rows else entry["train_loss"]
+        if score < best[0]:
+            best = (score, [p.copy() for p in net.params])
+    net.params = best[1]
+    net.meta.update({"vocab": list(encoding.vocab()), "history": res.history})
+    return res
@@ -5,10 +5,32 @@ Minimal UI shim used by engine/runner code.
 - In Pygame (or tests), you can monkey-patch ui_input / ui_print.
 """
 
-from typing import Any, Iterable
+import threading
+from typing import Any, Callable, Iterable, Optional, Tuple
+
+# Per-thread overrides (e.g. a game-server worker thread routing prompts to its client).
+_local = threading.local()
+
+
+def set_thread_io(
+    input_fn: Optional[Callable[[str], str]] = None,
+    print_fn: Optional[Callable[..., None]] = None,
+) -> None:
+    """Route ui_input / ui_print for the calling thread only (None restores the default)."""
+    _local.input_fn = input_fn
+    _local.print_fn = print_fn
+
+
+def thread_io() -> Tuple[Optional[Callable[[str], str]], Optional[Callable[..., None]]]:
+    """The calling thread's (input_fn, print_fn) overrides, for save/restore."""
+    return getattr(_local, "input_fn", None), getattr(_local, "print_fn", None)
 
 
 def ui_print(*args: Any, **kwargs: Any) -> None:
+    fn = getattr(_local, "print_fn", None)
+    if fn is not None:
+        fn(*args, **kwargs)
+        return
     print(*args, **kwargs)
 
 
@@ -20,6 +42,9 @@ def ui_log(game, message: str) -> None:
 
 def ui_input(prompt: str = "") -> str:
     """Default CLI input. In Pygame, monkey-patch this function."""
+    fn = getattr(_local, "input_fn", None)
+    if fn is not None:
+        return fn(prompt)
     return input(prompt)
 
 
@@ -0,0 +1,11 @@
+# starrealms/warehouse/__init__.py
+"""
+Local SQLite store for tournament and training results.
+
+    python -m starrealms.tournament ... --db ai_data/results.db
+    python -m starrealms.warehouse ai_data/results.db rates --by agent
+"""
+
+from .store import SeatResult, Warehouse, WinRate, wilson
+
+__all__ = ["SeatResult", "Warehouse", "WinRate", "wilson"]
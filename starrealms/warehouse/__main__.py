@@ -0,0 +1,72 @@
+# starrealms/warehouse/__main__.py
+import argparse
+import json
+
+from .store import GROUPS, Warehouse
+
+
+def _filters(args):
+    return {
+        k: getattr(args, k)
+        for k in ("run", "agent", "weights", "since", "until", "seed")
+        if getattr(args, k) is not None
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Query the Star Realms results warehouse")
+    ap.add_argument("db", help="SQLite results file")
+    ap.add_argument("query", choices=("runs", "rates", "turns", "games"))
+    ap.add_argument("--by", choices=sorted(GROUPS), default="agent", help="rates: group by")
+    ap.add_argument("--run", type=int)
+    ap.add_argument("--agent")
+    ap.add_argument("--weights", help="weights id, i.e. the policy key (a prefix is enough)")
+    ap.add_argument("--since", help="ISO date/time, inclusive (UTC)")
+    ap.add_argument("--until", help="ISO date/time, exclusive (UTC)")
+    ap.add_argument("--seed", type=int)
+    ap.add_argument("--limit", type=int, default=20, help="runs/games: rows to show")
+    ap.add_argument("--json", action="store_true", help="machine-readable output")
+    args = ap.parse_args(argv)
+
+    with Warehouse(args.db) as wh:
+        if args.query == "runs":
+            rows = wh.runs(args.limit)
+            if args.json:
+                print(json.dumps(rows, indent=2))
+                return
+            for r in rows:
+                print(
+                    f"{r['id']:>4} {r['kind']:<12} {r['started']} -> {r['finished'] or '...':<20}"
+                    f" {r['games']:>7} games  {json.dumps(r['meta'], sort_keys=True)}"
+                )
+        elif args.query == "rates":
+            rows = wh.win_rates(by=args.by, **_filters(args))
+            if args.json:
+                print(json.dumps([r.__dict__ for r in rows], indent=2))
+                return
+            print(f"{args.by:<20} {'G':>7} {'W':>6} {'D':>5} {'L':>6} {'score':>6} {'95% CI':>15} {'turns':>6}")
+            for r in rows:
+                turns = "-" if r.avg_turns is None else f"{r.avg_turns:.1f}"
+                print(
+                    f"{str(r.group):<20} {r.games:>7} {r.wins:>6} {r.draws:>5} {r.losses:>6} {r.score:>6.3f}"
+                    f" {f'[{r.low:.3f}, {r.high:.3f}]':>15} {turns:>6}"
+                )
+        elif args.query == "turns":
+            stats = wh.turn_stats(**_filters(args))
+            hist = wh.turn_histogram(**_filters(args))
+            if args.json:
+                print(json.dumps({"stats": stats, "histogram": hist}, indent=2))
+                return
+            print("  ".join(f"{k}={v:.1f}" if isinstance(v, float) else f"{k}={v}" for k, v in stats.items()))
+            peak = max((n for _, n in hist), default=0)
+            for t, n in hist:
+                print(f"{t:>5} {n:>7} {'#' * max(1, round(40 * n / peak))}")
+        else:
+            for i, row in enumerate(wh.iter_games(**_filters(args))):
+                if i >= args.limit:
+                    break
+                print(json.dumps(dict(zip(("id", "run", "key", "played", "seed", "winner", "turns"), row))))
+
+
+if __name__ == "__main__":
+    main()
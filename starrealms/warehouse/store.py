@@ -0,0 +1,295 @@
+# starrealms/warehouse/store.py
+"""
+SQLite results warehouse: per-run metadata and per-game outcomes.
+
+- WAL journal, so readers never block the writer and several processes can
+  append to one file; each process opens its own Warehouse (connections are
+  not shared across fork).
+- Games are buffered and written `batch_size` at a time in one transaction
+  (BEGIN IMMEDIATE, retried while another process holds the write lock).
+- One `seats` row per player per game, indexed by agent and weights hash;
+  games are indexed by run, seed and date. Queries aggregate in SQL, so large
+  runs are never loaded into memory.
+"""
+
+from __future__ import annotations
+import json
+import math
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id       INTEGER PRIMARY KEY,
+    kind     TEXT NOT NULL,
+    started  TEXT NOT NULL,
+    finished TEXT,
+    seed     INTEGER,
+    meta     TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS games (
+    id     INTEGER PRIMARY KEY,
+    run_id INTEGER REFERENCES runs(id),
+    key    TEXT,
+    played TEXT NOT NULL,
+    seed   INTEGER,
+    winner INTEGER,
+    turns  INTEGER
+);
+CREATE TABLE IF NOT EXISTS seats (
+    game_id   INTEGER NOT NULL REFERENCES games(id),
+    seat      INTEGER NOT NULL,
+    agent     TEXT NOT NULL,
+    weights   TEXT,
+    score     REAL NOT NULL,
+    authority INTEGER,
+    PRIMARY KEY (game_id, seat)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS games_run ON games(run_id);
+CREATE INDEX IF NOT EXISTS games_seed ON games(seed);
+CREATE INDEX IF NOT EXISTS games_played ON games(played);
+CREATE INDEX IF NOT EXISTS seats_agent ON seats(agent, score);
+CREATE INDEX IF NOT EXISTS seats_weights ON seats(weights, score);
+"""
+
+_MAX_CHAR = chr(0x10FFFF)  # sorts after every character a weights hash can hold
+GROUPS = {"agent": "s.agent", "weights": "s.weights", "run": "g.run_id", "seat": "s.seat"}
+
+
+def now_iso() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+@dataclass(frozen=True)
+class SeatResult:
+    agent: str
+    score: float  # 1 win, 0.5 draw, 0 loss
+    weights: Optional[str] = None  # planning.buy_cache.policy_key, so rows join buy-cache keys
+    authority: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class WinRate:
+    group: Any
+    games: int
+    wins: int
+    draws: int
+    losses: int
+    score: float
+    low: float  # 95% Wilson interval of the score
+    high: float
+    avg_turns: Optional[float]
+
+
+def wilson(score: float, n: int, z: float = 1.96) -> Tuple[float, float]:
+    """Wilson score interval for a mean score in [0, 1] over n games."""
+    if n <= 0:
+        return 0.0, 1.0
+    p = score / n
+    den = 1.0 + z * z / n
+    mid = (p + z * z / (2 * n)) / den
+    half = z * math.sqrt(p * (1.0 - p) / n + z * z / (4 * n * n)) / den
+    return max(0.0, mid - half), min(1.0, mid + half)
+
+
+class Warehouse:
+    """
+    with Warehouse("ai_data/results.db") as wh:
+        run = wh.start_run("tournament", seed=0, meta={...})
+        wh.add_game(run, [SeatResult("a", 1.0), SeatResult("b", 0.0)], winner=0, turns=41)
+        wh.win_rates(by="agent")
+    """
+
+    def __init__(self, path: str, batch_size: int = 500, timeout: float = 30.0):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self._pid = os.getpid()
+        self._pending: List[Tuple[Tuple, Sequence[SeatResult]]] = []
+        self.conn = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(_SCHEMA)  # IF NOT EXISTS: safe when several processes race here
+        self.conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    # ---------------- writing ----------------
+    def _write(self) -> "_Txn":
+        if os.getpid() != self._pid:
+            raise RuntimeError("a Warehouse cannot be used across fork; open one per process")
+        return _Txn(self.conn, self.timeout)
+
+    def start_run(self, kind: str, seed: Optional[int] = None, meta: Optional[Dict[str, Any]] = None) -> int:
+        with self._write():
+            cur = self.conn.execute(
+                "INSERT INTO runs (kind, started, seed, meta) VALUES (?, ?, ?, ?)",
+                (kind, now_iso(), seed, json.dumps(meta or {}, sort_keys=True)),
+            )
+        return int(cur.lastrowid)
+
+    def finish_run(self, run_id: int) -> None:
+        self.flush()
+        with self._write():
+            self.conn.execute("UPDATE runs SET finished = ? WHERE id = ?", (now_iso(), run_id))
+
+    def add_game(
+        self,
+        run_id: Optional[int],
+        seats: Sequence[SeatResult],
+        winner: Optional[int],
+        turns: Optional[int],
+        seed: Optional[int] = None,
+        key: Optional[str] = None,
+        played: Optional[str] = None,
+    ) -> None:
+        """Queue one game; written with the next full batch or flush()."""
+        self._pending.append(((run_id, key, played or now_iso(), seed, winner, turns), tuple(seats)))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write queued games in one transaction; returns how many."""
+        if not self._pending:
+            return 0
+        batch, self._pending = self._pending, []
+        with self._write():
+            for game, seats in batch:
+                gid = self.conn.execute(
+                    "INSERT INTO games (run_id, key, played, seed, winner, turns) VALUES (?, ?, ?, ?, ?, ?)", game
+                ).lastrowid
+                self.conn.executemany(
+                    "INSERT INTO seats (game_id, seat, agent, weights, score, authority) VALUES (?, ?, ?, ?, ?, ?)",
+                    [(gid, i, s.agent, s.weights, float(s.score), s.authority) for i, s in enumerate(seats)],
+                )
+        return len(batch)
+
+    def close(self) -> None:
+        if os.getpid() == self._pid:
+            self.flush()
+        self.conn.close()
+
+    def __enter__(self) -> "Warehouse":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ---------------- queries ----------------
+    @staticmethod
+    def _where(
+        run: Optional[int] = None,
+        agent: Optional[str] = None,
+        weights: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        seed: Optional[int] = None,
+    ) -> Tuple[str, List[Any]]:
+        clauses, args = [], []
+        # weights is a literal prefix, matched as a range so seats_weights serves it
+        upper = None if weights is None else weights + _MAX_CHAR
+        for sql, values in (
+            ("g.run_id = ?", (run,)),
+            ("s.agent = ?", (agent,)),
+            ("s.weights >= ? AND s.weights < ?", (weights, upper)),
+            ("g.played >= ?", (since,)),
+            ("g.played < ?", (until,)),
+            ("g.seed = ?", (seed,)),
+        ):
+            if values[0] is not None:
+                clauses.append(sql)
+                args.extend(values)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", args
+
+    def win_rates(self, by: str = "agent", **filters) -> List[WinRate]:
+        """Score per agent / weights hash / run / seat, best first. filters: see _where."""
+        if by not in GROUPS:
+            raise ValueError(f"group by one of {sorted(GROUPS)}")
+        where, args = self._where(**filters)
+        rows = self.conn.execute(
+            f"""SELECT {GROUPS[by]}, COUNT(*), SUM(s.score = 1.0), SUM(s.score = 0.5), SUM(s.score = 0.0),
+                       SUM(s.score), AVG(g.turns)
+                FROM seats s JOIN games g ON g.id = s.game_id{where}
+                GROUP BY 1""",
+            args,
+        ).fetchall()
+        out = []
+        for group, n, w, d, l, total, turns in rows:
+            low, high = wilson(total, n)
+            out.append(WinRate(group, n, w, d, l, total / n, low, high, turns))
+        out.sort(key=lambda r: (-r.score, str(r.group)))
+        return out
+
+    def turn_histogram(self, **filters) -> List[Tuple[int, int]]:
+        """(turns, games) pairs in turn order. With an agent/weights filter, its games only."""
+        where, args = self._where(**filters)
+        return self.conn.execute(
+            f"""SELECT g.turns, COUNT(DISTINCT g.id) FROM games g JOIN seats s ON s.game_id = g.id{where}
+                GROUP BY g.turns ORDER BY g.turns""",
+            args,
+        ).fetchall()
+
+    def turn_stats(self, quantiles: Sequence[float] = (0.1, 0.25, 0.5, 0.75, 0.9), **filters) -> Dict[str, Any]:
+        """Count, mean and quantiles of game length, from the histogram (no per-game rows)."""
+        hist = [(t, n) for t, n in self.turn_histogram(**filters) if t is not None]
+        total = sum(n for _, n in hist)
+        if not total:
+            return {"games": 0}
+        out: Dict[str, Any] = {"games": total, "mean": sum(t * n for t, n in hist) / total}
+        out["min"], out["max"] = hist[0][0], hist[-1][0]
+        for q in quantiles:
+            target, seen = q * total, 0
+            for t, n in hist:
+                seen += n
+                if seen >= target:
+                    out[f"p{round(q * 100)}"] = t
+                    break
+        return out
+
+    def runs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        rows = self.conn.execute(
+            """SELECT r.id, r.kind, r.started, r.finished, r.seed, r.meta,
+                      (SELECT COUNT(*) FROM games g WHERE g.run_id = r.id)
+               FROM runs r ORDER BY r.id DESC LIMIT ?""",
+            (limit,),
+        ).fetchall()
+        keys = ("id", "kind", "started", "finished", "seed", "meta", "games")
+        return [dict(zip(keys, r[:5] + (json.loads(r[5]), r[6]))) for r in rows]
+
+    def iter_games(self, **filters) -> Iterator[Tuple]:
+        """(game id, run, key, played, seed, winner, turns) rows, streamed from a cursor."""
+        where, args = self._where(**filters)
+        yield from self.conn.execute(
+            f"""SELECT DISTINCT g.id, g.run_id, g.key, g.played, g.seed, g.winner, g.turns
+                FROM games g JOIN seats s ON s.game_id = g.id{where} ORDER BY g.id""",
+            args,
+        )
+
+
+class _Txn:
+    """BEGIN IMMEDIATE ... COMMIT, waiting out other writers (WAL allows one at a time)."""
+
+    def __init__(self, conn: sqlite3.Connection, timeout: float):
+        self.conn = conn
+        self.timeout = timeout
+
+    def __enter__(self) -> None:
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                self.conn.execute("BEGIN IMMEDIATE")
+                return
+            except sqlite3.OperationalError as e:
+                if "locked" not in str(e) or time.monotonic() > deadline:
+                    raise
+                time.sleep(0.01)
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
@@ -0,0 +1,276 @@
+# starrealms/zobrist.py
+"""
+Incremental Zobrist hashing of game state.
+
+Hashed features (cards are identified by name):
+  - per player: the multisets in hand / deck / discard_pile / in_play / bases,
+    and the authority / trade_pool / combat_pool values,
+  - the trade row, slot by slot,
+  - whose turn it is.
+
+Hashing is opt-in: Game(hashing=True), or game.enable_hashing() on a running
+game, as search code does. Then player zones and the trade row are list
+subclasses that XOR their changes into the owner's running hash on every
+mutation, and the Player/Game __setattr__ hooks do the same for pools, the
+turn pointer and reassigned lists. Other games keep plain lists and pay
+nothing per move; their state_hash is computed from scratch when read. Multisets
+use one key per (zone, card, count) so duplicates never cancel out. Keys come
+from blake2b, so hashes are stable across processes.
+
+Runtime flags (_rt, _used, per-turn modifiers) and deck order are not hashed.
+Set STARREALMS_ZOBRIST_DEBUG=1 (or Game.zobrist_debug = True) to cross-check
+every state_hash read against compute_state_hash().
+"""
+
+from __future__ import annotations
+import hashlib
+import os
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Iterable, Optional
+
+PLAYER_ZONES = ("hand", "deck", "discard_pile", "in_play", "bases")
+PLAYER_POOLS = ("authority", "trade_pool", "combat_pool")
+
+DEBUG_ENV = "STARREALMS_ZOBRIST_DEBUG"
+
+
+def debug_enabled() -> bool:
+    return os.environ.get(DEBUG_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+@lru_cache(maxsize=1 << 16)
+def zkey(*parts: Hashable) -> int:
+    """Stable 64-bit random key for a feature tuple."""
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def card_id(card: Any) -> Optional[str]:
+    if card is None:
+        return None
+    if isinstance(card, dict):
+        return card.get("name")
+    return str(card)
+
+
+def _count_key(owner: str, zone: str, name: Optional[str], count: int) -> int:
+    return zkey("z", owner, zone, name, count) if count else 0
+
+
+def pool_key(owner: str, pool: str, value: Any) -> int:
+    return zkey("p", owner, pool, value)
+
+
+def row_key(slot: int, name: Optional[str]) -> int:
+    return zkey("row", slot, name)
+
+
+def turn_key(turn: int) -> int:
+    return zkey("turn", turn % 2)
+
+
+# ---------------- From-scratch hashes ----------------
+def multiset_hash(owner: str, zone: str, cards: Iterable[Any]) -> int:
+    counts: Dict[Optional[str], int] = {}
+    for c in cards:
+        n = card_id(c)
+        counts[n] = counts.get(n, 0) + 1
+    h = 0
+    for n, k in counts.items():
+        h ^= _count_key(owner, zone, n, k)
+    return h
+
+
+def row_hash(cards: Iterable[Any]) -> int:
+    h = 0
+    for i, c in enumerate(cards):
+        h ^= row_key(i, card_id(c))
+    return h
+
+
+def player_hash(player) -> int:
+    owner = player.name
+    h = 0
+    for zone in PLAYER_ZONES:
+        h ^= multiset_hash(owner, zone, getattr(player, zone, []) or [])
+    for pool in PLAYER_POOLS:
+        h ^= pool_key(owner, pool, getattr(player, pool, 0))
+    return h
+
+
+def compute_state_hash(game) -> int:
+    """Full recomputation of game.state_hash (for debugging / verification)."""
+    h = row_hash(getattr(game, "trade_row", []) or []) ^ turn_key(getattr(game, "turn", 0))
+    for p in getattr(game, "players", []):
+        h ^= player_hash(p)
+    return h
+
+
+# ---------------- Incremental containers ----------------
+class ZobristZone(list):
+    """A player zone (multiset of cards) that keeps its owner's hash current."""
+
+    def __init__(self, items: Iterable[Any] = (), owner=None, zone: str = ""):
+        super().__init__(items)
+        self._owner = owner
+        self._zone = zone
+        self._counts: Dict[Optional[str], int] = {}
+        for c in self:
+            n = card_id(c)
+            self._counts[n] = self._counts.get(n, 0) + 1
+
+    def __reduce__(self):
+        return (ZobristZone, (list(self), self._owner, self._zone))
+
+    def zhash(self) -> int:
+        name = self._owner.name
+        h = 0
+        for n, k in self._counts.items():
+            h ^= _count_key(name, self._zone, n, k)
+        return h
+
+    def _add(self, card) -> None:
+        n = card_id(card)
+        k = self._counts.get(n, 0)
+        self._counts[n] = k + 1
+        name = self._owner.name
+        self._owner._zx(_count_key(name, self._zone, n, k) ^ _count_key(name, self._zone, n, k + 1))
+
+    def _sub(self, card) -> None:
+        n = card_id(card)
+        k = self._counts.get(n, 0)
+        if k <= 1:
+            self._counts.pop(n, None)
+        else:
+            self._counts[n] = k - 1
+        name = self._owner.name
+        self._owner._zx(_count_key(name, self._zone, n, k) ^ _count_key(name, self._zone, n, k - 1))
+
+    def _resync(self, before: int) -> None:
+        self._counts = {}
+        for c in self:
+            n = card_id(c)
+            self._counts[n] = self._counts.get(n, 0) + 1
+        self._owner._zx(before ^ self.zhash())
+
+    # --- list mutators ---
+    def append(self, card) -> None:
+        super().append(card)
+        self._add(card)
+
+    def extend(self, cards) -> None:
+        cards = list(cards)
+        super().extend(cards)
+        for c in cards:
+            self._add(c)
+
+    def insert(self, index, card) -> None:
+        super().insert(index, card)
+        self._add(card)
+
+    def remove(self, card) -> None:
+        i = self.index(card)
+        self._sub(super().pop(i))
+
+    def pop(self, index=-1):
+        card = super().pop(index)
+        self._sub(card)
+        return card
+
+    def clear(self) -> None:
+        before = self.zhash()
+        super().clear()
+        self._resync(before)
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            before = self.zhash()
+            super().__setitem__(index, list(value))
+            self._resync(before)
+            return
+        old = self[index]
+        super().__setitem__(index, value)
+        if card_id(old) != card_id(value):  # shuffles swap in place: no net change
+            self._sub(old)
+            self._add(value)
+
+    def __delitem__(self, index) -> None:
+        if isinstance(index, slice):
+            before = self.zhash()
+            super().__delitem__(index)
+            self._resync(before)
+            return
+        old = self[index]
+        super().__delitem__(index)
+        self._sub(old)
+
+    def __iadd__(self, cards):
+        self.extend(cards)
+        return self
+
+    def __imul__(self, n):
+        before = self.zhash()
+        super().__imul__(n)
+        self._resync(before)
+        return self
+
+
+class ZobristRow(list):
+    """The trade row: hashed by (slot, card) so position matters."""
+
+    def __init__(self, items: Iterable[Any] = (), owner=None):
+        super().__init__(items)
+        self._owner = owner
+        self._h = row_hash(self)
+
+    def __reduce__(self):
+        return (ZobristRow, (list(self), self._owner))
+
+    def zhash(self) -> int:
+        return self._h
+
+    def _rehash(self) -> None:
+        new = row_hash(self)
+        self._owner._zx(self._h ^ new)
+        self._h = new
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            super().__setitem__(index, list(value))
+            self._rehash()
+            return
+        i = index + len(self) if index < 0 else index
+        old = self[i]
+        super().__setitem__(i, value)
+        delta = row_key(i, card_id(old)) ^ row_key(i, card_id(value))
+        self._h ^= delta
+        self._owner._zx(delta)
+
+    def _mutator(name):
+        def method(self, *args, **kwargs):
+            out = getattr(super(ZobristRow, self), name)(*args, **kwargs)
+            self._rehash()
+            return out
+
+        method.__name__ = name
+        return method
+
+    append = _mutator("append")
+    extend = _mutator("extend")
+    insert = _mutator("insert")
+    remove = _mutator("remove")
+    pop = _mutator("pop")
+    clear = _mutator("clear")
+    sort = _mutator("sort")
+    reverse = _mutator("reverse")
+    __delitem__ = _mutator("__delitem__")
+    del _mutator
+
+    def __iadd__(self, cards):
+        self.extend(cards)
+        return self
+
+    def __imul__(self, n):
+        super().__imul__(n)
+        self._rehash()
+        return self
@@ -0,0 +1,83 @@
+# tests/test_ability_index.py
+import copy
+import pickle
+
+import pytest
+
+from starrealms.cards import card_view, find_card
+from starrealms.engine.unified_dispatcher import (
+    AbilityDispatcher,
+    AbilityList,
+    GameAPI,
+    _ability_index,
+    compile_abilities,
+)
+
+
+CARD = {
+    "name": "Indexed",
+    "faction": "Blob",
+    "abilities": [
+        {"id": "a1", "trigger": "on_play", "effects": [{"type": "trade", "amount": 1}]},
+        {"id": "a2", "trigger": "continuous:on_ship_played", "effects": []},
+        {"id": "a3", "trigger": "ally", "faction": "Blob", "effects": []},
+        {"id": "a4", "trigger": "ally",
+         "condition": {"faction_in_play": {"faction": "Blob", "min": 1, "scope": "in_play"}},
+         "effects": []},
+        {"id": "a5", "trigger": "activated",
+         "condition": {"faction_in_play": {"faction": "Blob", "min": 3}},
+         "effects": []},
+        {"id": "a6", "trigger": "scrap_activated", "effects": []},
+    ],
+}
+
+
+def test_index_groups_abilities_by_trigger():
+    idx = _ability_index(CARD)
+    assert [(hook is not None, ab["id"]) for hook, ab, _c in idx.on_enter] == [(False, "a1"), (True, "a2")]
+    assert [ab["id"] for ab, _c in idx.get("activated")] == ["a5"]
+    assert idx.get("activated")[0][1] == ("Blob", 3, "this_turn")
+    assert [ab["id"] for ab, _c in idx.get("scrap_activated")] == ["a6"]
+    assert idx.get("on_turn_start") == ()
+    # ally thresholds pre-resolved: "another" card means at least 2 in play
+    assert [(i, f, need) for i, _ab, f, need in idx.allies] == [(2, "Blob", 2), (3, "Blob", 2)]
+
+
+def test_index_is_built_once_and_definitions_are_read_only():
+    card = dict(CARD, abilities=compile_abilities(CARD["abilities"]))
+    idx = _ability_index(card)
+    assert _ability_index(dict(card)) is idx  # copies share the definition
+    assert _ability_index(copy.deepcopy(card)) is idx
+    restored = pickle.loads(pickle.dumps(card))
+    assert type(restored["abilities"]) is AbilityList and len(_ability_index(restored).allies) == 2
+
+    with pytest.raises(TypeError):
+        card["abilities"].append({"trigger": "on_turn_start", "effects": []})
+    with pytest.raises(TypeError):
+        card["abilities"][0]["trigger"] = "scrap_activated"
+    assert _ability_index(card) is idx
+
+    grown = list(card["abilities"]) + [{"trigger": "on_turn_start", "effects": []}]
+    card["abilities"] = compile_abilities(grown)  # edits replace the list
+    assert len(_ability_index(card).get("on_turn_start")) == 1
+    assert _ability_index(dict(CARD)) is not idx  # plain lists are indexed per call
+
+
+def test_loaded_cards_carry_a_compiled_index():
+    view = card_view("Blob Fighter")
+    assert isinstance(view["abilities"], AbilityList)
+    assert _ability_index(find_card("Blob Fighter")) is _ability_index(view)
+
+
+def test_dispatcher_skips_cards_without_matching_triggers():
+    class ZoneGame:
+        def list_zone(self, player, zone):
+            return [{"name": "Plain", "abilities": [{"trigger": "on_play", "effects": []}]}]
+
+    calls = []
+    api = GameAPI(ZoneGame(), ui=None)
+    api.faction_in_play = lambda *a: calls.append(a) or True
+    disp = AbilityDispatcher(api)
+    disp.on_turn_start("P1")
+    disp._apply_pending_allies("P1")
+    assert calls == []
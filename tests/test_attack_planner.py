@@ -0,0 +1,75 @@
+# tests/test_attack_planner.py
+import itertools
+
+import pytest
+
+from starrealms.planning.attack import (
+    LETHAL_VALUE,
+    _solve,
+    base_value,
+    face_weight,
+    plan_attack,
+)
+from starrealms.runner.controller import apply_command
+
+
+def _base(name, defense, outpost=False):
+    return {"name": name, "type": "base", "defense": defense, "outpost": outpost}
+
+
+def _brute_force(combat, bases, authority):
+    """Best value over every legal destroy-set (outposts gate everything else)."""
+    best = 0.0
+    fw = face_weight(authority)
+    for r in range(len(bases) + 1):
+        for combo in itertools.combinations(range(len(bases)), r):
+            cost = sum(bases[i]["defense"] for i in combo)
+            if cost > combat:
+                continue
+            value = sum(base_value(bases[i]["defense"], bases[i]["outpost"]) for i in combo)
+            outposts_left = any(b["outpost"] for i, b in enumerate(bases) if i not in combo)
+            if outposts_left:
+                if any(not bases[i]["outpost"] for i in combo):
+                    continue  # illegal: normal base behind a standing outpost
+            else:
+                rest = combat - cost
+                if rest >= authority:
+                    return LETHAL_VALUE
+                value += rest * fw
+            best = max(best, value)
+    return best
+
+
+@pytest.mark.parametrize("combat", [0, 3, 5, 8, 12])
+@pytest.mark.parametrize("authority", [4, 10, 40])
+def test_planner_matches_brute_force(combat, authority):
+    bases = [_base("O1", 5, True), _base("N1", 3), _base("N2", 6), _base("O2", 2, True), _base("N3", 4)]
+    plan = plan_attack(combat, bases, authority)
+    assert plan.value == pytest.approx(_brute_force(combat, bases, authority))
+    assert sum(bases[i]["defense"] for i in plan.destroy) + plan.face <= combat
+
+
+def test_planner_prefers_lethal_over_bases():
+    bases = [_base("Outpost", 2, True), _base("Juicy", 4)]
+    plan = plan_attack(9, bases, 7)
+    assert plan.lethal
+    assert plan.destroy == (0,)
+    assert plan.face == 7
+
+
+def test_planner_is_memoized_on_canonical_key():
+    _solve.cache_clear()
+    plan_attack(7, [_base("A", 3), _base("B", 5, True)], 30)
+    plan_attack(7, [_base("X", 5, True), _base("Y", 3)], 45)
+    info = _solve.cache_info()
+    assert info.misses == 1 and info.hits == 1
+
+
+def test_ai_attack_destroys_two_cheap_bases_instead_of_face(game, p1, p2):
+    p2.bases[:] = [_base("Small A", 2), _base("Small B", 3)]
+    p2.authority = 40
+    p1.combat_pool = 6
+    apply_command(game, "a", None, last_log_len=0, echo=False)
+    assert p2.bases == []
+    assert p2.authority == 39
+    assert p1.combat_pool == 0
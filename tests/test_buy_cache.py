@@ -0,0 +1,125 @@
+# tests/test_buy_cache.py
+from starrealms.ai import GoodHeuristicAgent, PolicyAgent
+from starrealms.cards import find_card
+from starrealms.planning.buy_cache import BuyDecisionCache
+
+
+def _row(game, names):
+    game.trade_row = [find_card(n) if n else None for n in names]
+
+
+def test_lru_eviction_and_stats():
+    c = BuyDecisionCache(maxsize=2)
+    c.put(("a",), [1])
+    c.put(("b",), [2])
+    assert c.get(("a",)) == (1,)  # "a" is now most recent
+    c.put(("c",), ["x"])
+    assert c.get(("b",)) is None
+    assert c.get(("c",)) == ("x",)
+    assert c.stats()["hits"] == 2 and c.stats()["misses"] == 1
+    assert len(c) == 2
+
+
+def test_identical_situations_hit_across_games(game):
+    from starrealms.game import Game
+
+    cache = BuyDecisionCache()
+    agent = PolicyAgent(buy_cache=cache)
+    names = ["Cutter", "Ram", "Dreadnaught", "Viper", None]
+
+    p = game.current_player()
+    _row(game, names)
+    p.trade_pool = 5
+    first = agent.plan_buys(game, p)
+    assert cache.misses == 1
+
+    other = Game(("A", "B"))
+    _row(other, names)
+    other.current_player().trade_pool = 5
+    assert PolicyAgent(buy_cache=cache).plan_buys(other, other.current_player()) == first
+    assert cache.hits == 1
+
+    p.trade_pool = 6  # different input, different entry
+    agent.plan_buys(game, p)
+    assert cache.misses == 2
+
+
+def test_policy_and_turn_bucket_are_part_of_the_key(game):
+    cache = BuyDecisionCache()
+    p = game.current_player()
+    _row(game, ["Cutter", "Trading Post", "Ram", None, None])
+    p.trade_pool = 3
+    PolicyAgent(buy_cache=cache).plan_buys(game, p)
+    GoodHeuristicAgent(buy_cache=cache).plan_buys(game, p)
+    assert cache.misses == 2 and cache.hits == 0
+
+    good = GoodHeuristicAgent(buy_cache=cache)
+    game.turn_number = 8
+    good.plan_buys(game, p)
+    game.turn_number = 10  # same bucket
+    good.plan_buys(game, p)
+    assert cache.misses == 3 and cache.hits == 1
+
+
+def test_persistence_roundtrip(tmp_path, game):
+    cache = BuyDecisionCache()
+    p = game.current_player()
+    _row(game, ["Cutter", "Ram", None, "Viper", "Scout"])
+    p.trade_pool = 5
+    picks = PolicyAgent(buy_cache=cache).plan_buys(game, p)
+
+    path = str(tmp_path / "buy_cache.json")
+    cache.save(path)
+    warm = BuyDecisionCache()
+    assert warm.load(path) == 1
+    assert PolicyAgent(buy_cache=warm).plan_buys(game, p) == picks
+    assert warm.hits == 1
+
+
+def test_stale_or_missing_file_loads_nothing(tmp_path, monkeypatch):
+    import starrealms.planning.buy_cache as bc
+
+    path = str(tmp_path / "buy_cache.json")
+    assert BuyDecisionCache().load(path) == 0
+    c = BuyDecisionCache()
+    c.put(("k", ("Ram",)), [1])
+    c.save(path)
+    monkeypatch.setattr(bc, "cards_fingerprint", lambda: "changed")
+    assert BuyDecisionCache().load(path) == 0
+
+
+def test_policy_key_is_computed_when_weights_are_set(game, monkeypatch):
+    import starrealms.ai as ai
+
+    calls = []
+    real = ai.policy_key
+    monkeypatch.setattr(ai, "policy_key", lambda *a: calls.append(a) or real(*a))
+    agent = PolicyAgent(weights={"trade": 1.0}, buy_cache=BuyDecisionCache())
+    p = game.current_player()
+    _row(game, ["Cutter", "Ram", None, None, None])
+    for pool in (2, 3, 5, 5):
+        p.trade_pool = pool
+        agent.plan_buys(game, p)
+    assert len(calls) == 1
+    agent.weights = {"trade": 2.0}
+    assert len(calls) == 2 and agent._policy_key == real("PolicyAgent", {"trade": 2.0})
+
+
+def test_shared_cache_survives_concurrent_threads():
+    import threading
+
+    cache = BuyDecisionCache(maxsize=64)
+
+    def hammer(seed):
+        for i in range(5000):
+            key = ((seed * 7 + i) % 97,)
+            if cache.get(key) is None:
+                cache.put(key, [i])
+
+    threads = [threading.Thread(target=hammer, args=(s,)) for s in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    stats = cache.stats()
+    assert stats["size"] == 64 and stats["hits"] + stats["misses"] == 20000
@@ -0,0 +1,128 @@
+# tests/test_card_analytics.py
+import copy
+import io
+import json
+
+from starrealms.ai import GoodHeuristicAgent
+from starrealms.analytics import (
+    BOUGHT,
+    SCRAPPED,
+    CardRecorder,
+    CardStats,
+    GameSummary,
+    play_summary,
+    read_summaries,
+    simulate,
+)
+from starrealms.analytics.__main__ import main
+from starrealms.cards import card_template
+from starrealms.effects import apply_effects
+from starrealms.tournament import AgentSpec
+
+
+def _summary(winner, events, plays=(), agents=("a", "b")):
+    return GameSummary(1, winner, 10, agents, tuple(events), tuple(plays))
+
+
+class _MutedLog(list):
+    def append(self, msg):
+        pass
+
+
+def test_recorder_follows_engine_card_events(game):
+    rec = CardRecorder()
+    game.card_observers.append(rec.on_card)
+    p, o = game.players
+    game.log = _MutedLog()  # events come from Game.card_event, not the log text
+    game._acquire(p, card_template("Cutter"))
+    game._acquire_topdeck(o, card_template("Blob Fighter"))
+    explorer = card_template("Explorer").copy()
+    p.in_play.append(explorer)
+    p.activate_ship(explorer, o, game, scrap=True)
+    p.discard_pile.insert(0, card_template("Viper").copy())
+    apply_effects([{"type": "scrap_hand_or_discard"}], p, o, game)
+    apply_effects([{"type": "destroy_target_trade_row"}], p, o, game)  # the row's card is nobody's
+    assert rec.events == [
+        (0, BOUGHT, "Cutter", 1),
+        (1, BOUGHT, "Blob Fighter", 0),
+        (0, SCRAPPED, "Explorer", 1),
+        (0, SCRAPPED, "Viper", 1),
+    ]
+    assert copy.deepcopy(game).card_observers == []  # copies (search worlds) are not observed
+
+
+def test_recorder_summarizes_a_game():
+    agent = GoodHeuristicAgent()
+    s = play_summary([agent, agent], seed=5, max_turns=30)
+    assert s.turns == 30 or s.winner is not None
+    bought = [e for e in s.events if e[1] == BOUGHT]
+    assert bought and all(e[0] in (0, 1) and e[3] >= 1 for e in bought)
+    assert sorted(e[3] for e in bought if e[0] == 0) == [e[3] for e in bought if e[0] == 0]
+    assert sum(n for seat, name, n in s.plays if name in ("Scout", "Viper")) > 0
+    assert GameSummary.from_json(s.to_json()) == s
+
+
+def test_stats_exact_counts():
+    g1 = [(0, BOUGHT, "Blob Fighter", 2), (0, BOUGHT, "Blob Fighter", 4), (1, BOUGHT, "Cutter", 3)]
+    g2 = [(0, BOUGHT, "Cutter", 1), (1, BOUGHT, "Blob Fighter", 5), (1, SCRAPPED, "Blob Fighter", 7)]
+    games = [
+        _summary(0, g1, plays=[(0, "Blob Fighter", 3)]),
+        _summary(1, g2),
+        _summary(None, [(0, BOUGHT, "Cutter", 2)]),
+    ]
+    stats = CardStats().consume(games)
+    assert (stats.games, stats.player_games, stats.draws) == (3, 6, 1)
+    rows = {r["card"]: r for r in stats.rows()}
+
+    bf = rows["Blob Fighter"]
+    assert bf["bought_rate"] == 2 / 6
+    assert bf["win_when_bought"] == 1.0  # both buyers won
+    assert bf["win_without"] == (3.0 - 2.0) / 4
+    assert bf["avg_turn_bought"] == (2 + 4 + 5) / 3
+    assert bf["avg_first_turn"] == (2 + 5) / 2
+    assert bf["copies_per_game"] == 1.5
+    assert stats.cards["Blob Fighter"].plays == 3 and stats.cards["Blob Fighter"].scraps == 1
+
+    cutter = rows["Cutter"]
+    assert cutter["win_when_bought"] == (0 + 0 + 0.5) / 3
+    factions = {f["faction"]: f for f in stats.faction_rows()}
+    assert factions["Blob"]["primary_games"] == 2
+    assert factions["Trade Federation"]["win_when_primary"] == 0.5 / 3
+
+
+def test_merge_equals_one_pass_and_agent_filter():
+    games = [
+        _summary(0, [(0, BOUGHT, "Cutter", 1), (1, BOUGHT, "Blob Fighter", 2)]),
+        _summary(1, [(0, BOUGHT, "Blob Fighter", 1)], agents=("b", "a")),
+    ]
+    whole = CardStats().consume(games)
+    merged = CardStats().consume(games[:1]).merge(CardStats().consume(games[1:]))
+    assert merged.to_dict() == whole.to_dict()
+
+    only_a = CardStats("a").consume(games)
+    assert only_a.player_games == 2 and only_a.score == 2.0
+    assert set(only_a.cards) == {"Cutter"}
+
+
+def test_simulate_streams_seat_swapped_pairs():
+    specs = [AgentSpec("x", "heuristic"), AgentSpec("y", "heuristic")]
+    stream = simulate(specs, games=4, seed=3, max_turns=20, workers=1, chunk=1)
+    first = next(stream)  # lazy: one game played so far
+    rest = list(stream)
+    assert [s.agents for s in [first] + rest] == [("x", "y"), ("y", "x")] * 2
+    assert first.seed == rest[0].seed != rest[1].seed
+
+
+def test_cli_aggregates_a_saved_stream(tmp_path, capsys):
+    saved = tmp_path / "cards.jsonl"
+    report = tmp_path / "cards.json"
+    main(["--agent", "good=heuristic", "--games", "2", "--workers", "1", "--max-turns", "20", "--save", str(saved)])
+    with open(saved) as f:
+        assert len(list(read_summaries(f))) == 2
+    capsys.readouterr()
+
+    main(["--input", str(saved), "--report", str(report)])
+    data = json.loads(report.read_text())
+    assert data["games"] == 2 and data["player_games"] == 4
+    assert "card" in capsys.readouterr().out
+    assert list(read_summaries(io.StringIO('{"torn": \n'))) == []
@@ -0,0 +1,137 @@
+# tests/test_card_bundle.py
+import importlib.util
+import json
+import shutil
+from pathlib import Path
+
+import starrealms.cards as cards_mod
+
+BASE_SET_DIR = Path(cards_mod.__file__).parent / "standalone" / "base_set"
+
+
+def _load_set_copy(tmp_path, name="fake_set"):
+    """Copy the base set into tmp_path and import it as a standalone module."""
+    d = tmp_path / name
+    d.mkdir(exist_ok=True)
+    for fname in ("__init__.py", "cards.json", "counts.json"):
+        shutil.copy(BASE_SET_DIR / fname, d / fname)
+    return _import_set(d)
+
+
+def _import_set(d):
+    spec = importlib.util.spec_from_file_location(d.name, d / "__init__.py")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _count_compiles(monkeypatch):
+    calls = []
+    real = cards_mod._compile_set
+
+    def spy(m, source_hash):
+        calls.append(m.__name__)
+        return real(m, source_hash)
+
+    monkeypatch.setattr(cards_mod, "_compile_set", spy)
+    return calls
+
+
+def test_bundle_written_and_reused(tmp_path, monkeypatch):
+    mod = _load_set_copy(tmp_path)
+    calls = _count_compiles(monkeypatch)
+
+    first = cards_mod._set_bundle(mod)
+    assert calls == ["fake_set"]
+    assert (tmp_path / "fake_set" / cards_mod._BUNDLE_FILENAME).is_file()
+
+    second = cards_mod._set_bundle(mod)
+    assert calls == ["fake_set"], "unchanged data must not be re-validated"
+    assert [c["name"] for c in second["cards"]] == [c["name"] for c in first["cards"]]
+    assert second["deck_names"] == first["deck_names"]
+    assert len(second["deck_names"]) == 80
+
+
+def test_bundle_invalidated_when_counts_change(tmp_path, monkeypatch):
+    mod = _load_set_copy(tmp_path)
+    cards_mod._set_bundle(mod)
+
+    counts_path = tmp_path / "fake_set" / "counts.json"
+    counts = json.loads(counts_path.read_text(encoding="utf-8"))
+    counts["Cutter"] = counts["Cutter"] + 1
+    counts_path.write_text(json.dumps(counts), encoding="utf-8")
+    mod = _import_set(counts_path.parent)
+
+    calls = _count_compiles(monkeypatch)
+    bundle = cards_mod._set_bundle(mod)
+    assert calls == ["fake_set"]
+    assert bundle["deck_names"].count("Cutter") == counts["Cutter"]
+
+
+def test_bundle_key_reads_only_the_set_files(tmp_path, monkeypatch):
+    mod = _load_set_copy(tmp_path)
+    key = cards_mod._source_hash(mod)
+
+    def no_build():
+        raise AssertionError("the key must not build the deck")
+
+    monkeypatch.setattr(mod, "build_trade_deck", no_build)
+    next(c for c in mod.CARDS if c["name"] == "Cutter")["cost"] += 1  # in memory only
+    assert cards_mod._source_hash(mod) == key
+
+    (tmp_path / "fake_set" / "__init__.py").write_text(
+        (BASE_SET_DIR / "__init__.py").read_text(encoding="utf-8") + "\n# edited loader\n", encoding="utf-8"
+    )
+    assert cards_mod._source_hash(mod) != key
+
+
+def test_in_memory_edits_need_bundles_off(tmp_path, monkeypatch):
+    mod = _load_set_copy(tmp_path)
+    cards_mod._set_bundle(mod)
+
+    cutter = next(c for c in mod.CARDS if c["name"] == "Cutter")
+    cutter["cost"] += 1
+    monkeypatch.setenv(cards_mod._BUNDLE_ENV, "0")
+    bundle = cards_mod._set_bundle(mod)
+    assert next(c for c in bundle["cards"] if c["name"] == "Cutter")["cost"] == cutter["cost"]
+
+
+def test_bundle_invalidated_when_builder_source_changes(tmp_path, monkeypatch):
+    mod = _load_set_copy(tmp_path)
+    cards_mod._set_bundle(mod)
+    builders = cards_mod._bundle_builders()
+    for fn in (cards_mod._normalize_card, cards_mod._validate_card, cards_mod._compile_set):
+        assert fn.__module__ in builders
+
+    monkeypatch.setattr(cards_mod, "_builder_hash", "edited normalizer")
+    calls = _count_compiles(monkeypatch)
+    cards_mod._set_bundle(mod)
+    assert calls == ["fake_set"]
+
+
+def test_bundle_disabled_by_env(tmp_path, monkeypatch):
+    mod = _load_set_copy(tmp_path)
+    monkeypatch.setenv(cards_mod._BUNDLE_ENV, "0")
+    calls = _count_compiles(monkeypatch)
+    cards_mod._set_bundle(mod)
+    cards_mod._set_bundle(mod)
+    assert calls == ["fake_set", "fake_set"]
+    assert not (tmp_path / "fake_set" / cards_mod._BUNDLE_FILENAME).exists()
+
+
+def test_corrupt_bundle_is_recompiled(tmp_path, monkeypatch):
+    mod = _load_set_copy(tmp_path)
+    (tmp_path / "fake_set" / cards_mod._BUNDLE_FILENAME).write_bytes(b"not a pickle")
+    calls = _count_compiles(monkeypatch)
+    bundle = cards_mod._set_bundle(mod)
+    assert calls == ["fake_set"]
+    assert len(bundle["cards"]) == len(mod.CARDS)
+
+
+def test_trade_deck_from_bundle_matches_fresh_normalization():
+    deck = cards_mod.build_trade_deck()
+    raw = cards_mod._modules[0].build_trade_deck()
+    fresh = [cards_mod._normalize_card(c) for c in raw]
+    assert [c["name"] for c in deck] == [c["name"] for c in fresh]
+    assert deck == fresh
+    assert len({id(c) for c in deck}) == len(deck)
@@ -0,0 +1,64 @@
+# tests/test_card_lookup_index.py
+import starrealms.cards as cards_mod
+from starrealms.cards import card_view, find_card, get_card_by_name
+from starrealms.game import Game
+
+
+def test_card_view_is_memoized_and_matches_adapter():
+    v1 = card_view("Blob Carrier")
+    v2 = card_view("blob carrier", case_sensitive=False)
+    assert v1 is v2
+    assert v1 == cards_mod._adapt_to_new_schema(cards_mod.CARD_INDEX["Blob Carrier"])
+
+
+def test_get_card_by_name_reuses_the_view_for_templates(monkeypatch):
+    g = Game(("P1", "P2"))
+    card_view("Missile Mech")  # warm the memo
+
+    def boom(_card):
+        raise AssertionError("templates should reuse the memoized view")
+
+    monkeypatch.setattr(cards_mod, "_adapt_to_new_schema", boom)
+    c = get_card_by_name(g.card_db, "Missile Mech")
+    assert c == card_view("Missile Mech")
+    assert c is not card_view("Missile Mech")  # callers get their own dict to play
+    assert get_card_by_name(None, "missile mech", case_sensitive=False) == c
+
+
+def test_get_card_by_name_honours_the_callers_list():
+    custom = dict(cards_mod.CARD_INDEX["Cutter"], cost=99)
+    assert get_card_by_name([custom], "Cutter")["cost"] == 99
+    assert get_card_by_name([custom] + list(cards_mod.CARDS), "Cutter")["cost"] == 99
+    assert get_card_by_name([], "Cutter") is None
+
+
+def test_lookups_do_not_share_effect_lists():
+    for lookup in (lambda: get_card_by_name(cards_mod.CARDS, "Cutter"), lambda: find_card("Cutter")):
+        v = lookup()
+        v["on_play"].append({"type": "combat", "amount": 9})
+        assert lookup()["on_play"] == card_view("Cutter")["on_play"]
+        assert {"type": "combat", "amount": 9} not in card_view("Cutter")["on_play"]
+
+
+def test_get_card_by_name_adapts_cards_outside_the_index():
+    custom = dict(cards_mod.CARD_INDEX["Scout"], name="Custom Scout", cost=99)
+    c = get_card_by_name([custom], "Custom Scout")
+    assert c["cost"] == 99
+    assert "on_play" in c
+    assert get_card_by_name([custom], "No Such Card") is None
+
+
+def test_find_card_returns_independent_copies():
+    a = find_card("Explorer")
+    a["_rt"] = {"ally_triggered": True}
+    assert "_rt" not in find_card("Explorer")
+    assert find_card("No Such Card") is None
+
+
+def test_reload_invalidates_views_and_keeps_index_identity():
+    index = cards_mod.CARD_INDEX
+    old_view = card_view("Scout")
+    cards_mod.reload_enabled_sets()
+    assert cards_mod.CARD_INDEX is index
+    assert card_view("Scout") is not old_view
+    assert cards_mod.EXPLORER is cards_mod.CARD_INDEX["Explorer"]
@@ -0,0 +1,98 @@
+# tests/test_decisions.py
+import copy
+import random
+
+from starrealms.effects import apply_effect
+from starrealms.engine.decisions import Decision, Resumable
+from starrealms.game import Game
+from starrealms.view import ui_common
+
+
+def _discard(game):
+    apply_effect({"type": "discard", "amount": 1}, game.players[0], game.players[1], game)
+
+
+def test_resumable_parks_on_a_decision_and_replays_answers(game):
+    opp = game.players[1]
+    opp.human = True
+    hand = [c["name"] for c in opp.hand]
+    r = Resumable(_discard, game)
+
+    d = r.run()
+    assert isinstance(d, Decision) and d.seat == 1 and d.kind == "index"
+    assert d.context[1:] == tuple(f"  {i}: {n}" for i, n in enumerate(hand, start=1))
+    assert [c["name"] for c in opp.hand] == hand and not r.done
+
+    assert r.answer("99") is not None  # invalid: asked again
+    assert r.answer("3") is None and r.done
+    new_opp = r.game.players[1]
+    assert [c["name"] for c in new_opp.discard_pile][-1] == hand[2]
+    assert len(new_opp.hand) == len(hand) - 1
+    assert len(opp.hand) == len(hand)  # the original game was never touched
+
+
+def _redeal_then_ask(g):
+    g.players[1].deck.extend(g.players[1].hand)
+    g.players[1].hand.clear()
+    g.rng.shuffle(g.players[1].deck)
+    g.players[1].hand.extend(g.players[1].deck[:5])
+    _discard(g)
+
+
+def test_replay_restores_the_rng_position(game):
+    game.players[1].human = True
+    r = Resumable(_redeal_then_ask, game)
+    first = r.run()
+    random.random()  # someone else used the global RNG meanwhile
+    game.rng.random()  # or even this game's, outside the step
+    second = r.answer("x")  # invalid: same question, same shuffled hand
+    assert first.context[1:] == second.context[-len(first.context) + 1 :]
+
+
+def _gain_then_ask(g):
+    g.card_event(g.players[0], "acquire", {"name": "Scout"})
+    _discard(g)
+
+
+def test_card_events_reach_the_observers_once_the_step_completes(game):
+    game.players[1].human = True
+    seen = []
+    game.card_observers.append(lambda g, player, kind, card: seen.append((g, kind, card["name"])))
+    r = Resumable(_gain_then_ask, game)
+    assert r.run() is not None and r.answer("99") is not None
+    assert seen == []  # replays that parked report nothing
+    assert r.answer("1") is None
+    assert seen == [(r.game, "acquire", "Scout")]
+    assert r.game.card_observers is game.card_observers
+
+
+def test_concurrent_games_deal_from_their_own_rng():
+    from concurrent.futures import ThreadPoolExecutor
+
+    a = Game(("P1", "P2"), seed=1)
+    a.players[1].human = True
+    a.players[1].deck[:] = [{"name": f"C{i}", "type": "ship"} for i in range(10)]
+    b = copy.deepcopy(a)
+    b.rng = random.Random(2)  # same cards, another game's stream
+
+    # Created back to back, the steps still deal each game's own shuffle.
+    deals = {g: Resumable(_redeal_then_ask, g).run().context for g in (a, b)}
+    assert deals[a] != deals[b]
+
+    def replay(g):
+        r = Resumable(_redeal_then_ask, g)
+        first = r.run()
+        return first.context, r.answer("x").context[-len(first.context) :]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        games = [a, b] * 20
+        for g, (first, again) in zip(games, pool.map(replay, games)):
+            assert first == again == deals[g]
+
+
+def test_without_a_script_the_cli_prompt_answers(game, monkeypatch):
+    game.players[1].human = True
+    monkeypatch.setattr(ui_common, "ui_input", lambda prompt="": "1")
+    first = game.players[1].hand[0]["name"]
+    _discard(game)
+    assert game.players[1].discard_pile[-1]["name"] == first
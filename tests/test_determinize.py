@@ -0,0 +1,72 @@
+# tests/test_determinize.py
+from collections import Counter
+
+from starrealms.ai import PolicyAgent
+from starrealms.cards import find_card
+from starrealms.planning import Determinizer, KnowledgeTracker, clone_game
+from starrealms.planning.buy_cache import BuyDecisionCache
+from starrealms.runner.headless import play_turn
+
+
+def _names(cards):
+    return [c["name"] if c else None for c in cards]
+
+
+def test_clone_is_independent_and_shares_card_data(game):
+    p = game.players[0]
+    w = clone_game(game)
+    assert w.state_hash == game.state_hash
+    assert w.players[0].hand[0] is not p.hand[0] and w.players[0].hand[0] == p.hand[0]
+    assert w.trade_deck[0].get("effects") is game.trade_deck[0].get("effects")
+    w.players[0].hand.pop()
+    w.trade_row[0] = None
+    assert len(p.hand) == 3 and game.trade_row[0] is not None
+    assert w.state_hash != game.state_hash
+
+
+def test_worlds_keep_everything_the_observer_knows(game):
+    me, opp = game.players
+    opp.discard_pile.append(opp.deck.pop())
+    det = Determinizer(game, me, KnowledgeTracker(game), seed=3)
+    hands = set()
+    for w in det.worlds(30):
+        wm, wo = w.players
+        assert _names(wm.hand) == _names(me.hand)
+        assert Counter(_names(wm.deck)) == Counter(_names(me.deck))
+        assert len(wo.hand) == len(opp.hand) and len(wo.deck) == len(opp.deck)
+        assert Counter(_names(wo.hand + wo.deck)) == Counter(_names(opp.hand + opp.deck))
+        assert _names(wo.discard_pile) == _names(opp.discard_pile)
+        assert _names(w.trade_row) == _names(game.trade_row)
+        assert Counter(_names(w.trade_deck)) == Counter(_names(game.trade_deck))
+        hands.add(tuple(sorted(_names(wo.hand))))
+    assert len(hands) > 1  # the opponent's hand really is resampled
+    assert _names(opp.hand) == _names(game.players[1].hand)  # the real game is untouched
+
+
+def test_top_decked_cards_stay_put(game):
+    me, opp = game.players
+    tracker = KnowledgeTracker(game)
+    game._acquire_topdeck(opp, find_card("Cutter"))
+    tracker.observe(game)
+    assert tracker.known(opp) == [("deck", 0, "Cutter")]
+    assert tracker.known(me) == []
+
+    det = Determinizer(game, me, tracker, seed=0)
+    world = det.clone()
+    for _ in range(20):
+        assert det.determinize(world).players[1].deck[0]["name"] == "Cutter"
+
+    opp.draw_cards(1)  # now known to be in the opponent's hand
+    det = Determinizer(game, me, tracker, seed=0)
+    assert all("Cutter" in _names(w.players[1].hand) for w in det.worlds(20))
+
+    opp.discard_pile.append(opp.hand.pop())
+    tracker.observe(game)
+    assert tracker.known(opp) == []
+
+
+def test_engine_plays_on_in_a_world(game):
+    det = Determinizer(game, game.players[0], seed=1)
+    w = det.sample()
+    play_turn(w, PolicyAgent(buy_cache=BuyDecisionCache()))
+    assert w.turn == 1 and game.turn == 0
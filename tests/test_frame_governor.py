@@ -0,0 +1,64 @@
+# tests/test_frame_governor.py
+import os
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from starrealms.graphics.governor import FrameGovernor  # noqa: E402
+
+
+@pytest.fixture
+def display():
+    pygame.init()
+    pygame.display.set_mode((64, 64))
+    pygame.event.clear()
+    yield
+    pygame.quit()
+
+
+def test_rate_decays_from_max_to_idle_after_input():
+    g = FrameGovernor(max_fps=60, idle_fps=2, cooldown_ms=500)
+    g.activity(now=1000)
+    assert g.fps(now=1200) == 60
+    assert g.fps(now=1500) == 30
+    assert g.fps(now=2000) == 15
+    assert g.fps(now=60_000) == 2
+    assert g.timeout_ms(now=60_000) == 500
+    assert g.timeout_ms(deadline=60_120, now=60_000) == 120
+    assert g.timeout_ms(deadline=59_000, now=60_000) == 0
+
+
+def test_wait_sleeps_until_the_deadline_without_spinning(display):
+    g = FrameGovernor(max_fps=60, idle_fps=2, cooldown_ms=10)
+    pygame.time.wait(50)
+    start = pygame.time.get_ticks()
+    assert g.wait(deadline=start + 120) == []
+    assert pygame.time.get_ticks() - start >= 100
+    assert g.wait(deadline=start) == []  # a due deadline only polls
+
+
+def test_events_wake_the_loop_and_restore_full_rate(display):
+    g = FrameGovernor(max_fps=60, idle_fps=2, cooldown_ms=10)
+    pygame.time.wait(200)
+    assert g.fps() < 60
+    pygame.event.post(pygame.event.Event(pygame.USEREVENT, code=1))
+    events = g.wait()
+    assert [e.type for e in events] == [pygame.USEREVENT]
+    assert g.fps() == 60
+
+
+def test_log_panel_cursor_blinks_on_its_deadline(display):
+    from pygame_main import BLINK_MS, LogPanel
+
+    panel = LogPanel(size=(200, 100))
+    panel.draw()
+    due = panel.next_blink
+    panel.blink(now=due - 1)
+    assert not panel._dirty_input
+    panel.blink(now=due)
+    assert panel._dirty_input and panel.next_blink == due + BLINK_MS
+    panel.input_text = "p 1"  # typing restarts the blink with the cursor on
+    assert panel._cursor_on
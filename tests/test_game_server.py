@@ -0,0 +1,185 @@
+# tests/test_game_server.py
+import asyncio
+import json
+
+import pytest
+
+from starrealms.server import GameServer
+from starrealms.server.session import ActionError, apply_human
+
+
+class Client:
+    def __init__(self, reader, writer):
+        self.reader, self.writer = reader, writer
+
+    async def send(self, **msg):
+        self.writer.write((json.dumps(msg) + "\n").encode())
+        await self.writer.drain()
+
+    async def until(self, *types, game=None, answer="x"):
+        """Read events (answering prompts) until one of `types` arrives."""
+        while True:
+            line = await asyncio.wait_for(self.reader.readline(), 60)
+            assert line, "server closed the connection"
+            msg = json.loads(line)
+            if msg["type"] == "prompt":
+                await self.send(op="answer", game=msg["game"], text=answer)
+            elif msg["type"] in types and (game is None or msg.get("game") == game):
+                return msg
+
+
+async def _connect(server):
+    host, port = await server.start_tcp("127.0.0.1", 0)
+    r, w = await asyncio.open_connection(host, port)
+    c = Client(r, w)
+    assert (await c.until("hello"))["protocol"] == 1
+    return c
+
+
+def _run(coro):
+    return asyncio.run(asyncio.wait_for(coro, 120))
+
+
+def test_concurrent_bot_games_finish():
+    async def main():
+        server = GameServer()
+        c = await _connect(server)
+        try:
+            for seed in (3, 5):
+                await c.send(op="new", seats=["heuristic", "policy"], seed=seed)
+            ids = {(await c.until("created"))["game"] for _ in range(2)}
+            over = {}
+            while set(over) != ids:
+                msg = await c.until("game_over")
+                over[msg["game"]] = msg
+            assert all(m["winner"] in (0, 1) for m in over.values())
+            await c.send(op="list", id=9)
+            listing = await c.until("games")
+            assert listing["id"] == 9 and all(g["over"] for g in listing["games"])
+        finally:
+            c.writer.close()
+            await server.close()
+
+    _run(main())
+
+
+def test_concurrent_sessions_with_one_seed_play_the_same_game():
+    async def main():
+        server = GameServer()
+        c = await _connect(server)
+        try:
+            for _ in range(2):  # both run their steps on the same executor
+                await c.send(op="new", seats=["heuristic", "policy"], seed=11)
+            ids = {(await c.until("created"))["game"] for _ in range(2)}
+            over = {}
+            while set(over) != ids:
+                msg = await c.until("game_over")
+                over[msg["game"]] = (msg["winner"], msg["turns"])
+            assert len(set(over.values())) == 1
+            logs = [server.games[gid].game.log for gid in ids]
+            assert logs[0] == logs[1]
+        finally:
+            c.writer.close()
+            await server.close()
+
+    _run(main())
+
+
+def test_human_seat_plays_a_turn_against_a_bot():
+    async def main():
+        server = GameServer()
+        c = await _connect(server)
+        try:
+            await c.send(op="new", seats=["human", "heuristic"], seed=3)
+            gid = (await c.until("created"))["game"]
+            await c.until("your_turn", game=gid)
+            await c.send(op="state", game=gid)
+            state = await c.until("state", game=gid)
+            me, them = state["state"]["players"]
+            assert isinstance(me["hand"], list) and isinstance(them["hand"], int)
+
+            await c.send(op="action", game=gid, cmd="p", arg=99)
+            assert "out of range" in (await c.until("error"))["message"]
+
+            await c.send(op="action", game=gid, cmd="pa")
+            await c.until("ok")
+            await c.send(op="action", game=gid, cmd="e")
+            # the bot moves before the end-turn action is acknowledged
+            turn = await c.until("your_turn", game=gid)
+            assert turn["seat"] == 0
+            await c.send(op="state", game=gid)
+            state = await c.until("state", game=gid)
+            assert state["state"]["turn"] >= 3
+        finally:
+            c.writer.close()
+            await server.close()
+
+    _run(main())
+
+
+def test_actions_are_checked_per_seat():
+    async def main():
+        server = GameServer()
+        c = await _connect(server)
+        try:
+            await c.send(op="new", seats=["heuristic", "human"], seed=3, seat=1)
+            gid = (await c.until("created"))["game"]
+            await c.until("your_turn", game=gid)
+            await c.send(op="join", game=gid, seat=1)
+            assert "taken" in (await c.until("error"))["message"]
+            await c.send(op="nope")
+            assert "unknown op" in (await c.until("error"))["message"]
+        finally:
+            c.writer.close()
+            await server.close()
+
+    _run(main())
+
+
+def test_apply_human_rejects_illegal_buys(game):
+    p = game.current_player()
+    p.trade_pool = 0
+    with pytest.raises(ActionError):
+        apply_human(game, 0, "b", "x")
+    with pytest.raises(ActionError):
+        apply_human(game, 0, "b", 1)
+
+
+class _Sink:
+    def __init__(self):
+        self.msgs = []
+
+    async def send(self, msg):
+        self.msgs.append(msg)
+
+
+def test_a_decision_parks_the_game_without_a_thread():
+    from starrealms.effects import apply_effect
+    from starrealms.server import GameSession
+
+    def opponent_discards(game):
+        apply_effect({"type": "discard", "amount": 1}, game.players[0], game.players[1], game)
+
+    async def main():
+        g = GameSession("t", ["heuristic", "human"], asyncio.get_running_loop(), seed=3)
+        sink = _Sink()
+        g.clients[1] = sink
+        hand = [c["name"] for c in g.game.players[1].hand]
+        finished = []
+
+        async def then():
+            finished.append(True)
+
+        assert await g._step(opponent_discards, then=then) is False
+        prompt = [m for m in sink.msgs if m["type"] == "prompt"][-1]
+        assert prompt["seat"] == 1 and prompt["kind"] == "index"
+        assert len(prompt["context"]) == 1 + len(hand)
+        assert [c["name"] for c in g.game.players[1].hand] == hand  # untouched while parked
+
+        with pytest.raises(ActionError):
+            await g.answer(0, "1")
+        await g.answer(1, "2")
+        assert finished and g.pending is None
+        assert [c["name"] for c in g.game.players[1].discard_pile] == [hand[1]]
+
+    _run(main())
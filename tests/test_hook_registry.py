@@ -0,0 +1,62 @@
+# tests/test_hook_registry.py
+from starrealms.engine.unified_dispatcher import (
+    AbilityDispatcher,
+    GameAPI,
+    HookRegistry,
+    compile_abilities,
+)
+
+
+def test_registry_keeps_order_and_removes_by_handle():
+    reg = HookRegistry()
+    calls = []
+    h1 = reg.add("on_ship_played", lambda *a, **k: calls.append(1), "A")
+    reg.add("on_ship_played", lambda *a, **k: calls.append(2), "B")
+    reg.add("on_ship_played", lambda *a, **k: calls.append(3), "A")
+
+    assert [src for src, _fn in reg.get("on_ship_played")] == ["A", "B", "A"]
+    assert reg.remove(h1) is True
+    assert reg.remove(h1) is False
+    assert [src for src, _fn in reg.get("on_ship_played")] == ["B", "A"]
+
+    assert reg.remove_source("A") == 1
+    assert [src for src, _fn in reg.get("on_ship_played")] == ["B"]
+    assert len(reg) == 1
+
+
+def test_subscriber_snapshot_reused_until_changed():
+    reg = HookRegistry()
+    reg.add("e", print, "S")
+    snap = reg.subscribers("e")
+    assert reg.subscribers("e") is snap  # no allocation while unchanged
+    reg.add("e", print, "T")
+    assert reg.subscribers("e") is not snap
+
+
+def test_hook_may_unregister_its_source_while_firing():
+    api = GameAPI(game=None, ui=None)
+    seen = []
+
+    def once(api_, player, **payload):
+        seen.append(payload["n"])
+        api_.unregister_hooks_from_source(player, "Once")
+
+    api.register_hook("P1", "tick", once, source="Once")
+    api.register_hook("P1", "tick", lambda *a, **k: seen.append("other"), source="Other")
+    api.fire("P1", "tick", n=1)
+    api.fire("P1", "tick", n=2)
+    assert seen == [1, "other", "other"]
+
+
+def test_continuous_handler_compiled_once_per_ability():
+    ab = {"trigger": "continuous:on_ship_played", "effects": [{"type": "combat", "amount": 1}]}
+    card = {"name": "Aura", "type": "base", "abilities": compile_abilities([ab])}
+    h = card["abilities"].index.on_enter[0][0]
+    assert h.event == "on_ship_played"
+
+    api = GameAPI(game=None, ui=None)
+    api.game = type("G", (), {"list_zone": lambda *a: []})()
+    AbilityDispatcher(api)
+    api.dispatcher.on_card_enter_play("P1", card)
+    api.dispatcher.on_card_enter_play("P1", dict(card))
+    assert [fn for _src, fn in api.hooks["P1"].get("on_ship_played")] == [h, h]
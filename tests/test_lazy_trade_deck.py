@@ -0,0 +1,101 @@
+# tests/test_lazy_trade_deck.py
+import copy
+import random
+from collections import Counter
+
+import pytest
+
+import starrealms.cards as cards_mod
+from starrealms.ai import PolicyAgent
+from starrealms.cards.lazy_deck import LazyTradeDeck
+from starrealms.game import Game
+from starrealms.planning import Determinizer
+from starrealms.planning.buy_cache import BuyDecisionCache
+from starrealms.runner.headless import play_game
+
+
+def _draw_all(deck):
+    return [deck.pop()["name"] for _ in range(len(deck))]
+
+
+def test_draws_the_whole_deck_without_replacement():
+    full = Counter(c["name"] for c in cards_mod.build_trade_deck())
+    deck = LazyTradeDeck(rng=random.Random(1))
+    assert len(deck) == 80 and deck.counts() == full
+    card = deck.pop()
+    assert card is not deck.pop() and "_rt" not in card
+    deck = LazyTradeDeck(rng=random.Random(1))
+    assert Counter(_draw_all(deck)) == full and not deck
+    with pytest.raises(IndexError):
+        deck.pop()
+
+
+def test_seeded_draws_and_independent_copies():
+    a = LazyTradeDeck(rng=random.Random(5))
+    b = LazyTradeDeck(rng=random.Random(5))
+    assert [a.pop()["name"] for _ in range(10)] == [b.pop()["name"] for _ in range(10)]
+    c = copy.deepcopy(a)
+    assert _draw_all(c) == _draw_all(a)  # same RNG state, separate decks
+    d = LazyTradeDeck(rng=random.Random(5))
+    e = d.copy()
+    e.pop()
+    assert len(d) == 80 and len(e) == 79
+
+
+def test_fixed_order_replays_a_game():
+    random.seed(11)
+    g = Game(("P1", "P2"), lazy_trade_deck=True)
+    row = [c["name"] for c in g.trade_row]
+    assert g.trade_deck.history == row
+    replay = LazyTradeDeck(rng=random.Random(0), order=row + ["Cutter"])
+    assert [replay.pop()["name"] for _ in range(6)] == row + ["Cutter"]
+    assert replay.fixed == []
+    with pytest.raises(ValueError):
+        replay.fix_order(["Cutter"] * 10)
+    with pytest.raises(ValueError):
+        replay.fix_order(["Scout"])
+
+
+def test_from_cards_keeps_a_list_decks_order():
+    listed = cards_mod.new_trade_deck(random.Random(3))
+    lazy = LazyTradeDeck.from_cards(listed)
+    expect = [c["name"] for c in reversed(listed)]
+    assert _draw_all(lazy) == expect
+
+
+def test_games_play_and_determinize_with_a_lazy_deck():
+    res = play_game(
+        [PolicyAgent(buy_cache=BuyDecisionCache()), PolicyAgent(buy_cache=BuyDecisionCache())],
+        seed=2,
+        max_turns=30,
+        lazy_trade_deck=True,
+    )
+    assert res.turns > 0
+
+    g = Game(("P1", "P2"), lazy_trade_deck=True)
+    g.trade_deck.fix_order(["Cutter"])
+    for w in Determinizer(g, g.players[0], seed=0).worlds(5):
+        assert w.trade_deck.counts() == g.trade_deck.counts() and w.trade_deck.fixed == []
+    assert g.trade_deck.fixed == ["Cutter"]
+    assert len(g.trade_deck + g.card_db) == 75 + len(g.card_db)
+
+
+def test_determinizer_seed_fixes_lazy_worlds_whatever_the_global_rng():
+    g = Game(("P1", "P2"), lazy_trade_deck=True, seed=4)
+
+    def deal(global_seed):
+        random.seed(global_seed)
+        out = []
+        for w in Determinizer(g, g.players[0], seed=7).worlds(3):
+            out.append([w.trade_deck.pop()["name"] for _ in range(10)])
+            w.players[0].reshuffle_discard_into_deck()
+        return out, random.random()
+
+    first, after_a = deal(1)
+    again, after_b = deal(2)
+    assert first == again
+    assert len({tuple(d) for d in first}) == 3  # worlds differ from each other
+    random.seed(1)
+    r1 = random.random()
+    random.seed(2)
+    assert (after_a, after_b) == (r1, random.random())  # the global stream was not consumed
@@ -0,0 +1,92 @@
+# tests/test_lethal_solver.py
+from starrealms.ai import GoodHeuristicAgent, PolicyAgent
+from starrealms.cards import find_card
+from starrealms.planning import execute_line, find_lethal, has_lethal
+
+
+def _setup(game, hand, opp_authority, opp_bases=()):
+    p, o = game.players
+    p.hand = [find_card(n) for n in hand]
+    p.in_play, p.bases = [], []
+    p.combat_pool = 0
+    o.authority = opp_authority
+    o.bases = [find_card(n) for n in opp_bases]
+    return p, o
+
+
+def _names(line):
+    return [(kind, card["name"]) for kind, card, _ in line.steps]
+
+
+def test_scrap_for_combat_is_part_of_the_line(game):
+    p, o = _setup(game, ["Viper", "Explorer"], 3)
+    line = find_lethal(p, o, game)
+    assert line is not None and line.combat == 3
+    assert ("scrap", "Explorer") in _names(line)
+
+    execute_line(line, p, o, game)
+    assert p.combat_pool == 3
+
+
+def test_no_lethal_when_one_short(game):
+    p, o = _setup(game, ["Viper", "Explorer"], 4)
+    assert find_lethal(p, o, game) is None
+    assert not has_lethal(p, o, game)
+
+
+def test_outpost_must_be_paid_for(game):
+    p, o = _setup(game, ["Viper", "Explorer"], 1, ["Trading Post"])  # 4-defense outpost
+    assert find_lethal(p, o, game) is None
+
+
+def test_ally_destroy_base_removes_outpost(game):
+    p, o = _setup(game, ["Blob Destroyer", "Blob Fighter"], 9, ["Trading Post"])
+    line = find_lethal(p, o, game)
+    assert line is not None
+    assert (line.combat, line.destroys) == (9, 1)
+    o.authority = 10
+    assert find_lethal(p, o, game) is None
+
+
+def test_choose_branch_is_scripted(game):
+    p, o = _setup(game, [], 5)
+    mech = find_card("Patrol Mech")  # activated: 3 trade OR 5 combat
+    p.in_play = [mech]
+    line = find_lethal(p, o, game)
+    assert line is not None
+    assert [(k, c["name"], picks) for k, c, picks in line.steps] == [("activate", "Patrol Mech", (1,))]
+
+    execute_line(line, p, o, game)
+    assert p.combat_pool == 5
+    assert not hasattr(p, "agent") or not type(p.agent).__name__.startswith("_Scripted")
+
+
+def test_agents_plan_lethal_turn(game):
+    p, o = _setup(game, ["Viper", "Explorer"], 3)
+    for agent in (PolicyAgent({}), GoodHeuristicAgent()):
+        plan = agent.plan_turn(game)
+        assert plan[0][0] == "lethal"
+        assert [c for c, _ in plan[1:]] == ["a", "e"]
+
+
+def test_lethal_turn_through_controller(game):
+    from starrealms.ai import ai_take_turn
+    from starrealms.runner.controller import apply_command
+
+    p, o = _setup(game, ["Viper", "Explorer"], 3)
+    ai_take_turn(game, lambda cmd, arg: apply_command(game, cmd, arg, len(game.log), echo=False))
+    assert o.authority <= 0
+
+
+def test_card_specs_are_keyed_on_the_loaded_definition():
+    import copy
+
+    from starrealms.planning import lethal
+
+    viper = find_card("Viper")
+    spec = lethal._cached_spec(viper)
+    assert lethal._cached_spec(copy.deepcopy(viper)) is spec
+
+    custom = dict(viper, effects=[{"type": "combat", "amount": 9}])
+    assert lethal._cached_spec(custom) is not spec
+    assert lethal._SPECS["Viper"][1] is spec
@@ -0,0 +1,97 @@
+# tests/test_next_hand.py
+import copy
+import random
+from itertools import combinations
+from math import comb
+
+import pytest
+
+from starrealms.cards import find_card
+from starrealms.planning import KnowledgeTracker, hand_distribution, next_hand
+from starrealms.planning.draws import cache_info
+
+
+def _cards(*spec):
+    return [find_card(n) for n, k in spec for _ in range(k)]
+
+
+def test_starting_deck_is_hypergeometric():
+    out = hand_distribution(["Scout"] * 8 + ["Viper"] * 2)
+    pmf = out.trade_pmf()
+    for t in (3, 4, 5):
+        assert pmf[t] == pytest.approx(comb(8, t) * comb(2, 5 - t) / comb(10, 5))
+    assert sum(p for _, _, p in out.outcomes) == pytest.approx(1.0)
+    assert out.expected_trade == pytest.approx(4.0) and out.expected_combat == pytest.approx(1.0)
+
+
+def test_mid_draw_reshuffle_matches_brute_force():
+    deck = ["Viper", "Scout"]
+    discard = ["Explorer"] * 2 + ["Scout"] * 3 + ["Viper"] * 2
+    out = hand_distribution(deck, discard)
+    trade = {1: 0.0}
+    for picks in combinations(range(len(discard)), 3):
+        t = 1 + sum({"Explorer": 2, "Scout": 1}.get(discard[i], 0) for i in picks)
+        trade[t] = trade.get(t, 0.0) + 1 / comb(len(discard), 3)
+    assert out.trade_pmf() == pytest.approx({k: v for k, v in trade.items() if v})
+
+    short = hand_distribution(["Scout"], ["Viper"])  # fewer than five cards in all
+    assert short.outcomes == ((1, 1, 1.0),)
+
+
+def test_allies_in_hand_and_from_bases():
+    deck = ["Trade Pod"] * 2 + ["Scout"] * 4
+    out = hand_distribution(deck)
+    assert out.p_combat_at_least(4) == pytest.approx(comb(4, 3) / comb(6, 5))  # both Pods: 2 + 2
+    assert out.p_combat_at_least(1) == out.p_combat_at_least(4)  # a lone Pod has no ally
+    with_base = hand_distribution(deck, bases=[find_card("The Hive")])
+    assert with_base.p_combat_at_least(2) == pytest.approx(1.0)  # any Pod allies with the base
+
+
+def test_next_hand_follows_cleanup_and_top_deck(game):
+    p = game.players[0]
+    p.deck = _cards(("Scout", 1))
+    p.hand = _cards(("Viper", 2))
+    p.in_play = _cards(("Explorer", 1))
+    p.discard_pile = []
+    assert next_hand(p).outcomes == ((3, 2, 1.0),)  # everything comes back
+
+    p.topdeck_next_purchase = True
+    out = next_hand(p, bought=[find_card("Freighter")])
+    assert out.p_trade_at_least(5) == pytest.approx(1.0)  # Freighter on top, then the Scout
+
+    p.topdeck_next_purchase = False
+    p.deck = _cards(("Scout", 6))
+    tracker = KnowledgeTracker(game)
+    game._acquire_topdeck(p, find_card("Cutter"))
+    assert next_hand(p).p_trade_at_least(6) == pytest.approx(5 / 7)
+    tracker.observe(game)
+    assert next_hand(p, tracker=tracker).outcomes == ((6, 0, 1.0),)
+
+
+def test_exact_outlook_matches_the_engine(game):
+    p = game.players[0]
+    p.deck = _cards(("Scout", 2), ("Trade Pod", 1))
+    p.hand = _cards(("Viper", 2), ("Trade Pod", 1))
+    p.in_play = _cards(("Explorer", 2))
+    p.discard_pile = _cards(("Scout", 4), ("Blob Fighter", 1))
+    out = next_hand(p)
+    rng = random.Random(0)
+    n, seen = 3000, {}
+    for _ in range(n):
+        q = copy.deepcopy(p)
+        q.rng = rng  # one stream across copies (a copy's own RNG would repeat the same shuffle)
+        q.end_turn()
+        t = sum({"Scout": 1, "Explorer": 2, "Trade Pod": 3}.get(c["name"], 0) for c in q.hand)
+        seen[t] = seen.get(t, 0) + 1 / n
+    exact = out.trade_pmf()
+    assert set(seen) <= set(exact)
+    for t, prob in exact.items():
+        assert seen.get(t, 0.0) == pytest.approx(prob, abs=0.03)
+
+
+def test_outlooks_are_memoized():
+    deck = ["Scout"] * 6 + ["Viper"] * 3 + ["Cutter"]
+    hand_distribution(deck)
+    before = cache_info()["outlooks"].hits
+    hand_distribution(list(reversed(deck)))
+    assert cache_info()["outlooks"].hits == before + 1
@@ -34,4 +34,28 @@ def test_end_turn_moves_hand_and_inplay_and_draws():
     assert p.per_ship_combat_bonus == 0
 
     # Drew 5 new cards
-    assert len(p.hand) == 5
\ No newline at end of file
+    assert len(p.hand) == 5
+
+def test_ship_played_again_on_a_later_turn_resolves_again():
+    from starrealms.cards import card_template
+
+    g = Game(("P1","P2"))
+    p, opp = g.players
+    cutter = card_template("Cutter").copy()  # trade 2, authority 4
+    gains = []
+    for _ in range(2):
+        g.start_turn()
+        assert g.current_player() is p
+        p.hand.append(cutter)
+        before = p.authority
+        p.play_card(cutter, opp, g)
+        gains.append((p.trade_pool, p.authority - before))
+        assert cutter in p.in_play
+        g.end_turn()
+        assert "_rt" not in cutter
+        for zone in (p.discard_pile, p.deck, p.hand):  # cleanup may reshuffle it into the deck
+            if any(c is cutter for c in zone):
+                del zone[next(i for i, c in enumerate(zone) if c is cutter)]
+        g.start_turn()
+        g.end_turn()
+    assert gains == [(2, 4), (2, 4)]
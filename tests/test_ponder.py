@@ -0,0 +1,138 @@
+# tests/test_ponder.py
+import copy
+import random
+
+from starrealms.ai import GoodHeuristicAgent
+from starrealms.cards import find_card
+from starrealms.planning import find_lethal
+from starrealms.planning.buy_cache import BuyDecisionCache
+from starrealms.planning.ponder import LethalBook, Ponderer, lethal_key, max_lethal, ponder, warm_buys
+
+
+def _setup(game, hand, opp_authority, opp_bases=()):
+    p, o = game.players
+    p.hand = [find_card(n) for n in hand]
+    p.in_play, p.bases = [], []
+    p.combat_pool = 0
+    o.authority = opp_authority
+    o.bases = [find_card(n) for n in opp_bases]
+    return p, o
+
+
+def test_max_lethal_matches_find_lethal(game):
+    p, o = _setup(game, ["Viper", "Explorer", "Blob Fighter"], 50)
+    m, line = max_lethal(p, o, game)
+    assert o.authority == 50  # restored
+    assert line is not None and m == line.combat
+    o.authority = m
+    assert find_lethal(p, o, game) is not None
+    o.authority = m + 1
+    assert find_lethal(p, o, game) is None
+
+
+def test_lethal_book_is_exact_around_the_bound(game):
+    p, o = _setup(game, ["Viper", "Explorer"], 50)
+    m, line = max_lethal(p, o, game)
+    assert m == 3
+    book = LethalBook()
+    book.record(lethal_key(p, o, game), m, line, p)
+
+    o.authority = m
+    known, found = book.lookup(p, o, game)
+    assert known and found is not None
+    assert [c["name"] for _, c, _ in found.steps] == [c["name"] for _, c, _ in line.steps]
+    assert all(any(c is x for x in p.hand) for _, c, _ in found.steps)
+
+    o.authority = m + 1
+    assert book.lookup(p, o, game) == (True, None)
+
+    o.bases = [find_card("Trading Post")]  # the key changed: search again
+    assert book.lookup(p, o, game) == (False, None)
+
+
+def test_warm_buys_fills_a_private_cache(game):
+    agent = GoodHeuristicAgent(buy_cache=BuyDecisionCache())
+    p = game.current_player()
+    before = (list(game.trade_row), p.trade_pool)
+    cache = warm_buys(agent, game, p, budget=200)
+    assert 0 < len(cache) <= 200
+    assert len(agent.buy_cache) == 0
+    assert (list(game.trade_row), p.trade_pool) == before
+
+
+class _Scratch(GoodHeuristicAgent):
+    def __init__(self, buy_cache=None):
+        super().__init__(buy_cache)
+        self.scored = []  # per-agent scratch state, like ValueAgent._obs
+
+    def _buy_score(self, game, card):
+        self.scored.append(card["name"])
+        return super()._buy_score(game, card)
+
+
+def test_warm_buys_plans_with_a_deep_copy_of_the_agent(game):
+    agent = _Scratch(buy_cache=BuyDecisionCache())
+    cache = warm_buys(agent, game, game.current_player(), budget=50)
+    assert len(cache) > 0
+    assert agent.scored == [] and len(agent.buy_cache) == 0
+
+
+def test_agents_that_do_not_cache_buys_are_not_warmed(game):
+    from starrealms.dataset.encoding import obs_dim
+    from starrealms.value.agent import ValueAgent
+    from starrealms.value.mlp import MLP
+
+    agent = ValueAgent(MLP((obs_dim(), 1)), buy_cache=BuyDecisionCache())
+    assert not agent.uses_buy_cache
+    assert len(warm_buys(agent, game, game.current_player(), budget=50)) == 0
+    agent.net = None  # PolicyAgent buys: cached, so worth warming
+    assert len(warm_buys(agent, game, game.current_player(), budget=50)) > 0
+
+
+def test_ponder_leaves_the_real_game_and_rng_alone(game):
+    agent = GoodHeuristicAgent(buy_cache=BuyDecisionCache())
+    game.turn = 0
+    clone = copy.deepcopy(game)
+    state = random.getstate()
+    res = ponder(agent, clone, seat=1, budget=50)
+    assert clone.current_player() is clone.players[1]
+    assert res.lethal_key is not None and res.buys is not None
+    assert game.turn == 0 and game.turn_number == clone.turn_number - 1
+    assert random.getstate() == state
+
+
+def test_ponderer_merges_on_finish(game):
+    agent = GoodHeuristicAgent(buy_cache=BuyDecisionCache())
+    game.turn = 0
+    ponderer = Ponderer(agent, seat=1, budget=100)
+    hand = [c["name"] for c in game.players[1].hand]
+    try:
+        ponderer.start(game)
+        assert ponderer.wait(30)
+        assert len(agent.buy_cache) == 0  # nothing shared changes until finish()
+        res = ponderer.finish()
+    finally:
+        ponderer.close()
+    assert res is not None and not res.stopped
+    assert len(agent.buy_cache) == len(res.buys) > 0
+    assert len(agent.lethal_book) == 1
+    assert [c["name"] for c in game.players[1].hand] == hand
+
+    game.end_turn()
+    game.start_turn()
+    known, _ = agent.lethal_book.lookup(game.current_player(), game.opponent(), game)
+    assert known
+
+
+def test_finish_interrupts_a_running_ponder(game):
+    agent = GoodHeuristicAgent(buy_cache=BuyDecisionCache())
+    game.turn = 0
+    ponderer = Ponderer(agent, seat=1)
+    try:
+        ponderer.start(game)
+        res = ponderer.finish(timeout=30)
+    finally:
+        ponderer.close()
+    assert res is not None
+    assert len(agent.lethal_book) == (0 if res.lethal_key is None else 1)  # interrupted lethal is not recorded
+    assert ponderer.finish() is None
@@ -0,0 +1,113 @@
+# tests/test_purchase_planner.py
+from starrealms.ai import GoodHeuristicAgent, PolicyAgent
+from starrealms.cards import find_card
+from starrealms.planning.buy_cache import BuyDecisionCache
+from starrealms.planning.purchase import EXPLORER_SLOT, plan_purchases, run_purchases
+from starrealms.runner.headless import play_game
+
+
+def test_two_cheap_cards_beat_one_expensive():
+    offers = [(5, 8.0), (3, 5.0), (2, 4.0), None, (6, 20.0)]
+    plan = plan_purchases(offers, 5, dilution=0.0)
+    assert plan.picks == (2, 3)
+    assert plan.spent == 5 and plan.value == 9.0
+    assert plan_purchases(offers, 5).picks == (1,)  # the second card does not pay for its dilution
+
+
+def test_dilution_grows_with_each_card_bought_this_turn():
+    offers = [(3, 5.0), (3, 5.0)]
+    assert plan_purchases(offers, 6, dilution=4.0).picks == (1, 2)  # 5 + 5 - 4
+    assert plan_purchases(offers, 6, bought=(3,), dilution=4.0).picks == (1,)  # 5 - 4 beats 10 - 4 - 8
+    assert plan_purchases([(3, 3.0)], 3, bought=(3,), dilution=4.0).picks == ()
+
+
+def test_explorers_are_a_capped_fallback():
+    plan = plan_purchases([(7, 9.0)], 4, explorer=(2, 3.0), dilution=0.0)
+    assert plan.picks == (EXPLORER_SLOT,)  # one a turn
+    assert plan_purchases([(7, 9.0)], 4, explorer=(2, 3.0), bought=(EXPLORER_SLOT,)).picks == ()
+    plan = plan_purchases([(3, 1.0)], 5, explorer=(2, 3.0), dilution=0.0)
+    assert plan.picks == (1,)  # a row card that fits beats a higher-scoring Explorer
+    assert plan_purchases([(3, -1.0)], 5, explorer=(2, 3.0)).picks == (EXPLORER_SLOT,)
+
+
+def test_buy_cap_and_non_positive_scores():
+    offers = [(1, 2.0), (1, 2.0), (1, 2.0), (1, -1.0)]
+    assert len(plan_purchases(offers, 10, max_buys=2, dilution=0.0).picks) == 2
+    assert plan_purchases([(1, 0.0), (1, -3.0)], 10).picks == ()
+    assert plan_purchases(offers, 0, explorer=(2, 3.0)).picks == ()
+
+
+def test_ties_prefer_spending_less():
+    assert plan_purchases([(4, 5.0), (2, 5.0)], 4).picks == (2,)
+
+
+def test_run_purchases_replans_for_refills():
+    row = [(3, 6.0)]
+    bought = []
+
+    def plan(left, done):
+        assert done == tuple(bought)
+        return plan_purchases(row, 6 - 3 * len(bought), max_buys=left, dilution=0.0).picks[:1]
+
+    def buy(slot):
+        bought.append(slot)
+        row[0] = (3, 4.0)  # refill is only visible after the buy
+
+    assert run_purchases(plan, buy) == 2
+    assert bought == [1, 1]
+
+
+def test_agents_share_the_planner(game):
+    p = game.current_player()
+    game.trade_row = [find_card(n) for n in ("Cutter", "Ram", "Dreadnaught", "Viper", "Scout")]
+    p.trade_pool = 5
+    for agent in (PolicyAgent(), GoodHeuristicAgent()):
+        picks = agent.plan_buys(game, p)
+        assert sorted(picks, key=str) == [1, 2]  # Cutter + Ram over one big card
+
+    cmds = GoodHeuristicAgent().plan_turn(game)
+    assert [a for c, a in cmds if c == "b"] in ([1, 2], [2, 1])
+
+
+def test_agents_leave_trade_unspent_rather_than_buy_non_positive_cards(game):
+    # The original AI always bought its best affordable card, or an Explorer;
+    # the planner only buys cards that score above zero.
+    p = game.current_player()
+    game.trade_row = [find_card(n) for n in ("Cutter", "Ram")]
+    p.trade_pool = 6
+    agent = PolicyAgent(weights={"cost_penalty": 1.0}, buy_cache=BuyDecisionCache())
+    assert agent.plan_buys(game, p) == []  # every card (and the Explorer) scores below zero
+    agent = PolicyAgent(weights={"trade": 1.0, "cost_penalty": 2.0}, buy_cache=BuyDecisionCache())
+    assert agent.plan_buys(game, p) == []  # Cutter scores 0, Ram -4
+    agent = PolicyAgent(weights={"trade": 1.0, "cost_penalty": 1.5}, buy_cache=BuyDecisionCache())
+    assert agent.plan_buys(game, p) == [1]  # the Cutter alone pays off
+
+
+class _GreedyBuyer(GoodHeuristicAgent):
+    """The original buyer: the best affordable row card, else an Explorer, twice."""
+
+    def plan_buys(self, game, player, max_buys=2, bought=()):
+        picks, trade = [], player.trade_pool
+        for _ in range(max_buys):
+            fits = [
+                (self._buy_score(game, c), -i, i)
+                for i, c in enumerate(game.trade_row, start=1)
+                if c and i not in picks and c["cost"] <= trade
+            ]
+            if fits:
+                slot = max(fits)[2]
+                picks.append(slot)
+                trade -= game.trade_row[slot - 1]["cost"]
+            elif trade >= 2:
+                picks.append(EXPLORER_SLOT)
+                trade -= 2
+        return picks
+
+
+def test_planner_is_at_least_as_strong_as_the_greedy_buyer():
+    new, old = GoodHeuristicAgent(buy_cache=BuyDecisionCache()), _GreedyBuyer(buy_cache=BuyDecisionCache())
+    wins = 0
+    for k in range(200):  # seat-swapped pairs sharing a seed
+        agents = [new, old] if k % 2 == 0 else [old, new]
+        wins += play_game(agents, seed=k // 2, max_turns=200).winner == k % 2
+    assert wins >= 100
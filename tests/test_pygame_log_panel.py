@@ -0,0 +1,80 @@
+# tests/test_pygame_log_panel.py
+import builtins
+import os
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame_main  # noqa: E402
+from pygame_main import LogPanel  # noqa: E402
+
+
+@pytest.fixture
+def panel(monkeypatch):
+    monkeypatch.setattr(pygame_main, "MAX_LINES", 50)
+    p = LogPanel(size=(400, 300))
+    yield p
+    pygame.quit()
+
+
+def test_import_has_no_side_effects():
+    assert pygame_main.log_panel is None
+    assert builtins.print is not pygame_main._print_to_both
+
+
+def test_ring_buffer_keeps_the_newest_lines(panel):
+    for i in range(120):
+        panel.add_line(f"line {i}")
+    assert len(panel.lines) == 50
+    assert panel.lines[0][0] == "line 70"
+    assert panel.visible_rows()[-1][0] == "line 119"
+
+
+def test_only_visible_lines_are_wrapped(panel):
+    for i in range(40):
+        panel.add_line(f"entry {i} " + "word " * 30)  # several rows each
+    rows = panel.visible_rows()
+    assert len(rows) == panel.max_visible
+    assert len(panel._wraps) < 40  # older lines never wrapped
+    assert rows == panel.visible_rows()  # memoized wraps give the same rows
+
+
+def test_scroll_is_clamped_to_the_top(panel):
+    for i in range(3):
+        panel.add_line(f"line {i}")
+    panel.scroll_offset = 1000
+    assert panel.visible_rows()[0][0] == "line 0"
+    assert panel.scroll_offset == 0  # all three fit on screen
+
+
+def test_draw_repaints_only_on_change(panel, monkeypatch):
+    panel.add_line("hello")
+    flips, updates = [], []
+    monkeypatch.setattr(pygame.display, "flip", lambda: flips.append(1))
+    monkeypatch.setattr(pygame.display, "update", lambda *a: updates.append(a))
+    panel.draw()
+    panel.draw()
+    assert (len(flips), len(updates)) == (1, 0)
+
+    panel.input_text = "b 1"
+    panel.draw()
+    assert (len(flips), len(updates)) == (1, 1)  # just the input row
+
+    surfaces = len(panel._row_surfs)
+    panel.scroll_offset = 0
+    panel.add_line("hello")
+    panel.draw()
+    assert len(flips) == 2 and len(panel._row_surfs) == surfaces  # cached row reused
+
+
+def test_font_change_drops_caches(panel):
+    text = "word " * 60
+    panel.add_line(text)
+    panel.draw()
+    rows = len(panel._wrapped(text.rstrip()))
+    panel.set_font_size(40)
+    assert not panel._row_surfs and not panel._wraps
+    assert len(panel._wrapped(text.rstrip())) > rows  # re-wrapped for the bigger font
@@ -0,0 +1,52 @@
+# tests/test_pygame_view.py
+import os
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from starrealms.graphics.pygame_view import StarRealmsPygameView  # noqa: E402
+
+
+@pytest.fixture
+def view(game):
+    v = StarRealmsPygameView(game, w=1280, h=800)
+    yield v
+    pygame.quit()
+
+
+def test_only_changed_regions_are_repainted(view, game):
+    assert view.render() == [view.screen.get_rect()]  # first frame: everything
+    assert view.render() == []  # nothing changed
+
+    game.current_player().combat_pool += 3
+    (dirty,) = view.render()
+    assert dirty.colliderect(view.btn_end)  # the status panel
+    assert not dirty.colliderect(view.views[0].rect)
+
+    view.message = "hello"
+    (dirty,) = view.render()
+    assert dirty.y == 670
+
+
+def test_hover_repaints_just_the_cards(view):
+    view.render()
+    card = next(v for v in view.views if v.zone == "hand")
+    view.hover = card
+    assert view.render() == [card.rect]
+    view.hover = None
+    assert view.render() == [card.rect]
+
+
+def test_card_faces_and_text_are_rendered_once(view, game):
+    view.render()
+    faces, texts = dict(view._card_surfs), dict(view._text_surfs)
+    game.current_player().hand.reverse()  # same cards, new order: cache hits only
+    view.invalidate()
+    view.render()
+    assert view._card_surfs == faces and view._text_surfs == texts
+    view.hover = next(v for v in view.views if v.zone == "trade")
+    view.render()
+    assert len(view._card_surfs) == len(faces) + 1  # the highlighted face
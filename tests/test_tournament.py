@@ -0,0 +1,85 @@
+# tests/test_tournament.py
+import json
+
+from starrealms.runner.headless import play_game
+from starrealms.ai import GoodHeuristicAgent, PolicyAgent
+from starrealms.tournament import (
+    SWISS,
+    AgentSpec,
+    Tournament,
+    bradley_terry_elo,
+    load_results,
+    parse_agent,
+    trueskill_ratings,
+)
+from starrealms.tournament.runner import round_robin_jobs, swiss_pairings
+
+AGENTS = [AgentSpec("base", "policy"), AgentSpec("good", "heuristic"), AgentSpec("alt", "policy")]
+
+
+def test_seeded_headless_games_reproduce_and_finish():
+    a = play_game([GoodHeuristicAgent(), PolicyAgent()], seed=3)
+    b = play_game([GoodHeuristicAgent(), PolicyAgent()], seed=3)
+    assert a == b
+    assert a.winner in (0, 1)
+
+
+def test_round_robin_schedule_is_seat_swapped():
+    jobs = round_robin_jobs(["b", "a", "c"], games_per_pair=4, base_seed=1)
+    assert len(jobs) == 3 * 4
+    ab = [j for j in jobs if {j.first, j.second} == {"a", "b"}]
+    assert [(j.first, j.second) for j in ab] == [("a", "b"), ("b", "a")] * 2
+    assert ab[0].seed == ab[1].seed != ab[2].seed
+    assert len({j.id for j in jobs}) == len(jobs)
+
+
+def test_parse_agent():
+    assert parse_agent("x=policy@w.json") == AgentSpec("x", "policy", "w.json")
+    assert parse_agent("g=heuristic") == AgentSpec("g", "heuristic", None)
+
+
+def test_results_stream_and_resume(tmp_path):
+    path = str(tmp_path / "t.jsonl")
+    seen = []
+    t = Tournament(AGENTS, games_per_pair=2, workers=1, results_path=path, max_turns=40, on_result=seen.append)
+    rows = t.run()
+    assert len(seen) == 6
+    lines = (tmp_path / "t.jsonl").read_text().splitlines()
+    assert len(lines) == 6 and json.loads(lines[0])["id"].startswith("rr:")
+    assert sum(r.games for r in rows) == 12
+
+    # Drop the last result and tear a line, as after a crash: only that game reruns.
+    (tmp_path / "t.jsonl").write_text("\n".join(lines[:-1]) + '\n{"id": "rr:')
+    rerun = []
+    t2 = Tournament(AGENTS, games_per_pair=2, workers=1, results_path=path, max_turns=40, on_result=rerun.append)
+    assert len(t2.records) == 5
+    t2.run()
+    assert [r.id for r in rerun] == [json.loads(lines[-1])["id"]]
+    assert len(load_results(path)) == 6
+    assert [(s.name, s.wins) for s in t2.standings()] == [(s.name, s.wins) for s in rows]
+
+
+def test_swiss_rounds_pair_without_rematches():
+    pairs = swiss_pairings(["a", "b", "c", "d"], {"a": 3, "b": 2, "c": 1, "d": 0}, {"a": {"b"}, "b": {"a"}})
+    assert pairs == [("a", "c"), ("b", "d")]
+
+    specs = AGENTS + [AgentSpec("h2", "heuristic")]
+    t = Tournament(specs, format=SWISS, rounds=2, games_per_pair=2, workers=1, max_turns=30)
+    t.run()
+    assert {r.id.split(":")[0] for r in t.records.values()} == {"sw1", "sw2"}
+    assert len(t.records) == 2 * 2 * 2
+
+
+def test_ratings_order_and_intervals():
+    outcomes = [("a", "b", 1.0)] * 8 + [("a", "b", 0.0)] * 2 + [("b", "c", 1.0)] * 7 + [("b", "c", 0.5)] * 3
+    elo = bradley_terry_elo(outcomes)
+    assert elo["a"].elo > elo["b"].elo > elo["c"].elo
+    assert abs(sum(e.elo for e in elo.values()) / 3 - 1500) < 1e-6
+    assert all(e.low < e.elo < e.high for e in elo.values())
+
+    ts = trueskill_ratings(outcomes)
+    assert ts["a"].mu > ts["b"].mu > ts["c"].mu
+    assert all(r.sigma < 25 / 3 for r in ts.values())
+
+    unbeaten = bradley_terry_elo([("x", "y", 1.0)] * 5)
+    assert unbeaten["x"].elo < 3000  # prior keeps perfect scores finite
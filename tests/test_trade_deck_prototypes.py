@@ -0,0 +1,46 @@
+# tests/test_trade_deck_prototypes.py
+import random
+
+import starrealms.cards as cards_mod
+from starrealms.game import Game
+
+
+def test_new_game_does_not_renormalize_cards(monkeypatch):
+    cards_mod.build_trade_deck()  # warm the per-process cache
+
+    def boom(*_a, **_k):
+        raise AssertionError("trade deck should come from cached prototypes")
+
+    monkeypatch.setattr(cards_mod, "_normalize_card", boom)
+    monkeypatch.setattr(cards_mod, "_validate_card", boom)
+    g = Game(("P1", "P2"))
+    assert len(g.trade_deck) + len(g.trade_row) == 80
+
+
+def test_new_trade_deck_matches_shuffled_build_for_same_seed():
+    random.seed(1234)
+    legacy = cards_mod.build_trade_deck()
+    random.shuffle(legacy)
+
+    random.seed(1234)
+    deck = cards_mod.new_trade_deck()
+
+    assert [c["name"] for c in deck] == [c["name"] for c in legacy]
+
+
+def test_new_trade_deck_copies_are_independent_of_prototypes():
+    deck = cards_mod.new_trade_deck(random.Random(7))
+    protos = cards_mod._trade_deck_prototypes()
+    assert all(c is not p for c in deck for p in protos[:3])
+
+    deck[0]["_rt"] = {"ally_triggered": True}
+    assert all("_rt" not in p for p in protos)
+    assert all("_rt" not in c for c in cards_mod.new_trade_deck(random.Random(7)))
+
+
+def test_reload_resets_prototype_cache():
+    before = cards_mod._trade_deck_prototypes()
+    cards_mod.reload_enabled_sets()
+    after = cards_mod._trade_deck_prototypes()
+    assert before is not after
+    assert [c["name"] for c in before] == [c["name"] for c in after]
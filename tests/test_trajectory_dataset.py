@@ -0,0 +1,98 @@
+# tests/test_trajectory_dataset.py
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from starrealms.dataset import (  # noqa: E402
+    PASS,
+    ShardDataset,
+    ShardWriter,
+    TrajectoryRecorder,
+    encode_observation,
+    export_trajectories,
+    legal_mask,
+    n_actions,
+    obs_dim,
+    self_play_jobs,
+    vocab,
+)
+from starrealms.dataset.__main__ import main  # noqa: E402
+from starrealms.runner.headless import play_game  # noqa: E402
+from starrealms.ai import GoodHeuristicAgent  # noqa: E402
+from starrealms.tournament import AgentSpec  # noqa: E402
+
+
+def test_observation_and_mask_layout(game):
+    p, o = game.players
+    p.trade_pool = 3
+    obs = encode_observation(game, p)
+    assert obs.shape == (obs_dim(),) and obs.dtype == np.float32
+    v = len(vocab())
+    names = [c["name"] for c in p.hand]
+    assert obs[vocab().index("Scout")] == names.count("Scout")  # own hand block
+    assert obs[5 * v + vocab().index("Scout")] == 8  # opponent owns 8 Scouts, wherever they are
+    assert obs[7 * v + 2] == 3  # trade scalar
+
+    mask = legal_mask(game, p)
+    assert mask.shape == (n_actions(),) and mask[PASS]
+    row = {c["name"]: c["cost"] for c in game.trade_row if c}
+    for name, cost in row.items():
+        assert mask[1 + vocab().index(name)] == (cost <= 3)
+    assert mask[1 + vocab().index("Explorer")]
+
+
+def test_recorder_labels_are_legal():
+    rec = TrajectoryRecorder()
+    res = play_game([GoodHeuristicAgent(), GoodHeuristicAgent()], seed=4, max_turns=40, on_step=rec)
+    rows = rec.rows(res.winner, game_no=7)
+    n = len(rec)
+    assert n > 0 and rows["obs"].shape == (n, obs_dim())
+    assert rows["mask"][np.arange(n), rows["action"]].all()
+    assert (rows["action"] == PASS).any() and (rows["action"] != PASS).any()
+    assert set(np.unique(rows["outcome"])) <= {-1, 0, 1}
+    if res.winner is not None:
+        assert (rows["outcome"][rows["seat"] == res.winner] == 1).all()
+    assert (rows["game"] == 7).all()
+
+
+def test_writer_shards_and_zero_copy_batches(tmp_path):
+    root = str(tmp_path / "d")
+    cols = {"x": ("float32", (3,)), "y": ("int32", ())}
+    with ShardWriter(root, cols, shard_size=10, buffer_rows=4, seed=0) as w:
+        for start in range(0, 25, 5):
+            ids = np.arange(start, start + 5)
+            w.write({"x": np.repeat(ids[:, None], 3, axis=1), "y": ids})
+    ds = ShardDataset(root)
+    assert len(ds) == 25 and [s["rows"] for s in ds.index["shards"]] == [10, 10, 5]
+
+    seen = []
+    for b in ds.batches(4, seed=1):
+        assert isinstance(b["y"], np.memmap) and not b["y"].flags.owndata  # a view, not a copy
+        assert (b["x"][:, 0] == b["y"]).all()  # rows stay aligned across columns
+        seen.extend(b["y"].tolist())
+    assert sorted(seen) == list(range(25))
+    assert all(len(b["y"]) == 4 for b in ds.batches(4, seed=1, drop_last=True))
+
+    with pytest.raises(FileExistsError):
+        ShardWriter(root, cols)
+    with ShardWriter(root, cols, shard_size=10, append=True) as w:
+        w.write({"x": np.zeros((3, 3)), "y": np.full(3, 99)})
+    assert len(ShardDataset(root)) == 28
+
+
+def test_export_and_cli(tmp_path, capsys):
+    out = str(tmp_path / "traj")
+    jobs = self_play_jobs([AgentSpec("good", "heuristic")], games=2, seed=1)
+    w = export_trajectories(out, jobs, max_turns=30, shard_size=64, buffer_rows=32, seed=0)
+    ds = ShardDataset(out)
+    assert len(ds) == w.rows > 0
+    assert ds.meta["games"] == 2 and len(ds.meta["actions"]) == n_actions()
+    with open(tmp_path / "traj" / "index.json") as f:
+        assert json.load(f)["columns"]["obs"][1] == [obs_dim()]
+    game_ids = np.concatenate([ds.column(i, "game") for i in range(ds.num_shards)])
+    assert set(game_ids.tolist()) == {0, 1}
+
+    main(["info", out])
+    assert f"{len(ds)} rows" in capsys.readouterr().out
@@ -0,0 +1,72 @@
+# tests/test_transposition_table.py
+import copy
+
+from starrealms.cards import find_card
+from starrealms.planning.transposition import LOWER, TranspositionTable
+
+
+def test_store_probe_and_deeper_result_wins():
+    tt = TranspositionTable(16)
+    assert tt.probe(42) is None
+    tt.store(42, 1.5, depth=3, flag=LOWER, move=("p", 1))
+    e = tt.probe(42)
+    assert (e.value, e.depth, e.flag, e.move) == (1.5, 3, LOWER, ("p", 1))
+    tt.store(42, 9.0, depth=1)  # shallower: ignored
+    assert tt.probe(42).value == 1.5
+    tt.store(42, 2.0, depth=5)
+    assert tt.probe(42).value == 2.0
+    assert len(tt) == 1
+
+
+def test_index_collisions_are_detected_not_aliased():
+    tt = TranspositionTable(8)
+    a, b, c = 3, 3 + 8, 3 + 16  # same home bucket
+    tt.store(a, 1.0, depth=2)
+    tt.store(b, 2.0, depth=1)
+    assert tt.probe(a).value == 1.0 and tt.probe(b).value == 2.0
+    assert tt.probe(c) is None
+    assert tt.stats()["collisions"] == 1
+    assert tt.probe(2) is None  # shares the bucket, but no resident has index 2
+    assert tt.stats()["collisions"] == 1
+
+    # Bucket full in the same generation: shallower newcomer is rejected...
+    assert tt.store(c, 3.0, depth=0) is False
+    # ...a deeper one evicts the shallowest resident.
+    assert tt.store(c, 3.0, depth=4) is True
+    assert b not in tt and a in tt and c in tt
+    assert tt.stats()["replacements"] == 1 and tt.stats()["rejected"] == 1
+
+
+def test_old_generations_are_replaced_first():
+    tt = TranspositionTable(8)
+    tt.store(1, 1.0, depth=9)
+    tt.store(1 + 8, 1.0, depth=9)
+    tt.new_search()
+    tt.probe(1)  # touched in the new search: stays
+    assert tt.store(1 + 16, 5.0, depth=0)
+    assert 1 in tt and (1 + 8) not in tt
+
+
+def test_accumulate_keeps_a_running_mean():
+    tt = TranspositionTable(8)
+    for v in (1.0, 0.0, 0.5):
+        tt.accumulate(7, v)
+    e = tt.probe(7)
+    assert e.visits == 3 and abs(e.value - 0.5) < 1e-9
+
+
+def test_transposed_game_positions_share_an_entry(game):
+    tt = TranspositionTable()
+
+    def after(order):
+        g = copy.deepcopy(game)
+        me, opp = g.players
+        me.hand = [find_card("Scout"), find_card("Viper")]
+        for name in order:
+            me.play_card(next(c for c in me.hand if c["name"] == name), opp, g)
+        return g.state_hash
+
+    tt.store(after(["Scout", "Viper"]), 0.7, depth=1)
+    hit = tt.probe(after(["Viper", "Scout"]))
+    assert hit is not None and hit.value == 0.7
+    assert tt.stats()["hit_rate"] == 1.0
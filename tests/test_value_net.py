@@ -0,0 +1,99 @@
+# tests/test_value_net.py
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from starrealms.ai import PolicyAgent  # noqa: E402
+from starrealms.planning.buy_cache import BuyDecisionCache  # noqa: E402
+from starrealms.dataset import ShardDataset, encode_observation, export_trajectories, obs_dim, self_play_jobs, vocab  # noqa: E402
+from starrealms.runner.headless import play_game  # noqa: E402
+from starrealms.tournament import AgentSpec, make_agent  # noqa: E402
+from starrealms.value import MLP, ValueAgent, afterstates, buy_sets, candidate_sets, fit  # noqa: E402
+
+
+def test_gradients_match_finite_differences():
+    rng = np.random.default_rng(0)
+    net = MLP((5, 4, 3, 1), seed=1)
+    net.params = [p.astype(np.float64) for p in net.params]
+    x, y = rng.normal(size=(6, 5)), rng.choice([-1.0, 1.0], 6)
+    _, grads = net.loss_and_grads(x, y)
+    eps = 1e-6
+    for p, g in zip(net.params, grads):
+        for idx in [(0,) * p.ndim, tuple(s - 1 for s in p.shape)]:
+            old = p[idx]
+            p[idx] = old + eps
+            hi = net.loss_and_grads(x, y)[0]
+            p[idx] = old - eps
+            lo = net.loss_and_grads(x, y)[0]
+            p[idx] = old
+            assert g[idx] == pytest.approx((hi - lo) / (2 * eps), rel=1e-3, abs=1e-6)
+
+
+def test_save_load_roundtrip(tmp_path):
+    net = MLP((8, 4, 1), seed=3)
+    net.set_normalization(np.arange(8), np.full(8, 2.0))
+    net.meta["note"] = "x"
+    path = str(tmp_path / "m.npz")
+    net.save(path)
+    back = MLP.load(path)
+    x = np.random.default_rng(0).normal(size=(5, 8))
+    assert back.sizes == net.sizes and back.meta["note"] == "x"
+    np.testing.assert_allclose(back.forward(x), net.forward(x), rtol=1e-6)
+
+
+def test_candidates_and_afterstates_agree(game):
+    p = game.players[0]
+    p.trade_pool = 5
+    cands = candidate_sets(game, p)
+    assert cands[0] == ((), ())
+    costs = {c["name"]: c["cost"] for c in game.trade_row if c}
+    costs["Explorer"] = 2
+    for slots, ids in cands:
+        assert len(slots) <= 2 and sum(costs[vocab()[i]] for i in ids) <= 5
+    assert any(len(s) == 2 for s, _ in cands)  # two Explorers at least
+
+    obs = encode_observation(game, p)
+    singles = [(s, ids) for s, ids in cands if len(ids) == 1]
+    batch = buy_sets(obs, [ids for _, ids in singles])
+    actions = np.array([1 + ids[0] for _, ids in singles])
+    np.testing.assert_array_equal(batch, afterstates(np.repeat(obs[None], len(singles), 0), actions))
+    assert (afterstates(obs[None], np.array([0])) == obs).all()
+
+
+class _Prefers:
+    """A stand-in net that scores afterstates by how many of one card the player owns."""
+
+    def __init__(self, card):
+        self.inputs = obs_dim()
+        self.col = 3 * len(vocab()) + vocab().index(card)
+
+    def forward(self, x):
+        return x[:, self.col]
+
+
+def test_value_agent_buys_the_argmax(game):
+    p = game.players[0]
+    p.trade_pool = 4
+    agent = ValueAgent(_Prefers("Explorer"), buy_cache=BuyDecisionCache())
+    cands, values = agent.evaluate(game, p)
+    assert len(values) == len(cands)
+    assert agent.plan_buys(game, p) == ["x", "x"]
+
+
+def test_fit_and_play(tmp_path):
+    out = str(tmp_path / "traj")
+    export_trajectories(out, self_play_jobs([AgentSpec("good", "heuristic")], games=4, seed=2), max_turns=40, seed=0)
+    res = fit(ShardDataset(out), hidden=(16,), epochs=3, lr=3e-3, batch_size=64, val_fraction=0.25)
+    assert len(res.history) == 3 and res.val_rows > 0
+    assert res.history[-1]["train_loss"] < res.history[0]["train_loss"]
+
+    path = str(tmp_path / "v.npz")
+    res.net.save(path)
+    agent = make_agent(AgentSpec("v", "value", path))
+    assert isinstance(agent, ValueAgent) and agent.net.inputs == obs_dim()
+    opp = PolicyAgent(buy_cache=BuyDecisionCache())
+    r = play_game([agent, opp], seed=5, max_turns=60)
+    assert r.turns > 0
+
+    with pytest.raises(ValueError):
+        ValueAgent(MLP((obs_dim() + 1, 1)))
@@ -0,0 +1,98 @@
+# tests/test_warehouse.py
+import multiprocessing
+
+import pytest
+
+from starrealms.tournament import AgentSpec, Tournament
+from starrealms.ai import load_weights
+from starrealms.planning.buy_cache import policy_key
+from starrealms.warehouse import SeatResult, Warehouse, wilson
+from starrealms.warehouse.__main__ import main
+
+
+def _game(wh, run, a, b, score_a, turns, **kw):
+    winner = None if score_a == 0.5 else (0 if score_a == 1.0 else 1)
+    wh.add_game(run, [SeatResult(a, score_a, "w" + a), SeatResult(b, 1.0 - score_a, "w" + b)], winner, turns, **kw)
+
+
+def test_batches_and_win_rates(tmp_path):
+    with Warehouse(str(tmp_path / "r.db"), batch_size=3) as wh:
+        assert wh.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        run = wh.start_run("test", seed=7, meta={"note": "x"})
+        _game(wh, run, "a", "b", 1.0, 10, seed=1)
+        _game(wh, run, "a", "b", 0.5, 20, seed=2)
+        assert wh.conn.execute("SELECT COUNT(*) FROM games").fetchone()[0] == 0  # still buffered
+        _game(wh, run, "b", "a", 0.0, 30, seed=3)  # third game fills the batch
+        assert wh.conn.execute("SELECT COUNT(*) FROM games").fetchone()[0] == 3
+        _game(wh, run, "b", "c", 1.0, 40, played="2020-01-01T00:00:00Z")
+        wh.finish_run(run)
+
+        rates = {r.group: r for r in wh.win_rates()}
+        a = rates["a"]
+        assert (a.games, a.wins, a.draws, a.losses) == (3, 2, 1, 0)
+        assert a.score == pytest.approx(2.5 / 3)
+        assert (a.low, a.high) == pytest.approx(wilson(2.5, 3))
+        assert a.avg_turns == 20
+        assert [r.group for r in wh.win_rates(by="weights", weights="wc")] == ["wc"]
+        assert {r.group for r in wh.win_rates(since="2021-01-01")} == {"a", "b"}
+
+        assert wh.turn_histogram(agent="c") == [(40, 1)]
+        stats = wh.turn_stats()
+        assert (stats["games"], stats["min"], stats["max"], stats["p50"]) == (4, 10, 40, 20)
+        assert wh.runs()[0]["games"] == 4 and wh.runs()[0]["meta"] == {"note": "x"}
+
+
+def _writer(path, name, n):
+    with Warehouse(path, batch_size=25) as wh:
+        run = wh.start_run("worker", meta={"name": name})
+        for i in range(n):
+            _game(wh, run, name, "opp", float(i % 2), i, seed=i)
+
+
+def test_many_processes_append_to_one_file(tmp_path):
+    path = str(tmp_path / "r.db")
+    Warehouse(path).close()
+    ctx = multiprocessing.get_context("spawn")
+    procs = [ctx.Process(target=_writer, args=(path, f"p{k}", 120)) for k in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(60)
+        assert p.exitcode == 0
+    with Warehouse(path) as wh:
+        rates = {r.group: r for r in wh.win_rates()}
+        assert all(rates[f"p{k}"].games == 120 and rates[f"p{k}"].wins == 60 for k in range(4))
+        assert rates["opp"].games == 480
+        assert len(wh.runs()) == 4
+
+
+def test_weights_filter_is_a_literal_prefix(tmp_path):
+    with Warehouse(str(tmp_path / "r.db")) as wh:
+        run = wh.start_run("test")
+        wh.add_game(run, [SeatResult("a", 1.0, "ab_%1"), SeatResult("b", 0.0, "abX91")], 0, 5)
+        wh.flush()
+        assert [r.group for r in wh.win_rates(by="weights", weights="ab_%")] == ["ab_%1"]
+        assert [r.group for r in wh.win_rates(by="weights", weights="abX")] == ["abX91"]
+        assert wh.win_rates(weights="a%") == []
+
+        where, args = wh._where(weights="ab")
+        plan = wh.conn.execute(f"EXPLAIN QUERY PLAN SELECT COUNT(*) FROM seats s{where}", args).fetchall()
+        assert any("seats_weights" in row[-1] for row in plan)
+
+
+def test_tournament_stores_games(tmp_path, capsys):
+    db = str(tmp_path / "r.db")
+    agents = [AgentSpec("base", "policy"), AgentSpec("good", "heuristic")]
+    Tournament(agents, games_per_pair=2, workers=1, max_turns=30, db_path=db).run()
+    with Warehouse(db) as wh:
+        rates = {r.group: r for r in wh.win_rates()}
+        assert rates["base"].games == rates["good"].games == 2
+        [run] = wh.runs()
+        assert run["kind"] == "tournament" and run["finished"]
+        weights = {r.group for r in wh.win_rates(by="weights")}
+        assert weights == {None, policy_key("PolicyAgent", load_weights())}  # joins buy-cache keys
+
+    main([db, "rates", "--by", "agent"])
+    main([db, "turns", "--agent", "good"])
+    out = capsys.readouterr().out
+    assert "base" in out and "p50=" in out
@@ -0,0 +1,137 @@
+# tests/test_zobrist_hash.py
+import copy
+import pickle
+import random
+
+import pytest
+
+from starrealms.ai import GoodHeuristicAgent
+from starrealms.cards import find_card
+from starrealms.game import Game
+from starrealms.zobrist import ZobristRow, ZobristZone, compute_state_hash
+
+
+@pytest.fixture
+def game():
+    return Game(("P1", "P2"), hashing=True)
+
+
+@pytest.fixture
+def debug_game(monkeypatch):
+    monkeypatch.setattr(Game, "zobrist_debug", True)
+    return Game(("P1", "P2"), hashing=True)
+
+
+def test_initial_hash_matches_full_recompute(game):
+    assert game.state_hash == compute_state_hash(game)
+
+
+def test_incremental_hash_tracks_whole_games(debug_game):
+    """Every read cross-checks against a full recompute (zobrist_debug)."""
+    from starrealms.runner.controller import apply_command
+
+    random.seed(7)
+    g = debug_game
+    agent = GoodHeuristicAgent()
+    for _ in range(30):
+        if g.check_winner():
+            break
+        g.start_turn()
+        g.state_hash
+        for cmd, arg in agent.plan_turn(g):
+            apply_command(g, cmd, arg, len(g.log), echo=False)
+            g.state_hash
+            if cmd == "e":
+                break
+
+
+def test_play_order_transposes(game, p1, p2):
+    def played(order):
+        g = copy.deepcopy(game)
+        me, opp = g.players
+        me.hand = [find_card("Scout"), find_card("Viper")]
+        for name in order:
+            card = next(c for c in me.hand if c["name"] == name)
+            me.play_card(card, opp, g)
+        return g.state_hash
+
+    assert played(["Scout", "Viper"]) == played(["Viper", "Scout"])
+
+
+def test_duplicates_do_not_cancel(p1, game):
+    p1.hand = []
+    empty = game.state_hash
+    p1.hand.append(find_card("Scout"))
+    one = game.state_hash
+    p1.hand.append(find_card("Scout"))
+    assert len({empty, one, game.state_hash}) == 3
+    p1.hand.pop()
+    assert game.state_hash == one
+    p1.hand.clear()
+    assert game.state_hash == empty
+
+
+def test_pools_row_and_turn_are_hashed(game, p1):
+    h = game.state_hash
+    p1.trade_pool += 3
+    assert game.state_hash != h
+    p1.trade_pool -= 3
+    assert game.state_hash == h
+
+    game.trade_row[0], game.trade_row[1] = game.trade_row[1], game.trade_row[0]
+    assert game.state_hash != h or game.trade_row[0]["name"] == game.trade_row[1]["name"]
+    game.trade_row[0], game.trade_row[1] = game.trade_row[1], game.trade_row[0]
+    assert game.state_hash == h
+
+    game.turn += 1
+    assert game.state_hash != h
+    game.turn += 1
+    assert game.state_hash == h
+
+
+def test_reassigned_lists_and_copies_stay_consistent(game, p1):
+    p1.deck = p1.deck + [find_card("Cutter")]
+    game.trade_row = list(reversed(game.trade_row))
+    assert game.state_hash == compute_state_hash(game)
+
+    for clone in (copy.deepcopy(game), pickle.loads(pickle.dumps(game))):
+        assert clone.state_hash == game.state_hash
+        clone.players[0].hand.append(find_card("Viper"))
+        assert clone.state_hash == compute_state_hash(clone)
+        assert clone.state_hash != game.state_hash
+
+
+def test_hash_is_stable_across_fresh_games():
+    random.seed(3)
+    a = Game(("A", "B"), hashing=True)
+    random.seed(3)
+    b = Game(("A", "B"), hashing=True)
+    assert a.state_hash == b.state_hash
+
+
+def test_plain_games_use_plain_lists_and_hash_on_read():
+    random.seed(5)
+    plain = Game(("A", "B"))
+    random.seed(5)
+    hashed = Game(("A", "B"), hashing=True)
+    assert type(plain.trade_row) is list and type(plain.players[0].hand) is list
+    assert "_zhash" not in plain.__dict__ and "_zhash" not in plain.players[0].__dict__
+    assert plain.state_hash == hashed.state_hash
+
+    plain.players[0].hand.append(find_card("Scout"))
+    assert plain.state_hash == compute_state_hash(plain) != hashed.state_hash
+
+
+def test_enable_hashing_mid_game(monkeypatch):
+    monkeypatch.setattr(Game, "zobrist_debug", True)
+    g = Game(("A", "B"))
+    g.players[0].trade_pool = 4
+    g.turn = 1
+    h = g.state_hash
+    g.enable_hashing()
+    assert isinstance(g.trade_row, ZobristRow) and isinstance(g.players[1].deck, ZobristZone)
+    assert g.state_hash == h
+    g.players[1].hand.append(g.players[1].deck.pop())
+    g.players[0].trade_pool -= 4
+    assert g.state_hash == compute_state_hash(g)  # zobrist_debug cross-checks the read
+    assert copy.deepcopy(g).state_hash == g.state_hash
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# tools/bench_pygame_idle.py
+"""
+Idle CPU of the pygame front ends: legacy 60 FPS polling vs the event-driven
+loop (FrameGovernor + dirty repaints). Runs headless on SDL's dummy video
+driver; nothing touches the screen, so numbers are pure loop overhead.
+
+    python tools/bench_pygame_idle.py --seconds 5
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame  # noqa: E402
+
+from starrealms.graphics.governor import FrameGovernor  # noqa: E402
+
+
+def _measure(step, seconds: float):
+    """Run step() until `seconds` of wall time pass; (cpu %, wake-ups per second)."""
+    frames = 0
+    wall0, cpu0 = time.perf_counter(), time.process_time()
+    while time.perf_counter() - wall0 < seconds:
+        step()
+        frames += 1
+    wall = time.perf_counter() - wall0
+    return 100.0 * (time.process_time() - cpu0) / wall, frames / wall
+
+
+def bench_log_panel(seconds: float):
+    import pygame_main
+
+    panel = pygame_main.LogPanel()
+    for i in range(2000):
+        panel.add_line(f"[{i}] P1 plays Blob Fighter (Blob) and gains 3 combat; the trade row refills")
+
+    def polling():  # the old pygame_ui_input loop
+        pygame.event.get()
+        panel.invalidate()
+        panel.draw()
+        panel.tick(60)
+
+    governor = FrameGovernor()
+
+    def governed():  # the current pygame_ui_input loop
+        for e in governor.wait(panel.next_blink):
+            panel.handle_event(e)
+        panel.blink()
+        panel.draw()
+
+    return _measure(polling, seconds), _measure(governed, seconds)
+
+
+def bench_board(seconds: float):
+    from starrealms.game import Game
+    from starrealms.graphics.pygame_view import StarRealmsPygameView
+
+    view = StarRealmsPygameView(Game(("P1", "P2")))
+
+    def polling():  # the old StarRealmsPygameView.loop
+        pygame.event.get()
+        view.invalidate()
+        view.render()
+        view.clock.tick(60)
+
+    governor = FrameGovernor(max_fps=view.fps)
+
+    def governed():
+        governor.wait()
+        view.render()
+
+    return _measure(polling, seconds), _measure(governed, seconds)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Idle CPU of the pygame loops (SDL dummy driver)")
+    ap.add_argument("--seconds", type=float, default=5.0, help="wall time per measurement")
+    args = ap.parse_args(argv)
+    print(f"{'loop':<30} {'CPU %':>7} {'wakeups/s':>10}")
+    for name, bench in (("LogPanel input", bench_log_panel), ("board view", bench_board)):
+        (cpu_a, fps_a), (cpu_b, fps_b) = bench(args.seconds)
+        print(f"{name + ' (60 FPS poll)':<30} {cpu_a:>7.1f} {fps_a:>10.1f}")
+        print(f"{name + ' (event wait)':<30} {cpu_b:>7.1f} {fps_b:>10.1f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()